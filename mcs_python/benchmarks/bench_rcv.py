@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Round trip benchmark of McsDevice.rcv() (before/after comparison).
+
+Compares the legacy 2 ms polling receive of McsDevice with the current event
+driven receive (condition notified by put_msg() from the Mcs reader thread).
+No CAN hardware is required: an echo communicator acknowledges each telegram
+sent with an info 0 telegram.
+
+Usage:
+    $ python benchmarks/bench_rcv.py [round trips]
+"""
+import queue
+import statistics
+import sys
+import time
+from typing import List, Optional
+
+import can
+
+import mcs
+
+
+class EchoCom(mcs.mcsbus.ComInterface):
+    """Communicator acknowledging every sent MCS telegram immediately."""
+
+    def __init__(self) -> None:
+        self._rx = queue.Queue()
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def send(self, msg: can.Message) -> None:
+        self._rx.put(can.Message(arbitration_id=msg.arbitration_id & 0xff,
+                                 is_extended_id=False,
+                                 data=[0x00, 0x00, msg.data[0]]))
+
+    def read_in_loop(self) -> Optional[can.Message]:
+        try:
+            return self._rx.get(timeout=0.01)
+        except queue.Empty:
+            return None
+
+
+class PollingMcsDevice(mcs.McsDevice):
+    """McsDevice with the legacy polling rcv() for reference ("before")."""
+
+    def rcv(self, timeout=mcs.mcsbus.CAN_TIMEOUT) -> can.Message:
+        poll_interval = 0.002
+        poll_actions = int(timeout / poll_interval)
+        for x in range(poll_actions):
+            if self._is_msg_available():
+                break
+            time.sleep(poll_interval)
+        else:
+            self._log_history_and_raise(
+                mcs.McsTimeoutException(f"Time out: no response from {self}"))
+        if self._lock.locked():
+            self._lock.release()
+        return self.get_msg()
+
+
+def measure(device: mcs.McsDevice, round_trips: int) -> List[float]:
+    durations = []
+    for _ in range(round_trips):
+        start = time.perf_counter()
+        device.send_and_check_rsp([0x22, 0x00], check=[0x00, None, 0x22])
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def report(name: str, durations: List[float]) -> None:
+    durations = sorted(durations)
+    p99 = durations[int(len(durations) * 0.99) - 1]
+    print(f"{name:<10} mean {statistics.mean(durations) * 1e3:7.3f} ms  "
+          f"p50 {statistics.median(durations) * 1e3:7.3f} ms  "
+          f"p99 {p99 * 1e3:7.3f} ms  "
+          f"({len(durations) / sum(durations):8.1f} round trips/s)")
+
+
+def run(round_trips: int = 1000) -> None:
+    can_mcs = mcs.Mcs(mcs.McsBus(EchoCom()))
+    can_mcs.open(register="ignore")
+    try:
+        for name, cls, can_id in (("before", PollingMcsDevice, 0x421),
+                                  ("after", mcs.McsDevice, 0x423)):
+            device = cls(can_id, can_mcs.bus)
+            can_mcs.register(device)
+            report(name, measure(device, round_trips))
+    finally:
+        can_mcs.close()
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:2]])
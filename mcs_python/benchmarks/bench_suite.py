@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""Micro-benchmark suite for the MCS request/response path.
+
+Runs without CAN hardware using the simulated communicator (ComSimulated with
+zero bus latency), so the results show the overhead of the Python stack
+itself. Reports operations per second and p50/p99 latency per operation,
+optionally writes the results as JSON and compares them with a stored
+baseline.
+
+Usage:
+    $ python benchmarks/bench_suite.py [--repeat N] [--json results.json]
+        [--save-baseline] [--baseline benchmarks/baseline.json]
+        [--max-regression 0.2]
+
+Exits with 1 if an operation is slower (p50) than the baseline by more than
+the given maximum regression.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional
+
+import can
+
+import mcs
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+DISPATCH_BATCH = 100  # Frames dispatched per measurement.
+
+
+class ReplayCom(mcs.mcsbus.ComInterface):
+    """Communicator returning given messages from read_in_loop()."""
+
+    def __init__(self) -> None:
+        self.messages: Iterator[can.Message] = iter(())
+        self.done = threading.Event()
+        self.ready = threading.Event()
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def send(self, msg: can.Message) -> None:
+        pass
+
+    def read_in_loop(self) -> Optional[can.Message]:
+        try:
+            return next(self.messages)
+        except StopIteration:
+            self.ready.clear()
+            self.done.set()
+            self.ready.wait(0.01)
+            return None
+
+
+def get_stats(durations: List[float], ops_per_sample: int = 1
+              ) -> Dict[str, float]:
+    """Return ops/s and p50/p99 (in microseconds per operation)."""
+    per_op = sorted(d / ops_per_sample for d in durations)
+    return {
+        "ops_per_s": len(per_op) / sum(per_op),
+        "p50_us": statistics.median(per_op) * 1e6,
+        "p99_us": per_op[math.ceil(len(per_op) * 0.99) - 1] * 1e6,
+    }
+
+
+def measure(func: Callable[[], object], repeat: int, warmup: int = 100
+            ) -> Dict[str, float]:
+    for _ in range(warmup):
+        func()
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return get_stats(durations)
+
+
+def measure_dispatch(repeat: int) -> Dict[str, float]:
+    """Measure Mcs._read_msg() dispatch of received frames to devices."""
+    com = ReplayCom()
+    can_mcs = mcs.Mcs(mcs.McsBus(com))
+    device = mcs.McsDevice(0x423, can_mcs.bus)
+    can_mcs.register(device)
+    # Status change info 0 (updates the device status but is not buffered):
+    msg = can.Message(arbitration_id=0x023, is_extended_id=False,
+                      data=[0x00, 0x00, 0x00])
+    can_mcs.open(register="ignore")
+    durations = []
+    try:
+        for _ in range(max(1, repeat // DISPATCH_BATCH)):
+            com.done.clear()
+            com.messages = iter([msg] * DISPATCH_BATCH)
+            start = time.perf_counter()
+            com.ready.set()
+            com.done.wait()
+            durations.append(time.perf_counter() - start)
+    finally:
+        can_mcs.close()
+    return get_stats(durations, DISPATCH_BATCH)
+
+
+def run(repeat: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    std_msg = can.Message(arbitration_id=0x423, is_extended_id=False,
+                          data=[0x40, 0x00, 0x04, 0x00, 0xc4, 0x09])
+    ext_msg = can.Message(arbitration_id=0x1640e004, is_extended_id=True,
+                          data=[0xf0, 0x0f, 0xb1, 0x03])
+    results["msg_txt"] = measure(lambda: mcs.mcsbus.msg_txt(std_msg), repeat)
+    results["msg_txt_tml"] = measure(lambda: mcs.mcsbus.msg_txt(ext_msg),
+                                     repeat)
+    results["read_msg_dispatch"] = measure_dispatch(repeat)
+
+    can_mcs = mcs.get_simulated_mcs([mcs.SimulatedLaserBoard(0x423)],
+                                    latency=0.0)
+    try:
+        device = can_mcs.get_device(0x423)
+        hardware_device = mcs.HardwareDevice(device, ports={
+            "temperature": mcs.DataPort(4, 2, True, "r",
+                                        factor_raw_to_user=0.01)})
+        results["send_and_check_rsp"] = measure(
+            lambda: device.send_and_check_rsp([0x1b, 0x00],
+                                              check=[0x00, None, 0x1b]),
+            repeat)
+        results["get_port"] = measure(lambda: device.get_port(port=4),
+                                      repeat)
+        results["set_port"] = measure(
+            lambda: device.set_port(port=5, value=1, length=2), repeat)
+        results["read_port"] = measure(
+            lambda: hardware_device.read_port("temperature"), repeat)
+    finally:
+        can_mcs.close()
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]],
+            baseline: Dict[str, Dict[str, float]],
+            max_regression: float) -> bool:
+    """Print comparison with baseline and return if within max regression."""
+    ok = True
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result["p50_us"] / baseline[name]["p50_us"]
+        regression = ratio - 1 > max_regression
+        ok &= not regression
+        print(f"{name:<20} p50 {ratio:6.2f}x baseline"
+              f"{'  REGRESSION' if regression else ''}")
+    return ok
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5000,
+                        help="measurements per operation")
+    parser.add_argument("--json", help="write results to JSON file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store results as new baseline")
+    parser.add_argument("--max-regression", type=float, default=0.2,
+                        help="max. allowed p50 slow down (0.2 = 20 %%)")
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat)
+    for name, r in results.items():
+        print(f"{name:<20} {r['ops_per_s']:10.0f} ops/s  "
+              f"p50 {r['p50_us']:8.2f} us  p99 {r['p99_us']:8.2f} us")
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "mcs": mcs.__version__,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        return 0
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        if not compare(results, baseline, args.max_regression):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Per frame overhead of CAN message logging and binary trace recording.
+
+Measures the time McsBus.send() takes per frame (as seen by the calling
+thread) without file logging, with the text file log (log_to_file()) and with
+the binary trace recorder (record_to_file()). Files are written to a
+temporary directory and their size per frame is reported, too.
+
+Usage:
+    $ python benchmarks/bench_trace.py [frames]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import can
+
+import mcs
+
+
+class NullCom(mcs.mcsbus.ComInterface):
+    """Communicator discarding all messages."""
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def send(self, msg: can.Message) -> None:
+        pass
+
+    def read_in_loop(self) -> None:
+        return None
+
+
+def measure(bus: mcs.McsBus, frames: int) -> float:
+    start = time.perf_counter()
+    for i in range(frames):
+        bus.send(0x421, [0x40, 0x00, i & 0xff, 0x00, 0x08, 0x00])
+    return (time.perf_counter() - start) / frames
+
+
+def run(frames: int = 100000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        bus = mcs.McsBus(NullCom())
+        print(f"{'no log':<12} {measure(bus, frames) * 1e6:7.2f} us/frame")
+
+        path = os.path.join(tmp, "mcs.log")
+        bus.log_to_file(path)
+        duration = measure(bus, frames)
+        bus.stop_log_to_file()
+        print(f"{'text log':<12} {duration * 1e6:7.2f} us/frame "
+              f"{os.path.getsize(path) / frames:6.1f} bytes/frame")
+
+        path = os.path.join(tmp, "mcs.trace")
+        recorder = bus.record_to_file(path)
+        duration = measure(bus, frames)
+        bus.stop_record_to_file()
+        print(f"{'binary trace':<12} {duration * 1e6:7.2f} us/frame "
+              f"{os.path.getsize(path) / frames:6.1f} bytes/frame "
+              f"({recorder.dropped} dropped)")
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:2]])
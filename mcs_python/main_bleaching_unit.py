@@ -1,43 +1,43 @@
-# -*- coding: utf-8 -*-
-import logging
-import sys
-import time
-
-import mcs
-
-log_format = (f'%(asctime)s %(levelname)-8.8s %(name)-20.20s '
-              f'%(message)s')
-formatter = logging.Formatter(log_format)
-console_handler = logging.StreamHandler(sys.stdout)  # instead of stderr
-console_handler.setFormatter(formatter)
-console_handler.setLevel(logging.DEBUG)
-log_mcs = logging.getLogger("mcs")
-log_mcs.addHandler(console_handler)
-log_mcs.setLevel(logging.DEBUG)
-log = logging.getLogger(__name__)
-
-
-def run() -> None:
-    can = mcs.get_mcs()
-    try:
-        bleaching_unit = mcs.BleachingUnit(can.get_device(0x43C))
-
-        bleaching_unit.initialize()
-
-        bleaching_unit.set_intensity_default_all()
-
-        bleaching_unit.enable(channel="green", on=True)
-
-        time.sleep(2)
-
-        bleaching_unit.enable_all(on=False)
-
-    finally:
-        try:
-            can.close()
-        except Exception as exc:
-            print(exc)
-
-
-if __name__ == "__main__":
-    run()
+# -*- coding: utf-8 -*-
+import logging
+import sys
+import time
+
+import mcs
+
+log_format = (f'%(asctime)s %(levelname)-8.8s %(name)-20.20s '
+              f'%(message)s')
+formatter = logging.Formatter(log_format)
+console_handler = logging.StreamHandler(sys.stdout)  # instead of stderr
+console_handler.setFormatter(formatter)
+console_handler.setLevel(logging.DEBUG)
+log_mcs = logging.getLogger("mcs")
+log_mcs.addHandler(console_handler)
+log_mcs.setLevel(logging.DEBUG)
+log = logging.getLogger(__name__)
+
+
+def run() -> None:
+    can = mcs.get_mcs()
+    try:
+        bleaching_unit = mcs.BleachingUnit(can.get_device(0x43C))
+
+        bleaching_unit.initialize()
+
+        bleaching_unit.set_intensity_default_all()
+
+        bleaching_unit.enable(channel="green", on=True)
+
+        time.sleep(2)
+
+        bleaching_unit.enable_all(on=False)
+
+    finally:
+        try:
+            can.close()
+        except Exception as exc:
+            print(exc)
+
+
+if __name__ == "__main__":
+    run()
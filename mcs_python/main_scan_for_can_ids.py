@@ -1,5 +1,5 @@
-import mcs
-
-can = mcs.get_mcs()
-
+import mcs
+
+can = mcs.get_mcs()
+
 print(can.scan_for_devices())
\ No newline at end of file
@@ -1,66 +1,89 @@
-# -*- coding: utf-8 -*-
-from mcs.version import __version__
-from mcs.error_codes import CanErrors
-from mcs.module_names import DEVICE_NAME
-from mcs.cmd_names import CMD_NAME
-from mcs.mcsbus import McsBus
-from mcs.mcsbus import ComPeakCan
-from mcs.mcsbus import ComPythonCan
-from mcs.mcsbus import McsBusException
-from mcs.mcsbus import McsException
-from mcs.mcsbus import McsBusErrorFrameException
-from mcs.mcsbus import McsBusMessageTypeException
-from mcs.mcsbus import McsBusOffException
-from mcs.mcsdevice import McsDevice
-from mcs.mcsdevice import McsHardwareException
-from mcs.mcsdevice import McsTimeoutException
-from mcs.mcsdevice import get_can_id_from_device_name
-from mcs.tml import AxisProperties
-from mcs.tml import TechnosoftAxis
-from mcs.tml import TechnosoftException
-from mcs.tml import TmlDevice
-from mcs.tml import TmlDevicesHandler
-from mcs.mcs import Mcs
-from mcs.mcs import get_mcs
-from mcs.mcs import get_mcs_tml
-from mcs.mcs import get_socket_mcs
-from mcs.mcs import get_pci_mcs
-from mcs.mcs import get_usb_mcs
-from mcs.devices.dataport import DataPort
-from mcs.devices.dataport import Parameter
-from mcs.devices.hardware_device import HardwareDevice  # This first
-from mcs.devices.bleaching_unit import BleachingUnit
-from mcs.devices.bottledetect import BottleDetect
-from mcs.devices.buffersupply import BufferSupply
-from mcs.devices.tec import TEC
-from mcs.devices.diluter import Diluter
-from mcs.devices.laser_board import LaserBoard
-from mcs.devices.magnet import MagnetNeo
-from mcs.devices.magnet import MagnetMacscellerate
-from mcs.devices.needle_arm import Axis
-from mcs.devices.needle_arm_dc_pump import DcPump  # e.g.waste pump
-from mcs.devices.needle_arm_mixer import NeedleMixer
-from mcs.devices.valves import Valve
-from mcs.devices.magnet_valves import MagnetValves
-from mcs.devices.peristaltic_pump import PeristalticPump
-from mcs.devices.lhs_board import PeristalticPumpLHS
-from mcs.devices.lhs_board import MagnetValvesLHS
-from mcs.devices.lhs_board import GearPumpLHS
-from mcs.devices.lhs_board import SerialTunneler
-from mcs.devices.gas_mix import GasMix
-from mcs.devices.manifold import PneumaticManifold
-from mcs.devices.pressureline import PressureLine
-from mcs.devices.pressure_ctrl import PressureCtrl
-from mcs.devices.pressure_gen import PressureGeneration
-from mcs.devices.pressure_gen import PressureGenerationMC
-from mcs.devices.sampler import Sampler
-from mcs.devices.technosoftdrive import TechnosoftDrive
-from mcs.devices.fld_tyto_board import MagnetValvesFLD
-from mcs.devices.fld_tyto_board import DCPumpFLD
-from mcs.models.hardware_model import HardwareModel  # This first
-from mcs.models.axis_drive_model import AxisDriveModel
-from mcs.models.manifold_model import PneumaticManifoldModel
-from mcs.models.pressureline_model import PressureLineModel
-from mcs.devices.pipette_head import Ejector
-from mcs.devices.pipette_head import Plunger
-from mcs.devices.dispenser import Dispenser
+# -*- coding: utf-8 -*-
+from mcs.version import __version__
+from mcs.error_codes import CanErrors
+from mcs.module_names import DEVICE_NAME
+from mcs.cmd_names import CMD_NAME
+from mcs.metrics import McsMetrics
+from mcs.mcsbus import McsBus
+from mcs.mcsbus import ComPeakCan
+from mcs.mcsbus import ComPythonCan
+from mcs.mcsbus import McsBusException
+from mcs.mcsbus import McsException
+from mcs.mcsbus import McsBusErrorFrameException
+from mcs.mcsbus import McsBusMessageTypeException
+from mcs.mcsbus import McsBusOffException
+from mcs.mcsbus import McsBusTxBufferFullException
+from mcs.mcsdevice import McsDevice
+from mcs.mcsdevice import McsHardwareException
+from mcs.mcsdevice import McsTimeoutException
+from mcs.mcsdevice import get_can_id_from_device_name
+from mcs.subscription import PortSubscription
+from mcs.subscription import PortSubscriptions
+from mcs.scheduler import WaitScheduler
+from mcs.scheduler import get_wait_scheduler
+from mcs.scheduler import PollReader
+from mcs.scheduler import PollScheduler
+from mcs.scheduler import get_poll_scheduler
+from mcs.simulation import ComSimulated
+from mcs.simulation import SimulatedLaserBoard
+from mcs.simulation import SimulatedModule
+from mcs.tml import AxisProperties
+from mcs.tml import TechnosoftAxis
+from mcs.tml import TechnosoftException
+from mcs.tml import TmlDevice
+from mcs.tml import TmlDevicesHandler
+from mcs.mcs import Mcs
+from mcs.mcs import MultiMcs
+from mcs.mcs import get_mcs
+from mcs.mcs import get_mcs_tml
+from mcs.mcs import get_multi_mcs
+from mcs.mcs import get_socket_mcs
+from mcs.mcs import get_pci_mcs
+from mcs.mcs import get_simulated_mcs
+from mcs.mcs import get_usb_mcs
+from mcs.executor import DeviceExecutor
+from mcs.executor import get_executor
+from mcs.aio import AsyncMcs
+from mcs.aio import AsyncMcsDevice
+from mcs.devices.dataport import DataPort
+from mcs.devices.dataport import Parameter
+from mcs.devices.data_cache import DataCache
+from mcs.devices.hardware_device import HardwareDevice  # This first
+from mcs.devices.bleaching_unit import BleachingUnit
+from mcs.devices.bottledetect import BottleDetect
+from mcs.devices.buffersupply import BufferSupply
+from mcs.devices.tec import TEC
+from mcs.devices.diluter import Diluter
+from mcs.devices.laser_board import LaserBoard
+from mcs.devices.magnet import MagnetNeo
+from mcs.devices.magnet import MagnetMacscellerate
+from mcs.devices.needle_arm import Axis
+from mcs.devices.needle_arm_dc_pump import DcPump  # e.g.waste pump
+from mcs.devices.needle_arm_mixer import NeedleMixer
+from mcs.devices.valves import Valve
+from mcs.devices.magnet_valves import MagnetValves
+from mcs.devices.peristaltic_pump import PeristalticPump
+from mcs.devices.lhs_board import PeristalticPumpLHS
+from mcs.devices.lhs_board import MagnetValvesLHS
+from mcs.devices.lhs_board import GearPumpLHS
+from mcs.devices.lhs_board import SerialTunneler
+from mcs.devices.gas_mix import GasMix
+from mcs.devices.manifold import PneumaticManifold
+from mcs.devices.pressureline import PressureLine
+from mcs.devices.pressure_ctrl import PressureCtrl
+from mcs.devices.pressure_gen import PressureGeneration
+from mcs.devices.pressure_gen import PressureGenerationMC
+from mcs.devices.sampler import Sampler
+from mcs.devices.technosoftdrive import TechnosoftDrive
+from mcs.devices.fld_tyto_board import MagnetValvesFLD
+from mcs.devices.fld_tyto_board import DCPumpFLD
+from mcs.models.hardware_model import HardwareModel  # This first
+from mcs.models.axis_drive_model import AxisDriveModel
+from mcs.models.manifold_model import PneumaticManifoldModel
+from mcs.models.pressureline_model import PressureLineModel
+from mcs.devices.pipette_head import Ejector
+from mcs.devices.pipette_head import Plunger
+from mcs.devices.dispenser import Dispenser
+from mcs.devices import configuration
+from mcs.devices.bring_up import BringUp
+from mcs.devices.bring_up import BringUpResult
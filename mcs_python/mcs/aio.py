@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+"""Asyncio front-end for the MCS stack.
+
+AsyncMcs and AsyncMcsDevice use the same Mcs instance, reader thread and
+device buffers as the synchronous API. Responses are handed from the reader
+thread to the event loop (see McsDevice.add_listener()), so many device
+operations and timers can run concurrently in one event loop without a thread
+per operation:
+
+    can_mcs = mcs.get_mcs()
+    async_mcs = mcs.AsyncMcs(can_mcs)
+
+    async def read_temperatures():
+        lasers = [async_mcs.get_device(can_id) for can_id in (0x421, 0x423)]
+        return await asyncio.gather(*[d.get_port(4) for d in lasers])
+
+The synchronous API (and its background users, e.g. the poll scheduler) keeps
+working for the same device: an asynchronous request waits (without blocking
+the event loop) while the device is locked by a synchronous one.
+"""
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+import can
+
+import mcs
+from mcs.codec import TELEGRAMS
+from mcs.mcsdevice import McsTimeoutException, get_value_from_rsp
+
+log = logging.getLogger(__name__)
+
+LOCK_POLL_PERIOD = 0.002  # Seconds between attempts to acquire device lock.
+
+
+class AsyncMcsDevice(object):
+    """Awaitable MCS telegrams for an McsDevice.
+
+    Requests to the same device are serialized (one request waiting for its
+    response at a time), requests to different devices run concurrently.
+    """
+
+    def __init__(self, device: mcs.McsDevice) -> None:
+        """Instantiate asynchronous device.
+
+        Args:
+            device: Registered McsDevice (e.g. from Mcs.get_device()).
+        """
+        self.device = device
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._event: Optional[asyncio.Event] = None  # Set on each message.
+        self._request_lock: Optional[asyncio.Lock] = None
+
+    def __repr__(self) -> str:
+        return f"async {self.device}"
+
+    def _bind(self) -> None:
+        """Bind to running event loop and listen to messages of device."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._loop is not None:
+            self.device.remove_listener(self._on_msg)
+        self._loop = loop
+        self._event = asyncio.Event()
+        self._request_lock = asyncio.Lock()
+        self.device.add_listener(self._on_msg)
+
+    def close(self) -> None:
+        """Stop listening to messages of device."""
+        self.device.remove_listener(self._on_msg)
+        self._loop = None
+
+    def _on_msg(self, msg: can.Message) -> None:
+        """Called from reader thread for each message put into the device."""
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._event.set)
+
+    async def _wait_for(self, predicate, timeout: Optional[float]) -> bool:
+        """Wait until predicate is true (checked on each message received).
+
+        Returns:
+            result: False on time out.
+        """
+        end_time = None if timeout is None else self._loop.time() + timeout
+        while True:
+            self._event.clear()
+            if predicate():
+                return True
+            remaining = None
+            if end_time is not None:
+                remaining = end_time - self._loop.time()
+                if remaining <= 0:
+                    return False
+            try:
+                await asyncio.wait_for(self._event.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _acquire_device_lock(self, timeout: float) -> None:
+        """Acquire lock of device shared with the synchronous API.
+
+        Raises:
+            McsTimeoutException: If device is locked for longer than timeout.
+        """
+        end_time = self._loop.time() + timeout
+        while not self.device._lock.acquire(blocking=False):
+            if self._loop.time() >= end_time:
+                self.device.mcs.metrics.inc("lock_failures",
+                                            self.device.rsp_id)
+                raise McsTimeoutException(
+                    f"{self}: Device locked for more than {timeout} s")
+            await asyncio.sleep(LOCK_POLL_PERIOD)
+
+    async def rcv(self, timeout: float = mcs.mcsbus.CAN_TIMEOUT
+                  ) -> can.Message:
+        """Return received message as soon as available in buffer.
+
+        Raises:
+            McsTimeoutException: If no message was received in time.
+        """
+        self._bind()
+        if not await self._wait_for(self.device._is_msg_available, timeout):
+            self.device.cancel_request()
+            self.device.mcs.metrics.inc("timeouts", self.device.rsp_id)
+            self.device._log_history_and_raise(
+                McsTimeoutException(f"Time out: no response from {self}"))
+        return self.device.get_msg()
+
+    async def send_and_check_rsp(self, data: List[int],
+                                 timeout: float = mcs.mcsbus.CAN_TIMEOUT,
+                                 check: Optional[List[int]] = None,
+                                 check_dlc: bool = True) -> can.Message:
+        """Send telegram and return checked response.
+
+        See McsDevice.send_and_check_rsp().
+
+        Raises:
+            McsTimeoutException: If device stays locked by the synchronous
+                API or no response was received in time.
+            McsHardwareException: On NACK or if device reports an error.
+        """
+        self._bind()
+        async with self._request_lock:
+            await self._acquire_device_lock(timeout)
+            try:
+                # Queued for sending (paced by McsBus) without blocking the
+                # event loop:
+                future = self.device.send_nowait(data)
+                try:
+                    sent_msg = await asyncio.wrap_future(future)
+                except Exception:
+                    self.device.cancel_request()
+                    raise
+                self.device._history.append(sent_msg)
+                rsp = await self.rcv(timeout)
+            finally:
+                self.device._lock.release()
+        if ((self.device.has_error() or self.device.has_warning())
+                and data != [0x1b, 0x01]):
+            self.device._raise_error(*await self.info_error())
+        if rsp.data[0] == 0x00 and rsp.data[2] == 0xff:
+            self.device._raise_not_acknowledge(*await self.info_error())
+        return self.device.check_rsp(rsp, data, check, check_dlc)
+
+    async def wait(self, timeout: float = 60) -> None:
+        """Wait till device reports to be not busy anymore.
+
+        Args:
+            timeout: Seconds to wait. 0: wait forever.
+
+        Raises:
+            McsTimeoutException: On timeout while waiting.
+            McsHardwareException: If device reports an error or warning.
+        """
+        self._bind()
+        idle = await self._wait_for(lambda: not self.device.is_busy(),
+                                    timeout or None)
+        if not idle:
+            self.device.mcs.metrics.inc("wait_timeouts", self.device.rsp_id)
+            self.device._log_history_and_raise(
+                McsTimeoutException(
+                    f"{self}: Time-out waiting for busy module: "
+                    f"Status: {bin(self.device.status)}"))
+        if self.device.has_error() or self.device.has_warning():
+            self.device._raise_error(*await self.info_error())
+
+    async def info_error(self) -> (int, int):
+        """Request and return error and warning code."""
+        rsp = await self.send_and_check_rsp(
+            data=[0x1b, 0x01],
+            check=[0x01, None, None, None, None, None, None, None])
+        self.device.error = rsp.data[2] | (rsp.data[3] << 8)
+        self.device.warning = rsp.data[4] | (rsp.data[5] << 8)
+        return self.device.error, self.device.warning
+
+    async def _command(self, data: List[int], timeout: float) -> None:
+        """Send command, check acknowledge and wait if timeout is given."""
+        await self.send_and_check_rsp(data=data, check=[0x00, None, data[0]])
+        if timeout:
+            await self.wait(timeout)
+
+    async def reset(self, reset_mask: int = 0xff, timeout: float = 10) -> None:
+        """Reset device (see McsDevice.reset())."""
+        await self._command([0x1c, reset_mask], timeout)
+
+    async def init(self, cmd_mode: int = 0, timeout: float = 10) -> None:
+        """Initialize device (see McsDevice.init())."""
+        await self._command([0x22, cmd_mode], timeout)
+
+    async def operate(self, cmd_mode: int = 0, timeout: float = 0) -> None:
+        """Send operate command to device (see McsDevice.operate())."""
+        await self._command([0xef, cmd_mode], timeout)
+
+    async def stop(self, cmd_mode: int = 0, timeout: float = 0) -> None:
+        """Stop device activity (see McsDevice.stop())."""
+        await self._command([0x2f, cmd_mode], timeout)
+
+    async def set_port(self, port: int, value: int, length: int,
+                       pulse_time: int = 0, timeout: float = 0) -> None:
+        """Set a port to a specified value (see McsDevice.set_port())."""
+        await self._command(TELEGRAMS[0x40].encode(0x00, port, pulse_time,
+                                                   value, length=length),
+                            timeout)
+
+    async def get_port(self, port: int, signed: bool = False) -> int:
+        """Read the current port value (see McsDevice.get_port())."""
+        rsp = await self.send_and_check_rsp(
+            data=[0x41, port],
+            check=[0x42, None, port, None, None, None, None],
+            check_dlc=False)  # We do not know how many bytes the port holds.
+        return get_value_from_rsp(rsp, offset=4, signed=signed)
+
+    async def set_parameter(self, parameter: int, value: int, length: int = 4
+                            ) -> None:
+        """Set a parameter value (see McsDevice.set_parameter())."""
+        await self.send_and_check_rsp(
+            data=TELEGRAMS[0xde].encode(parameter, value, length=length),
+            check=TELEGRAMS[0xde].ack)
+
+    async def get_parameter(self, parameter: int, signed: bool = False) -> int:
+        """Read the current parameter value (see McsDevice.get_parameter())."""
+        rsp = await self.send_and_check_rsp(
+            data=[0xdb, parameter],
+            check=[0xdc, parameter, None, None, None, None],
+            check_dlc=False)  # We do not know how many bytes the param. holds.
+        return get_value_from_rsp(rsp, offset=2, signed=signed)
+
+
+class AsyncMcs(object):
+    """Asyncio front-end for an Mcs instance.
+
+    Supports use of async with statement (opens and closes the Mcs instance).
+    """
+
+    def __init__(self, mcs_instance: mcs.Mcs) -> None:
+        """Instantiate asynchronous MCS.
+
+        Args:
+            mcs_instance: Mcs instance (opened or not) also usable with the
+                synchronous API.
+        """
+        self.mcs = mcs_instance
+        self._devices: Dict[int, AsyncMcsDevice] = {}
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+        return False
+
+    async def open(self, register: str = "auto") -> None:
+        """Open Mcs instance (in executor, see Mcs.open())."""
+        await asyncio.get_running_loop().run_in_executor(
+            None, self.mcs.open, register)
+
+    async def close(self) -> None:
+        """Close Mcs instance (in executor, see Mcs.close())."""
+        for device in self._devices.values():
+            device.close()
+        self._devices = {}
+        await asyncio.get_running_loop().run_in_executor(None, self.mcs.close)
+
+    def get_device(self, can_id: int) -> AsyncMcsDevice:
+        """Return asynchronous device for registered device with given CAN id.
+
+        Raises:
+            McsException: If device with this CAN Id is not registered.
+        """
+        device = self.mcs.get_device(can_id)
+        async_device = self._devices.get(device.rsp_id)
+        if async_device is None or async_device.device is not device:
+            async_device = AsyncMcsDevice(device)
+            self._devices[device.rsp_id] = async_device
+        return async_device
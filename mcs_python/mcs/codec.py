@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""Telegram codecs of MCS commands.
+
+Layouts of telegrams (data bytes of CAN messages) are declared once in
+TELEGRAMS, keyed by command byte (see cmd_names.py), and compiled to
+struct.Struct instances. Fields are little endian and masked to their size
+(negative values are sent as two's complement):
+
+    data = mcs.codec.TELEGRAMS[0x40].encode(0, port, pulse_time, value,
+                                            length=2)  # set port
+    value = mcs.codec.TELEGRAMS[0x42].decode_value(rsp.data)  # port data
+
+Format characters are those of the struct module, a trailing value of
+variable length (1 to 4 bytes, e.g. port or parameter values) is declared
+with value=True and a 24 bit memory address following the command byte with
+address=True.
+
+Expected response data (e.g. check argument of McsDevice.check_msg()) is
+compiled to an item getter and compared at once (see compile_check()).
+"""
+import functools
+import operator
+import struct
+from typing import Optional, Sequence, Tuple
+
+from mcs.cmd_names import CMD_NAME
+
+_FIELD_MASKS = {"B": 0xff, "H": 0xffff, "I": 0xffffffff}
+
+
+class TelegramCodec(object):
+    """Encoder and decoder of a telegram layout."""
+
+    def __init__(self, cmd: int, fmt: str = "", value: bool = False,
+                 address: bool = False) -> None:
+        """Compile telegram layout.
+
+        Args:
+            cmd: Command byte (data[0]).
+            fmt: Format of fields following the command byte (and address),
+                e.g. "BB" (only B, H and I are supported).
+            value: Telegram ends with a value of variable length (up to 4
+                bytes, see encode() and decode_value()).
+            address: Command byte is followed by a 24 bit address.
+        """
+        self.cmd = cmd
+        self.name = CMD_NAME.get(cmd, f"command {hex(cmd)}")
+        self.address = address
+        head_fmt = "<" + ("I" if address else "B") + fmt
+        self._head = struct.Struct(head_fmt)
+        self._struct = struct.Struct(head_fmt + ("I" if value else ""))
+        self.value_offset = self._head.size if value else None
+        masks = [_FIELD_MASKS[c] for c in fmt + ("I" if value else "")]
+        self._masks = tuple(masks)
+        self.ack = compile_check([0x00, None, cmd])  # Acknowledge expected.
+
+    def __repr__(self) -> str:
+        return f"{self.name} telegram ({self._struct.format})"
+
+    def encode(self, *fields: int, length: Optional[int] = None) -> bytes:
+        """Return telegram data for given fields (without command byte).
+
+        Args:
+            fields: Field values (address first if declared).
+            length: No. of bytes of the trailing value (default: 4).
+        """
+        if self.address:
+            address, *fields = fields
+            cmd = self.cmd | (address & 0xffffff) << 8
+        else:
+            cmd = self.cmd
+        try:
+            data = self._struct.pack(cmd, *fields)
+        except struct.error:  # Out of range, e.g. negative: mask fields.
+            data = self._struct.pack(
+                cmd, *map(operator.and_, fields, self._masks))
+        if length is not None and self.value_offset is not None:
+            return data[:self.value_offset + length]
+        return data
+
+    def decode(self, data: bytes) -> Tuple[int, ...]:
+        """Return fields (without command byte and trailing value).
+
+        Args:
+            data: Telegram data (bytes-like, e.g. can.Message.data).
+
+        Raises:
+            struct.error: If data is too short.
+        """
+        fields = self._head.unpack_from(data)
+        if self.address:
+            return (fields[0] >> 8,) + fields[1:]
+        return fields[1:]
+
+    def decode_value(self, data: Sequence[int], signed: bool = False) -> int:
+        """Return trailing value (of variable length) of telegram data."""
+        return int.from_bytes(data[self.value_offset:], "little",
+                              signed=signed)
+
+
+class TelegramCheck(object):
+    """Expected telegram data compiled to a single comparison (see
+    compile_check()).
+    """
+
+    def __init__(self, check: Sequence[Optional[int]]) -> None:
+        """Compile check (use compile_check() for cached instances)."""
+        self.check = tuple(check)
+        indices = [i for i, c in enumerate(check) if c]
+        self._get = operator.itemgetter(*indices) if indices else None
+        self._expected = operator.itemgetter(*indices)(check) if indices \
+            else None
+
+    def __len__(self) -> int:
+        return len(self.check)
+
+    def __getitem__(self, i):
+        return self.check[i]
+
+    def __repr__(self) -> str:
+        return f"TelegramCheck({list(self.check)})"
+
+    def matches(self, data: Sequence[int]) -> bool:
+        """Return if data holds expected values (None or 0: not checked)."""
+        if self._get is None:
+            return True
+        try:
+            return self._get(data) == self._expected
+        except IndexError:  # Data too short.
+            return False
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_check(check: Tuple[Optional[int], ...]) -> TelegramCheck:
+    return TelegramCheck(check)
+
+
+def compile_check(check: Sequence[Optional[int]]) -> TelegramCheck:
+    """Return (cached) compiled check of expected telegram data.
+
+    Args:
+        check: Expected data bytes, None (or 0) items are not checked, e.g.
+            [0x00, None, 0x40] for the acknowledge of set port (also available
+            as TELEGRAMS[0x40].ack). Compiled checks are returned as is.
+    """
+    if isinstance(check, TelegramCheck):
+        return check
+    return _compile_check(tuple(check))
+
+
+TELEGRAMS = {codec.cmd: codec for codec in [
+    TelegramCodec(0x1b, "B"),  # Info request: info id.
+    TelegramCodec(0x1c, "B"),  # Reset: reset mask.
+    TelegramCodec(0x22, "B"),  # Init: mode.
+    TelegramCodec(0x23, "BIH"),  # Move: mode, position, speed.
+    TelegramCodec(0x25, "BBH"),  # Rotate: mode, direction, speed.
+    TelegramCodec(0x2f, "B"),  # Stop: mode.
+    TelegramCodec(0x40, "BBB", value=True),  # Set port: 0, port, pulse time.
+    TelegramCodec(0x41, "B"),  # Get port: port.
+    TelegramCodec(0x42, "BBB", value=True),  # Port data: status, port, 0.
+    TelegramCodec(0x43, "BBHH"),  # Set port mode: port, mode, valid, idle.
+    TelegramCodec(0x49, "BBB", value=True),  # Set port param.: 0, port, id.
+    TelegramCodec(0x4a, "BBB"),  # Get port parameter: 0, port, parameter.
+    TelegramCodec(0x4b, "BBB", value=True),  # Port param. data: see 0x49.
+    TelegramCodec(0x4c, "BB"),  # Set port zero: 0, port.
+    TelegramCodec(0xdb, "B"),  # Get parameter: parameter.
+    TelegramCodec(0xdc, "B", value=True),  # Parameter data: parameter.
+    TelegramCodec(0xde, "B", value=True),  # Set parameter: parameter.
+    TelegramCodec(0xe2, "H"),  # Set target value: value.
+    TelegramCodec(0xef, "B"),  # Operate: mode.
+    TelegramCodec(0xfb, "B", address=True),  # Get memory: length.
+    TelegramCodec(0xfe, address=True),  # Set memory: followed by data.
+]}
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""Parallel bring-up of hardware devices with dependency ordering.
+
+Start-up sequences (e.g. reset and init, each waiting for the module to be
+not busy anymore) of independent devices run concurrently, a device starts as
+soon as the devices it depends on are up:
+
+    bring_up = mcs.BringUp()
+    bring_up.add(pressure_gen)
+    bring_up.add(valves, after=[pressure_gen])  # Needs pressure.
+    for laser in lasers:
+        bring_up.add(laser, steps=["initialize",
+                                   ("operate", lambda d: d.operate(1))])
+    results = bring_up.run()
+    print(bring_up.report())
+
+Bringing up many independent devices takes about as long as the slowest one.
+A device whose dependency failed is not started (see BringUpResult.error).
+"""
+import concurrent.futures
+import functools
+import logging
+import time
+from typing import (Callable, Dict, Iterable, List, Optional, Sequence, Tuple,
+                    Union)
+
+import mcs
+
+log = logging.getLogger(__name__)
+
+# Step: Name of a method of the device called without arguments (e.g. "init")
+# or name and function called with the device.
+Step = Union[str, Tuple[str, Callable[["mcs.HardwareDevice"], None]]]
+
+
+class BringUpResult(object):
+    """Timing breakdown and outcome of the bring-up of a device.
+
+    Attributes:
+        device: HardwareDevice.
+        steps: Seconds taken by each finished step by step name.
+        waited: Seconds waited for the devices it depends on.
+        start: Time (time.monotonic()) the first step started (None if not
+            started).
+        end: Time (time.monotonic()) the device has been done (or failed).
+        error: Exception of the failed step (or McsException if a dependency
+            failed). None on success.
+    """
+
+    def __init__(self, device: "mcs.HardwareDevice") -> None:
+        self.device = device
+        self.steps: Dict[str, float] = {}
+        self.waited = 0.0
+        self.start: Optional[float] = None
+        self.end: Optional[float] = None
+        self.error: Optional[Exception] = None
+
+    def __repr__(self) -> str:
+        steps = ", ".join(f"{name} {seconds:.3f} s"
+                          for name, seconds in self.steps.items())
+        state = "ok" if self.error is None else f"failed: {self.error}"
+        return (f"{self.device}: {state} (waited {self.waited:.3f} s"
+                f"{', ' + steps if steps else ''})")
+
+    @property
+    def ok(self) -> bool:
+        return self.end is not None and self.error is None
+
+    @property
+    def duration(self) -> float:
+        """Seconds from the first step to done (without waiting)."""
+        if self.start is None or self.end is None:
+            return 0.0
+        return self.end - self.start
+
+
+class BringUp(object):
+    """Brings up devices concurrently in order of their dependencies."""
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        """Instantiate bring-up.
+
+        Args:
+            max_workers: Max. no. of devices brought up at the same time.
+                Default: All devices.
+        """
+        self.max_workers = max_workers
+        self._steps: Dict["mcs.HardwareDevice", List[Step]] = {}
+        self._after: Dict["mcs.HardwareDevice",
+                          List["mcs.HardwareDevice"]] = {}
+        self.results: Dict["mcs.HardwareDevice", BringUpResult] = {}
+        self.duration = 0.0  # Seconds taken by last run().
+
+    def add(self, device: "mcs.HardwareDevice",
+            steps: Optional[Sequence[Step]] = None,
+            after: Iterable["mcs.HardwareDevice"] = ()) -> None:
+        """Add device to be brought up.
+
+        Args:
+            device: HardwareDevice.
+            steps: Steps run one after the other (see Step), e.g.
+                ["reset", "init"]. Default: ["startup"].
+            after: Devices to be up before this device is started (must be
+                added, too).
+        """
+        self._steps[device] = list(steps or ["startup"])
+        self._after[device] = list(after)
+
+    def run(self) -> Dict["mcs.HardwareDevice", BringUpResult]:
+        """Bring up all added devices.
+
+        Returns:
+            results: Result by device (see BringUpResult.ok).
+
+        Raises:
+            McsException: If a dependency is not added or dependencies are
+                cyclic (no device is started).
+        """
+        self._check_dependencies()
+        self.results = {device: BringUpResult(device)
+                        for device in self._steps}
+        waiting = dict(self._after)
+        running = {}
+        start = time.monotonic()
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_workers or max(1, len(waiting)),
+                thread_name_prefix=__name__) as executor:
+            while waiting or running:
+                pending = len(waiting)
+                for device, after in list(waiting.items()):
+                    results = [self.results[d] for d in after]
+                    if any(r.error is not None for r in results):
+                        failed = [r.device for r in results if r.error]
+                        self._fail(device, mcs.McsException(
+                            f"{device}: Not started, dependencies failed: "
+                            f"{failed}"))
+                        del waiting[device]
+                    elif all(r.ok for r in results):
+                        del waiting[device]
+                        self.results[device].waited = (time.monotonic()
+                                                       - start)
+                        running[executor.submit(self._bring_up, device)
+                                ] = device
+                if not running:
+                    if len(waiting) == pending:  # No progress possible.
+                        for device in waiting:
+                            self._fail(device, mcs.McsException(
+                                f"{device}: Not started, dependencies not "
+                                f"done"))
+                        waiting = {}
+                    continue  # Failed dependencies propagated.
+                done, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    device = running.pop(future)
+                    result = self.results[device]
+                    if future.exception() is not None:
+                        self._fail(device, future.exception())
+                    elif result.end is None:
+                        self._fail(device, mcs.McsException(
+                            f"{device}: Bring-up did not finish"))
+        self.duration = time.monotonic() - start
+        failed = [r for r in self.results.values() if not r.ok]
+        log.info(f"Brought up {len(self.results) - len(failed)} of "
+                 f"{len(self.results)} devices in {self.duration:.3f} s")
+        return self.results
+
+    def report(self) -> str:
+        """Return timing breakdown of last run() (one line per device)."""
+        lines = [f"Bring-up of {len(self.results)} devices: "
+                 f"{self.duration:.3f} s"]
+        lines += [f"  {result}" for result in sorted(
+            self.results.values(), key=lambda r: r.end or 0.0)]
+        return "\n".join(lines)
+
+    def _check_dependencies(self) -> None:
+        for device, after in self._after.items():
+            missing = [d for d in after if d not in self._steps]
+            if missing:
+                raise mcs.McsException(
+                    f"{device}: Dependencies not added: {missing}")
+        done = set()
+        remaining = dict(self._after)
+        while remaining:
+            ready = [d for d, after in remaining.items()
+                     if all(a in done for a in after)]
+            if not ready:
+                raise mcs.McsException(
+                    f"Cyclic dependencies of {list(remaining)}")
+            for device in ready:
+                done.add(device)
+                del remaining[device]
+
+    def _fail(self, device: "mcs.HardwareDevice", exc: Exception) -> None:
+        result = self.results[device]
+        result.error = exc
+        result.end = time.monotonic()
+        log.error(exc if result.start is None
+                  else f"{device}: Bring-up failed: {exc}")
+
+    def _bring_up(self, device: "mcs.HardwareDevice") -> None:
+        """Run steps of device (worker thread, any exception fails the
+        device)."""
+        result = self.results[device]
+        result.start = time.monotonic()
+        for step in self._steps[device]:
+            name = step if isinstance(step, str) else step[0]
+            step_start = time.monotonic()
+            try:
+                if isinstance(step, str):
+                    func = getattr(device, step)
+                else:
+                    func = functools.partial(step[1], device)
+                func()
+            except Exception as exc:
+                result.steps[name] = time.monotonic() - step_start
+                self._fail(device, exc)
+                return
+            result.steps[name] = time.monotonic() - step_start
+        result.end = time.monotonic()
+        log.debug(result)
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""Bulk configuration of device parameters: snapshot, diff, apply, restore.
+
+Instead of writing a fixed list of parameters one round trip at a time, the
+parameters of several devices are read in a single pass, compared with the
+desired configuration and only the differences are written and verified:
+
+    devices = [tec, gas_mix]
+    snapshot, errors = mcs.devices.configuration.snapshot(devices)
+    save_snapshot("rig.json", snapshot)
+    written, errors = apply({tec: {"temperature target": 37.0}}, snapshot)
+    ...
+    restore(devices, load_snapshot("rig.json"))
+
+Requests are pipelined across devices: in each round one request is sent to
+every device back-to-back before the responses are collected (like
+Mcs.send_and_check_rsp_group()), so a pass over many devices takes about as
+long as the device with the most parameters. Requests to the same device stay
+sequential (one outstanding request per device, acknowledges of set parameter
+do not carry the parameter id).
+
+Snapshots hold raw values by parameter name and device (CAN id):
+
+    {"time": ..., "devices": {"0x021": {"name": "...", "parameters": {
+        "temperature target": 3700, ...}}}}
+"""
+import json
+import logging
+import os
+import time
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import mcs
+from mcs.codec import TELEGRAMS
+from mcs.mcs import _collect_group, _send_group
+from mcs.mcsdevice import get_value_from_rsp
+
+log = logging.getLogger(__name__)
+
+Config = Dict[Union[str, int, mcs.DataPort], float]  # Values by parameter.
+
+
+def _device_label(device: mcs.HardwareDevice) -> str:
+    return f"0x{device.rsp_id:03x}"
+
+
+def _run_rounds(jobs: Dict[mcs.HardwareDevice, List[Tuple[list, list]]],
+                timeout: float
+                ) -> Tuple[Dict[mcs.HardwareDevice, list],
+                           Dict[mcs.HardwareDevice, Exception]]:
+    """Send requests (data, check) of all devices round by round.
+
+    Returns:
+        responses: Checked responses (in order of the requests) by device.
+        errors: First exception by device (following requests of the device
+            are not sent).
+    """
+    responses = {device: [] for device in jobs}
+    errors = {}
+    pending = {device: list(requests) for device, requests in jobs.items()
+               if requests}
+    while pending:
+        requests = {device: requests.pop(0)
+                    for device, requests in pending.items()}
+        sent, round_errors = _send_group(
+            {device: data for device, (data, _) in requests.items()},
+            lambda device: device._device)
+        results = _collect_group(
+            sent, {device: data for device, (data, _) in requests.items()},
+            time.monotonic() + timeout,
+            {device: check for device, (_, check) in requests.items()},
+            False, round_errors)
+        for device, rsp in results.items():
+            responses[device].append(rsp)
+        errors.update(round_errors)
+        pending = {device: requests for device, requests in pending.items()
+                   if requests and device not in errors}
+    return responses, errors
+
+
+def _read_jobs(params: Dict[mcs.HardwareDevice, List[mcs.DataPort]]
+               ) -> Dict[mcs.HardwareDevice, List[Tuple[list, list]]]:
+    return {device: [([0xdb, param.id], [0xdc, param.id]) for param in ps]
+            for device, ps in params.items()}
+
+
+def _readable_parameters(device: mcs.HardwareDevice) -> Dict[str,
+                                                             mcs.DataPort]:
+    return {name: param for name, param in device.parameters.items()
+            if param.read_access}
+
+
+def read_parameters(params: Dict[mcs.HardwareDevice, Dict[str, mcs.DataPort]],
+                    timeout: float = mcs.mcsbus.CAN_TIMEOUT
+                    ) -> Tuple[Dict[mcs.HardwareDevice, Dict[str, int]],
+                               Dict[mcs.HardwareDevice, Exception]]:
+    """Read raw parameter values of devices (pipelined across devices).
+
+    Args:
+        params: Parameters by name to be read by device.
+        timeout: Max. seconds to wait for the responses of a round.
+
+    Returns:
+        values: Raw values by parameter name by device (missing for devices
+            with error).
+        errors: Exception by device.
+    """
+    responses, errors = _run_rounds(
+        _read_jobs({d: list(ps.values()) for d, ps in params.items()}),
+        timeout)
+    values = {}
+    for device, ps in params.items():
+        if device not in errors:
+            values[device] = {
+                name: get_value_from_rsp(rsp, offset=2, signed=param.signed)
+                for (name, param), rsp in zip(ps.items(), responses[device])}
+    return values, errors
+
+
+def snapshot(devices: Iterable[mcs.HardwareDevice],
+             timeout: float = mcs.mcsbus.CAN_TIMEOUT
+             ) -> Tuple[dict, Dict[mcs.HardwareDevice, Exception]]:
+    """Read all readable parameters of devices (see module doc).
+
+    Returns:
+        snapshot: Raw values by parameter name and device (CAN id).
+        errors: Exception by device (device missing in snapshot).
+    """
+    devices = list(devices)
+    values, errors = read_parameters(
+        {device: _readable_parameters(device) for device in devices}, timeout)
+    result = {"time": time.time(), "devices": {}}
+    for device in devices:
+        if device in values:
+            result["devices"][_device_label(device)] = {
+                "name": device.name, "parameters": values[device]}
+    return result, errors
+
+
+def save_snapshot(path: str, snapshot_: dict) -> None:
+    """Write snapshot to JSON file (replaced atomically)."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(snapshot_, f, indent=2)
+    os.replace(tmp_path, path)
+    log.debug(f"Snapshot of {len(snapshot_['devices'])} devices written to "
+              f"{path}")
+
+
+def load_snapshot(path: str) -> dict:
+    """Return snapshot from JSON file (see save_snapshot())."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def diff(device: mcs.HardwareDevice, config: Config,
+         current: Optional[Dict[str, int]], raw: bool = False
+         ) -> Dict[str, int]:
+    """Return raw values of parameters differing from current values.
+
+    Args:
+        device: HardwareDevice.
+        config: Desired values by parameter (name, id or Parameter).
+        current: Current raw values by parameter name (e.g. from snapshot).
+            Parameters missing here are returned, too.
+        raw: Values of config are raw values (not user units).
+
+    Returns:
+        differences: Raw values by parameter name to be written.
+    """
+    current = current or {}
+    differences = {}
+    for param, value in config.items():
+        param = device._get_param_instance(param)
+        name = device.get_param_name_by_id(param.id)
+        raw_value = int(value) if raw else param.convert_to_raw(value)
+        if current.get(name) != raw_value:
+            differences[name] = raw_value
+    return differences
+
+
+def apply(configs: Dict[mcs.HardwareDevice, Config],
+          snapshot_: Optional[dict] = None, raw: bool = False,
+          verify: bool = True, timeout: float = mcs.mcsbus.CAN_TIMEOUT
+          ) -> Tuple[Dict[mcs.HardwareDevice, Dict[str, int]],
+                     Dict[mcs.HardwareDevice, Exception]]:
+    """Write parameters differing from current values (see module doc).
+
+    Args:
+        configs: Desired values by parameter (name, id or Parameter) by
+            device.
+        snapshot_: Current values (see snapshot()). Default: Readable
+            parameters of configs are read first (write-only parameters are
+            always written).
+        raw: Values of configs are raw values (not user units).
+        verify: Read back written parameters (except write-only ones).
+        timeout: Max. seconds to wait for the responses of a round.
+
+    Returns:
+        written: Written raw values by parameter name by device.
+        errors: Exception by device (e.g. McsException if verification
+            failed).
+    """
+    if snapshot_ is None:
+        params = {device: {name: device.parameters[name]
+                           for name in diff(device, config, None, raw)
+                           if device.parameters[name].read_access}
+                  for device, config in configs.items()}
+        current, errors = read_parameters(params, timeout)
+    else:
+        current = {device: snapshot_["devices"].get(
+            _device_label(device), {}).get("parameters", {})
+            for device in configs}
+        errors = {}
+    differences = {device: diff(device, config, current.get(device), raw)
+                   for device, config in configs.items()
+                   if device not in errors}
+    jobs = {}
+    for device, values in differences.items():
+        jobs[device] = []
+        for name, value in values.items():
+            param = device.parameters[name]
+            jobs[device].append((TELEGRAMS[0xde].encode(
+                param.id, value, length=param.len), TELEGRAMS[0xde].ack))
+    _, write_errors = _run_rounds(jobs, timeout)
+    errors.update(write_errors)
+    written = {device: values for device, values in differences.items()
+               if device not in errors}
+    log.info(f"Wrote {sum(len(v) for v in written.values())} parameters of "
+             f"{len(written)} devices")
+    if verify:
+        read, read_errors = read_parameters(
+            {device: {name: device.parameters[name] for name in values
+                      if device.parameters[name].read_access}
+             for device, values in written.items()}, timeout)
+        errors.update(read_errors)
+        for device, values in read.items():
+            mismatch = {name: value for name, value in values.items()
+                        if value != written[device][name]}
+            if mismatch:
+                errors[device] = mcs.McsException(
+                    f"{device}: Verification failed for {mismatch} (written: "
+                    f"{ {n: written[device][n] for n in mismatch} })")
+        written = {device: values for device, values in written.items()
+                   if device not in errors}
+    return written, errors
+
+
+def restore(devices: Iterable[mcs.HardwareDevice], snapshot_: dict,
+            current: Optional[dict] = None, verify: bool = True,
+            timeout: float = mcs.mcsbus.CAN_TIMEOUT
+            ) -> Tuple[Dict[mcs.HardwareDevice, Dict[str, int]],
+                       Dict[mcs.HardwareDevice, Exception]]:
+    """Write parameters of snapshot differing from current values.
+
+    Args:
+        devices: Devices to be restored (others in snapshot are ignored).
+        snapshot_: Snapshot to be restored (see snapshot()).
+        current: Snapshot of current values. Default: Read first.
+        verify: Read back written parameters.
+        timeout: Max. seconds to wait for the responses of a round.
+
+    Returns:
+        written: See apply().
+        errors: See apply().
+    """
+    configs = {}
+    for device in devices:
+        saved = snapshot_["devices"].get(_device_label(device))
+        if saved is not None:
+            configs[device] = {name: value for name, value
+                               in saved["parameters"].items()
+                               if name in device.parameters}
+    return apply(configs, current, raw=True, verify=verify, timeout=timeout)
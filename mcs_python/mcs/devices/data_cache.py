@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""Read-through cache of port and parameter values of hardware devices.
+
+Opt-in for a HardwareDevice (see HardwareDevice.enable_cache()):
+
+    tec = mcs.TEC(can_mcs.get_device(0x41a))
+    tec.enable_cache()
+    tec.read_parameter("temperature target")  # Read from device.
+    tec.read_parameter("temperature target")  # Cached.
+
+How long a value is cached is given by its DataPort (see DataPort.cache_ttl):
+volatile ports (e.g. sensor values) and RAM parameters are not cached by
+default, FRAM parameters are cached until they are written or the device is
+reset or initialized. The cache listens to the acknowledges of the device, so
+writes by other code (e.g. McsDevice.set_parameter()) invalidate the value,
+too.
+"""
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import can
+
+import mcs
+from mcs.mcsdevice import STATUS_NOT_INIT
+
+log = logging.getLogger(__name__)
+
+PORT = "port"
+PARAMETER = "parameter"
+
+
+class DataCache(object):
+    """Cache of raw port and parameter values keyed by (device, kind, id).
+
+    May be shared by several devices. Thread-safe.
+
+    Attributes:
+        hits: No. of reads served from cache.
+        misses: No. of reads of cacheable values from the device.
+        bypasses: No. of reads of values not to be cached.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # Raw value and time (time.monotonic()) of reading by key:
+        self._values: Dict[Tuple[int, str, int], Tuple[int, float]] = {}
+        self._listeners: Dict[int, Callable[[can.Message], None]] = {}
+        self._generation = 0  # Incremented on each invalidation.
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def read(self, device: mcs.McsDevice, kind: str,
+             data_port: mcs.DataPort, read: Callable[[], int]) -> int:
+        """Return cached raw value or read (and cache) it.
+
+        Args:
+            device: Device the value belongs to.
+            kind: PORT or PARAMETER.
+            data_port: Port or parameter (defines TTL, see
+                DataPort.cache_ttl).
+            read: Reads the raw value from the device.
+        """
+        ttl = data_port.cache_ttl
+        if ttl <= 0:
+            self.bypasses += 1
+            return read()
+        key = (device.rsp_id, kind, data_port.id)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is not None and now - entry[1] <= ttl:
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            generation = self._generation
+        value = read()
+        with self._lock:
+            if generation == self._generation:  # Not invalidated meanwhile.
+                self._values[key] = (value, now)
+        return value
+
+    def get(self, device: mcs.McsDevice, kind: str, data_port: mcs.DataPort
+            ) -> Optional[int]:
+        """Return cached raw value (None if not cached or expired)."""
+        ttl = data_port.cache_ttl
+        if ttl <= 0:
+            return None
+        with self._lock:
+            entry = self._values.get((device.rsp_id, kind, data_port.id))
+            if entry is not None and time.monotonic() - entry[1] <= ttl:
+                self.hits += 1
+                return entry[0]
+        return None
+
+    def put(self, device: mcs.McsDevice, kind: str, data_port: mcs.DataPort,
+            value: int) -> None:
+        """Cache raw value just read from device (e.g. by a group request).
+        """
+        if data_port.cache_ttl > 0:
+            with self._lock:
+                self.misses += 1
+                self._values[(device.rsp_id, kind, data_port.id)] = (
+                    value, time.monotonic())
+
+    def invalidate(self, device: Optional[mcs.McsDevice] = None,
+                   kind: Optional[str] = None, data_id: Optional[int] = None
+                   ) -> None:
+        """Discard cached values (all by default).
+
+        Args:
+            device: Discard values of this device only.
+            kind: Discard ports (PORT) or parameters (PARAMETER) only.
+            data_id: Discard port or parameter with this id only.
+        """
+        can_id = None if device is None else device.rsp_id
+        with self._lock:
+            self._generation += 1
+            self._values = {
+                key: entry for key, entry in self._values.items()
+                if not ((can_id is None or key[0] == can_id)
+                        and (kind is None or key[1] == kind)
+                        and (data_id is None or key[2] == data_id))}
+
+    def stats(self) -> dict:
+        """Return hit/miss statistics."""
+        reads = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses,
+                "bypasses": self.bypasses, "size": len(self._values),
+                "hit_ratio": self.hits / reads if reads else 0.0}
+
+    def attach(self, device: mcs.McsDevice) -> None:
+        """Invalidate values of device on its reset, init and write
+        acknowledges (see detach())."""
+        if device.rsp_id not in self._listeners:
+            listener = self._listeners[device.rsp_id] = (
+                lambda msg: self._on_msg(device, msg))
+            device.add_listener(listener)
+
+    def detach(self, device: mcs.McsDevice) -> None:
+        """Stop listening to device (see attach())."""
+        listener = self._listeners.pop(device.rsp_id, None)
+        if listener is not None:
+            device.remove_listener(listener)
+
+    def _on_msg(self, device: mcs.McsDevice, msg: can.Message) -> None:
+        """Invalidate values changed by acknowledged command (reader thread).
+        """
+        if msg.data[0] != 0x00:
+            return
+        cmd = msg.data[2]
+        if cmd in (0x1c, 0x22) or (cmd == 0x00
+                                   and msg.data[1] & STATUS_NOT_INIT):
+            self.invalidate(device)  # Reset, init or reboot of module.
+        elif cmd in (0x40, 0xde):
+            request = device.request
+            if request is not None and request.response is msg:
+                if cmd == 0x40:
+                    self.invalidate(device, PORT, request.data[2])
+                else:
+                    self.invalidate(device, PARAMETER, request.data[1])
@@ -1,246 +1,246 @@
-# -*- coding: utf-8 -*-
-
-class CanErrors(object):
-    BUS_ERRORS = {
-        0x00000000: 'No error',
-        0x00000001: 'Unknown error',
-        0x00000002: 'Wrong parameter values or param itself',
-        0x00000004: 'Resource (fifo, client, timeout) failed',
-        0x00000008: 'Client handle failed',
-        0x00000010: 'No more net handles available',
-        0x00000020: 'Net handle  already in use',
-        0x00000040: 'Net configuration failed',
-        0x00000080: 'Hardware handle failed',
-        0x00000100: 'Hardware already in use',
-        0x00000200: 'Driver problem',
-        0x00000400: 'Register-test of 82C200/SJA1000 failed',
-        0x00000800: 'Buffer of the controller is overrun',
-        0x00001000: 'Controller read out to late',
-        0x00002000: 'Queue read out to late',
-        0x00004000: 'Bus error 1 (bus light)',
-        0x00008000: 'Bus error 2 (bus heavy)',
-        0x00010000: 'Bus error 3 (bus off)',
-        0x02000000: 'Can message processing failed',
-        0x04000000: 'Module init flag lost',
-        0x08000000: 'Module serial number invalid',
-        0x10000000: 'Module timeout reached',
-        0x20000000: 'Invalid can-communication device',
-        0x40000000: 'Invalid can-id',
-        0x80000000: 'Internal error',
-    }
-    MODULE_ERRORS = {
-        # generic errors
-        0x0000: "None",
-        0x0001: 'CAN timeout',
-        0x0002: 'CAN overrun',
-        0x0003: 'CAN send failed',
-        0x0004: 'Invalid command id',
-        0x0005: 'Module not initialized',
-        0x0006: 'Invalid init',
-        0x0007: 'Error while info request',
-        0x0008: 'Data length invalid (buffer DLC)',
-        0x0009: 'Invalid sensor',
-        0x000A: 'Parameter unknown',
-        0x000B: 'FRAM access failed',
-        0x000C: 'Parameter range invalid',
-        0x000D: 'Parameter length invalid',
-        0x000E: 'Invalid reset level',
-        0x000F: 'Invalid execution group',
-        0x0010: 'Invalid serial parity',
-        0x0011: 'Invalid port',
-        0x0012: 'Invalid port mode',
-        0x0013: 'Serial communication overrun',
-        0x0014: 'Serial communication timeout',
-        0x0015: 'Invalid module address',
-        0x0016: 'Module not configured',
-        0x0017: 'Invalid port operation',
-        0x0018: 'Invalid position',
-        0x0019: 'Invalid speed',
-        0x001A: 'Invalid serial frame',
-        0x001B: 'No init pattern found',
-        0x001C: 'Not turning, rotating',
-        0x001D: 'Stepper tolerance overstep',
-        0x001E: 'Invalid port limit number',
-        0x001F: 'Invalid command byte',
-        0x0020: 'Serial communication invalid checksum (CRC error)',
-        0x0021: 'Invalid port configuration',
-        0x0022: 'Function is not allowed',
-        0x0023: 'Invalid off photo sensor',
-        0x0024: 'Invalid on photo sensor',
-        0x0025: 'Backlash overrun',
-        # I2C communication
-        0x0026: 'I2C acknowledge timeout',
-        0x0027: 'I2C address timeout',
-        0x0028: 'I2C bus error',
-        0x0029: 'I2C cont timeout',
-        0x002A: 'I2C stop timeout',
-        0x002B: 'I2C busy timeout',
-        0x002C: 'I2C write timeout',
-        0x002D: 'I2C read timeout',
-        # DS1820 (Dallas 1?Wire Digital Thermometer)
-        0x0030: 'DS1820 thermometer channel select error',
-        0x0031: 'DS1820 thermometer communication checksum error (CRC)',
-        0x0032: 'DS1820 thermometer bridge configuration error',
-        0x0033: 'DS1820 thermometer bridge reset error',
-        # laser errors
-        0x0040: 'Laser busy timeout',
-        0x0041: 'Laser silent timeout',
-        0x0042: 'Laser error report',
-        0x0043: 'Laser prompt off timeout',
-        0x0044: 'Laser prompt off error',
-        0x0045: 'Laser echo off timeout',
-        0x0046: 'Laser echo off error',
-        0x0047: 'Laser on timeout',
-        0x0048: 'Laser on error',
-        0x0049: 'Laser set power timeout',
-        0x004A: 'Laser set power error',
-        0x004B: 'Laser off timeout',
-        0x004C: 'Laser off error',
-        0x004D: 'Laser get temperature timeout',
-        0x004E: 'Laser get temperature error',
-        0x004F: 'Laser on query timeout',
-        0x0050: 'Laser on query error',
-        0x0051: 'Laser power query timeout',
-        0x0052: 'Laser echo error',
-        0x0053: 'Laser prompt error',
-        0x0054: 'Laser query hours error',
-        0x0055: 'Laser get power timeout',
-        0x0056: 'Laser get power error',
-        0x0057: 'Laser get version timeout',
-        0x0058: 'Laser get version error',
-        0x0059: 'Laser undefined',
-        0x005A: 'Laser send timeout',
-        0x005B: 'Laser rec. timeout',
-        0x005C: 'Laser syntax error',
-        0x005D: 'Laser rec. overrun',
-        0x005E: 'Laser temperature overrun',
-        0x005F: 'Laser measure error',
-        0x0060: 'Laser unknown error',
-        0x0061: 'Laser unknown error',
-        0x0062: 'Laser unknown error',
-        0x0063: 'Laser unknown error',
-        # TEC unit
-        0x0081: 'Maximal temperature exceeded',
-        0x0082: 'Maximal temperature gradient exceeded',
-        0x0083: 'TEC element is cooling instead of heating',
-        0x0084: 'TEC element is heating instead of cooling',
-        0x0085: 'Maximal TEC element current exceeded',
-        0x0086: 'Temperature was not set before operate',
-        0x0087: 'Error on temperature sensor 1 (DS0, TEC element cold)',
-        0x0088: 'Error on temperature sensor 2 (DS1)',
-        0x0089: 'Error on temperature sensor 3 (DS2, TEC element hot)',
-        0x008A: 'Error on temperature sensor 4 (DS3, chamber)',
-        0x008B: 'Error on temperature sensor 5 (DS4)',
-        0x008C: 'Error on temperature sensor 6 (DS5)',
-        0x008D: 'Error on temperature sensor 7 (DS6)',
-        0x008E: 'Error on temperature sensor 8 (DS7)',
-        0x008F: 'Error on temperature IR sensor 1',
-        0x0090: 'Error on temperature IR sensor 2',
-        0x0091: 'Error PIC did not answer',
-        0x0092: 'Sensor required for this operation mode is not configured',
-        0x0093: 'No current detected while driver stage active',
-        0x0094: 'Fan is on but no current detected',
-        0x0095: 'Ambient fan 1 (pcb center) is on but no speedometer pulses '
-                'detected',
-        0x0096: 'Ambient fan 2 (pcb edge) is on but no speedometer pulses '
-                'detected',
-        # needle arm errors
-        0x0101: 'Position not allowed',
-        0x0102: 'Invalid servo command',
-        0x0103: 'Servo controller error',
-        0x0104: 'Servo communication timeout',
-        0x0105: 'Servo communication error',
-        0x0106: 'Liquid detector qt300 error',
-        0x0107: 'Rack detection failed. First bar is to small',
-        0x0108: 'Rack detection failed. Bar is invalid',
-        0x0109: 'Invalid bottom sensor state',
-        0x010A: 'Invalid bottom sensor value',
-        # laser module errors
-        0x0201: 'Temperature control not available',
-        # pump errors
-        0x0301: 'Initialization failed',
-        0x0302: 'Command invalid',
-        0x0303: 'Operand invalid',
-        0x0304: 'Command Sequence invalid',
-        0x0305: 'Fluid detection failed',
-        0x0306: 'EEPROM error',
-        0x0307: 'Device not initialized',
-        0x0308: 'Unknown error 1',
-        0x0309: 'Plunger overload',
-        0x030A: 'Valve overload',
-        0x030B: 'Plunger-movement not allowed',
-        0x030C: 'Unknown error 2',
-        0x030D: 'Unknown error 3',
-        0x030E: 'Unknown error 4',
-        0x030F: 'Command overflow',
-        0x0310: 'Serial crc error',
-        0x0311: 'Liquid sensor error',
-        # cartridge pressure control unit
-        0x0701: 'Timeout during pressurizing',
-        0x0702: 'Pump not running while activated (no speedometer pulse)',
-        # fpga
-        0x0706: 'FPGA error overrun',
-        0x0707: 'FPGA error double byte 2',
-        0x0708: 'FPGA error double byte 1',
-        0x0709: 'FPGA error state machine',
-        0x070A: 'FPGA error parity',
-        0x070B: 'FPGA error framing',
-        0x070C: 'FPGA error timeout',
-        0x070D: 'FPGA error data rate too high',
-        # tiny sampler errors
-        0x0901: 'Position not allowed',
-        0x0902: 'Invalid command',
-        0x0903: 'Servo controller error',
-        0x0904: 'Servo motor off',
-        # big sampler errors
-        0x0A01: 'Position not allowed',
-        0x0A02: 'Invalid command',
-        0x0A03: 'Servo controller error',
-        0x0A04: 'Servo motor off',
-        0x0A05: 'Latch module not initialized',
-        0x0A06: 'Latch position not allowed',
-        0x0A07: 'Shaker module not initialized',
-        0x0A08: 'Shaker position not allowed',
-        0x0A09: 'Clamping failed',
-        0x0A0A: 'Servo position invalid',
-        # special camera errors
-        0x0B01: 'Configure FPGA timeout',
-        0x0B02: 'DLL lock timeout',
-        0x0B03: 'Camera power up timeout',
-        0x0B04: 'DLL lock lost',
-        0x0B11: 'i2c error',
-        0x0B12: 'i2c error',
-        0x0B13: 'i2c error',
-        0x0B21: 'i2c error',
-        0x0B22: 'i2c error',
-        0x0B23: 'i2c error',
-        0x0B31: 'i2c error',
-        0x0B32: 'i2c error',
-        0x0B33: 'i2c error',
-        0x0B41: 'i2c error',
-        0x0B42: 'i2c error',
-        0x0B43: 'i2c error',
-        # solenoid and strobe errors
-        0x140B: 'High solenoid temperature',
-        0x240B: 'High solenoid 2 temperature',
-        0x340B: 'Long strobe pulse',
-        0x440B: 'Low solenoid current',
-        0x540B: 'Low solenoid 2 current',
-        0x640B: 'Long solenoid pulse',
-        0x740B: 'Long solenoid 2 pulse',
-        0x840B: 'Current change while active',
-        0x940B: 'No solenoid temperature sensor',
-        0xA40B: 'No solenoid 2 temperature sensor',
-        0xB40B: 'High solenoid trigger frequency',
-        0xC40B: 'High solenoid 2 trigger frequency',
-        0xD40B: 'High strobe trigger frequency',
-        # gas mix block/chamber
-        0x0185: 'Aeration invalid fluid media configuration',
-        0x0186: 'Aeration no filling flow or leakage',
-        0x0187: 'Pressure sensor i2c error',
-        0x0188: 'Aeration no emptying flow',
-    }
-    MODULE_WARNINGS = {
-        # generic warnings
-        0x0000: "No warning",
-    }
+# -*- coding: utf-8 -*-
+
+class CanErrors(object):
+    BUS_ERRORS = {
+        0x00000000: 'No error',
+        0x00000001: 'Unknown error',
+        0x00000002: 'Wrong parameter values or param itself',
+        0x00000004: 'Resource (fifo, client, timeout) failed',
+        0x00000008: 'Client handle failed',
+        0x00000010: 'No more net handles available',
+        0x00000020: 'Net handle  already in use',
+        0x00000040: 'Net configuration failed',
+        0x00000080: 'Hardware handle failed',
+        0x00000100: 'Hardware already in use',
+        0x00000200: 'Driver problem',
+        0x00000400: 'Register-test of 82C200/SJA1000 failed',
+        0x00000800: 'Buffer of the controller is overrun',
+        0x00001000: 'Controller read out to late',
+        0x00002000: 'Queue read out to late',
+        0x00004000: 'Bus error 1 (bus light)',
+        0x00008000: 'Bus error 2 (bus heavy)',
+        0x00010000: 'Bus error 3 (bus off)',
+        0x02000000: 'Can message processing failed',
+        0x04000000: 'Module init flag lost',
+        0x08000000: 'Module serial number invalid',
+        0x10000000: 'Module timeout reached',
+        0x20000000: 'Invalid can-communication device',
+        0x40000000: 'Invalid can-id',
+        0x80000000: 'Internal error',
+    }
+    MODULE_ERRORS = {
+        # generic errors
+        0x0000: "None",
+        0x0001: 'CAN timeout',
+        0x0002: 'CAN overrun',
+        0x0003: 'CAN send failed',
+        0x0004: 'Invalid command id',
+        0x0005: 'Module not initialized',
+        0x0006: 'Invalid init',
+        0x0007: 'Error while info request',
+        0x0008: 'Data length invalid (buffer DLC)',
+        0x0009: 'Invalid sensor',
+        0x000A: 'Parameter unknown',
+        0x000B: 'FRAM access failed',
+        0x000C: 'Parameter range invalid',
+        0x000D: 'Parameter length invalid',
+        0x000E: 'Invalid reset level',
+        0x000F: 'Invalid execution group',
+        0x0010: 'Invalid serial parity',
+        0x0011: 'Invalid port',
+        0x0012: 'Invalid port mode',
+        0x0013: 'Serial communication overrun',
+        0x0014: 'Serial communication timeout',
+        0x0015: 'Invalid module address',
+        0x0016: 'Module not configured',
+        0x0017: 'Invalid port operation',
+        0x0018: 'Invalid position',
+        0x0019: 'Invalid speed',
+        0x001A: 'Invalid serial frame',
+        0x001B: 'No init pattern found',
+        0x001C: 'Not turning, rotating',
+        0x001D: 'Stepper tolerance overstep',
+        0x001E: 'Invalid port limit number',
+        0x001F: 'Invalid command byte',
+        0x0020: 'Serial communication invalid checksum (CRC error)',
+        0x0021: 'Invalid port configuration',
+        0x0022: 'Function is not allowed',
+        0x0023: 'Invalid off photo sensor',
+        0x0024: 'Invalid on photo sensor',
+        0x0025: 'Backlash overrun',
+        # I2C communication
+        0x0026: 'I2C acknowledge timeout',
+        0x0027: 'I2C address timeout',
+        0x0028: 'I2C bus error',
+        0x0029: 'I2C cont timeout',
+        0x002A: 'I2C stop timeout',
+        0x002B: 'I2C busy timeout',
+        0x002C: 'I2C write timeout',
+        0x002D: 'I2C read timeout',
+        # DS1820 (Dallas 1?Wire Digital Thermometer)
+        0x0030: 'DS1820 thermometer channel select error',
+        0x0031: 'DS1820 thermometer communication checksum error (CRC)',
+        0x0032: 'DS1820 thermometer bridge configuration error',
+        0x0033: 'DS1820 thermometer bridge reset error',
+        # laser errors
+        0x0040: 'Laser busy timeout',
+        0x0041: 'Laser silent timeout',
+        0x0042: 'Laser error report',
+        0x0043: 'Laser prompt off timeout',
+        0x0044: 'Laser prompt off error',
+        0x0045: 'Laser echo off timeout',
+        0x0046: 'Laser echo off error',
+        0x0047: 'Laser on timeout',
+        0x0048: 'Laser on error',
+        0x0049: 'Laser set power timeout',
+        0x004A: 'Laser set power error',
+        0x004B: 'Laser off timeout',
+        0x004C: 'Laser off error',
+        0x004D: 'Laser get temperature timeout',
+        0x004E: 'Laser get temperature error',
+        0x004F: 'Laser on query timeout',
+        0x0050: 'Laser on query error',
+        0x0051: 'Laser power query timeout',
+        0x0052: 'Laser echo error',
+        0x0053: 'Laser prompt error',
+        0x0054: 'Laser query hours error',
+        0x0055: 'Laser get power timeout',
+        0x0056: 'Laser get power error',
+        0x0057: 'Laser get version timeout',
+        0x0058: 'Laser get version error',
+        0x0059: 'Laser undefined',
+        0x005A: 'Laser send timeout',
+        0x005B: 'Laser rec. timeout',
+        0x005C: 'Laser syntax error',
+        0x005D: 'Laser rec. overrun',
+        0x005E: 'Laser temperature overrun',
+        0x005F: 'Laser measure error',
+        0x0060: 'Laser unknown error',
+        0x0061: 'Laser unknown error',
+        0x0062: 'Laser unknown error',
+        0x0063: 'Laser unknown error',
+        # TEC unit
+        0x0081: 'Maximal temperature exceeded',
+        0x0082: 'Maximal temperature gradient exceeded',
+        0x0083: 'TEC element is cooling instead of heating',
+        0x0084: 'TEC element is heating instead of cooling',
+        0x0085: 'Maximal TEC element current exceeded',
+        0x0086: 'Temperature was not set before operate',
+        0x0087: 'Error on temperature sensor 1 (DS0, TEC element cold)',
+        0x0088: 'Error on temperature sensor 2 (DS1)',
+        0x0089: 'Error on temperature sensor 3 (DS2, TEC element hot)',
+        0x008A: 'Error on temperature sensor 4 (DS3, chamber)',
+        0x008B: 'Error on temperature sensor 5 (DS4)',
+        0x008C: 'Error on temperature sensor 6 (DS5)',
+        0x008D: 'Error on temperature sensor 7 (DS6)',
+        0x008E: 'Error on temperature sensor 8 (DS7)',
+        0x008F: 'Error on temperature IR sensor 1',
+        0x0090: 'Error on temperature IR sensor 2',
+        0x0091: 'Error PIC did not answer',
+        0x0092: 'Sensor required for this operation mode is not configured',
+        0x0093: 'No current detected while driver stage active',
+        0x0094: 'Fan is on but no current detected',
+        0x0095: 'Ambient fan 1 (pcb center) is on but no speedometer pulses '
+                'detected',
+        0x0096: 'Ambient fan 2 (pcb edge) is on but no speedometer pulses '
+                'detected',
+        # needle arm errors
+        0x0101: 'Position not allowed',
+        0x0102: 'Invalid servo command',
+        0x0103: 'Servo controller error',
+        0x0104: 'Servo communication timeout',
+        0x0105: 'Servo communication error',
+        0x0106: 'Liquid detector qt300 error',
+        0x0107: 'Rack detection failed. First bar is to small',
+        0x0108: 'Rack detection failed. Bar is invalid',
+        0x0109: 'Invalid bottom sensor state',
+        0x010A: 'Invalid bottom sensor value',
+        # laser module errors
+        0x0201: 'Temperature control not available',
+        # pump errors
+        0x0301: 'Initialization failed',
+        0x0302: 'Command invalid',
+        0x0303: 'Operand invalid',
+        0x0304: 'Command Sequence invalid',
+        0x0305: 'Fluid detection failed',
+        0x0306: 'EEPROM error',
+        0x0307: 'Device not initialized',
+        0x0308: 'Unknown error 1',
+        0x0309: 'Plunger overload',
+        0x030A: 'Valve overload',
+        0x030B: 'Plunger-movement not allowed',
+        0x030C: 'Unknown error 2',
+        0x030D: 'Unknown error 3',
+        0x030E: 'Unknown error 4',
+        0x030F: 'Command overflow',
+        0x0310: 'Serial crc error',
+        0x0311: 'Liquid sensor error',
+        # cartridge pressure control unit
+        0x0701: 'Timeout during pressurizing',
+        0x0702: 'Pump not running while activated (no speedometer pulse)',
+        # fpga
+        0x0706: 'FPGA error overrun',
+        0x0707: 'FPGA error double byte 2',
+        0x0708: 'FPGA error double byte 1',
+        0x0709: 'FPGA error state machine',
+        0x070A: 'FPGA error parity',
+        0x070B: 'FPGA error framing',
+        0x070C: 'FPGA error timeout',
+        0x070D: 'FPGA error data rate too high',
+        # tiny sampler errors
+        0x0901: 'Position not allowed',
+        0x0902: 'Invalid command',
+        0x0903: 'Servo controller error',
+        0x0904: 'Servo motor off',
+        # big sampler errors
+        0x0A01: 'Position not allowed',
+        0x0A02: 'Invalid command',
+        0x0A03: 'Servo controller error',
+        0x0A04: 'Servo motor off',
+        0x0A05: 'Latch module not initialized',
+        0x0A06: 'Latch position not allowed',
+        0x0A07: 'Shaker module not initialized',
+        0x0A08: 'Shaker position not allowed',
+        0x0A09: 'Clamping failed',
+        0x0A0A: 'Servo position invalid',
+        # special camera errors
+        0x0B01: 'Configure FPGA timeout',
+        0x0B02: 'DLL lock timeout',
+        0x0B03: 'Camera power up timeout',
+        0x0B04: 'DLL lock lost',
+        0x0B11: 'i2c error',
+        0x0B12: 'i2c error',
+        0x0B13: 'i2c error',
+        0x0B21: 'i2c error',
+        0x0B22: 'i2c error',
+        0x0B23: 'i2c error',
+        0x0B31: 'i2c error',
+        0x0B32: 'i2c error',
+        0x0B33: 'i2c error',
+        0x0B41: 'i2c error',
+        0x0B42: 'i2c error',
+        0x0B43: 'i2c error',
+        # solenoid and strobe errors
+        0x140B: 'High solenoid temperature',
+        0x240B: 'High solenoid 2 temperature',
+        0x340B: 'Long strobe pulse',
+        0x440B: 'Low solenoid current',
+        0x540B: 'Low solenoid 2 current',
+        0x640B: 'Long solenoid pulse',
+        0x740B: 'Long solenoid 2 pulse',
+        0x840B: 'Current change while active',
+        0x940B: 'No solenoid temperature sensor',
+        0xA40B: 'No solenoid 2 temperature sensor',
+        0xB40B: 'High solenoid trigger frequency',
+        0xC40B: 'High solenoid 2 trigger frequency',
+        0xD40B: 'High strobe trigger frequency',
+        # gas mix block/chamber
+        0x0185: 'Aeration invalid fluid media configuration',
+        0x0186: 'Aeration no filling flow or leakage',
+        0x0187: 'Pressure sensor i2c error',
+        0x0188: 'Aeration no emptying flow',
+    }
+    MODULE_WARNINGS = {
+        # generic warnings
+        0x0000: "No warning",
+    }
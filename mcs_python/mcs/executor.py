@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""Serial executor of commands per device with coalescing of writes.
+
+Commands (e.g. writing a port from a UI slider) are executed one after the
+other in a single thread per device instead of a new thread per command:
+
+    executor = mcs.get_executor(device)
+    future = executor.submit(device.write_port, "speed", 100,
+                             key=("port", "speed"))
+    future.result()  # Returns result or raises exception of command.
+
+A command with a key supersedes a pending (not started) command with the same
+key: only the latest value is written. The superseded command is removed
+from the queue and its future is the future of the latest command.
+"""
+import collections
+import concurrent.futures
+import logging
+import threading
+import weakref
+from typing import Callable, Hashable, Optional
+
+import mcs
+
+log = logging.getLogger(__name__)
+
+EXECUTOR_QUEUE_SIZE = 32  # Max. no. of pending commands per device.
+
+
+class _Command(object):
+    def __init__(self, key: Optional[Hashable], func: Callable, args, kwargs,
+                 future: concurrent.futures.Future) -> None:
+        self.key = key
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.future = future
+
+    def __repr__(self) -> str:
+        return getattr(self.func, "__name__", repr(self.func))
+
+
+class DeviceExecutor(object):
+    """Executes commands for a device serially in a worker thread.
+
+    Attributes:
+        coalesced: No. of commands superseded by a later command (not
+            executed).
+    """
+
+    def __init__(self, name: str, max_pending: int = EXECUTOR_QUEUE_SIZE
+                 ) -> None:
+        """Instantiate executor (see get_executor() for the executor of a
+        device).
+
+        Args:
+            name: Name for logging (e.g. of device).
+            max_pending: Max. no. of pending commands.
+        """
+        self.name = name
+        self.max_pending = max_pending
+        self.coalesced = 0
+        self._pending = collections.deque()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._shutdown = False
+
+    def __repr__(self) -> str:
+        return f"executor of {self.name}"
+
+    def __len__(self) -> int:
+        """Return no. of pending commands."""
+        return len(self._pending)
+
+    def submit(self, func: Callable, *args, key: Optional[Hashable] = None,
+               **kwargs) -> concurrent.futures.Future:
+        """Queue command for execution.
+
+        Args:
+            func: Command, e.g. device.write_port.
+            *args: Arguments of command.
+            key: Commands with equal key supersede each other (e.g. writes to
+                the same port). None: Never superseded.
+            **kwargs: Keyword arguments of command.
+
+        Returns:
+            future: Result (or exception) of the command (or of the command
+                superseding it).
+
+        Raises:
+            McsException: If too many commands are pending or the executor is
+                shut down.
+        """
+        with self._condition:
+            if self._shutdown:
+                raise mcs.McsException(f"{self} is shut down")
+            future = None
+            if key is not None:
+                for command in self._pending:
+                    if command.key == key:
+                        self._pending.remove(command)
+                        future = command.future
+                        self.coalesced += 1
+                        break
+            if future is None:
+                if len(self._pending) >= self.max_pending:
+                    raise mcs.McsException(
+                        f"{self}: Too many pending commands")
+                future = concurrent.futures.Future()
+            self._pending.append(_Command(key, func, args, kwargs, future))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    name=f"{__name__} {self.name}", target=self._run,
+                    daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop executing after pending commands (no new commands accepted).
+        """
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify()
+            thread = self._thread
+        if wait and thread is not None:
+            thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._shutdown:
+                    self._condition.wait()
+                if not self._pending:
+                    self._thread = None
+                    return
+                command = self._pending.popleft()
+            if not command.future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = command.func(*command.args, **command.kwargs)
+            except BaseException as exc:
+                log.error(f"{self}: {command} failed: {exc}")
+                command.future.set_exception(exc)
+            else:
+                command.future.set_result(result)
+
+
+_executors = weakref.WeakKeyDictionary()
+_executors_lock = threading.Lock()
+
+
+def get_executor(device: mcs.McsDevice) -> DeviceExecutor:
+    """Return the executor of a device (created on first call).
+
+    Args:
+        device: McsDevice or HardwareDevice (shares the executor of its
+            McsDevice).
+    """
+    device = getattr(device, "_device", device)
+    with _executors_lock:
+        executor = _executors.get(device)
+        if executor is None:
+            executor = _executors[device] = DeviceExecutor(str(device))
+        return executor
@@ -1,406 +1,1024 @@
-# -*- coding: utf-8 -*-
-import can
-import collections
-import logging
-import time
-import threading
-from typing import List, Optional
-
-import mcs
-
-log = logging.getLogger(__name__)
-
-
-class Mcs(object):
-    """Miltenyi CAN System instance for multiple McsDevice instances.
-
-    Manages McsDevices with ID ranging from 0x0 to 0xff and their
-    corresponding master's arbitration IDs (0x400 to 0x4ff). MCS telegram
-    responses from the CAN modules are handled in a single reading thread using
-    an McsBus instance and put into the buffer of registered McsDevices.
-
-    Also supports TML CAN devices (Technosoft axes) using extended CAN message
-    format.
-
-    Supports use of with statement: Provides __enter__ and __exit__ methods.
-    """
-
-    def __init__(self, bus: mcs.McsBus,
-                 devices: Optional[List[mcs.McsDevice]] = None,
-                 ext_msg_receiver: Optional[mcs.TmlDevicesHandler] = None
-                 ) -> None:
-        """Instantiate MCS object.
-
-        Args:
-            bus: McsBus to be used for CAN communication.
-            devices: List of McsDevices to be used.
-            ext_msg_receiver: TML devices handler (to put extended can messages
-                to).
-        """
-        self._read_thread = None
-        self.bus = bus
-        # We keep a list of all possible devices. Each device is at the element
-        # of its slave CAN Id (response Id). We start with an "empty" list where
-        # all elements are None. Registered devices will be added according to
-        # their response CAN Id here then (if given, or later by registering):
-        self._devices: List[Optional[mcs.McsDevice]] = [None] * 256
-        if devices:
-            for d in devices:
-                self.register(d)
-        self.ext_msg_rcv = ext_msg_receiver  # Receiver for all TML devices
-        # which use extended CAN messages.
-
-    def __enter__(self):
-        self.bus.open()
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.bus.close()
-        return False  # Re-raise any exception within with statement.
-
-    def open(self, register: str = "auto") -> None:
-        """Open MCS CAN bus.
-
-        Args:
-            register: "scan", "all", "auto", or "ignore":
-                "scan": Register devices that respond on the bus, unregister
-                    all others.
-                "all": Register (dummy) devices for all ids.
-                "auto": Scan if no devices are currently registerd else stick
-                    with registered devices.
-                "ignore": Do not care about registering devices. Registering has
-                    to be done otherwise (before or after calling open() here).
-        """
-        log.debug("Opening MCS...")
-        self.bus.open()
-        log.info("MCS is open")
-        self._start_reading()
-        if register == "all":
-            log.debug("Registered all missing devices.")
-            self.register_missing_devices()
-        elif (register == "scan" or
-              (register == "auto" and self._devices == [None] * 256)):
-            log.debug("Scanning for devices...")
-            devices = self.scan_for_devices()
-            log.debug(f"Responding devices: {devices}")
-        else:
-            log.debug("Unregistered devices will be ignored")
-
-    def close(self) -> None:
-        log.debug("Closing MCS...")
-        self._stop_reading()
-        self.bus.close()
-        log.info("MCS is closed")
-
-    def is_registered(self, can_id: int) -> bool:
-        """Return whether device with given CAN Id is registered.
-
-        Args:
-            can_id: Either master (send) or slave (response) CAN id, e.g. 0x411.
-        """
-        return self._get_device_from_device_list(can_id) is not None
-
-    def get_device(self, can_id: int) -> mcs.McsDevice:
-        """Return registered McsDevice instance from given CAN Id.
-
-        Args:
-            can_id: Either master (send) or slave (response) CAN id, e.g. 0x411.
-
-        Raises:
-            ValueError: If device with this CAN Id is not registered.
-        """
-        device = self._get_device_from_device_list(can_id)
-        if device is None:
-            raise mcs.McsException(f"Device {hex(can_id)} not registered")
-        return device
-
-    def _get_device_from_device_list(self, can_id: int
-                                     ) -> Optional[mcs.McsDevice]:
-        """Return device from device list.
-
-        Args:
-            can_id: Either master (send) or slave (response) CAN id, e.g. 0x411.
-        """
-        can_id &= 0xff
-        device: Optional[mcs.McsDevice] = self._devices[can_id]
-        return device
-
-    def get_registered_devices(self):
-        registered = []
-        for device in self._devices:
-            if device:
-                registered.append(device)
-        return registered
-
-    def register(self, device: mcs.McsDevice) -> None:
-        """Register the device for response handling (by CAN ID).
-
-        There are dummy devices 'registered' for all CAN ID from 0x0 .. 0xff at
-        startup which can be replaced. Is called by __init__ method of
-        mcs.McsDevice automatically (and all inherited classes).
-        """
-        can_id = device.rsp_id
-        self._devices[can_id] = device
-
-    def unregister(self, can_id) -> None:
-        can_id &= 0xff
-        self._devices[can_id] = None
-
-    def register_missing_devices(self, ids: Optional[List[int]] = None):
-        """Register dummy devices.
-
-        These devices (which could also be replaced later) are required to
-        handle responses. If a dummy device is missing for a CAN/arbitration id
-        the response received from this id will otherwise be ignored.
-        """
-        if ids is None:
-            ids = range(0xff)
-        for can_id in ids:
-            if not self._get_device_from_device_list(can_id):
-                # Register dummy modules which are required to handle responses.
-                self.register(mcs.McsDevice(can_id, self.bus))
-
-    def scan_for_devices(self, ids: Optional[List[int]] = None,
-                         timeout=mcs.mcsbus.CAN_TIMEOUT) -> List[mcs.McsDevice]:
-        """Return list of responding devices.
-
-        Automatically registers these devices and unregisters non-responders.
-        Response is checked by sending an info 3 request on the CAN bus.
-        """
-        if not ids:
-            ids = range(0x0, 0x100)
-        self.register_missing_devices(ids)
-        # TODO(MME): Do we need to acquire a lock in case buffer is accessed
-        #  from another thread?
-        for can_id in ids:
-            device = self._get_device_from_device_list(can_id)
-            device.buffer = []  # First we clear the buffer.
-            device.send([0x1b, 0x03], block=False)
-            time.sleep(0.001)  # Avoid socket buffer overload error (Linux).
-        time.sleep(timeout)
-        responding_devices = []
-        for can_id in ids:
-            device = self._get_device_from_device_list(can_id)
-            if device.buffer:  # Response received!
-                device.buffer = []
-                responding_devices.append(device)
-            else:
-                self.unregister(can_id)
-        return responding_devices
-
-    def get_recent_commands(self, length: int = 20) -> List[can.Message]:
-        return list(self.bus.get_recent_commands(length=length))
-
-    def log_recent_commands(self, length: int = mcs.mcsbus.DEFAULT_CMD_LOG_LEN):
-        self.bus.log_recent_commands(length=length)
-
-    def _start_reading(self):
-        if self._read_thread and self._read_thread.is_alive():
-            raise RuntimeError("MCS read thread is still alive")
-        self._read_thread = threading.Thread(target=self._read_msg, daemon=True)
-        self._read_thread.start()
-
-    def _stop_reading(self):
-        self._do_read = False
-        if self._read_thread:
-            self._read_thread.join(timeout=5)
-            if self._read_thread.is_alive():
-                raise RuntimeError("MCS read thread did not terminate in time")
-
-    def _read_msg(self):
-        """Reads MCS bus and puts received messages in device's buffer.
-
-        To be run in a thread started in the method _start_reading().
-        """
-        self._do_read = True
-        while self._do_read:
-            try:
-                msg = self.bus.read()
-                if msg is not None:
-                    if (msg.is_fd
-                            or msg.is_remote_frame
-                            or msg.bitrate_switch
-                            or msg.error_state_indicator):
-                        raise mcs.McsBusMessageTypeException(
-                            f"non-MCS conform CAN frame read: {msg}")
-                    # Do not try to process these messages in the
-                    # MCS modules buffer.
-                    if msg.is_error_frame:
-                        raise mcs.McsBusErrorFrameException(
-                            f"Error frame on bus detected: {msg}")
-                    # All other types of CAN frames (data frames)
-                    # are then processed by putting them into the
-                    # module's rcv buffer:
-                    if self._do_read:
-                        if msg.is_extended_id:
-                            # Extended CAN message used by TML devices only:
-                            if self.ext_msg_rcv:
-                                self.ext_msg_rcv.put_msg(msg)
-                        else:  # Regular MCS message (not extended)
-                            module: Optional[mcs.McsDevice] = self._devices[
-                                msg.arbitration_id]
-                            if module is None:
-                                log.debug(f"Received message from unregistered "
-                                          f"module: {msg}")
-                            else:
-                                # if msg.arbitration_id < 256:
-                                module.put_msg(msg)
-            except Exception as err:
-                log.exception(err)
-
-
-# Mcs instance getters:
-CAN_COMMUNICATORS = collections.OrderedDict({
-    "pci1":
-        {'channel': 'PCAN_PCIBUS1', 'bus_type': 'pcan', 'bit_rate': 1000000},
-    "usb1":
-        {'channel': 'PCAN_USBBUS1', 'bus_type': 'pcan', 'bit_rate': 1000000},
-    "usb2":
-        {'channel': 'PCAN_USBBUS2', 'bus_type': 'pcan', 'bit_rate': 1000000},
-    "socket0":
-        {'channel': 'can0', 'bus_type': 'socketcan', 'bit_rate': 1000000},
-    "socket1":
-        {'channel': 'can1', 'bus_type': 'socketcan', 'bit_rate': 1000000},
-    "socket2":
-        {'channel': 'can2', 'bus_type': 'socketcan', 'bit_rate': 1000000},
-})
-
-
-def _get_mcs_instance(name: str) -> Mcs:
-    kwargs = CAN_COMMUNICATORS[name]
-    com_can = mcs.ComPythonCan(**kwargs)
-    mcs_bus = mcs.McsBus(com_can)
-    mcs_instance = Mcs(mcs_bus)
-    return mcs_instance
-
-
-def _get_opened_mcs_instance(name: str) -> Mcs:
-    mcs_instance = _get_mcs_instance(name)
-    mcs_instance.open()
-    return mcs_instance
-
-
-def get_usb_mcs() -> Mcs:
-    """Return Mcs instance for PEAK CAN USB Bus 1.
-
-    The instance is returned opened.
-
-    Returns:
-        mcs_instance: Opened Mcs instance.
-    """
-    return _get_opened_mcs_instance("usb1")
-
-
-def get_pci_mcs() -> Mcs:
-    """Return Mcs instance for PEAK CAN PCI Bus 1.
-
-    The instance is returned opened.
-
-    Returns:
-        mcs_instance: Opened Mcs instance.
-    """
-    return _get_opened_mcs_instance("pci1")
-
-
-def get_socket_mcs() -> Mcs:
-    """Return Mcs instance for Socket CAN channel 0.
-
-    The instance is returned opened.
-
-    Returns:
-        mcs_instance: Opened Mcs instance.
-    """
-    return _get_opened_mcs_instance("socket0")
-
-
-def get_any_mcs_python_can() -> Mcs:
-    """Return first available PEAK CAN Bus either PCI, USB, or socket CAN.
-
-    The instance is returned opened (required for checking anyway). The package
-    python-can is used here.
-
-    Returns:
-        mcs_instance: Opened Mcs instance.
-
-    Raises:
-        McsException: If no bus can be found.
-    """
-    for c in CAN_COMMUNICATORS:
-        mcs_instance = _get_mcs_instance(c)
-        try:
-            log.debug(f"Opening CAN bus '{c}'")
-            mcs_instance.open()
-        except mcs.McsException:
-            log.debug(f"CAN bus '{c}' failed to open")
-        except can.CanOperationError as exc:
-            log.exception(f"CAN bus '{c}' failed to open: {exc}")
-        else:
-            log.debug(f"Opened CAN bus instance '{c}'")
-            return mcs_instance
-    raise mcs.McsException("No CAN bus found")
-
-
-def get_any_mcs_peak_chardev() -> Mcs:
-    """Return any available PEAK CAN Bus either PCI or USB with chardev driver.
-
-    The instance is returned opened (required for checking anyway). Here for
-    the communicator a ComPeakCan instance is used (instead of using the
-    package python-can for that). First available instance that can be opened
-    is returned.
-
-    Returns:
-        mcs_instance: Opened Mcs instance.
-
-    Raises:
-        McsException: If no bus can be found.
-    """
-    for c in ["PCAN_PCIBUS1", "PCAN_USBBUS1", "PCAN_USBBUS2"]:
-        com_can = mcs.ComPeakCan(c)
-        mcs_bus = mcs.McsBus(com_can)
-        mcs_instance = Mcs(mcs_bus)
-        try:
-            log.debug(f"Opening CAN bus '{c}' (chardev driver)")
-            mcs_instance.open()
-        except mcs.McsException:
-            log.debug(f"CAN bus '{c}' failed to open (chardev driver)")
-        else:
-            log.debug(f"Opened CAN bus instance '{c}' (chardev driver)")
-            return mcs_instance
-    raise mcs.McsException("No CAN bus found")
-
-
-def get_mcs() -> Mcs:
-    """Return any CAN Bus instance.
-
-    First available instance that can be opened is returned, either using the
-    python-can package or the proprietary PEAK chardev driver.
-
-    Returns:
-        mcs_instance: Opened Mcs instance.
-
-    Raises:
-        McsException: If no bus can be found.
-    """
-    try:
-        return get_any_mcs_python_can()
-    except mcs.McsException:
-        log.debug("No python-can compliant CAN bus instance found")
-    return get_any_mcs_peak_chardev()
-
-
-def get_mcs_tml() -> Mcs:
-    """Return any CAN Bus instance with extended message support (for TML).
-
-    First available instance that can be opened is returned, either using the
-    python-can package or the proprietary PEAK chardev driver.
-
-    Returns:
-        mcs_instance: Opened Mcs instance.
-
-    Raises:
-        McsException: If no bus can be found.
-    """
-    can_mcs_tml = mcs.get_mcs()
-    tml_handler = mcs.TmlDevicesHandler(can_mcs_tml.bus)
-    can_mcs_tml.ext_msg_rcv = tml_handler
-    return can_mcs_tml
+# -*- coding: utf-8 -*-
+import can
+import collections
+import concurrent.futures
+import contextlib
+import json
+import logging
+import os
+import time
+import threading
+from typing import Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+import mcs
+
+log = logging.getLogger(__name__)
+
+SCAN_SETTLE_TIME = 0.05  # Scan ends if no response arrived for this time.
+TOPOLOGY_PATH_ENV = "MCS_TOPOLOGY_PATH"  # Default topology cache file.
+
+
+class Mcs(object):
+    """Miltenyi CAN System instance for multiple McsDevice instances.
+
+    Manages McsDevices with ID ranging from 0x0 to 0xff and their
+    corresponding master's arbitration IDs (0x400 to 0x4ff). MCS telegram
+    responses from the CAN modules are handled in a single reading thread using
+    an McsBus instance and put into the buffer of registered McsDevices.
+
+    Also supports TML CAN devices (Technosoft axes) using extended CAN message
+    format.
+
+    Acceptance filters of the CAN communicator are derived from the registered
+    devices (and the TML devices handler) so that messages from other modules
+    on the bus are dropped by the CAN driver (if supported, e.g. in the kernel
+    for socketcan) instead of waking up the reading thread.
+
+    The responding devices (id, name, firmware version) can be cached in a
+    topology file (see open() and scan_with_topology()) so that only these ids
+    are probed on the next start instead of all 256 ids.
+
+    Supports use of with statement: Provides __enter__ and __exit__ methods.
+    """
+
+    def __init__(self, bus: mcs.McsBus,
+                 devices: Optional[List[mcs.McsDevice]] = None,
+                 ext_msg_receiver: Optional[mcs.TmlDevicesHandler] = None,
+                 use_can_filters: bool = True,
+                 topology_path: Optional[str] = None
+                 ) -> None:
+        """Instantiate MCS object.
+
+        Args:
+            bus: McsBus to be used for CAN communication.
+            devices: List of McsDevices to be used.
+            ext_msg_receiver: TML devices handler (to put extended can messages
+                to).
+            use_can_filters: Receive only messages of registered devices (and
+                extended messages if there is a TML devices handler). If False,
+                all messages are received (e.g. for logging the whole bus).
+            topology_path: Topology cache file used by open() (defaults to
+                environment variable MCS_TOPOLOGY_PATH, if set).
+        """
+        self._read_thread = None
+        self.bus = bus
+        self.topology_path = topology_path or os.environ.get(TOPOLOGY_PATH_ENV)
+        self._use_can_filters = use_can_filters
+        self._filter_update_deferred = False
+        self._ext_msg_rcv = None
+        self._subscriptions: Optional[mcs.PortSubscriptions] = None
+        # We keep a list of all possible devices. Each device is at the element
+        # of its slave CAN Id (response Id). We start with an "empty" list where
+        # all elements are None. Registered devices will be added according to
+        # their response CAN Id here then (if given, or later by registering):
+        self._devices: List[Optional[mcs.McsDevice]] = [None] * 256
+        if devices:
+            for d in devices:
+                self.register(d)
+        self.ext_msg_rcv = ext_msg_receiver  # Receiver for all TML devices
+        # which use extended CAN messages.
+
+    @property
+    def ext_msg_rcv(self) -> Optional[mcs.TmlDevicesHandler]:
+        """Receiver of extended CAN messages (TML devices handler)."""
+        return self._ext_msg_rcv
+
+    @ext_msg_rcv.setter
+    def ext_msg_rcv(self, receiver: Optional[mcs.TmlDevicesHandler]) -> None:
+        self._ext_msg_rcv = receiver
+        self._update_can_filters()
+
+    def __enter__(self):
+        self.bus.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.bus.close()
+        return False  # Re-raise any exception within with statement.
+
+    def open(self, register: str = "auto") -> None:
+        """Open MCS CAN bus.
+
+        Args:
+            register: "scan", "cached", "all", "auto", or "ignore":
+                "scan": Register devices that respond on the bus, unregister
+                    all others.
+                "cached": Probe the devices of the topology file (see
+                    topology_path) and scan only if the topology does not
+                    match (see scan_with_topology()).
+                "all": Register (dummy) devices for all ids.
+                "auto": Scan (or "cached" if there is a topology_path) if no
+                    devices are currently registerd else stick with
+                    registered devices.
+                "ignore": Do not care about registering devices. Registering has
+                    to be done otherwise (before or after calling open() here).
+        """
+        log.debug("Opening MCS...")
+        self.bus.open()
+        log.info("MCS is open")
+        self._start_reading()
+        nothing_registered = self._devices == [None] * 256
+        if register == "all":
+            log.debug("Registered all missing devices.")
+            self.register_missing_devices()
+        elif (register == "cached" or
+              (register == "auto" and nothing_registered and
+               self.topology_path)):
+            log.debug(f"Probing devices of topology {self.topology_path}...")
+            devices = self.scan_with_topology(self.topology_path)
+            log.debug(f"Responding devices: {devices}")
+        elif register == "scan" or (register == "auto" and nothing_registered):
+            log.debug("Scanning for devices...")
+            devices = self.scan_for_devices()
+            log.debug(f"Responding devices: {devices}")
+        else:
+            log.debug("Unregistered devices will be ignored")
+
+    def close(self) -> None:
+        log.debug("Closing MCS...")
+        if self._subscriptions is not None:
+            self._subscriptions.close()
+        self._stop_reading()
+        self.bus.close()
+        log.info("MCS is closed")
+
+    def is_registered(self, can_id: int) -> bool:
+        """Return whether device with given CAN Id is registered.
+
+        Args:
+            can_id: Either master (send) or slave (response) CAN id, e.g. 0x411.
+        """
+        return self._get_device_from_device_list(can_id) is not None
+
+    def get_device(self, can_id: int) -> mcs.McsDevice:
+        """Return registered McsDevice instance from given CAN Id.
+
+        Args:
+            can_id: Either master (send) or slave (response) CAN id, e.g. 0x411.
+
+        Raises:
+            ValueError: If device with this CAN Id is not registered.
+        """
+        device = self._get_device_from_device_list(can_id)
+        if device is None:
+            raise mcs.McsException(f"Device {hex(can_id)} not registered")
+        return device
+
+    def _get_device_from_device_list(self, can_id: int
+                                     ) -> Optional[mcs.McsDevice]:
+        """Return device from device list.
+
+        Args:
+            can_id: Either master (send) or slave (response) CAN id, e.g. 0x411.
+        """
+        can_id &= 0xff
+        device: Optional[mcs.McsDevice] = self._devices[can_id]
+        return device
+
+    def get_registered_devices(self):
+        registered = []
+        for device in self._devices:
+            if device:
+                registered.append(device)
+        return registered
+
+    def register(self, device: mcs.McsDevice) -> None:
+        """Register the device for response handling (by CAN ID).
+
+        There are dummy devices 'registered' for all CAN ID from 0x0 .. 0xff at
+        startup which can be replaced. Is called by __init__ method of
+        mcs.McsDevice automatically (and all inherited classes).
+        """
+        can_id = device.rsp_id
+        self._devices[can_id] = device
+        self._update_can_filters()
+
+    def unregister(self, can_id) -> None:
+        can_id &= 0xff
+        self._devices[can_id] = None
+        self._update_can_filters()
+
+    def get_can_filters(self) -> Optional[List[dict]]:
+        """Return CAN filters (python-can format) for registered devices.
+
+        Returns:
+            filters: Filters matching the response ids of all registered
+                devices and all extended ids if there is a TML devices handler.
+                None (receive all) if CAN filters are not used or if there is
+                nothing registered.
+        """
+        if not self._use_can_filters:
+            return None
+        if None not in self._devices:  # All ids 0x000 to 0x0ff.
+            filters = [{"can_id": 0x000, "can_mask": 0x700, "extended": False}]
+        else:
+            filters = [{"can_id": can_id, "can_mask": mcs.mcsbus.STD_ID_MASK,
+                        "extended": False}
+                       for can_id, device in enumerate(self._devices)
+                       if device is not None]
+        if self._ext_msg_rcv:
+            filters.append({"can_id": 0, "can_mask": 0, "extended": True})
+        return filters or None
+
+    def _update_can_filters(self) -> None:
+        if self._use_can_filters and not self._filter_update_deferred:
+            self.bus.set_filters(self.get_can_filters())
+
+    @contextlib.contextmanager
+    def _deferred_can_filter_update(self):
+        """Update CAN filters once after (un)registering several devices."""
+        deferred, self._filter_update_deferred = (
+            self._filter_update_deferred, True)
+        try:
+            yield
+        finally:
+            self._filter_update_deferred = deferred
+            self._update_can_filters()
+
+    def register_missing_devices(self, ids: Optional[List[int]] = None):
+        """Register dummy devices.
+
+        These devices (which could also be replaced later) are required to
+        handle responses. If a dummy device is missing for a CAN/arbitration id
+        the response received from this id will otherwise be ignored.
+        """
+        if ids is None:
+            ids = range(0xff)
+        with self._deferred_can_filter_update():
+            for can_id in ids:
+                if not self._get_device_from_device_list(can_id):
+                    # Register dummy modules which are required to handle
+                    # responses.
+                    self.register(mcs.McsDevice(can_id, self.bus))
+
+    def scan_for_devices(self, ids: Optional[List[int]] = None,
+                         timeout=mcs.mcsbus.CAN_TIMEOUT,
+                         settle_time: float = SCAN_SETTLE_TIME
+                         ) -> List[mcs.McsDevice]:
+        """Return list of responding devices.
+
+        Automatically registers these devices and unregisters non-responders.
+        Response is checked by sending an info 3 request on the CAN bus.
+
+        Args:
+            ids: CAN ids to be scanned (default: all ids 0x00 to 0xff).
+            timeout: Max. seconds to wait for responses after sending.
+            settle_time: Scan ends early if all ids responded or if no further
+                response arrived for this time.
+        """
+        return list(self._scan(ids, timeout, settle_time))
+
+    def _scan(self, ids: Optional[List[int]], timeout: float,
+              settle_time: float) -> Dict[mcs.McsDevice, can.Message]:
+        """Scan ids and return info 3 response of each responding device."""
+        if not ids:
+            ids = range(0x0, 0x100)
+        self.register_missing_devices(ids)
+        devices = [self._get_device_from_device_list(can_id) for can_id in ids]
+        responses = {}
+        responded = threading.Condition()
+
+        def on_msg(msg: can.Message) -> None:
+            if msg.data and msg.data[0] == 0x03:
+                with responded:
+                    responses[msg.arbitration_id] = msg
+                    responded.notify()
+
+        # TODO(MME): Do we need to acquire a lock in case buffer is accessed
+        #  from another thread?
+        futures = []
+        for device in devices:
+            device.clear_buffer()
+            device.add_listener(on_msg)
+            # Queued requests are paced to the bus speed by McsBus:
+            futures.append(device.send_nowait(
+                [0x1b, 0x03], priority=mcs.mcsbus.PRIORITY_POLL))
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                if future.exception():
+                    log.warning(f"Scan request failed: {future.exception()}")
+            end_time = time.monotonic() + timeout
+            last_response_time = time.monotonic()
+            with responded:
+                while len(responses) < len(devices):
+                    count = len(responses)
+                    remaining = min(end_time,
+                                    last_response_time + settle_time
+                                    ) - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    responded.wait(remaining)
+                    if len(responses) > count:
+                        last_response_time = time.monotonic()
+        finally:
+            for device in devices:
+                device.remove_listener(on_msg)
+        responding_devices = {}
+        with self._deferred_can_filter_update():
+            for device in devices:
+                if device.responses:  # Response received!
+                    device.clear_buffer()
+                    responding_devices[device] = responses.get(device.rsp_id)
+                else:
+                    self.unregister(device.rsp_id)
+        return responding_devices
+
+    def scan_with_topology(self, path: str,
+                           timeout=mcs.mcsbus.CAN_TIMEOUT,
+                           settle_time: float = SCAN_SETTLE_TIME
+                           ) -> List[mcs.McsDevice]:
+        """Return list of responding devices using a topology cache file.
+
+        Only the ids of the cached topology are probed. If the responding
+        devices (id, name, firmware version) do not match the cached topology
+        (or there is no valid topology file) all ids are scanned and the
+        topology file is written. See scan_for_devices().
+
+        Args:
+            path: Topology cache file (JSON).
+            timeout: Max. seconds to wait for responses after sending.
+            settle_time: Scan ends early if all ids responded or if no further
+                response arrived for this time.
+        """
+        cached = load_topology(path)
+        if cached:
+            responses = self._scan(list(cached), timeout, settle_time)
+            if get_topology(responses) == cached:
+                return list(responses)
+            log.info(f"Topology changed (cached in {path}), scanning all ids")
+        responses = self._scan(None, timeout, settle_time)
+        save_topology(path, get_topology(responses))
+        return list(responses)
+
+    def send_and_check_rsp_group(
+            self,
+            data: Union[List[int], Dict[int, List[int]]],
+            can_ids: Optional[List[int]] = None,
+            timeout: float = mcs.mcsbus.CAN_TIMEOUT,
+            check: Union[None, List[int], Dict[int, List[int]]] = None,
+            check_dlc: bool = True
+    ) -> Tuple[Dict[int, can.Message], Dict[int, Exception]]:
+        """Send telegram to several devices and collect all responses.
+
+        Telegrams are sent back-to-back to all devices first, then responses
+        are collected. As each device has its own response id and buffer the
+        responses are received concurrently, i.e. requesting N devices takes
+        about one round trip instead of N (see send_and_check_rsp() of
+        McsDevice).
+
+        Args:
+            data: Data to be sent to all devices, e.g. [0x41, 0x04], or dict
+                with data for each device by CAN id.
+            can_ids: Ids of (registered) devices to send data to. Ignored if
+                data is a dict. Default: All registered devices.
+            timeout: Max. time to wait for all responses.
+            check: Expected response data (None items are not checked), or dict
+                with expected response data for each device by CAN id.
+            check_dlc: Check length of response data, too.
+
+        Returns:
+            results: Checked responses by CAN id (as given).
+            errors: Exceptions by CAN id (as given) for devices that are not
+                registered, failed, or did not respond in time.
+        """
+        if isinstance(data, dict):
+            requests = data
+        else:
+            if can_ids is None:
+                can_ids = [d.id for d in self.get_registered_devices()]
+            requests = {can_id: data for can_id in can_ids}
+        sent, errors = _send_group(requests, self.get_device)
+        results = _collect_group(sent, requests, time.monotonic() + timeout,
+                                 check, check_dlc, errors)
+        return results, errors
+
+    def get_port_group(self, port: Union[int, Dict[int, int]],
+                       can_ids: Optional[List[int]] = None,
+                       signed: bool = False,
+                       timeout: float = mcs.mcsbus.CAN_TIMEOUT
+                       ) -> Tuple[Dict[int, int], Dict[int, Exception]]:
+        """Read port value of several devices in one bus round.
+
+        Args:
+            port: Port id, or dict with port id for each device by CAN id.
+            can_ids: Ids of (registered) devices to read port from. Ignored if
+                port is a dict. Default: All registered devices.
+            signed: If port values are signed.
+            timeout: Max. time to wait for all responses.
+
+        Returns:
+            values: Port values by CAN id (as given).
+            errors: Exceptions by CAN id (as given), see
+                send_and_check_rsp_group().
+        """
+        if not isinstance(port, dict):
+            if can_ids is None:
+                can_ids = [d.id for d in self.get_registered_devices()]
+            port = {can_id: port for can_id in can_ids}
+        results, errors = self.send_and_check_rsp_group(
+            data={can_id: [0x41, p] for can_id, p in port.items()},
+            timeout=timeout,
+            check={can_id: [0x42, None, p, None, None, None, None]
+                   for can_id, p in port.items()},
+            check_dlc=False)  # We do not know how many bytes the port holds.
+        values = {can_id: mcs.mcsdevice.get_value_from_rsp(rsp, offset=4,
+                                                           signed=signed)
+                  for can_id, rsp in results.items()}
+        return values, errors
+
+    def get_parameter_group(self, parameter: Union[int, Dict[int, int]],
+                            can_ids: Optional[List[int]] = None,
+                            signed: bool = False,
+                            timeout: float = mcs.mcsbus.CAN_TIMEOUT
+                            ) -> Tuple[Dict[int, int], Dict[int, Exception]]:
+        """Read parameter value of several devices in one bus round.
+
+        Args:
+            parameter: Parameter id, or dict with parameter id for each device
+                by CAN id.
+            can_ids: Ids of (registered) devices to read parameter from.
+                Ignored if parameter is a dict. Default: All registered
+                devices.
+            signed: If parameter values are signed.
+            timeout: Max. time to wait for all responses.
+
+        Returns:
+            values: Parameter values by CAN id (as given).
+            errors: Exceptions by CAN id (as given), see
+                send_and_check_rsp_group().
+        """
+        if not isinstance(parameter, dict):
+            if can_ids is None:
+                can_ids = [d.id for d in self.get_registered_devices()]
+            parameter = {can_id: parameter for can_id in can_ids}
+        results, errors = self.send_and_check_rsp_group(
+            data={can_id: [0xdb, p] for can_id, p in parameter.items()},
+            timeout=timeout,
+            check={can_id: [0xdc, p, None, None, None, None]
+                   for can_id, p in parameter.items()},
+            check_dlc=False)  # We do not know how many bytes the param. holds.
+        values = {can_id: mcs.mcsdevice.get_value_from_rsp(rsp, offset=2,
+                                                           signed=signed)
+                  for can_id, rsp in results.items()}
+        return values, errors
+
+    @property
+    def subscriptions(self) -> mcs.PortSubscriptions:
+        """Port subscriptions and latest port values (see subscribe())."""
+        if self._subscriptions is None:
+            self._subscriptions = mcs.PortSubscriptions(self)
+        return self._subscriptions
+
+    def subscribe(self, device: Union[int, mcs.McsDevice], port: int,
+                  period: Optional[float] = None,
+                  callback: Optional[Callable[[mcs.PortSubscription], None]
+                                     ] = None,
+                  signed: bool = False) -> mcs.PortSubscription:
+        """Subscribe to values pushed by a device port (auto mode) instead of
+        polling it.
+
+        See PortSubscriptions.subscribe().
+
+        Args:
+            device: Registered McsDevice or its CAN id, e.g. 0x423.
+            port: Port id.
+            period: Seconds between values. None: Value is reported on change
+                only.
+            callback: Called with the subscription for each received value
+                (from the reading thread, must return quickly).
+            signed: Port value is signed.
+        """
+        return self.subscriptions.subscribe(device, port, period, callback,
+                                            signed)
+
+    def unsubscribe(self, subscription: mcs.PortSubscription) -> None:
+        """Cancel subscription (see subscribe())."""
+        self.subscriptions.unsubscribe(subscription)
+
+    def get_recent_commands(self, length: int = 20) -> List[can.Message]:
+        return list(self.bus.get_recent_commands(length=length))
+
+    def log_recent_commands(self, length: int = mcs.mcsbus.DEFAULT_CMD_LOG_LEN):
+        self.bus.log_recent_commands(length=length)
+
+    def _start_reading(self):
+        if self._read_thread and self._read_thread.is_alive():
+            raise RuntimeError("MCS read thread is still alive")
+        self._read_thread = threading.Thread(target=self._read_msg, daemon=True)
+        self._read_thread.start()
+
+    def _stop_reading(self):
+        self._do_read = False
+        self.bus.wake_up()
+        if self._read_thread:
+            self._read_thread.join(timeout=5)
+            if self._read_thread.is_alive():
+                raise RuntimeError("MCS read thread did not terminate in time")
+
+    def _read_msg(self):
+        """Reads MCS bus and puts received messages in device's buffer.
+
+        To be run in a thread started in the method _start_reading(). Blocks
+        until messages are received and dispatches all of them at once (see
+        McsBus.read_batch()).
+        """
+        self._do_read = True
+        while self._do_read:
+            try:
+                msgs = self.bus.read_batch()
+            except Exception as err:
+                log.exception(err)
+                continue
+            for msg in msgs:
+                try:
+                    self._dispatch_msg(msg)
+                except Exception as err:
+                    log.exception(err)
+
+    def _dispatch_msg(self, msg: can.Message) -> None:
+        """Put received message into buffer of device (or TML handler)."""
+        if (msg.is_fd
+                or msg.is_remote_frame
+                or msg.bitrate_switch
+                or msg.error_state_indicator):
+            self.bus.metrics.inc("invalid_frames")
+            raise mcs.McsBusMessageTypeException(
+                f"non-MCS conform CAN frame read: {msg}")
+        # Do not try to process these messages in the
+        # MCS modules buffer.
+        if msg.is_error_frame:
+            self.bus.metrics.inc("error_frames")
+            raise mcs.McsBusErrorFrameException(
+                f"Error frame on bus detected: {msg}")
+        # All other types of CAN frames (data frames)
+        # are then processed by putting them into the
+        # module's rcv buffer:
+        if self._do_read:
+            if msg.is_extended_id:
+                # Extended CAN message used by TML devices only:
+                if self.ext_msg_rcv:
+                    self.bus.metrics.count_rx()
+                    self.ext_msg_rcv.put_msg(msg)
+            else:  # Regular MCS message (not extended)
+                module: Optional[mcs.McsDevice] = self._devices[
+                    msg.arbitration_id]
+                if module is None:
+                    log.debug(f"Received message from unregistered "
+                              f"module: {msg}")
+                else:
+                    # if msg.arbitration_id < 256:
+                    self.bus.metrics.count_rx(msg.arbitration_id)
+                    module.put_msg(msg)
+
+
+def get_topology(responses: Dict[mcs.McsDevice, can.Message]
+                 ) -> Dict[int, dict]:
+    """Return topology (name and firmware version by CAN id) from scan.
+
+    Args:
+        responses: Info 3 response by device (see Mcs._scan()).
+    """
+    topology = {}
+    for device, rsp in responses.items():
+        firmware = None
+        if rsp is not None and rsp.dlc == 8:
+            firmware = f"{rsp.data[4]}.{rsp.data[5]}.{rsp.data[6]}." \
+                       f"{chr(rsp.data[7])}"
+        topology[device.rsp_id] = {"name": device.name, "firmware": firmware}
+    return topology
+
+
+def load_topology(path: str) -> Optional[Dict[int, dict]]:
+    """Return topology from file (see save_topology()).
+
+    Returns:
+        topology: None if file does not exist or is invalid.
+    """
+    try:
+        with open(path) as f:
+            return {int(d["id"], 16): {"name": d["name"],
+                                       "firmware": d["firmware"]}
+                    for d in json.load(f)["devices"]}
+    except FileNotFoundError:
+        log.debug(f"No topology file {path}")
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        log.warning(f"Invalid topology file {path}: {exc}")
+    return None
+
+
+def save_topology(path: str, topology: Dict[int, dict]) -> None:
+    """Write topology (see get_topology()) to file (JSON).
+
+    The file is replaced atomically, so concurrently starting processes never
+    read a partially written file.
+    """
+    devices = [{"id": f"0x{can_id:03x}", "name": d["name"],
+                "firmware": d["firmware"]}
+               for can_id, d in sorted(topology.items())]
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"devices": devices}, f, indent=2)
+    os.replace(tmp_path, path)
+    log.debug(f"Topology with {len(devices)} devices written to {path}")
+
+
+def _send_group(requests: Dict[Hashable, List[int]],
+                get_device: Callable[[Hashable], mcs.McsDevice]
+                ) -> Tuple[Dict[Hashable, mcs.McsDevice],
+                           Dict[Hashable, Exception]]:
+    """Send data to devices (first part of a group request).
+
+    Args:
+        requests: Data to be sent by device key (e.g. CAN id).
+        get_device: Returns device for key.
+
+    Returns:
+        sent: Devices data has been sent to by key.
+        errors: Exceptions by key.
+    """
+    sent = {}
+    errors = {}
+    for key, data in requests.items():
+        try:
+            device = get_device(key)
+            device.send(data, priority=mcs.mcsbus.PRIORITY_POLL)
+        except Exception as exc:
+            errors[key] = exc
+        else:
+            sent[key] = device
+    return sent, errors
+
+
+def _collect_group(sent: Dict[Hashable, mcs.McsDevice],
+                   requests: Dict[Hashable, List[int]],
+                   end_time: float,
+                   check: Union[None, List[int], Dict[Hashable, List[int]]],
+                   check_dlc: bool,
+                   errors: Dict[Hashable, Exception]
+                   ) -> Dict[Hashable, can.Message]:
+    """Receive and check responses (second part of a group request).
+
+    Args:
+        sent: Devices data has been sent to by key (see _send_group()).
+        requests: Sent data by key.
+        end_time: Time (time.monotonic()) till all responses are received.
+        check: Expected response data, or dict with it by key.
+        check_dlc: Check length of response data, too.
+        errors: Exceptions by key (updated).
+
+    Returns:
+        results: Checked responses by key.
+    """
+    results = {}
+    for key, device in sent.items():
+        device_check = check.get(key) if isinstance(check, dict) else check
+        try:
+            rsp = device.rcv(max(0.0, end_time - time.monotonic()))
+            results[key] = device.check_rsp(rsp, requests[key], device_check,
+                                            check_dlc)
+        except Exception as exc:
+            errors[key] = exc
+    return results
+
+
+class MultiMcs(object):
+    """Coordinator for several Mcs instances, one per CAN channel.
+
+    Each Mcs instance has its own bus and reading thread, so the channels are
+    served in parallel. Devices are addressed by (bus name, CAN id).
+
+    Supports use of with statement: Provides __enter__ and __exit__ methods.
+    """
+
+    def __init__(self, instances: Dict[str, Mcs]) -> None:
+        """Instantiate multi-channel MCS.
+
+        Args:
+            instances: Mcs instances by bus name (e.g. "socket0").
+        """
+        self.instances = dict(instances)
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def __getitem__(self, bus: str) -> Mcs:
+        return self.instances[bus]
+
+    def open(self, register: str = "auto") -> None:
+        """Open all Mcs instances in parallel (see Mcs.open()).
+
+        Raises:
+            McsException: If any instance fails to open (all instances opened
+                so far are closed again).
+        """
+        opened = []
+        errors = []
+
+        def open_instance(mcs_instance: Mcs) -> None:
+            try:
+                mcs_instance.open(register=register)
+            except Exception as exc:
+                errors.append(exc)
+            else:
+                opened.append(mcs_instance)
+
+        threads = [threading.Thread(target=open_instance, args=(m,))
+                   for m in self.instances.values()]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        if errors:
+            for mcs_instance in opened:
+                mcs_instance.close()
+            raise mcs.McsException(f"Cannot open all CAN buses: {errors}")
+
+    def close(self) -> None:
+        for mcs_instance in self.instances.values():
+            mcs_instance.close()
+
+    def get_device(self, bus: str, can_id: int) -> mcs.McsDevice:
+        """Return registered McsDevice instance from given bus and CAN Id.
+
+        Raises:
+            McsException: If bus is unknown or device is not registered.
+        """
+        if bus not in self.instances:
+            raise mcs.McsException(f"Unknown CAN bus '{bus}'")
+        return self.instances[bus].get_device(can_id)
+
+    def get_registered_devices(self) -> Dict[Tuple[str, int], mcs.McsDevice]:
+        """Return registered devices of all buses by (bus name, CAN id)."""
+        return {(bus, d.id): d for bus, m in self.instances.items()
+                for d in m.get_registered_devices()}
+
+    def send_and_check_rsp_group(
+            self,
+            data: Union[List[int], Dict[Tuple[str, int], List[int]]],
+            keys: Optional[List[Tuple[str, int]]] = None,
+            timeout: float = mcs.mcsbus.CAN_TIMEOUT,
+            check: Union[None, List[int],
+                         Dict[Tuple[str, int], List[int]]] = None,
+            check_dlc: bool = True
+    ) -> Tuple[Dict[Tuple[str, int], can.Message],
+               Dict[Tuple[str, int], Exception]]:
+        """Send telegram to devices on all buses and collect all responses.
+
+        See Mcs.send_and_check_rsp_group(), but devices are given by (bus
+        name, CAN id). Telegrams are sent to all buses before responses are
+        collected, so requesting devices on several buses takes about one round
+        trip, too.
+
+        Args:
+            data: Data to be sent to all devices, or dict with data for each
+                device by (bus name, CAN id).
+            keys: (bus name, CAN id) of devices to send data to. Ignored if
+                data is a dict. Default: All registered devices.
+            timeout: Max. time to wait for all responses.
+            check: Expected response data, or dict with it for each device.
+            check_dlc: Check length of response data, too.
+
+        Returns:
+            results: Checked responses by (bus name, CAN id).
+            errors: Exceptions by (bus name, CAN id).
+        """
+        if isinstance(data, dict):
+            requests = data
+        else:
+            if keys is None:
+                keys = list(self.get_registered_devices())
+            requests = {key: data for key in keys}
+        sent, errors = _send_group(requests,
+                                   lambda key: self.get_device(*key))
+        results = _collect_group(sent, requests, time.monotonic() + timeout,
+                                 check, check_dlc, errors)
+        return results, errors
+
+    def get_port_group(self, port: Union[int, Dict[Tuple[str, int], int]],
+                       keys: Optional[List[Tuple[str, int]]] = None,
+                       signed: bool = False,
+                       timeout: float = mcs.mcsbus.CAN_TIMEOUT
+                       ) -> Tuple[Dict[Tuple[str, int], int],
+                                  Dict[Tuple[str, int], Exception]]:
+        """Read port value of devices on all buses in one bus round.
+
+        See Mcs.get_port_group(), but devices are given by (bus name, CAN id).
+        """
+        if not isinstance(port, dict):
+            if keys is None:
+                keys = list(self.get_registered_devices())
+            port = {key: port for key in keys}
+        results, errors = self.send_and_check_rsp_group(
+            data={key: [0x41, p] for key, p in port.items()},
+            timeout=timeout,
+            check={key: [0x42, None, p, None, None, None, None]
+                   for key, p in port.items()},
+            check_dlc=False)  # We do not know how many bytes the port holds.
+        values = {key: mcs.mcsdevice.get_value_from_rsp(rsp, offset=4,
+                                                        signed=signed)
+                  for key, rsp in results.items()}
+        return values, errors
+
+
+# Mcs instance getters:
+CAN_COMMUNICATORS = collections.OrderedDict({
+    "pci1":
+        {'channel': 'PCAN_PCIBUS1', 'bus_type': 'pcan', 'bit_rate': 1000000},
+    "usb1":
+        {'channel': 'PCAN_USBBUS1', 'bus_type': 'pcan', 'bit_rate': 1000000},
+    "usb2":
+        {'channel': 'PCAN_USBBUS2', 'bus_type': 'pcan', 'bit_rate': 1000000},
+    "socket0":
+        {'channel': 'can0', 'bus_type': 'socketcan', 'bit_rate': 1000000},
+    "socket1":
+        {'channel': 'can1', 'bus_type': 'socketcan', 'bit_rate': 1000000},
+    "socket2":
+        {'channel': 'can2', 'bus_type': 'socketcan', 'bit_rate': 1000000},
+})
+
+
+def _get_mcs_instance(name: str) -> Mcs:
+    kwargs = CAN_COMMUNICATORS[name]
+    com_can = mcs.ComPythonCan(**kwargs)
+    mcs_bus = mcs.McsBus(com_can)
+    mcs_instance = Mcs(mcs_bus)
+    return mcs_instance
+
+
+def _get_opened_mcs_instance(name: str) -> Mcs:
+    mcs_instance = _get_mcs_instance(name)
+    mcs_instance.open()
+    return mcs_instance
+
+
+def get_usb_mcs() -> Mcs:
+    """Return Mcs instance for PEAK CAN USB Bus 1.
+
+    The instance is returned opened.
+
+    Returns:
+        mcs_instance: Opened Mcs instance.
+    """
+    return _get_opened_mcs_instance("usb1")
+
+
+def get_pci_mcs() -> Mcs:
+    """Return Mcs instance for PEAK CAN PCI Bus 1.
+
+    The instance is returned opened.
+
+    Returns:
+        mcs_instance: Opened Mcs instance.
+    """
+    return _get_opened_mcs_instance("pci1")
+
+
+def get_socket_mcs() -> Mcs:
+    """Return Mcs instance for Socket CAN channel 0.
+
+    The instance is returned opened.
+
+    Returns:
+        mcs_instance: Opened Mcs instance.
+    """
+    return _get_opened_mcs_instance("socket0")
+
+
+def get_any_mcs_python_can() -> Mcs:
+    """Return first available PEAK CAN Bus either PCI, USB, or socket CAN.
+
+    The instance is returned opened (required for checking anyway). The package
+    python-can is used here.
+
+    Returns:
+        mcs_instance: Opened Mcs instance.
+
+    Raises:
+        McsException: If no bus can be found.
+    """
+    for c in CAN_COMMUNICATORS:
+        mcs_instance = _get_mcs_instance(c)
+        try:
+            log.debug(f"Opening CAN bus '{c}'")
+            mcs_instance.open()
+        except mcs.McsException:
+            log.debug(f"CAN bus '{c}' failed to open")
+        except can.CanOperationError as exc:
+            log.exception(f"CAN bus '{c}' failed to open: {exc}")
+        else:
+            log.debug(f"Opened CAN bus instance '{c}'")
+            return mcs_instance
+    raise mcs.McsException("No CAN bus found")
+
+
+def get_any_mcs_peak_chardev() -> Mcs:
+    """Return any available PEAK CAN Bus either PCI or USB with chardev driver.
+
+    The instance is returned opened (required for checking anyway). Here for
+    the communicator a ComPeakCan instance is used (instead of using the
+    package python-can for that). First available instance that can be opened
+    is returned.
+
+    Returns:
+        mcs_instance: Opened Mcs instance.
+
+    Raises:
+        McsException: If no bus can be found.
+    """
+    for c in ["PCAN_PCIBUS1", "PCAN_USBBUS1", "PCAN_USBBUS2"]:
+        com_can = mcs.ComPeakCan(c)
+        mcs_bus = mcs.McsBus(com_can)
+        mcs_instance = Mcs(mcs_bus)
+        try:
+            log.debug(f"Opening CAN bus '{c}' (chardev driver)")
+            mcs_instance.open()
+        except mcs.McsException:
+            log.debug(f"CAN bus '{c}' failed to open (chardev driver)")
+        else:
+            log.debug(f"Opened CAN bus instance '{c}' (chardev driver)")
+            return mcs_instance
+    raise mcs.McsException("No CAN bus found")
+
+
+def get_mcs() -> Mcs:
+    """Return any CAN Bus instance.
+
+    First available instance that can be opened is returned, either using the
+    python-can package or the proprietary PEAK chardev driver.
+
+    Returns:
+        mcs_instance: Opened Mcs instance.
+
+    Raises:
+        McsException: If no bus can be found.
+    """
+    try:
+        return get_any_mcs_python_can()
+    except mcs.McsException:
+        log.debug("No python-can compliant CAN bus instance found")
+    return get_any_mcs_peak_chardev()
+
+
+def get_simulated_mcs(modules: List[mcs.SimulatedModule],
+                      latency: float = 0.0005,
+                      jitter: float = 0.0) -> Mcs:
+    """Return Mcs instance with simulated modules (no CAN hardware required).
+
+    The instance is returned opened and the simulated modules are registered
+    (scanned).
+
+    Args:
+        modules: Simulated modules on the bus (e.g. SimulatedLaserBoard).
+        latency: Mean response latency in seconds.
+        jitter: Max. deviation from mean latency in seconds.
+
+    Returns:
+        mcs_instance: Opened Mcs instance.
+    """
+    com_sim = mcs.ComSimulated(modules, latency=latency, jitter=jitter)
+    mcs_instance = Mcs(mcs.McsBus(com_sim))
+    mcs_instance.open(register="scan")
+    return mcs_instance
+
+
+def get_multi_mcs(names: List[str]) -> MultiMcs:
+    """Return MultiMcs instance for given CAN communicators.
+
+    The instance is returned opened (all buses are opened in parallel).
+
+    Args:
+        names: Names of CAN communicators, e.g. ["socket0", "socket1"] (see
+            CAN_COMMUNICATORS).
+
+    Returns:
+        multi_mcs: Opened MultiMcs instance.
+
+    Raises:
+        McsException: If any bus cannot be opened.
+    """
+    multi_mcs = MultiMcs({name: _get_mcs_instance(name) for name in names})
+    multi_mcs.open()
+    return multi_mcs
+
+
+def get_mcs_tml() -> Mcs:
+    """Return any CAN Bus instance with extended message support (for TML).
+
+    First available instance that can be opened is returned, either using the
+    python-can package or the proprietary PEAK chardev driver.
+
+    Returns:
+        mcs_instance: Opened Mcs instance.
+
+    Raises:
+        McsException: If no bus can be found.
+    """
+    can_mcs_tml = mcs.get_mcs()
+    tml_handler = mcs.TmlDevicesHandler(can_mcs_tml.bus)
+    can_mcs_tml.ext_msg_rcv = tml_handler
+    return can_mcs_tml
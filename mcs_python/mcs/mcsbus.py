@@ -1,481 +1,1043 @@
-# -*- coding: utf-8 -*-
-import datetime
-
-import can  # python-can package
-import collections
-import logging
-import logging.handlers
-import time
-from typing import List, Optional, Tuple
-
-from mcs import PCANBasic
-from mcs.cmd_names import CMD_NAME
-from mcs.opcode_names import OPCODE_NAME, OPERATION_CATEGORY
-
-CAN_BUFFER_SIZE = 5  # Max no. of messages.
-CAN_TIMEOUT = 0.3  # Time-out when waiting for response from module.
-CMD_DEQUE_LEN = 512  # Max. no. of messages in command history (e.g. logging).
-DEFAULT_CMD_LOG_LEN = 20  # Default no. of recent messages to be logged.
-
-log = logging.getLogger(__name__)
-
-
-def get_data_from_tml_id(arbitration_id: int
-                         ) -> (int, int, int, int, int, int):
-    """Return opcode and axis id from TML extended CAN message (arbitration) id.
-
-    An arbitration id send by the master is 29 bits long and contains the
-    operation category (c), the axis id addressed (a) and the operand id (d):
-
-    bits:  28...24...20...16...12...8 ...4 ...0
-           |    |    |    |    |    |    |    |
-        0b c cccc cc00 00aa aaa0 000d dddd dddd
-
-    The opcode (operation code) is the operation category (c) and the operand id
-    (d) combined (16 bit word):
-
-    bits:    ...12...8 ...4 ...0
-                |    |    |    |
-          0b cccc cccd dddd dddd
-          op.category|operand id
-
-    An arbitration id send by the slave (axis) is of different format. The
-    axis id is then often but not always reported as the operand id.
-
-    Args:
-          arbitration_id: TML message id, which is the first element (16-bit
-            word) of TML instruction list.
-    """
-    axis_id = (arbitration_id & 0b11110000000000000) >> 13  # bits 13 to 16
-    operation_category = arbitration_id >> 22  # last 7 bits (bits 22 to 28).
-    operand_id = arbitration_id & 0b111111111  # first 9 bits (bits 0 to 8).
-    opcode = (operation_category << 9) | operand_id
-    data_l = (arbitration_id & 0b1111000000000) >> 9  # bits 9 to 13
-    data_r = (arbitration_id & 0b111100000000000000000) >> 17  # bits 17 to 21
-    return axis_id, opcode, operation_category, operand_id, data_r, data_l
-
-
-def msg_txt(msg: can.Message) -> str:
-    """Return message info str in human readable format.
-
-    MCS examples:
-        Timestamp: 18.055597 ID: 0465 S DLC: 2  41 32           get port
-        Timestamp: 18.060731 ID: 0065 S DLC: 5  42 00 32 00 01  port data
-        Timestamp: 18.567338 ID: 0465 S DLC: 5  40 00 08 00 08  set port
-        Timestamp: 18.573692 ID: 0065 S DLC: 3  00 00 40        status info
-
-    TML examples:
-                                                      op-  ax-  op-   op-
-                                                      ct   id  id    code
-                                                      |  ? | ? |     |
-        Ti...162 ID: 0000e002 X DLC: 0              | 00 0 7 0 002 | 0002 axis
-            off (motor command)
-        Ti...906 ID: 1640e004 X DLC: 4  f0 0f b1 03 | 59 0 7 0 004 | b204 read
-            16-bit (GiveMeData2)
-        Ti...945 ID: 1a9fe007 X DLC: 4  b1 03 05 20 | 6a 0 f f 007 | d407
-            -slave- (TakeData2)
-
-    Messages sent by master use ax-id (axis id) for addressing individual axis.
-    Messages sent by slave (axis) often report their axis id in op-id (operand
-    id). The opcode is operation category (op-ct) and operand id (op-id) as a
-    single 16-bit word (op-id bits 0 to 9 and op-ct bits 10 to 15).
-    """
-    try:
-        if msg.is_extended_id:
-            axis, opcode, op_category, op_id, d_l, d_r = get_data_from_tml_id(
-                msg.arbitration_id)
-
-            cmd_txt = (f"| {op_category:02x} {d_l:x} {axis:x} {d_r:x} "
-                       f"{op_id:3x} | {opcode:4x}")
-
-            if op_category == 0x6b:
-                # TakeData2 message from slave (not in dictionary of op-code
-                # names).
-                opcode_name = "-slave-"
-            else:
-                opcode_name = OPCODE_NAME.get(opcode, "-")
-            cmd_txt += f" {opcode_name}"
-
-            cat_name = OPERATION_CATEGORY.get(op_category, "-")
-            cmd_txt += f" ({cat_name})"
-        else:
-            cmd_txt = CMD_NAME.get(msg.data[0], "?")
-        can_txt = str(msg)
-        if len(can_txt) > 98:
-            can_txt = can_txt[:98]
-        return f"{can_txt:<98} {cmd_txt}"
-    except (KeyError, TypeError):
-        # msg.data[0] not defined when msg.data is None (e.g. for error frames)
-        return str(msg)  # str-implementation of python-can message as fallback
-
-
-class McsException(Exception):
-    """Base MCS Exception
-
-    Other MCS Exception are derived from this base exception class.
-    """
-    pass
-
-
-class McsBusException(McsException):
-    """Raised when a CAN bus exception occurs."""
-    pass
-
-
-class McsBusMessageTypeException(McsException):
-    """Raised when an unsupported CAN frame is received, e.g. remote frame."""
-    pass
-
-
-class McsBusOffException(McsException):
-    """Raised when CAN Controller is in BUS OFF and cannot write on the bus.
-
-    It will need a reinit or power cycle."""
-    pass
-
-
-class McsBusErrorFrameException(McsException):
-    """Raised when CAN Controller receives an error frame."""
-    pass
-
-
-class ComInterface(object):
-    """Interface for CAN communication classes for use with McsBus class.
-
-    Uses python-can Message objects:
-        Message(timestamp=float, arbitration_id=int, is_extended_id=bool,
-                is_remote_frame=bool, is_error_frame=bool, channel=int,
-                dlc=int, data=bytes, ...):
-    """
-
-    def open(self) -> None:
-        raise NotImplementedError("Not implemented in interface class")
-
-    def close(self) -> None:
-        raise NotImplementedError("Not implemented in interface class")
-
-    def send(self, msg: can.Message) -> None:
-        raise NotImplementedError("Not implemented in interface class")
-
-    def read_in_loop(self) -> Optional[can.Message]:  # read is called in loop
-        raise NotImplementedError("Not implemented in interface class")
-
-
-class McsBus(object):
-    """Miltenyi CAN bus handling instance.
-
-    Handles sending and reading of Miltenyi CAN telegrams (e.g. for McsDevice
-    instances and MCS instance). Supports multiple CAN bus types (communicator).
-    """
-
-    def __init__(self, communicator: ComInterface) -> None:
-        """Instantiate MCS CAN Bus instance.
-
-        Args:
-            communicator: Any matching communication interface (e.g.
-                ComPythonCan).
-        """
-        self._com = communicator
-        self.error_code = 0
-        self._do_read = False
-        self._time_shift = None
-        self._cmd_history = collections.deque(maxlen=CMD_DEQUE_LEN)
-        self._file_log = None
-
-    def open(self) -> None:
-        """Open CAN bus for communicating.
-
-        Raises:
-            McsBusException: If opening fails.
-        """
-        rsp = self._com.open()
-        if rsp:
-            msg = f"Cannot open CAN connection: {rsp}"
-            log.critical(msg)
-            raise McsBusException(msg)
-
-    def close(self) -> None:
-        """Close CAN bus. """
-        self._com.close()
-
-    def read(self) -> Optional[can.Message]:
-        """Read messages received from CAN bus.
-
-        This is usually called from a single thread that dispatches CAN messages
-        to the corresponding arbitration Ids (MCS device CAN Ids).
-
-        Returns:
-            message: Latest read message.
-        """
-        msg = self._com.read_in_loop()
-        if msg is not None:
-            if not self._time_shift:
-                self._update_time_stamp_offset(msg)
-            self._cmd_history.append(msg)
-            txt = msg_txt(msg)
-            log.debug(txt)
-            if self._file_log:
-                self._file_log.info(txt)
-        return msg
-
-    def _update_time_stamp_offset(self, msg: can.Message) -> None:
-        """Calculated time stamp offset from time in (received) message.
-
-        Sent messages get a time stamp written when send. There is an offset
-        between the Python process time and the time used by the CAN bus. To
-        calculate the offset usually the first response received from the CAN
-        bus used. The current time is then synchronized (offset calculation)
-        and is used from then on to add time stamps to sent CAN messages.
-
-        Args:
-            msg: Message received from CAN bus which time stamp shall be used
-                for time offset (i.e sync) calculation.
-        """
-        now = time.time()
-        self._time_shift = msg.timestamp - now
-        log.debug(f"Time shift set to {self._time_shift} "
-                  f"({msg.timestamp} - {now})")
-
-    def send(self, can_id: int, data: List[int], dlc: Optional[int] = None,
-             is_extended: bool = False) -> can.Message:
-        """Send CAN message to CAN bus and add to history queue.
-
-        Args:
-            can_id: Arbitration Id to be used when sending, e.g. 0x474.
-            data: List of data to be send, e.g. [0x1c, 0xff].
-            dlc: Number of data elements to be send (optional and usually
-                calculated automatically from len(data).
-            is_extended: message type
-
-        Returns:
-            message: Sent message (with time stamp added).
-        """
-
-        if not dlc:
-            dlc = len(data)
-        can_msg = can.Message(arbitration_id=can_id, is_extended_id=is_extended,
-                              dlc=dlc, data=data)
-        if self._time_shift:
-            can_msg.timestamp = self._time_shift + time.time()
-
-        txt = msg_txt(can_msg)
-        log.debug(txt)
-        if self._file_log:
-            self._file_log.info(txt)
-        self._cmd_history.append(can_msg)
-        self._com.send(can_msg)
-        return can_msg
-
-    def get_recent_commands(self, length: int = -1) -> List[can.Message]:
-        """Return list of recent CAN messages.
-
-        Args:
-            length: Number of recent CAN messages to be returned. Defaults to
-                -1 which returns all messages that are stored in queue.
-
-        Returns:
-            list of messages: List of recent can.Message items.
-        """
-        if length <= 0:
-            commands = self._cmd_history
-        else:
-            commands = collections.deque(self._cmd_history, maxlen=length)
-        return list(commands)
-
-    def log_recent_commands(self, length: int = DEFAULT_CMD_LOG_LEN) -> None:
-        """Log recent CAN command queue to standard logger.
-
-        Args:
-            length: Number of recent CAN commands to be logged from queue.
-        """
-        # TODO(MME): Add filter functionality for ids here (and in get_rec...).
-        commands = self.get_recent_commands(length=length)
-        history = f"Last {len(commands)} commands for all devices:\n"
-        for i in commands:
-            name = CMD_NAME.get(i.data[0], "?")
-            history += f"{i.__str__():<97} {name}\n"
-        log.debug(history)
-
-    def log_to_file(self, path: Optional[str] = None) -> None:
-        """Log CAN messages (send and received) to file.
-
-        The data is logged in rotating mode with upt o 5 backup files. The log
-        file will grow up to 16 MiB and will then be backup-ed into files with
-        a suffix number added to id. Where the most recent is '.1' and the
-        oldest one is ending with '.10'.
-
-        The most current file is always the one specified in 'path', and each
-        time it reaches the size limit it is renamed with the suffix .1. Each
-        of the existing backup files is renamed to increment the suffix
-        (.1 becomes .2, etc.) and the .11 file is erased.
-
-        Args:
-            path: Full path to log file (incl. file name). Defaults to
-                'mcs_DATE.log' if None where DATE is replaced by current date
-                and time e.g. 'mcs_2021-01-26-16_50_03.log'.
-        """
-        now = datetime.datetime.today().strftime('%Y-%m-%d-%H:%M:%S')
-        if not path:
-            path = f"mcs_{now.replace(':', '_')}.log"
-        self._file_log = logging.getLogger('McsFileLog')
-        self._file_log.setLevel(logging.INFO)
-        handler = logging.handlers.RotatingFileHandler(
-            path,
-            maxBytes=2**24,  # 16 MiB
-            backupCount=10
-        )
-        self._file_log.addHandler(handler)
-        self._file_log.info(f"CAN message logging started: {now}")
-
-    def stop_log_to_file(self) -> None:
-        """Stop log file writing."""
-        self._file_log = None
-
-
-class ComPeakCan(ComInterface):
-    """CAN communicator using the proprietary PEAK chardev driver."""
-
-    def __init__(self, channel: str = 'PCAN_PCIBUS1') -> None:
-        self._bus = PCANBasic.PCANBasic()
-        if channel == "PCAN_USBBUS1":
-            self._channel = PCANBasic.PCAN_USBBUS1
-        elif channel == 'PCAN_PCIBUS1':
-            # Some computers may have a PCI-card built in instead of a
-            # PCAN-USB-dongle
-            self._channel = PCANBasic.PCAN_PCIBUS1
-        else:
-            raise ValueError(f"Channel type '{channel}' is not supported")
-
-    def open(self) -> None:
-        rsp = self._bus.Initialize(self._channel, PCANBasic.PCAN_BAUD_1M)
-        if rsp == PCANBasic.PCAN_ERROR_OK:
-            return
-        raise McsBusException(f"PCANBasic initialize error {rsp}")
-
-    def close(self) -> None:
-        self._bus.Uninitialize(self._channel)
-
-    def send(self, msg: can.Message) -> Optional[None]:
-        peak_msg = PCANBasic.TPCANMsg()
-        peak_msg.ID = msg.arbitration_id
-        peak_msg.LEN = msg.dlc
-        if msg.is_extended_id:
-            peak_msg.MSGTYPE = PCANBasic.PCAN_MESSAGE_EXTENDED
-        else:
-            peak_msg.MSGTYPE = PCANBasic.PCAN_MESSAGE_STANDARD
-        for i in range(peak_msg.LEN):
-            peak_msg.DATA[i] = msg.data[i]
-        resp = None
-        result = self._bus.Write(self._channel, peak_msg)
-        if result != PCANBasic.PCAN_ERROR_OK:
-            # if self.modules[id&0xff].getThrowError():
-            # resp = "PCANBasic.Write Error"
-            raise RuntimeError(f"PCANBasic write error: {result}")
-        return resp
-
-    def read_in_loop(self) -> Optional[can.Message]:  # read is called in loop
-        msg = None
-        rsp: List = [PCANBasic.PCAN_ERROR_OK, ]
-        if ((rsp[0] & PCANBasic.PCAN_ERROR_QRCVEMPTY)
-                != PCANBasic.PCAN_ERROR_QRCVEMPTY):
-            rsp: Tuple[PCANBasic.TPCANStatus, PCANBasic.TPCANMsg,
-                       PCANBasic.TPCANTimestamp] = self._bus.Read(self._channel)
-            status = rsp[0]
-            if status == PCANBasic.PCAN_ERROR_OK:  # [0]=status
-                peak_msg = rsp[1]  # [1]=message
-                peak_time = rsp[2]  # [2]=timestamp
-                time_stamp = (peak_time.micros + 1000 * peak_time.millis +
-                              0x100000000 * 1000 * peak_time.millis_overflow)
-                time_stamp /= 1000000  # Microseconds to seconds conversion
-                is_extended = False
-                if peak_msg.MSGTYPE == PCANBasic.PCAN_MESSAGE_EXTENDED.value:
-                    is_extended = True
-                msg = can.Message(
-                    arbitration_id=peak_msg.ID,
-                    dlc=peak_msg.LEN,
-                    timestamp=time_stamp,
-                    is_extended_id=is_extended,
-                    data=peak_msg.DATA
-                )
-        else:
-            time.sleep(0.01)
-        return msg
-
-
-class ComPythonCan(ComInterface):
-    """CAN communicator using the python-can package."""
-
-    def __init__(self, channel: str = 'PCAN_PCIBUS1', bus_type: str = 'pcan',
-                 bit_rate: int = 1000000) -> None:
-        self._channel = channel
-        self._bus_type = bus_type
-        self._bit_rate = bit_rate
-        self._bus = None
-
-    def open(self) -> None:
-        """Open CAN communication using the python-can package.
-
-        Note: For socket/network based CAN on Linux systems (not using the
-        chardev PEAK driver but the one that comes with the Linux kernel):
-
-        self._bus = can.interface.Bus(channel='can0',
-                                     bustype='socketcan',
-                                     bitrate=1000000
-                                     )
-
-        You might need to type in a terminal first:
-
-        $ sudo modprobe peak_usb
-        or:
-        $ sudo modprobe peak_pci
-        then:
-        $ sudo ip link set can0 up type can bitrate 1000000
-
-        Code for doing this from Python (needs testing as sudo is involved):
-
-        ---
-        import shlex
-        import subprocess
-        import time
-        cmd = 'sudo modprobe peak_pci'
-        # cmd = 'sudo modprobe peak_usb'
-        # args = shlex.split(cmd)
-        # subprocess.Popen(args)
-        subprocess.Popen(cmd, shell=True)
-        cmd = 'sudo ip link set can0 up type can bitrate 1000000'
-        # args = shlex.split(cmd)
-        # subprocess.Popen(args)
-        subprocess.Popen(cmd, shell=True)
-        # subprocess.Popen(cmd, shell=True, stdin=subprocess.PIPE,
-        #     stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        time.sleep(0.5)
-        ---
-
-        then do as above:
-
-        self._bus = can.interface.Bus(channel='can0',
-                                     bustype='socketcan',
-                                     bitrate=1000000
-                                     )
-
-        Raises:
-              McsException: If opening/connect fails.
-        """
-        try:
-            # self._bus = can.interface.Bus(channel='PCAN_USBBUS1',
-            self._bus = can.interface.Bus(channel=self._channel,
-                                          bustype=self._bus_type,
-                                          bitrate=self._bit_rate
-                                          )
-        except Exception as exc:
-            raise McsBusException(exc)
-
-    def close(self) -> None:
-        pass
-
-    def send(self, msg: PCANBasic.TPCANMsg) -> Optional[None]:
-        self._bus.send(msg)
-
-    def read_in_loop(self) -> Optional[can.Message]:  # read is called in loop
-        msg: can.message.Message = self._bus.recv(0.01)
-        return msg
+# -*- coding: utf-8 -*-
+import datetime
+
+import can  # python-can package
+import collections
+import concurrent.futures
+import errno
+import itertools
+import logging
+import logging.handlers
+import platform
+import queue
+import selectors
+import socket
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from mcs import PCANBasic
+from mcs.cmd_names import CMD_NAME
+from mcs.metrics import McsMetrics
+from mcs.opcode_names import OPCODE_NAME, OPERATION_CATEGORY
+from mcs.trace import TRACE_BACKUP_COUNT, TRACE_MAX_BYTES, TraceRecorder
+
+CAN_BUFFER_SIZE = 5  # Max no. of messages.
+CAN_TIMEOUT = 0.3  # Time-out when waiting for response from module.
+CMD_DEQUE_LEN = 512  # Max. no. of messages in command history (e.g. logging).
+DEFAULT_CMD_LOG_LEN = 20  # Default no. of recent messages to be logged.
+READ_BATCH_SIZE = 64  # Max. no. of messages read at once (see read_batch()).
+READ_TIMEOUT = 0.5  # Max. time a read blocks if there is no message.
+PRIORITY_CONTROL = 0  # TX lane for commands (sent first).
+PRIORITY_POLL = 1  # TX lane for polling requests (e.g. scans, port updates).
+TX_PACING_WINDOW = 0.001  # Max. seconds of frames sent ahead of the wire.
+TX_RETRY_TIMEOUT = 0.1  # Max. seconds to retry if TX buffer is full.
+STD_ID_MASK = 0x7ff  # 11 bit standard arbitration id.
+EXT_ID_MASK = 0x1fffffff  # 29 bit extended arbitration id.
+
+log = logging.getLogger(__name__)
+
+
+def get_data_from_tml_id(arbitration_id: int
+                         ) -> (int, int, int, int, int, int):
+    """Return opcode and axis id from TML extended CAN message (arbitration) id.
+
+    An arbitration id send by the master is 29 bits long and contains the
+    operation category (c), the axis id addressed (a) and the operand id (d):
+
+    bits:  28...24...20...16...12...8 ...4 ...0
+           |    |    |    |    |    |    |    |
+        0b c cccc cc00 00aa aaa0 000d dddd dddd
+
+    The opcode (operation code) is the operation category (c) and the operand id
+    (d) combined (16 bit word):
+
+    bits:    ...12...8 ...4 ...0
+                |    |    |    |
+          0b cccc cccd dddd dddd
+          op.category|operand id
+
+    An arbitration id send by the slave (axis) is of different format. The
+    axis id is then often but not always reported as the operand id.
+
+    Args:
+          arbitration_id: TML message id, which is the first element (16-bit
+            word) of TML instruction list.
+    """
+    axis_id = (arbitration_id & 0b11110000000000000) >> 13  # bits 13 to 16
+    operation_category = arbitration_id >> 22  # last 7 bits (bits 22 to 28).
+    operand_id = arbitration_id & 0b111111111  # first 9 bits (bits 0 to 8).
+    opcode = (operation_category << 9) | operand_id
+    data_l = (arbitration_id & 0b1111000000000) >> 9  # bits 9 to 13
+    data_r = (arbitration_id & 0b111100000000000000000) >> 17  # bits 17 to 21
+    return axis_id, opcode, operation_category, operand_id, data_r, data_l
+
+
+def get_filter_ranges(filters: List[Dict]) -> List[Tuple[int, int, bool]]:
+    """Return merged arbitration id ranges covering given CAN filters.
+
+    For hardware that only supports id range filters (e.g. PEAK PCANBasic).
+    Each range includes all ids matching the filter (and maybe more, if the
+    filter mask is not contiguous).
+
+    Args:
+        filters: CAN filters in python-can format, i.e. dicts with keys
+            "can_id", "can_mask" and "extended".
+
+    Returns:
+        ranges: Sorted list of (lowest id, highest id, is extended).
+    """
+    ranges = []
+    for extended, id_mask in [(False, STD_ID_MASK), (True, EXT_ID_MASK)]:
+        bounds = sorted(
+            (f["can_id"] & f["can_mask"] & id_mask,
+             (f["can_id"] & f["can_mask"] & id_mask)
+             | (~f["can_mask"] & id_mask))
+            for f in filters if f.get("extended", False) == extended)
+        for low, high in bounds:
+            if (ranges and ranges[-1][2] == extended
+                    and low <= ranges[-1][1] + 1):
+                ranges[-1] = (ranges[-1][0], max(high, ranges[-1][1]),
+                              extended)
+            else:
+                ranges.append((low, high, extended))
+    return ranges
+
+
+def get_frame_time(msg: can.Message, bit_rate: int) -> float:
+    """Return max. time in seconds to transmit message on the bus.
+
+    Includes frame overhead (SOF, arbitration, control, CRC, ACK, EOF and
+    interframe space) and worst case bit stuffing.
+    """
+    overhead = 67 if msg.is_extended_id else 47
+    bits = overhead + 8 * msg.dlc
+    return bits * 1.2 / bit_rate  # Stuff bits: max. 1 per 4 (+20 %).
+
+
+def msg_txt(msg: can.Message) -> str:
+    """Return message info str in human readable format.
+
+    MCS examples:
+        Timestamp: 18.055597 ID: 0465 S DLC: 2  41 32           get port
+        Timestamp: 18.060731 ID: 0065 S DLC: 5  42 00 32 00 01  port data
+        Timestamp: 18.567338 ID: 0465 S DLC: 5  40 00 08 00 08  set port
+        Timestamp: 18.573692 ID: 0065 S DLC: 3  00 00 40        status info
+
+    TML examples:
+                                                      op-  ax-  op-   op-
+                                                      ct   id  id    code
+                                                      |  ? | ? |     |
+        Ti...162 ID: 0000e002 X DLC: 0              | 00 0 7 0 002 | 0002 axis
+            off (motor command)
+        Ti...906 ID: 1640e004 X DLC: 4  f0 0f b1 03 | 59 0 7 0 004 | b204 read
+            16-bit (GiveMeData2)
+        Ti...945 ID: 1a9fe007 X DLC: 4  b1 03 05 20 | 6a 0 f f 007 | d407
+            -slave- (TakeData2)
+
+    Messages sent by master use ax-id (axis id) for addressing individual axis.
+    Messages sent by slave (axis) often report their axis id in op-id (operand
+    id). The opcode is operation category (op-ct) and operand id (op-id) as a
+    single 16-bit word (op-id bits 0 to 9 and op-ct bits 10 to 15).
+    """
+    try:
+        if msg.is_extended_id:
+            axis, opcode, op_category, op_id, d_l, d_r = get_data_from_tml_id(
+                msg.arbitration_id)
+
+            cmd_txt = (f"| {op_category:02x} {d_l:x} {axis:x} {d_r:x} "
+                       f"{op_id:3x} | {opcode:4x}")
+
+            if op_category == 0x6b:
+                # TakeData2 message from slave (not in dictionary of op-code
+                # names).
+                opcode_name = "-slave-"
+            else:
+                opcode_name = OPCODE_NAME.get(opcode, "-")
+            cmd_txt += f" {opcode_name}"
+
+            cat_name = OPERATION_CATEGORY.get(op_category, "-")
+            cmd_txt += f" ({cat_name})"
+        else:
+            cmd_txt = CMD_NAME.get(msg.data[0], "?")
+        can_txt = str(msg)
+        if len(can_txt) > 98:
+            can_txt = can_txt[:98]
+        return f"{can_txt:<98} {cmd_txt}"
+    except (KeyError, TypeError):
+        # msg.data[0] not defined when msg.data is None (e.g. for error frames)
+        return str(msg)  # str-implementation of python-can message as fallback
+
+
+class LazyMsgTxt(object):
+    """Message info str (see msg_txt()) formatted on demand, only.
+
+    Pass as logging argument (e.g. log.debug("%s", LazyMsgTxt(msg))) so the
+    message is decoded only if a handler actually emits the log record.
+    """
+    __slots__ = ("msg", )
+
+    def __init__(self, msg: can.Message) -> None:
+        self.msg = msg
+
+    def __str__(self) -> str:
+        return msg_txt(self.msg)
+
+
+class _DeferredFormatQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves formatting of records to the queue listener.
+
+    The default QueueHandler formats the record in the logging thread which is
+    the time critical CAN reader thread here.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class McsException(Exception):
+    """Base MCS Exception
+
+    Other MCS Exception are derived from this base exception class.
+    """
+    pass
+
+
+class McsBusException(McsException):
+    """Raised when a CAN bus exception occurs."""
+    pass
+
+
+class McsBusTxBufferFullException(McsBusException):
+    """Raised by communicators if the transmit buffer is (temporarily) full.
+
+    McsBus retries sending in this case (see TX_RETRY_TIMEOUT).
+    """
+    pass
+
+
+class McsBusMessageTypeException(McsException):
+    """Raised when an unsupported CAN frame is received, e.g. remote frame."""
+    pass
+
+
+class McsBusOffException(McsException):
+    """Raised when CAN Controller is in BUS OFF and cannot write on the bus.
+
+    It will need a reinit or power cycle."""
+    pass
+
+
+class McsBusErrorFrameException(McsException):
+    """Raised when CAN Controller receives an error frame."""
+    pass
+
+
+class ComInterface(object):
+    """Interface for CAN communication classes for use with McsBus class.
+
+    Uses python-can Message objects:
+        Message(timestamp=float, arbitration_id=int, is_extended_id=bool,
+                is_remote_frame=bool, is_error_frame=bool, channel=int,
+                dlc=int, data=bytes, ...):
+
+    Set bit_rate (bits per second) to let McsBus pace sending to the bus speed.
+    send() should raise McsBusTxBufferFullException if the transmit buffer is
+    temporarily full.
+    """
+    bit_rate: Optional[int] = None
+
+    def open(self) -> None:
+        raise NotImplementedError("Not implemented in interface class")
+
+    def close(self) -> None:
+        raise NotImplementedError("Not implemented in interface class")
+
+    def send(self, msg: can.Message) -> None:
+        raise NotImplementedError("Not implemented in interface class")
+
+    def read_in_loop(self) -> Optional[can.Message]:  # read is called in loop
+        raise NotImplementedError("Not implemented in interface class")
+
+    def read_batch(self) -> List[can.Message]:
+        """Return received messages.
+
+        Blocks until at least one message is received, wake_up() is called, or
+        (an implementation specific) time out. Communicators should override
+        this to wait for messages without polling and to return all pending
+        messages at once (up to READ_BATCH_SIZE).
+        """
+        msg = self.read_in_loop()
+        return [] if msg is None else [msg]
+
+    def wake_up(self) -> None:
+        """Return from a blocking read_batch() call (e.g. to stop reading)."""
+        pass
+
+    def set_filters(self, filters: Optional[List[Dict]]) -> None:
+        """Set acceptance filters for received messages (if supported).
+
+        Communicators not supporting filters receive all messages (unwanted
+        ones are ignored by the Mcs instance anyway).
+
+        Args:
+            filters: CAN filters in python-can format, i.e. dicts with keys
+                "can_id", "can_mask" and "extended". None: receive all.
+        """
+        pass
+
+
+class Waker(object):
+    """Wake-up socket pair to interrupt a blocking select() on a CAN socket."""
+
+    def __init__(self) -> None:
+        self._rsock, self._wsock = socket.socketpair()
+        self._rsock.setblocking(False)
+        self._wsock.setblocking(False)
+
+    def fileno(self) -> int:
+        return self._rsock.fileno()
+
+    def wake_up(self) -> None:
+        try:
+            self._wsock.send(b"\x00")
+        except BlockingIOError:  # Already woken up (buffer is full).
+            pass
+
+    def clear(self) -> None:
+        try:
+            while self._rsock.recv(512):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self) -> None:
+        self._rsock.close()
+        self._wsock.close()
+
+
+class McsBus(object):
+    """Miltenyi CAN bus handling instance.
+
+    Handles sending and reading of Miltenyi CAN telegrams (e.g. for McsDevice
+    instances and MCS instance). Supports multiple CAN bus types (communicator).
+
+    While open, messages are sent by a transmit thread from a queue with
+    priority lanes (PRIORITY_CONTROL before PRIORITY_POLL). Sending is paced to
+    the bit rate of the communicator (if known) and retried while the transmit
+    buffer is full, so bursts run at wire speed without sleeps by the caller.
+
+    Performance counters of the bus and its devices are collected in metrics
+    (see McsMetrics).
+    """
+
+    def __init__(self, communicator: ComInterface) -> None:
+        """Instantiate MCS CAN Bus instance.
+
+        Args:
+            communicator: Any matching communication interface (e.g.
+                ComPythonCan).
+        """
+        self._com = communicator
+        self.error_code = 0
+        self._do_read = False
+        self._time_shift = None
+        self._cmd_history = collections.deque(maxlen=CMD_DEQUE_LEN)
+        self._file_log = None
+        self._file_log_listener = None  # Writes file log in background.
+        self._trace_recorder = None  # Binary trace recording (optional).
+        self._read_batch = collections.deque()  # Messages read but not
+        # returned yet by read().
+        self._tx_queue = queue.PriorityQueue()  # (priority, seq., msg, future)
+        self._tx_sequence = itertools.count()  # FIFO within priority lane.
+        self._tx_thread = None
+        self._tx_lock = threading.Lock()  # Held while pacing and writing.
+        self._tx_wire_time = 0.0  # Time when all sent frames are on the wire.
+        self.metrics = McsMetrics()
+
+    def open(self) -> None:
+        """Open CAN bus for communicating.
+
+        Raises:
+            McsBusException: If opening fails.
+        """
+        rsp = self._com.open()
+        if rsp:
+            msg = f"Cannot open CAN connection: {rsp}"
+            log.critical(msg)
+            raise McsBusException(msg)
+        self._start_tx_thread()
+
+    def close(self) -> None:
+        """Close CAN bus. """
+        self._stop_tx_thread()
+        self._com.close()
+
+    def _start_tx_thread(self) -> None:
+        if self._tx_thread and self._tx_thread.is_alive():
+            return
+        self._tx_thread = threading.Thread(
+            name=f"{__name__} transmit", target=self._tx_loop, daemon=True)
+        self._tx_thread.start()
+
+    def _stop_tx_thread(self) -> None:
+        """Stop transmit thread, fail messages not sent yet."""
+        thread, self._tx_thread = self._tx_thread, None
+        if thread:
+            self._tx_queue.put((-1, -1, None, None))  # Stop request.
+            thread.join(timeout=5)
+        while not self._tx_queue.empty():
+            _, _, _, future = self._tx_queue.get_nowait()
+            if future and future.set_running_or_notify_cancel():
+                future.set_exception(McsBusException("CAN bus closed"))
+
+    def _tx_loop(self) -> None:
+        """Send queued messages until stop request (see _stop_tx_thread())."""
+        while True:
+            _, _, msg, future = self._tx_queue.get()
+            if msg is None:
+                return
+            if not future.set_running_or_notify_cancel():
+                continue  # Cancelled.
+            try:
+                with self._tx_lock:
+                    self._pace(msg)
+                    self._write(msg)
+            except Exception as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(msg)
+
+    def _pace(self, msg: can.Message) -> None:
+        """Wait so that sent frames are at most TX_PACING_WINDOW ahead of the
+        wire (according to bit rate of communicator)."""
+        bit_rate = self._com.bit_rate
+        if not bit_rate:
+            return
+        now = time.perf_counter()
+        ahead = self._tx_wire_time - now
+        if ahead > TX_PACING_WINDOW:
+            time.sleep(ahead - TX_PACING_WINDOW)
+        self._tx_wire_time = (max(now, self._tx_wire_time)
+                              + get_frame_time(msg, bit_rate))
+
+    def _write(self, msg: can.Message) -> None:
+        """Write message to communicator, retry while TX buffer is full."""
+        if self._time_shift:
+            msg.timestamp = self._time_shift + time.time()
+        self._log_msg(msg, sent=True)
+        self._cmd_history.append(msg)
+        can_id = None if msg.is_extended_id else msg.arbitration_id & 0xff
+        delay = 0.0005
+        end_time = time.perf_counter() + TX_RETRY_TIMEOUT
+        while True:
+            try:
+                self._com.send(msg)
+                self.metrics.inc("tx_frames", can_id)
+                return
+            except McsBusTxBufferFullException:
+                if time.perf_counter() + delay > end_time:
+                    raise
+                self.metrics.inc("tx_retries", can_id)
+                time.sleep(delay)
+                delay = min(2 * delay, 0.01)
+
+    def set_filters(self, filters: Optional[List[Dict]]) -> None:
+        """Set acceptance filters of communicator (see ComInterface)."""
+        log.debug(f"Set CAN filters: {filters}")
+        self._com.set_filters(filters)
+
+    def read(self) -> Optional[can.Message]:
+        """Read message received from CAN bus.
+
+        Returns:
+            message: Oldest message read (None if there is none).
+        """
+        if not self._read_batch:
+            self._read_batch.extend(self.read_batch())
+        return self._read_batch.popleft() if self._read_batch else None
+
+    def read_batch(self) -> List[can.Message]:
+        """Read all messages received from CAN bus.
+
+        This is usually called from a single thread that dispatches CAN messages
+        to the corresponding arbitration Ids (MCS device CAN Ids). Blocks until
+        messages are received (or time out or wake_up()).
+
+        Returns:
+            messages: Read messages (oldest first, may be empty).
+        """
+        if self._read_batch:  # Left over from read().
+            msgs = list(self._read_batch)
+            self._read_batch.clear()
+            return msgs
+        msgs = self._com.read_batch()
+        for msg in msgs:
+            if not self._time_shift:
+                self._update_time_stamp_offset(msg)
+            self._cmd_history.append(msg)
+            self._log_msg(msg)
+        return msgs
+
+    def wake_up(self) -> None:
+        """Return from blocking read() or read_batch() (e.g. to stop reading).
+        """
+        self._com.wake_up()
+
+    def _log_msg(self, msg: can.Message, sent: bool = False) -> None:
+        """Log message to standard logger, file log and trace (if enabled).
+
+        The message is formatted lazily, i.e. only if the log record is
+        emitted. File log records and trace records are written by background
+        threads (see log_to_file() and record_to_file()).
+
+        Args:
+            msg: Message sent or received.
+            sent: If message was sent (True) or received.
+        """
+        if self._trace_recorder:
+            self._trace_recorder.record(msg, sent)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("%s", LazyMsgTxt(msg))
+        if self._file_log:
+            self._file_log.info("%s", LazyMsgTxt(msg))
+
+    def _update_time_stamp_offset(self, msg: can.Message) -> None:
+        """Calculated time stamp offset from time in (received) message.
+
+        Sent messages get a time stamp written when send. There is an offset
+        between the Python process time and the time used by the CAN bus. To
+        calculate the offset usually the first response received from the CAN
+        bus used. The current time is then synchronized (offset calculation)
+        and is used from then on to add time stamps to sent CAN messages.
+
+        Args:
+            msg: Message received from CAN bus which time stamp shall be used
+                for time offset (i.e sync) calculation.
+        """
+        now = time.time()
+        self._time_shift = msg.timestamp - now
+        log.debug(f"Time shift set to {self._time_shift} "
+                  f"({msg.timestamp} - {now})")
+
+    def send(self, can_id: int, data: List[int], dlc: Optional[int] = None,
+             is_extended: bool = False,
+             priority: int = PRIORITY_CONTROL) -> can.Message:
+        """Send CAN message to CAN bus and add to history queue.
+
+        Blocks until the message is written to the communicator.
+
+        Args:
+            can_id: Arbitration Id to be used when sending, e.g. 0x474.
+            data: List of data to be send, e.g. [0x1c, 0xff].
+            dlc: Number of data elements to be send (optional and usually
+                calculated automatically from len(data).
+            is_extended: message type
+            priority: Transmit lane, PRIORITY_CONTROL or PRIORITY_POLL.
+
+        Returns:
+            message: Sent message (with time stamp added).
+        """
+        if (self._tx_thread is not None and self._tx_queue.empty()
+                and self._tx_lock.acquire(blocking=False)):
+            # Nothing queued: write directly (saves the hand-over to the
+            # transmit thread).
+            try:
+                can_msg = self._create_msg(can_id, data, dlc, is_extended)
+                self._pace(can_msg)
+                self._write(can_msg)
+                return can_msg
+            finally:
+                self._tx_lock.release()
+        return self.send_nowait(can_id, data, dlc, is_extended,
+                                priority).result()
+
+    def send_nowait(self, can_id: int, data: List[int],
+                    dlc: Optional[int] = None, is_extended: bool = False,
+                    priority: int = PRIORITY_CONTROL
+                    ) -> concurrent.futures.Future:
+        """Queue CAN message for sending (see send()).
+
+        Returns:
+            future: Completion future, its result is the sent message (with
+                time stamp added), or it raises the exception of sending.
+        """
+        can_msg = self._create_msg(can_id, data, dlc, is_extended)
+        future = concurrent.futures.Future()
+        if self._tx_thread is None:  # Bus not opened by McsBus: send directly.
+            future.set_running_or_notify_cancel()
+            try:
+                self._write(can_msg)
+            except Exception as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(can_msg)
+        else:
+            self._tx_queue.put((priority, next(self._tx_sequence), can_msg,
+                                future))
+        return future
+
+    @staticmethod
+    def _create_msg(can_id: int, data: List[int], dlc: Optional[int],
+                    is_extended: bool) -> can.Message:
+        if not dlc:
+            dlc = len(data)
+        return can.Message(arbitration_id=can_id, is_extended_id=is_extended,
+                           dlc=dlc, data=data)
+
+    def get_recent_commands(self, length: int = -1) -> List[can.Message]:
+        """Return list of recent CAN messages.
+
+        Args:
+            length: Number of recent CAN messages to be returned. Defaults to
+                -1 which returns all messages that are stored in queue.
+
+        Returns:
+            list of messages: List of recent can.Message items.
+        """
+        if length <= 0:
+            commands = self._cmd_history
+        else:
+            commands = collections.deque(self._cmd_history, maxlen=length)
+        return list(commands)
+
+    def log_recent_commands(self, length: int = DEFAULT_CMD_LOG_LEN) -> None:
+        """Log recent CAN command queue to standard logger.
+
+        Args:
+            length: Number of recent CAN commands to be logged from queue.
+        """
+        # TODO(MME): Add filter functionality for ids here (and in get_rec...).
+        commands = self.get_recent_commands(length=length)
+        history = f"Last {len(commands)} commands for all devices:\n"
+        for i in commands:
+            name = CMD_NAME.get(i.data[0], "?")
+            history += f"{i.__str__():<97} {name}\n"
+        log.debug(history)
+
+    def log_to_file(self, path: Optional[str] = None) -> None:
+        """Log CAN messages (send and received) to file.
+
+        The data is logged in rotating mode with upt o 5 backup files. The log
+        file will grow up to 16 MiB and will then be backup-ed into files with
+        a suffix number added to id. Where the most recent is '.1' and the
+        oldest one is ending with '.10'.
+
+        The most current file is always the one specified in 'path', and each
+        time it reaches the size limit it is renamed with the suffix .1. Each
+        of the existing backup files is renamed to increment the suffix
+        (.1 becomes .2, etc.) and the .11 file is erased.
+
+        Messages are formatted and written to file in a background thread so
+        that the CAN reader thread does not block on disk access.
+
+        Args:
+            path: Full path to log file (incl. file name). Defaults to
+                'mcs_DATE.log' if None where DATE is replaced by current date
+                and time e.g. 'mcs_2021-01-26-16_50_03.log'.
+        """
+        self.stop_log_to_file()
+        now = datetime.datetime.today().strftime('%Y-%m-%d-%H:%M:%S')
+        if not path:
+            path = f"mcs_{now.replace(':', '_')}.log"
+        file_log = logging.getLogger('McsFileLog')
+        file_log.setLevel(logging.INFO)
+        handler = logging.handlers.RotatingFileHandler(
+            path,
+            maxBytes=2**24,  # 16 MiB
+            backupCount=10
+        )
+        log_queue = queue.SimpleQueue()
+        file_log.addHandler(_DeferredFormatQueueHandler(log_queue))
+        self._file_log_listener = logging.handlers.QueueListener(log_queue,
+                                                                 handler)
+        self._file_log_listener.start()
+        self._file_log = file_log
+        self._file_log.info(f"CAN message logging started: {now}")
+
+    def stop_log_to_file(self) -> None:
+        """Stop log file writing.
+
+        Pending messages are written to file before returning.
+        """
+        file_log, self._file_log = self._file_log, None
+        if file_log:
+            for handler in file_log.handlers[:]:
+                if isinstance(handler, _DeferredFormatQueueHandler):
+                    file_log.removeHandler(handler)
+        if self._file_log_listener:
+            self._file_log_listener.stop()  # Flushes queue.
+            for handler in self._file_log_listener.handlers:
+                handler.close()
+            self._file_log_listener = None
+
+    def record_to_file(self, path: Optional[str] = None,
+                       max_bytes: int = TRACE_MAX_BYTES,
+                       backup_count: int = TRACE_BACKUP_COUNT,
+                       compress: bool = False) -> TraceRecorder:
+        """Record CAN messages (send and received) to binary trace file.
+
+        Compact alternative to log_to_file(): Each frame is stored as a fixed-
+        size binary record (see mcs.trace) by a background thread. Use
+        mcs.trace_reader to query and analyze trace files.
+
+        Args:
+            path: Full path to trace file (incl. file name). Defaults to
+                'mcs_DATE.trace' if None where DATE is replaced by current date
+                and time e.g. 'mcs_2021-01-26-16_50_03.trace'.
+            max_bytes: File size limit for rotation. 0: never rotate.
+            backup_count: Max. no. of rotated files to keep.
+            compress: Compress rotated files with gzip.
+
+        Returns:
+            recorder: Started trace recorder (e.g. for statistics).
+        """
+        self.stop_record_to_file()
+        if not path:
+            now = datetime.datetime.today().strftime('%Y-%m-%d-%H_%M_%S')
+            path = f"mcs_{now}.trace"
+        recorder = TraceRecorder(path, max_bytes=max_bytes,
+                                 backup_count=backup_count, compress=compress)
+        recorder.start()
+        self._trace_recorder = recorder
+        return recorder
+
+    def stop_record_to_file(self) -> None:
+        """Stop binary trace recording.
+
+        Pending messages are written to file before returning.
+        """
+        recorder, self._trace_recorder = self._trace_recorder, None
+        if recorder:
+            recorder.stop()
+
+
+class ComPeakCan(ComInterface):
+    """CAN communicator using the proprietary PEAK chardev driver."""
+
+    def __init__(self, channel: str = 'PCAN_PCIBUS1') -> None:
+        self._bus = PCANBasic.PCANBasic()
+        if channel == "PCAN_USBBUS1":
+            self._channel = PCANBasic.PCAN_USBBUS1
+        elif channel == 'PCAN_PCIBUS1':
+            # Some computers may have a PCI-card built in instead of a
+            # PCAN-USB-dongle
+            self._channel = PCANBasic.PCAN_PCIBUS1
+        else:
+            raise ValueError(f"Channel type '{channel}' is not supported")
+        self.bit_rate = 1000000  # PCAN_BAUD_1M
+        self._filter_ranges = None  # Id ranges to receive (None: all).
+        self._hw_filter_ranges = None  # Id ranges currently set in hardware.
+        self._is_open = False
+        self._selector = None  # Waits on receive event (Linux only).
+        self._waker = None
+
+    def open(self) -> None:
+        rsp = self._bus.Initialize(self._channel, PCANBasic.PCAN_BAUD_1M)
+        if rsp == PCANBasic.PCAN_ERROR_OK:
+            self._is_open = True
+            self._hw_filter_ranges = None  # Filter is open after init.
+            if self._filter_ranges is not None:
+                self._add_filter_ranges(self._filter_ranges, reset=True)
+            self._open_selector()
+            return
+        raise McsBusException(f"PCANBasic initialize error {rsp}")
+
+    def set_filters(self, filters: Optional[List[Dict]]) -> None:
+        """Set hardware message filter (id ranges) of PCAN channel.
+
+        PCANBasic filters can only be expanded while the channel is open (a
+        reset would close the filter for a moment and drop messages). So ranges
+        are only added here and the filter is narrowed on next open().
+
+        Args:
+            filters: CAN filters in python-can format. None: receive all.
+        """
+        ranges = None if filters is None else get_filter_ranges(filters)
+        self._filter_ranges = ranges
+        if not self._is_open:
+            return
+        if ranges is None:
+            self._bus.SetValue(self._channel, PCANBasic.PCAN_MESSAGE_FILTER,
+                               PCANBasic.PCAN_FILTER_OPEN)
+            self._hw_filter_ranges = None
+        elif self._hw_filter_ranges is not None:  # Else: filter is open.
+            self._add_filter_ranges(
+                [r for r in ranges if not any(
+                    hw[2] == r[2] and hw[0] <= r[0] and r[1] <= hw[1]
+                    for hw in self._hw_filter_ranges)])
+
+    def _add_filter_ranges(self, ranges: List[Tuple[int, int, bool]],
+                           reset: bool = False) -> None:
+        """Expand hardware filter by given id ranges (close it first if reset).
+        """
+        if reset:
+            self._bus.SetValue(self._channel, PCANBasic.PCAN_MESSAGE_FILTER,
+                               PCANBasic.PCAN_FILTER_CLOSE)
+            self._hw_filter_ranges = []
+        for low, high, extended in ranges:
+            mode = (PCANBasic.PCAN_MODE_EXTENDED if extended
+                    else PCANBasic.PCAN_MODE_STANDARD)
+            rsp = self._bus.FilterMessages(self._channel, low, high, mode)
+            if rsp != PCANBasic.PCAN_ERROR_OK:
+                log.warning(f"PCANBasic filter error {rsp}: {hex(low)} to "
+                            f"{hex(high)}")
+            self._hw_filter_ranges.append((low, high, extended))
+
+    def close(self) -> None:
+        self._is_open = False
+        self._close_selector()
+        self._bus.Uninitialize(self._channel)
+
+    def _open_selector(self) -> None:
+        """Wait on PCAN receive event (a file descriptor on Linux) if possible.
+
+        Else read_batch() falls back to polling.
+        """
+        if platform.system() == "Windows":
+            return  # Receive event would need a Windows event handle.
+        rsp = self._bus.GetValue(self._channel, PCANBasic.PCAN_RECEIVE_EVENT)
+        if rsp[0] != PCANBasic.PCAN_ERROR_OK:
+            log.debug(f"PCANBasic receive event not available: {rsp[0]}")
+            return
+        self._waker = Waker()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(rsp[1], selectors.EVENT_READ)
+        self._selector.register(self._waker, selectors.EVENT_READ)
+
+    def _close_selector(self) -> None:
+        if self._selector:
+            self._selector.close()
+            self._selector = None
+        if self._waker:
+            self._waker.close()
+            self._waker = None
+
+    def send(self, msg: can.Message) -> Optional[None]:
+        peak_msg = PCANBasic.TPCANMsg()
+        peak_msg.ID = msg.arbitration_id
+        peak_msg.LEN = msg.dlc
+        if msg.is_extended_id:
+            peak_msg.MSGTYPE = PCANBasic.PCAN_MESSAGE_EXTENDED
+        else:
+            peak_msg.MSGTYPE = PCANBasic.PCAN_MESSAGE_STANDARD
+        for i in range(peak_msg.LEN):
+            peak_msg.DATA[i] = msg.data[i]
+        resp = None
+        result = self._bus.Write(self._channel, peak_msg)
+        if result in (PCANBasic.PCAN_ERROR_XMTFULL,
+                      PCANBasic.PCAN_ERROR_QXMTFULL):
+            raise McsBusTxBufferFullException(
+                f"PCANBasic write error: {result}")
+        if result != PCANBasic.PCAN_ERROR_OK:
+            # if self.modules[id&0xff].getThrowError():
+            # resp = "PCANBasic.Write Error"
+            raise RuntimeError(f"PCANBasic write error: {result}")
+        return resp
+
+    def wake_up(self) -> None:
+        if self._waker:
+            self._waker.wake_up()
+
+    def read_in_loop(self) -> Optional[can.Message]:  # read is called in loop
+        msgs = self.read_batch()
+        if len(msgs) > 1:
+            log.warning(f"{len(msgs) - 1} messages dropped, use read_batch()")
+        return msgs[0] if msgs else None
+
+    def read_batch(self) -> List[can.Message]:
+        """Return all messages in PCAN receive queue (see ComInterface).
+
+        Waits on the PCAN receive event if available, else sleeps 10 ms if the
+        receive queue is empty.
+        """
+        if self._selector:
+            for key, _ in self._selector.select(READ_TIMEOUT):
+                if key.fileobj is self._waker:
+                    self._waker.clear()
+        msgs = []
+        while len(msgs) < READ_BATCH_SIZE:
+            msg = self._read()
+            if msg is None:
+                break
+            msgs.append(msg)
+        if not msgs and not self._selector:
+            time.sleep(0.01)
+        return msgs
+
+    def _read(self) -> Optional[can.Message]:
+        """Return next message from PCAN receive queue (None if empty)."""
+        rsp: Tuple[PCANBasic.TPCANStatus, PCANBasic.TPCANMsg,
+                   PCANBasic.TPCANTimestamp] = self._bus.Read(self._channel)
+        status = rsp[0]
+        if status != PCANBasic.PCAN_ERROR_OK:  # [0]=status
+            if status != PCANBasic.PCAN_ERROR_QRCVEMPTY:
+                log.debug(f"PCANBasic read error {status}")
+            return None
+        peak_msg = rsp[1]  # [1]=message
+        peak_time = rsp[2]  # [2]=timestamp
+        time_stamp = (peak_time.micros + 1000 * peak_time.millis +
+                      0x100000000 * 1000 * peak_time.millis_overflow)
+        time_stamp /= 1000000  # Microseconds to seconds conversion
+        is_extended = False
+        if peak_msg.MSGTYPE == PCANBasic.PCAN_MESSAGE_EXTENDED.value:
+            is_extended = True
+        return can.Message(
+            arbitration_id=peak_msg.ID,
+            dlc=peak_msg.LEN,
+            timestamp=time_stamp,
+            is_extended_id=is_extended,
+            data=peak_msg.DATA
+        )
+
+
+class ComPythonCan(ComInterface):
+    """CAN communicator using the python-can package."""
+
+    def __init__(self, channel: str = 'PCAN_PCIBUS1', bus_type: str = 'pcan',
+                 bit_rate: int = 1000000) -> None:
+        self._channel = channel
+        self._bus_type = bus_type
+        self._bit_rate = bit_rate
+        self.bit_rate = bit_rate
+        self._bus = None
+        self._filters = None
+        self._selector = None  # Waits on CAN socket (e.g. socketcan).
+        self._waker = None
+
+    def open(self) -> None:
+        """Open CAN communication using the python-can package.
+
+        Note: For socket/network based CAN on Linux systems (not using the
+        chardev PEAK driver but the one that comes with the Linux kernel):
+
+        self._bus = can.interface.Bus(channel='can0',
+                                     bustype='socketcan',
+                                     bitrate=1000000
+                                     )
+
+        You might need to type in a terminal first:
+
+        $ sudo modprobe peak_usb
+        or:
+        $ sudo modprobe peak_pci
+        then:
+        $ sudo ip link set can0 up type can bitrate 1000000
+
+        Code for doing this from Python (needs testing as sudo is involved):
+
+        ---
+        import shlex
+        import subprocess
+        import time
+        cmd = 'sudo modprobe peak_pci'
+        # cmd = 'sudo modprobe peak_usb'
+        # args = shlex.split(cmd)
+        # subprocess.Popen(args)
+        subprocess.Popen(cmd, shell=True)
+        cmd = 'sudo ip link set can0 up type can bitrate 1000000'
+        # args = shlex.split(cmd)
+        # subprocess.Popen(args)
+        subprocess.Popen(cmd, shell=True)
+        # subprocess.Popen(cmd, shell=True, stdin=subprocess.PIPE,
+        #     stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        time.sleep(0.5)
+        ---
+
+        then do as above:
+
+        self._bus = can.interface.Bus(channel='can0',
+                                     bustype='socketcan',
+                                     bitrate=1000000
+                                     )
+
+        Raises:
+              McsException: If opening/connect fails.
+        """
+        try:
+            # self._bus = can.interface.Bus(channel='PCAN_USBBUS1',
+            self._bus = can.interface.Bus(channel=self._channel,
+                                          bustype=self._bus_type,
+                                          bitrate=self._bit_rate,
+                                          can_filters=self._filters
+                                          )
+        except Exception as exc:
+            raise McsBusException(exc)
+        self._open_selector()
+
+    def _open_selector(self) -> None:
+        """Wait on file descriptor of bus if available (e.g. socketcan).
+
+        Else read_batch() blocks in recv() of the python-can bus.
+        """
+        try:
+            fd = self._bus.fileno()
+        except (AttributeError, NotImplementedError):
+            return
+        self._waker = Waker()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(fd, selectors.EVENT_READ)
+        self._selector.register(self._waker, selectors.EVENT_READ)
+
+    def set_filters(self, filters: Optional[List[Dict]]) -> None:
+        """Set acceptance filters of python-can bus.
+
+        Filters are applied in the kernel for socketcan (unwanted messages do
+        not wake up the reading thread), other interfaces may filter in
+        software only.
+
+        Args:
+            filters: CAN filters in python-can format. None: receive all.
+        """
+        self._filters = filters
+        if self._bus:
+            self._bus.set_filters(filters)
+
+    def close(self) -> None:
+        if self._selector:
+            self._selector.close()
+            self._selector = None
+        if self._waker:
+            self._waker.close()
+            self._waker = None
+
+    def send(self, msg: PCANBasic.TPCANMsg) -> Optional[None]:
+        try:
+            self._bus.send(msg)
+        except can.CanError as exc:
+            # E.g. socketcan: ENOBUFS if the interface's TX queue is full.
+            cause = exc.__cause__ or exc.__context__
+            if (getattr(cause, "errno", None) in (errno.ENOBUFS, errno.EAGAIN)
+                    or "Transmit buffer full" in str(exc)):
+                raise McsBusTxBufferFullException(exc) from exc
+            raise
+
+    def wake_up(self) -> None:
+        if self._waker:
+            self._waker.wake_up()
+
+    def read_in_loop(self) -> Optional[can.Message]:  # read is called in loop
+        msg: can.message.Message = self._bus.recv(0.01)
+        return msg
+
+    def read_batch(self) -> List[can.Message]:
+        """Return all received messages (see ComInterface).
+
+        Waits on the bus file descriptor (woken up by the kernel on reception)
+        if available, else blocks in recv() for max. 0.1 s.
+        """
+        if self._selector:
+            timeout = 0.0
+            for key, _ in self._selector.select(READ_TIMEOUT):
+                if key.fileobj is self._waker:
+                    self._waker.clear()
+        else:
+            timeout = 0.1
+        msgs = []
+        msg = self._bus.recv(timeout)
+        while msg is not None:
+            msgs.append(msg)
+            if len(msgs) >= READ_BATCH_SIZE:
+                break
+            msg = self._bus.recv(0.0)
+        return msgs
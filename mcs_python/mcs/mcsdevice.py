@@ -1,1168 +1,1573 @@
-# -*- coding: utf-8 -*-
-import can  # python-can package
-import collections
-import logging
-import time
-import threading
-from typing import List, Optional, Union
-import warnings
-
-import mcs
-
-# Firmware module states (as in status bytes in info telegram):
-STATUS_NOT_INIT = 1
-STATUS_PREPARED = 2
-STATUS_ACTIVE = 4
-STATUS_ERROR = 8
-STATUS_WARNING = 16
-STATUS_DETECTED = 64
-STATUS_DATA = 128
-
-CAN_BUFFER_SIZE = 5  # Max no. of messages.
-
-log = logging.getLogger(__name__)
-
-
-def unsigned_to_signed(value: int, number_of_bytes: int) -> int:
-    """Return unsigned value calculated from signed value."""
-    # TODO(MME): There are tools in Python 3 for this.
-    bits = number_of_bytes * 8
-    if (value & (1 << (bits - 1))) != 0:
-        value = value - (1 << bits)
-    return value
-
-
-def status_str(status: int) -> str:
-    state_bin = bin(status)
-    status_txt = f"{state_bin} {hex(status)}"
-    txt = ["not-init", "prepared", "busy", "error", "warning", "detected",
-           "data"]
-    bits = state_bin
-    for i in range(min(7, len(state_bin))):
-        if state_bin[-(i + 1)] == '1':
-            status_txt += f" {txt[i]}"
-    return status_txt
-
-
-def get_can_id_from_device_name(name: str) -> int:
-    """Return CAN Id for given device name.
-
-    Args:
-        name: Device name, not case sensitive.
-
-    Returns:
-        can_id: Master (send) CAN Id of device, e.g. 0x43a for 'bottle detect'.
-    """
-    for can_id in mcs.DEVICE_NAME:
-        if name.lower() == mcs.DEVICE_NAME[can_id].lower():
-            return can_id
-    raise ValueError(f"Name {name} not in list of devices")
-
-
-class McsTimeoutException(mcs.McsException):
-    """Raised when a CAN device did not respond in time.
-
-    Either the device did not respond in time as it is not available or
-    because it did not report a status change in time (e.g. is still busy).
-    """
-    pass
-
-
-class McsHardwareException(mcs.McsException):
-    """Raised when an MCS exception occurs.
-
-    Attributes:
-        error_code -- error code reported by firmware of module
-    """
-
-    def __init__(self, message, err_code: int = -1):
-        self.error_code = err_code  # Modules report positive numbers here only.
-        self.message = message
-
-
-class McsDevice(object):
-    """Miltenyi CAN System Device.
-
-    This device uses an McsBus instance to send CAN command messages (i.e. CAN
-    telegram). It is usually used in an MCS instance itself that reads all
-    incoming response messages on the bus (McsBus instance) and calls the
-    put_msg() method of this instance here to add messages received from a
-    hardware module to the corresponding McsDevice instance's buffer. Here the
-    response to the initially send command is checked, the McsDevice state is
-    updated and in case of errors an exception is raised. The exception needs
-    to be handled by the instance using this McsDevice.
-    """
-
-    def __init__(self, can_id: int, mcs_bus: mcs.McsBus) -> None:
-        """Instantiate an MCS compliant CAN device."""
-        can_id &= 0xff  # We allow master and slave arbitration ids (e.g. 0x411
-        # and 0x011) as id argument (but use the slave id now).
-        # CAN arbitration id used by firmware for sending (i.e. is in received
-        # response messages to those send from this device here):
-        self.rsp_id = can_id
-        # CAN arbitration id used for sending by this device here (master) to
-        # the firmware (slave) of the hardware module. The master uses a CAN
-        # arbitration id that is the CAN arbitration id the slave is using for
-        # his message plus 0x400:
-        self.id = self.rsp_id + 0x400  # Default is master id.
-        self.name = mcs.DEVICE_NAME.get(self.id, "<unnamed device>")
-
-        self.mcs = mcs_bus
-        if self.mcs.error_code != 0:
-            raise RuntimeError('MCS instance with error cannot be used')
-
-        self.status = 0  # Holds status parsed from response messages.
-        self.error = 0  # Holds error code received from info 1 response.
-        self.warning = 0  # Holds warning code received from info 1 response.
-        self.com_error = 0  # Holds error code received from info 6 response.
-        self.buffer = []  # Holds unhandled received messages.
-        self._history = collections.deque(maxlen=16)  # Holds recent send and
-        # received messages for debug logging in case of an exception.
-        self._lock = threading.Lock()  # Do not allow other commands for this
-        # device to be send (by master) until acknowledge response is received
-        # from device (slave).
-
-    def __repr__(self) -> str:
-        txt = f"{mcs.DEVICE_NAME.get(self.id, 'device')} {hex(self.rsp_id)}"
-        return txt
-
-    def put_msg(self, msg: can.Message) -> None:
-        """Put (new received) message (from slave hardware module) into this
-        device module's buffer.
-
-        This method is typically called from the MCS (CAN bus) instance's reader
-        thread.
-        """
-        self._history.append(msg)
-        if msg.data[0] == 0x00:  # Info 0 telegram received.
-            # log.debug(f"{self}: Status: {status_str(self.status)}")
-            self.status = msg.data[1]  # Update the device status.
-            # Note: if not locked, we could have race conditions here with
-            # self.status and methods calling it such as self.has_error()!
-            if self.has_error():
-                log.error(f"{self}: Status: {status_str(self.status)}")
-                # Cannot raise here on error as this method is called from a
-                # thread continuously reading the CAN bus. Either
-                # send_and_check_rsp() or wait() will raise eventually which
-                # are called from main or a thread that is directly using the
-                # McsDevice instance and should handle the error then there.
-            else:
-                # Reset error code if error bit is not (or no longer) set in
-                # the modules status byte:
-                self.error = 0
-                # log.debug(f"{self}: Error cleared")
-            if self.has_warning():
-                log.warning(f"{self}: Status: {status_str(self.status)}")
-            else:
-                self.warning = 0
-                # log.debug(f"{self}: Warning cleared")
-            # TODO(MME): When do we update self.com_error? Here based on status
-            #  info, too?
-            if msg.data[2] == 0x00:
-                # A simple state change info (neither an ACK nor a NOT-ACK).
-                # E.g. the module state changed from busy to idle. As the state
-                # has been updated above already we do not need to handle this
-                # specifically and as this is not a direct response to a send
-                # message, we do not add it to the buffer and just return here:
-                # log.debug(f"{self}: Status: {status_str(self.status)}")
-                return
-            elif msg.data[2] == 0xff:
-                # Firmware of module does not acknowledge last received command
-                # (a NOT-ACK of our last send command):
-                log.error(f"{self}: Received NACK: {msg}")
-                #     self.mcs.send(self.id | 0x400, [0x1b, 0x06],
-                #                       block=False)  # send Info6-Request
-        # elif msg.data[0] == 0x01:
-        # # This is done in response handling of self.info_error() anyway!
-        #     # Info 1 telegram (holds error and warning code); is a response of
-        #     # a specific info 1 request.
-        #     self.error = msg.data[2] | (msg.data[3] << 8)  # Update error code
-        #     self.warning = msg.data[4] | (msg.data[5] << 8)  # Upd. warning.
-        #     if self.error:
-        #         log.debug(f"{self} reports error: {hex(self.error)}")
-        #     if self.warning:
-        #         log.debug(f"{self} reports warning: {hex(self.error)}")
-        elif msg.data[0] == 0x06:
-            # Info 6 telegram received (holds communication error code, e.g.
-            # cause for previous NOT-ACK; is a response of a specific info 6
-            # request.
-            self.com_error = msg.data[1] | (msg.data[2] << 8)  # Update error.
-        if len(self.buffer) >= CAN_BUFFER_SIZE:
-            popped = self.buffer.pop(0)
-            log.warning(f"{self}: Buffer overflow: Discarding oldest message: "
-                        f"{popped}")
-            # Throw away oldest message. Should not happen. Usually there is
-            # only a single message in the response buffer (maybe unless
-            # auto-port feature is used).
-        self.buffer.append(msg)
-
-    def get_msg(self) -> can.Message:
-        """Return and remove (pop) last message from buffer."""
-        msg = self.buffer.pop(0)
-        return msg
-
-    def rcv(self, timeout=mcs.mcsbus.CAN_TIMEOUT) -> can.Message:
-        """Return received message as soon as available in buffer.
-
-        Args:
-            timeout: Time to wait for a message in buffer. If no message is
-                available in buffer within this time, an McsTimeoutException
-                is raised.
-
-        Returns:
-            message: Received message read from buffer.
-
-        Raises:
-            McsTimeoutException: If no message was received in time.
-        """
-        poll_interval = 0.002  # Seconds; less than 0.002 shows no improvement.
-        poll_actions = int(timeout / poll_interval)
-        for x in range(poll_actions):
-            if self._is_msg_available():
-                break
-            time.sleep(poll_interval)
-        else:
-            self._log_history_and_raise(
-                McsTimeoutException(f"Time out: no response from {self}"))
-        # The above polling action is the most time sensitive part (besides
-        # logging). Test performance if changes have been done here!
-        # Note: Using a while loop drastically (4x) decreases performance
-        # here:
-        # stop = time.time() + timeout
-        # while not self._is_msg_available():
-        #     if time.time() > stop:
-        #         self._log_history_and_raise(
-        #             McsTimeoutException(f"Time out: no response from {self}"))
-        #     # time.sleep(0.001)
-
-        if self._lock.locked():
-            self._lock.release()
-        can_msg = self.get_msg()
-        return can_msg
-
-    def send(self, data: List[int], block: bool = True) -> None:
-        """Send message to CAN bus and add to history.
-
-        Args:
-            data: List of data to be send, e.g. [0x1c, 0xff].
-            block: Do not allow other commands to be send until acknowledge
-                response is received. Highly recommended. Know what you are
-                doing if you set this to False!
-
-        Raises:
-            RuntimeError: If device communication is locked (device is waiting
-                on response by slave) for longer than 1 second.
-        """
-        if block:
-            acquired = self._lock.acquire(timeout=1.0)
-            if not acquired:
-                try:
-                    self.mcs.log_recent_commands()
-                finally:
-                    raise RuntimeError("Cannot acquire lock for sending")
-        sent_msg = self.mcs.send(can_id=self.id, data=data)
-        self._history.append(sent_msg)
-
-    def _is_msg_available(self) -> bool:
-        """Return bool if a message is available for this device."""
-        return len(self.buffer) > 0
-
-    def check_msg(self, msg: Optional[can.Message],
-                  data: Optional[List[int]] = None,
-                  check_dlc: bool = True) -> None:
-        if self.rsp_id != msg.arbitration_id:
-            raise_txt = (f"Wrong CAN ID: received {msg.arbitration_id:0x}, "
-                         f"expected {self.id:0x}")
-            # This can only happen if the message was not assigned to the
-            # proper device/module handler. This is not a hardware module error.
-            # We directly raise here:
-            self._log_history_and_raise(ValueError(raise_txt))
-        # Check for NACK:
-        if msg.data[0] == 0x00 and msg.data[2] == 0xff:
-            self._handle_not_acknowledge()
-        if check_dlc:
-            dlc = len(data)
-            if dlc != msg.dlc:
-                raise_txt = (f"{self}: Wrong DLC: received {msg.dlc}, "
-                             f"expected {dlc}")
-                self._log_history_and_raise(ValueError(raise_txt))
-        if data:
-            for i in range(len(data)):
-                if data[i] and data[i] != msg.data[i]:
-                    raise_txt = (
-                        f"{self}: Wrong data {i}: Received "
-                        f"{msg.data[i]:02x}, expected {data[i]:02x}, message: "
-                        f"{msg}")
-                    self._log_history_and_raise(ValueError(raise_txt))
-
-    def send_and_check_rsp(self, data: List[int],
-                           block: bool = True,
-                           timeout: int = 0.3,
-                           check: Optional[List[int]] = None,
-                           check_dlc: bool = True,
-                           ) -> can.Message:
-        self.send(data, block)
-        rsp = self.rcv(timeout)  # Status is updated automatically here.
-        log.debug(f"received {rsp}")
-        if (self.has_error() or self.has_warning()) and (data != [0x1b, 0x01]):
-            # Request modules error and warning codes with an info error
-            # telegram. If last send data is info request, i.e. [0x1b, 0x01],
-            # we do not handle here again.
-            log.debug(f"{self}: Requesting error info")
-            self._handle_error()  # Raises
-        else:
-            self.check_msg(rsp, check, check_dlc)
-        return rsp
-
-    def _get_history_str(self):
-        history = f"{self}: Call history:\n"
-        for i in self._history:
-            history += f"{mcs.mcsbus.msg_txt(i)}\n"
-        return history
-
-    def _log_history_and_raise(self, exc):
-        try:
-            log.critical(exc)
-            log.critical(self._get_history_str())
-        finally:
-            raise exc
-
-    def _handle_error(self) -> None:
-        """Handle error.
-
-        Request modules error and warning state and eventually raise.
-
-        Raises:
-            McsHardwareException: Raises in all cases (that's the job).
-        """
-        error_code, warning_code = self.info_error()  # Sends CAN command.
-        warn_txt = mcs.CanErrors.MODULE_ERRORS.get(self.warning,
-                                                   "<unknown warning>")
-        err_txt = mcs.CanErrors.MODULE_ERRORS.get(self.error,
-                                                  "<unknown error>")
-        raise_txt = (f"{self}: Error {hex(error_code)} '{err_txt}' "
-                     f"and warning {hex(warning_code)} '{warn_txt}'")
-        exception = McsHardwareException(raise_txt, err_code=error_code)
-        self._log_history_and_raise(exception)
-
-    def _handle_not_acknowledge(self) -> None:
-        """Handle NACK reported by device.
-
-        Raises:
-            McsHardwareException: Raises in all cases (that's the job).
-        """
-        raise_txt = f"{self}: NACK received"
-        # Request error and warning codes:
-        error_code, warning_code = self.info_error()
-        if error_code:
-            err_txt = mcs.CanErrors.MODULE_ERRORS.get(self.error,
-                                                      "<unknown error>")
-            raise_txt += (f": error {error_code} ({hex(error_code)}) "
-                          f"'{err_txt}'")
-        if warning_code:
-            warn_txt = mcs.CanErrors.MODULE_ERRORS.get(self.warning,
-                                                       "<unknown warning>")
-            raise_txt += (f": warning {warning_code} ({hex(warning_code)}) "
-                          f" '{warn_txt}'")
-        exception = McsHardwareException(raise_txt, err_code=error_code)
-        self._log_history_and_raise(exception)
-
-    def wait(self, timeout: int = 60) -> None:
-        """Wait till module reports to be not busy anymore.
-
-        Args:
-            timeout: Time in seconds to wait that device is no longer busy. If
-                set to 0 will wait forever. Default is 60 but might not fit all
-                device actions.
-
-        Raises:
-            McsTimeoutException: On timeout while waiting.
-        """
-        # log.debug(f"{self}: Waiting: Status: {status_str(self.status)}")
-        start_time = time.time()
-        while self.is_busy():
-            if timeout:
-                if time.time() > start_time + timeout:
-                    log.debug(f"{self}: Time-out: Status: {self.status}")
-                    self._log_history_and_raise(
-                        McsTimeoutException(
-                            f"{self}: Time-out waiting for busy module: "
-                            f"Status: {bin(self.status)}"))
-            time.sleep(0.01)
-        if self.has_error() or self.has_warning():
-            log.debug(f"{self}: Has error or warning")
-            self._handle_error()  # Raises
-        # log.debug(f"{self}: Done: Status: {status_str(self.status)}")
-
-    # State bits:
-    def is_busy(self) -> bool:
-        return bool(self.status & STATUS_ACTIVE)
-
-    def has_error(self) -> bool:
-        return bool(self.status & STATUS_ERROR)
-
-    def has_warning(self) -> bool:
-        return bool(self.status & STATUS_WARNING)
-
-    def is_prepared(self) -> bool:
-        return bool(self.status & STATUS_PREPARED)
-
-    def is_not_initialized(self) -> bool:
-        return bool(self.status & STATUS_NOT_INIT)
-
-    def has_detected(self) -> bool:
-        return bool(self.status & STATUS_DETECTED)
-
-    def has_data(self) -> bool:
-        return bool(self.status & STATUS_DATA)
-
-    # MCS telegrams:
-    def info(self, info_id):
-        """Request an info with given info id.
-
-        There are more specific info_... methods available that also check the
-        dlc of the received info message.
-
-        Args:
-            info_id: Info id (0 .. 6)
-
-        Returns:
-            info_data: List of ints
-
-        """
-        rsp = self.send_and_check_rsp(
-            data=[0x1b, info_id], check=[info_id], check_dlc=False)
-        return rsp[1:]
-
-    def info_error(self) -> (int, int):
-        """Request and return error and warning code.
-
-        Returns:
-            error_code: Code of last error.
-            warning_code: Code of last warning.
-        """
-        rsp = self.send_and_check_rsp(
-            data=[0x1b, 0x01],
-            check=[0x01, None, None, None, None, None, None, None])
-        error_code = rsp.data[2] | (rsp.data[3] << 8)
-        warning_code = rsp.data[4] | (rsp.data[5] << 8)
-        print(error_code, warning_code, rsp)
-        # Update self.error and self.warning:
-        self.error = error_code
-        self.warning = warning_code
-        return error_code, warning_code
-
-    def info_firmware_version(self) -> List[int]:
-        """Send firmware version info command and return received data.
-
-        Returns:
-              firmware version data: Full data list. For research use firmware
-              the version is in elements [4:8].
-        """
-        rsp = self.send_and_check_rsp(
-            data=[0x1b, 0x03],
-            check=[0x03, None, None, None, None, None, None, None])
-        return rsp.data
-
-    def get_firmware_version_str(self, medical: bool = False) -> str:
-        """Request firmware version and return as string.
-
-        Args:
-            medical: If version code is of MCS medical type or not.
-
-        Returns:
-              firmware version str: E.g. '2.1.1.r' for non-medical."
-        """
-        rsp = self.info_firmware_version()
-        if medical:
-            shift = 0
-            result = 0
-            for i in range(4, len(rsp)):
-                result = result | (rsp[i] << shift)
-                shift = shift + 8
-            if result > 9999999:
-                result = result % 10000000
-                return "E_%6d_%d" % (result / 10, result % 10)
-            else:
-                return "I_%6d_%d" % (result / 10, result % 10)
-        else:
-            # rsp.data[4:8]
-            fw_str = f"{rsp[4]}.{rsp[5]}.{rsp[6]}.{chr(rsp[7])}"
-        return fw_str
-
-    def get_firmware_version_tuple(self) -> (int, int, int, int):
-        """Request firmware version and return as tuple (major, minor, ...).
-
-        Returns:
-              firmware version: [major, minor, patch, release identifier]
-                Example: [2, 1, 1, 72] where 72 (ASCII "r") = release version.
-        """
-        rsp = self.info_firmware_version()
-        return rsp[4:8]
-
-    def info_hardware_configuration(self) -> (int, int, int, int, int):
-        """Request and return hardware related device data.
-
-        Returns:
-            controller mode: 0: main program active, 1: boot loader running.
-            boot CAN id: Varies from main CAN id for some modules (e.g. PNM).
-            hardware version: Hardware configuration device is reporting.
-            boot block: Block data required for flashing.
-            main block: Block data required for flashing.
-        """
-        rsp = self.send_and_check_rsp(
-            data=[0x1b, 0x05],
-            check=[0x05, None, None, None, None, None, None, None])
-        mode = rsp.data[1]
-        boot_id = rsp.data[2]
-        hardware_version = rsp.data[3]
-        boot_block = rsp.data[4] | (rsp.data[5] << 8)
-        main_block = rsp.data[6] | (rsp.data[7] << 8)
-        return mode, boot_id, hardware_version, boot_block, main_block
-
-    def get_controller_mode(self) -> int:
-        c, i, h, b, m = self.info_hardware_configuration()
-        return c
-
-    def get_boot_id(self) -> int:
-        c, i, h, b, m = self.info_hardware_configuration()
-        return i
-
-    def get_hardware_version(self) -> int:
-        c, i, h, b, m = self.info_hardware_configuration()
-        return h
-
-    def get_boot_block(self) -> int:
-        c, i, h, b, m = self.info_hardware_configuration()
-        return b
-
-    def get_main_block(self) -> int:
-        c, i, h, b, m = self.info_hardware_configuration()
-        return m
-
-    def info_com_error(self) -> int:
-        """Request and return last communication error code."""
-        rsp = self.send_and_check_rsp(data=[0x1b, 0x06],
-                                      check=[0x06, None, None])
-        nack_error_code = rsp.data[1] | (rsp.data[2] << 8)
-        return nack_error_code
-
-    def reset(self, reset_mask: int = 0xff, timeout: int = 10) -> None:
-        """Reset device.
-
-        Args:
-            reset_mask: Reset actions are defined by the reset mask.
-                0x01: Reset warning bit and warning code
-                0x02: Reset error bit, error code, and communication error code.
-                0x04: Stop all activities
-                0x08: Set device into NOT-INIT state. If active: includes: stop
-                    all actions. The reset flag "stop all activities" may result
-                    into a situation, that the module looses information
-                    necessary to perform further activities. (e.g. actual step
-                    count, actual position). In such cases also the NOT-INIT
-                    flag is set.
-                0x10: Not used
-                0x20: Resets counters and other local data, which the module
-                    stores for external use. E.g.: actual step count of pump.
-                0x40: Resets port state: Reset all Port modes to "NORMAL" mode.
-                    Resets data bit in state byte. Resets port limit data (FRAM
-                    -> RAM). If active: includes: stop all actions. If no FRAM
-                    available: Reset to 0 or module specific defaults.
-                0x80: Free / module specific
-                0xff: A Reset(0xFF) puts the module in a state which is
-                    logically equivalent to the power on situation.
-                Note: If module is busy and reset mask does not stop activity:
-                    Completion of command cannot be detected by evaluating the
-                    active bit. Observe other bit influenced by reset mask
-                    instead. As active bit is normally used to detect timeout
-                    errors, command must be sent without timeout control.
-                    Completion must be polled.
-                Caution: Be careful: not all combinations of bits in the reset
-                    mask may make sense.
-            timeout: Seconds to wait until not busy anymore. 0: no wait.
-
-        Raises:
-            McsTimeoutException: On timeout while waiting.
-        """
-        self.send_and_check_rsp(data=[0x1c, reset_mask],
-                                check=[0x00, None, 0x1c])
-        if timeout:
-            self.wait(timeout)
-
-    def init(self, cmd_mode: int = 0, timeout: int = 10) -> None:
-        """Initialize device.
-
-        Does all activities to bring module in a defined, usable state.
-        NOT-INIT and DETECTED flag is erased. If NOT-INIT flag is already
-        erased (i.e. device is already initialised) flag is set with
-        acknowledge message. Module may go busy for a time.
-        On success: NOT-INIT and DETECTED bits are reset.
-
-        Args:
-            cmd_mode: May modify command behaviour (device specific).
-            timeout: Seconds to wait until not busy anymore. 0: no wait.
-
-        Raises:
-            McsTimeoutException: On timeout while waiting.
-        """
-        self.send_and_check_rsp(data=[0x22, cmd_mode],
-                                check=[0x00, None, 0x22])
-        if timeout:
-            self.wait(timeout)
-
-    def operate(self, cmd_mode: int = 0, timeout: int = 0) -> None:
-        """Send operate command to device.
-
-        Args:
-            cmd_mode: Device specific operate mode.
-            timeout: Seconds to wait until not busy anymore. 0: no wait.
-
-        Raises:
-            McsTimeoutException: On timeout while waiting.
-        """
-        self.send_and_check_rsp(data=[0xef, cmd_mode], check=[0, None, 0xef])
-        if timeout:
-            self.wait(timeout)
-
-    def stop(self, cmd_mode: int = 0, timeout: int = 0) -> None:
-        """Immediately stop device activity.
-
-        If already stopped, command succeeds immediately. Device may stay/go
-        busy for a while.
-
-        Args:
-            cmd_mode: Device specific operate mode.
-            timeout: Seconds to wait until not busy anymore. 0: no wait.
-        """
-        self.send_and_check_rsp(data=[0x2f, cmd_mode], check=[0x00, None, 0x2f])
-        if timeout:
-            self.wait(timeout)
-
-    def set_target_value(self, value: int) -> None:
-        """Set target value for operation.
-
-        Usually for closed loop control done by firmware. Often the operation
-        command has to be send afterwards to take effect if a control loop is
-        running. Operation may be required to be stopped to change the target
-        value (device specific).
-
-        Args:
-            value: Target value to be set.
-        """
-        self.send_and_check_rsp(data=[0xe2,
-                                      value & 0xff,
-                                      (value >> 8) & 0xff],
-                                check=[0x00, None, 0xe2])
-
-    def set_target_value_deprecated(self, value: int) -> None:
-        """Set target value for operation - deprecated!
-
-        Args:
-            value: Target value to be set.
-
-        Deprecated: only used in Prodigy TEC Board Rev5 Firmware. New designs
-        shall use 0xE2 telegram: set_target_value().
-        """
-        warnings.warn("Deprecated. Use set_target_value instead!",
-                      PendingDeprecationWarning)
-        self.send_and_check_rsp(data=[0xe5,
-                                      value & 0xff,
-                                      (value >> 8) & 0xff],
-                                check=[0x00, None, 0xe5])
-
-    def set_port(self, port: int, value: int, length: int, pulse_time: int = 0,
-                 timeout: int = 0) -> None:
-        """Set a port to a specified value.
-
-        A port can be real or virtual. A port can be analogous or digital.
-        Often a port is a connected digital or analogue data source. There are
-        two kinds of ports. Output ports can be set to an arbitrary value of
-        their specified data range (e.g. digital on/off, or analogous for D/A
-        converters). Input ports (e.g. all sensors) can be queried. As an input
-        a port can be configured to provide feedback or interrupt signals for
-        other functions on the same module.
-
-        Args:
-            length: Number of bytes of port value (port specific: 1, 2, or 4).
-            port: Port id.
-            value: Value to be set to port.
-            pulse_time: Device specific to modify command behaviour.
-            timeout: Seconds to wait until not busy anymore. 0: no wait.
-                Usually setting a port does not change the modules busy status.
-                Some special devices activate (and are then busy) if a port is
-                set to a non-zero value for the duration of the pulse time
-                (e.g. buffer supply station pump).
-
-        Raises:
-            McsTimeoutException: On timeout while waiting.
-        """
-        data = [0x40,
-                0x00,
-                port,
-                pulse_time,
-                value & 0xff,
-                (value >> 8) & 0xff,
-                (value >> 16) & 0xff,
-                (value >> 24) & 0xff]
-        self.send_and_check_rsp(data=data[:4 + length],
-                                check=[0x00, None, 0x40])
-        if timeout:
-            self.wait(timeout)
-
-    def get_port(self, port: int, signed: bool = False) -> int:
-        """Read the current port value.
-
-        Args:
-            port: Port id.
-            signed: If port value is signed.
-
-        Returns:
-            value: Value read from given port.
-        """
-        rsp = self.send_and_check_rsp(
-            data=[0x41, port], check=[0x42, None, port, None, None, None, None],
-            check_dlc=False)  # We do not know how many bytes the port holds.
-        shift = 0
-        result = 0
-        for i in range(4, rsp.dlc):
-            result = result | (rsp.data[i] << shift)
-            shift = shift + 8
-        if signed:
-            result = unsigned_to_signed(result, number_of_bytes=rsp.dlc - 4)
-        return result
-
-    def set_port_mode(self, port: int, mode: int, data_valid_time: int = 0,
-                      port_idle_time: int = 0) -> None:
-        """Set port mode.
-
-        Ports may operate in different modes (normal, stop, and auto). A port
-        must not operate in several modes at the same time.
-
-        Reset of respective status bits:
-            Stop mode: Detected bit is erased with init() and any command
-                switching module into busy state (e.g. rotate, move).
-            Auto mode: Reset Data bit, when all triggered AUTO ports were
-                queried by getPortData(). Send new INFO 0 if data bit was reset.
-
-        Args:
-            port: Port id.
-            mode: Mode the port will be set to:
-                0x00: Normal mode.
-                0x02: Stop mode: Stops device when condition becomes true.
-                0x20: Auto mode: Sets DATA status bit, when condition becomes
-                    true.
-            data_valid_time:
-            port_idle_time:
-        """
-        self.send_and_check_rsp(
-            data=[0x43,
-                  port,
-                  mode,
-                  data_valid_time & 0xff,
-                  (data_valid_time >> 8) & 0xff,
-                  port_idle_time & 0xff,
-                  (port_idle_time >> 8) & 0xff],
-            check=[0x00, None, 0x43])
-
-    def get_port_mode(self, port: int) -> int:
-        """Read the port mode currently set.
-
-        Args:
-            port: Port id.
-
-        Returns:
-            value: Mode read from given port:
-                0x00: Normal mode.
-                0x02: Stop mode: Stops device when condition becomes true.
-                0x20: Auto mode: Sets DATA status bit, when condition becomes
-                    true.
-        """
-        rsp = self.send_and_check_rsp(
-            data=[0x44, port],
-            check=[0x45, port, None, None, None, None, None, None],
-            check_dlc=False)  # Not exactly specified how many bytes rsp. holds.
-        mode = rsp.data[2]
-        return mode
-
-    def set_port_parameter(self, port: int, parameter: int, value: int,
-                           length: int = 4) -> None:
-        """Set value of a port parameter.
-
-        Port parameter are used for conversion between port values and user
-        units. Usually this conversion calculation is done:
-
-        User units = ((internal port units * multiplier) / divisor) – offset
-
-        Where:
-            internal port units: E. g. Digits representing a pressure value
-            offset: value must be given in user units.
-
-        Args:
-            length: Number of bytes of port parameter (e.g.: 1, 2, or 4).
-            port: Port id.
-            parameter: Port parameter id:
-                0: Offset.
-                1: Divisor.
-                2: Multiplier.
-                3: Delta.
-                4: Lower limit.
-                5: Upper limit.
-                6: Target value.
-            value: Value to be set to port parameter.
-        """
-        data = [0x49,
-                0x00,
-                port,
-                parameter,
-                value & 0xff,
-                (value >> 8) & 0xff,
-                (value >> 16) & 0xff,
-                (value >> 24) & 0xff]
-        self.send_and_check_rsp(data=data[:4 + length],
-                                check=[0x00, None, 0x49])
-
-    def get_port_parameter(self, port: int, parameter: int,
-                           signed: bool = False) -> int:
-        """Read value of a port parameter.
-
-        Args:
-            port: Port id.
-            parameter: Port parameter id: 0 .. 6 (see set_port_parameter).
-            signed: If port value is signed.
-
-        Returns:
-            value: Read result.
-        """
-        rsp = self.send_and_check_rsp(
-            data=[0x4a, 0, port, parameter],
-            check=[0x4b, None, port, parameter, None, None, None, None],
-            check_dlc=False)  # Not known how many bytes the port param. holds.
-        shift = 0
-        result = 0
-        for i in range(4, rsp.dlc):
-            result = result | (rsp.data[i] << shift)
-            shift = shift + 8
-        if signed:
-            result = unsigned_to_signed(result, number_of_bytes=rsp.dlc - 4)
-        return result
-
-    def set_port_zero(self, port: int, timeout: int = 5) -> None:
-        """Set current port value as new zero value.
-
-        Some ports can be zero-ed for calibration purposes to remove an offset.
-
-        Args:
-            port: Port to be zero-ed.
-            timeout: Seconds to wait until not busy anymore. 0: no wait.
-        """
-        self.send_and_check_rsp(data=[0x4c, 0, port], check=[0x00, None, 0x4c])
-        if timeout:
-            self.wait(timeout)
-
-    def set_parameter(self, parameter: int, value: int, length: int = 4
-                      ) -> None:
-        """Set a parameter value.
-
-        A device maintains a table of parameters. The number, meaning, and size
-        of parameters is module specific. Parameter values are used to store
-        calibration values, hardware specific properties, persistent counters,
-        etc. If available parameters might be stored persistent in non-volatile
-        RAM (FRAM). In many cases parameters from 0 to 127 are FRAM-parameters
-        and parameters from 128 on are volatile.
-
-        Args:
-            length: Number of bytes of port parameter (e.g.: 1, 2, or 4). More
-                recent firmware uses 4 bytes for all parameters.
-            parameter: Parameter id.
-            value: Value to be set to parameter.
-        """
-        data = [0xde,
-                parameter,
-                value & 0xff,
-                (value >> 8) & 0xff,
-                (value >> 16) & 0xff,
-                (value >> 24) & 0xff,
-                0,
-                0]
-        self.send_and_check_rsp(data=data[:2+length], check=[0x0, None, 0xde])
-
-    def get_parameter(self, parameter: int, signed: bool = False) -> int:
-        """Read the current parameter value.
-
-        Args:
-            parameter: Parameter id.
-            signed: If parameter value is signed.
-
-        Returns:
-            value: Value read from given parameter.
-        """
-        rsp = self.send_and_check_rsp(
-            data=[0xdb, parameter],
-            check=[0xdc, parameter, None, None, None, None],
-            check_dlc=False)  # We do not know how many bytes the param. holds.
-        shift = 0
-        result = 0
-        for i in range(2, rsp.dlc):
-            result = result | (rsp.data[i] << shift)
-            shift = shift + 8
-        if signed:
-            result = unsigned_to_signed(result, number_of_bytes=rsp.dlc-2)
-        return result
-
-    def rotate(self, cmd_mode: int, direction: int, speed: int,
-               timeout: int = 0) -> None:
-        """Do rotate action.
-
-        Not all devices have a rotation actor. Usually rotation is done until
-        stopped, so a time_out does not make sense. Some special command modes
-        might set a duration time though.
-
-        Args:
-            cmd_mode: Device specific operate mode.
-            direction: 0: CW (clock-wise), 1: CCW (counter-clock-wise).
-            speed: Rotation velocity. Usually unsigned (direction is a separate
-                argument). Device specific units.
-            timeout: Seconds to wait until not busy anymore. 0: no wait.
-
-        Raises:
-            McsTimeoutException: On timeout while waiting.
-        """
-        self.send_and_check_rsp(data=[0x25,
-                                      cmd_mode,
-                                      direction & 0xff,
-                                      speed & 0xff,
-                                      (speed >> 8) & 0xff],
-                                check=[0x00, None, 0x25])
-        if timeout:
-            self.wait(timeout)
-
-    def move(self, position: int, speed: int, timeout: int = 0,
-             cmd_mode: int = 0) -> None:
-        """Do an absolute or relative move.
-
-        Not all devices have a moving actor.
-
-        Args:
-            cmd_mode: Device specific move mode. Usually: 0: absolute move,
-                                                          1: relative move.
-                For Diluter: 0: absolute move, 1: relative move,
-                             2: automatic stop on bubble detection.
-            position: Target position to move to (absolute move mode) or to 
-                move by (relative move mode).
-            speed: Velocity (device specific units).
-            timeout: Seconds to wait until not busy anymore. 0: no wait.
-
-        Raises:
-            McsTimeoutException: On timeout while waiting.
-        """
-        self.send_and_check_rsp(
-            data=[0x23,
-                  cmd_mode,
-                  position & 0xff,
-                  (position >> 8) & 0xff,
-                  (position >> 16) & 0xff,
-                  (position >> 24) & 0xff,
-                  speed & 0xff,
-                  (speed >> 8) & 0xff],
-            check=[0x00, None, 0x23])
-        if timeout:
-            self.wait(timeout)
-
-    def move_abs(self, position: int, speed: int, timeout: int = 0) -> None:
-        self.move(position=position, speed=speed, timeout=timeout, cmd_mode=0)
-
-    def move_rel(self, position: int, speed: int, timeout: int = 0) -> None:
-        self.move(position=position, speed=speed, timeout=timeout, cmd_mode=1)
-
-    def move_discrete(self, cmd_mode: int, position_id: int,
-                      direction: Union[int, str] = 'CCW',
-                      timeout: int = 10) -> None:
-        """Move to a predefined position.
-
-        Not all devices have a moving actor.
-
-        Args:
-            cmd_mode: Device specific move mode.
-            direction: Direction of move/rotation:
-                0x00 or "CCW": Counter-clock-wise.
-                0x80 or "CW": Clock-wise.
-                0x40 or "SHORTEST": Shortest way.
-            position_id: Predefined position to move to.
-            timeout: Seconds to wait until not busy anymore. 0: no wait.
-        """
-
-        if isinstance(direction, str):
-            direction = direction.upper()
-            if direction == 'CCW':
-                position_id = position_id | 0x00
-            elif direction == "CW":
-                position_id = position_id | 0x80
-            elif direction == "SHORTEST":
-                position_id = position_id | 0x40
-        self.send_and_check_rsp(data=[0x24, cmd_mode, position_id & 0xff],
-                                check=[0x00, None, 0x24])
-        if timeout:
-            self.wait(timeout)
-
-    def get_move(self) -> (int, int):
-        """Read and return current position and speed.
-
-        Not available for all devices.
-        """
-        rsp = self.send_and_check_rsp(
-            data=[0x26, 0x00],
-            check=[0x27, None, None, None, None, None, None, None])
-        shift = 0
-        position = 0
-        for i in range(2, 6):
-            position = position | (rsp.data[i] << shift)
-            shift = shift + 8
-        position = unsigned_to_signed(position, 4)
-        shift = 0
-        speed = 0
-        for i in range(6, 8):
-            speed = speed | (rsp.data[i] << shift)
-            shift = shift + 8
-        speed = unsigned_to_signed(speed, 2)
-        return position, speed
-
-    def get_pos(self) -> int:
-        p, s = self.get_move()
-        return p
-
-    def get_speed(self) -> int:
-        p, s = self.get_move()
-        return s
-
-    def set_ramping(self, acceleration: int, deceleration: int) -> None:
-        """Set acceleration and deceleration data."""
-        data = [0x28, acceleration & 0xff, (acceleration >> 8) & 0xff,
-                deceleration & 0xff, (deceleration >> 8) & 0xff]
-        self.send_and_check_rsp(data=data, check=[0x00, None, 0x28])
-
-    def get_ramping(self) -> (int, int):
-        """Read acceleration and deceleration data.
-
-        Returns:
-            acceleration:
-            deceleration:
-        """
-        rsp = self.send_and_check_rsp([0x29, ], check=[0x2a, ])
-        shift = 0
-        acceleration = 0
-        for i in range(1, 3):
-            acceleration = acceleration | (rsp.data[i] << shift)
-            shift = shift + 8
-        shift = 0
-        deceleration = 0
-        for i in range(3, 5):
-            deceleration = deceleration | (rsp.data[i] << shift)
-            shift = shift + 8
-        return acceleration, deceleration
-
-    def set_discrete_position(self, position_id: int, position: int) -> None:
-        data = [0x2b, position_id & 0xff, position & 0xff,
-                (position >> 8) & 0xff]
-        self.send_and_check_rsp(data=data, check=[0x00, None, 0x2b])
-
-    def get_discrete_position(self, position_id: int) -> int:
-        rsp = self.send_and_check_rsp(data=[0x2c, ], check=[0x2d, position_id],
-                                      check_dlc=False)
-        shift = 0
-        position = 0
-        for i in range(2, 6):
-            position = position | (rsp.data[i] << shift)
-            shift = shift + 8
-        return position
-
-    def erase_mem(self, address: int, timeout: int = 15) -> None:
-        data = [0xfd, address & 0xff, (address >> 8) & 0xff,
-                (address >> 16) & 0xff]
-        self.send_and_check_rsp(data=data, check=[0x00, None, 0xfd])
-        if timeout:
-            self.wait(timeout)
-
-    def set_mem_list(self, address: int, data: List[int]) -> None:
-        d = [0xfe, address & 0xff, (address >> 8) & 0xff,
-             (address >> 16) & 0xff]
-        d += data
-        self.send_and_check_rsp(data=d, check=[0x00, None, 0xfe])
-
-    def set_mem_int(self, address: int, data: Union[int, List[int]],
-                    length: Optional[int] = None) -> None:
-        d = [data & 0xff, (data >> 8) & 0xff, (data >> 16) & 0xff,
-             (data >> 24) & 0xff]
-        self.set_mem_list(address=address, data=d[:4+length])
-
-    def set_mem_array(self, address: int, data: str) -> None:
-        d = []
-        for b in data:
-            d.append(ord(b))
-
-        self.set_mem_list(address=address, data=d)
-
-    def get_mem_list(self, address: int, length: int) -> List[int]:
-        d = [0xfb, address & 0xff, (address >> 8) & 0xff,
-             (address >> 16) & 0xff, length & 0xff]
-        rsp = self.send_and_check_rsp(data=d, check=[0xfc, ], check_dlc=False)
-        log.debug(f"rsp: {rsp.data[1:]} ")
-        return rsp.data[1:]
-
-    def get_mem_int(self, address: int, length: int, signed: bool = False
-                    ) -> int:
-        rsp = self.get_mem_list(address=address, length=length)
-        shift = 0
-        result = 0
-        for i in rsp:
-            result |= i << shift
-            shift += 8
-        if signed:
-            result = unsigned_to_signed(result, number_of_bytes=len(rsp)-1)
-        return result
-
-    def get_mem_array(self, address: int, length: int) -> List[str]:
-        rsp = self.get_mem_list(address=address, length=length)
-        data = []
-        for i in rsp:
-            data.append(chr(i))  # TODO(MME): Check if this is what we want.
-        return data
-
-    def get_mem_str(self, address: int, length: int) -> str:
-        rsp = self.get_mem_list(address=address, length=length)
-        data = ""
-        for i in rsp:
-            data += chr(i)
-        return data
-
-    def set_aux_data(self, data: List[int]) -> None:
-        d = [0x55, ] + data
-        self.send_and_check_rsp(data=d, check=[0x00, None, 0x55])
-
-    def get_aux_data(self) -> List[int]:
-        rsp = self.send_and_check_rsp(data=[0x53, ], check=[0x54, ],
-                                      check_dlc=False)
-        return rsp.data[1:]
-
-    def set_boot_mode(self, mode: int, crc: int, timeout: int = 15) -> None:
-        self.send_and_check_rsp(
-            data=[0xfa, mode, crc & 0xff, (crc >> 8) & 0xff],
-            check=[0x0, None, 0xfa])
-        if timeout:
-            self.wait(timeout)
-
-    def go_main(self, timeout: int = 2) -> None:
-        self.send_and_check_rsp([0xf9, ], check=[0x00, None, 0xf9])
-        # Just 2 seconds pause. Device might have a different CAN id in main
-        # mode now.
-        time.sleep(timeout)
-
-    def go_boot(self, timeout=2) -> None:
-        self.send_and_check_rsp(data=[0xf8, ], check=[0x00, None, 0xf8])
-        # Just 2 seconds pause. Device might have a different CAN id in boot
-        # mode now.
-        time.sleep(timeout)
-
-    def init_boot(self, cmd_mode: int = 0, timeout: int = 10) -> None:
-        self.send_and_check_rsp(data=[0x1d, cmd_mode], check=[0x00, None, 0x1d])
-        if timeout:
-            self.wait(timeout)
+# -*- coding: utf-8 -*-
+import can  # python-can package
+import collections
+import concurrent.futures
+import logging
+import time
+import threading
+from typing import Callable, List, Optional, Set, Tuple, Union
+import warnings
+
+import mcs
+from mcs.codec import TELEGRAMS, TelegramCheck
+
+# Firmware module states (as in status bytes in info telegram):
+STATUS_NOT_INIT = 1
+STATUS_PREPARED = 2
+STATUS_ACTIVE = 4
+STATUS_ERROR = 8
+STATUS_WARNING = 16
+STATUS_DETECTED = 64
+STATUS_DATA = 128
+
+CAN_BUFFER_SIZE = 5  # Max no. of messages (acknowledges and responses).
+UNSOLICITED_BUFFER_SIZE = 32  # Max. no. of unsolicited messages kept.
+CANCELLED_REQUESTS = 8  # Max. no. of cancelled requests kept (see Request).
+LATE_RESPONSE_TIME = 2.0  # Max. seconds a late response is recognized.
+REAPPEARANCE_POLL_PERIOD = 0.1  # Seconds between info requests while waiting
+# for a restarting module (see wait_for_reappearance()).
+
+# Overflow policies of receive channels:
+DROP_OLDEST = "drop oldest"  # Discard oldest message to make room.
+DROP_NEWEST = "drop newest"  # Discard message received.
+
+log = logging.getLogger(__name__)
+
+
+def unsigned_to_signed(value: int, number_of_bytes: int) -> int:
+    """Return unsigned value calculated from signed value."""
+    # TODO(MME): There are tools in Python 3 for this.
+    bits = number_of_bytes * 8
+    if (value & (1 << (bits - 1))) != 0:
+        value = value - (1 << bits)
+    return value
+
+
+def get_value_from_rsp(rsp: can.Message, offset: int, signed: bool = False
+                       ) -> int:
+    """Return value of a port or parameter read response.
+
+    Args:
+        rsp: Response message, e.g. to a get port or get parameter request.
+        offset: Index of the value's first (least significant) data byte.
+        signed: If value is signed.
+    """
+    return int.from_bytes(rsp.data[offset:rsp.dlc], "little", signed=signed)
+
+
+def status_str(status: int) -> str:
+    state_bin = bin(status)
+    status_txt = f"{state_bin} {hex(status)}"
+    txt = ["not-init", "prepared", "busy", "error", "warning", "detected",
+           "data"]
+    bits = state_bin
+    for i in range(min(7, len(state_bin))):
+        if state_bin[-(i + 1)] == '1':
+            status_txt += f" {txt[i]}"
+    return status_txt
+
+
+def get_can_id_from_device_name(name: str) -> int:
+    """Return CAN Id for given device name.
+
+    Args:
+        name: Device name, not case sensitive.
+
+    Returns:
+        can_id: Master (send) CAN Id of device, e.g. 0x43a for 'bottle detect'.
+    """
+    for can_id in mcs.DEVICE_NAME:
+        if name.lower() == mcs.DEVICE_NAME[can_id].lower():
+            return can_id
+    raise ValueError(f"Name {name} not in list of devices")
+
+
+class ReceiveChannel(object):
+    """Bounded FIFO of received messages with overflow policy and counters.
+
+    Messages are put by the reading thread and got by the thread waiting for
+    them (append and popleft of the deque do not need a lock).
+    """
+
+    def __init__(self, name: str, size: int, overflow: str = DROP_OLDEST
+                 ) -> None:
+        """Instantiate receive channel.
+
+        Args:
+            name: Channel name (for logging), e.g. "acknowledge".
+            size: Max. no. of messages.
+            overflow: Overflow policy, DROP_OLDEST or DROP_NEWEST.
+        """
+        if overflow not in (DROP_OLDEST, DROP_NEWEST):
+            raise ValueError(f"Unknown overflow policy '{overflow}'")
+        self.name = name
+        self.size = size
+        self.overflow = overflow
+        self.received = 0  # No. of messages put.
+        self.dropped = 0  # No. of messages discarded on overflow.
+        self._queue = collections.deque()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def __iter__(self):
+        return iter(list(self._queue))
+
+    def __repr__(self) -> str:
+        return (f"{self.name} channel ({len(self)}/{self.size}, "
+                f"{self.dropped} dropped)")
+
+    def put(self, msg: can.Message) -> Optional[can.Message]:
+        """Put message into channel.
+
+        Returns:
+            dropped: Message discarded on overflow (None if there is room).
+        """
+        self.received += 1
+        dropped = None
+        if len(self._queue) >= self.size:
+            self.dropped += 1
+            if self.overflow == DROP_NEWEST:
+                return msg
+            dropped = self._queue.popleft()
+        self._queue.append(msg)
+        return dropped
+
+    def get(self) -> can.Message:
+        """Return and remove oldest message.
+
+        Raises:
+            IndexError: If channel is empty.
+        """
+        return self._queue.popleft()
+
+    def clear(self) -> None:
+        self._queue.clear()
+
+
+class Request(object):
+    """Request sent to a device waiting for its response (transaction).
+
+    Created by McsDevice.send() and finished by McsDevice.rcv() or cancelled
+    (on time out or by McsDevice.cancel_request()). Responses to cancelled
+    requests are recognized (see matches()) and discarded.
+
+    Attributes:
+        data: Sent data.
+        send_time: Time (time.perf_counter()) the request was created.
+        deadline: Time (time.perf_counter()) the response is expected until
+            (set by McsDevice.rcv()).
+        response: Received response (None if not received yet).
+        cancelled: If request was cancelled.
+    """
+
+    def __init__(self, data: List[int], lock: Optional[threading.Lock] = None
+                 ) -> None:
+        """Create request.
+
+        Args:
+            data: Sent data, e.g. [0x41, 5].
+            lock: Device lock acquired for this request (released once the
+                request is finished or cancelled).
+        """
+        self.data = data
+        self.send_time = time.perf_counter()
+        self.deadline: Optional[float] = None
+        self.response: Optional[can.Message] = None
+        self.cancelled = False
+        self._lock = lock
+
+    def __repr__(self) -> str:
+        state = ("cancelled" if self.cancelled else
+                 "done" if self.response is not None else "outstanding")
+        return f"request {bytes(self.data).hex(' ')} ({state})"
+
+    def matches(self, msg: can.Message) -> bool:
+        """Return if message (not a status change) is response to request.
+        """
+        cmd = self.data[0]
+        rsp_cmd = msg.data[0]
+        if rsp_cmd == 0x00:  # ACK or NACK of command.
+            return msg.data[2] in (cmd, 0xff)
+        if rsp_cmd == 0x42:  # Port data: requested or pushed (auto-port).
+            return cmd == 0x41 and msg.data[2] == self.data[1]
+        if cmd == 0x1b:  # Info request.
+            return len(self.data) > 1 and rsp_cmd == self.data[1]
+        return True
+
+    def release(self) -> None:
+        """Release device lock (if acquired for this request, only once)."""
+        lock, self._lock = self._lock, None
+        if lock is not None:
+            lock.release()
+
+
+class McsTimeoutException(mcs.McsException):
+    """Raised when a CAN device did not respond in time.
+
+    Either the device did not respond in time as it is not available or
+    because it did not report a status change in time (e.g. is still busy).
+    """
+    pass
+
+
+class McsHardwareException(mcs.McsException):
+    """Raised when an MCS exception occurs.
+
+    Attributes:
+        error_code -- error code reported by firmware of module
+    """
+
+    def __init__(self, message, err_code: int = -1):
+        self.error_code = err_code  # Modules report positive numbers here only.
+        self.message = message
+
+
+class McsDevice(object):
+    """Miltenyi CAN System Device.
+
+    This device uses an McsBus instance to send CAN command messages (i.e. CAN
+    telegram). It is usually used in an MCS instance itself that reads all
+    incoming response messages on the bus (McsBus instance) and calls the
+    put_msg() method of this instance here to add messages received from a
+    hardware module to the corresponding McsDevice instance's buffer. Here the
+    response to the initially send command is checked, the McsDevice state is
+    updated and in case of errors an exception is raised. The exception needs
+    to be handled by the instance using this McsDevice.
+
+    Received messages are sorted into receive channels: acknowledges (info 0
+    ACK/NACK), responses (data requested by the last command sent) and
+    unsolicited messages (e.g. port data pushed by auto-port mode). rcv()
+    returns acknowledges and responses only, so unsolicited messages neither
+    fill up the buffer nor are mistaken for a response.
+    """
+
+    def __init__(self, can_id: int, mcs_bus: mcs.McsBus) -> None:
+        """Instantiate an MCS compliant CAN device."""
+        can_id &= 0xff  # We allow master and slave arbitration ids (e.g. 0x411
+        # and 0x011) as id argument (but use the slave id now).
+        # CAN arbitration id used by firmware for sending (i.e. is in received
+        # response messages to those send from this device here):
+        self.rsp_id = can_id
+        # CAN arbitration id used for sending by this device here (master) to
+        # the firmware (slave) of the hardware module. The master uses a CAN
+        # arbitration id that is the CAN arbitration id the slave is using for
+        # his message plus 0x400:
+        self.id = self.rsp_id + 0x400  # Default is master id.
+        self.name = mcs.DEVICE_NAME.get(self.id, "<unnamed device>")
+
+        self.mcs = mcs_bus
+        if self.mcs.error_code != 0:
+            raise RuntimeError('MCS instance with error cannot be used')
+
+        self.status = 0  # Holds status parsed from response messages.
+        self.error = 0  # Holds error code received from info 1 response.
+        self.warning = 0  # Holds warning code received from info 1 response.
+        self.com_error = 0  # Holds error code received from info 6 response.
+        # Hold unhandled received messages (see _put_msg()):
+        self.acknowledges = ReceiveChannel("acknowledge", CAN_BUFFER_SIZE)
+        self.responses = ReceiveChannel("response", CAN_BUFFER_SIZE)
+        self.unsolicited = ReceiveChannel("unsolicited",
+                                          UNSOLICITED_BUFFER_SIZE)
+        self._history = collections.deque(maxlen=16)  # Holds recent send and
+        # received messages for debug logging in case of an exception.
+        self._lock = threading.Lock()  # Do not allow other commands for this
+        # device to be send (by master) until acknowledge response is received
+        # from device (slave).
+        self._rcv_condition = threading.Condition()  # Notified by put_msg()
+        # whenever a message is added to the buffer or the status changed.
+        self._listeners: List[Callable[[can.Message], None]] = []
+        # Ports whose values are pushed by the module (auto mode, see
+        # mcs.subscription), mutated in place only:
+        self.pushed_ports: Set[int] = set()
+        # Outstanding request and recently cancelled requests. Mutated in
+        # place only (methods might be called with a HardwareDevice as self
+        # which forwards attribute access to this instance):
+        self._request = collections.deque(maxlen=1)
+        self._cancelled_requests = collections.deque(maxlen=CANCELLED_REQUESTS)
+        # Last status change info 0 telegram (see wait_for_reappearance()):
+        self._status_change = collections.deque(maxlen=1)
+
+    def __repr__(self) -> str:
+        txt = f"{mcs.DEVICE_NAME.get(self.id, 'device')} {hex(self.rsp_id)}"
+        return txt
+
+    def put_msg(self, msg: can.Message) -> None:
+        """Put (new received) message (from slave hardware module) into this
+        device module's buffer.
+
+        This method is typically called from the MCS (CAN bus) instance's reader
+        thread. Threads blocking in rcv() or wait() are notified and listeners
+        are called.
+        """
+        with self._rcv_condition:
+            self._put_msg(msg)
+            self._rcv_condition.notify_all()
+        for listener in self._listeners:
+            try:
+                listener(msg)
+            except Exception as exc:
+                log.exception(f"{self}: Listener failed: {exc}")
+
+    def add_listener(self, listener: Callable[[can.Message], None]) -> None:
+        """Add callable to be called with each message put into this device.
+
+        Listeners are called from the reader thread (after status and buffer
+        have been updated) and must return quickly.
+        """
+        self._listeners = self._listeners + [listener]
+
+    def remove_listener(self, listener: Callable[[can.Message], None]
+                        ) -> None:
+        """Remove listener added by add_listener()."""
+        self._listeners = [x for x in self._listeners if x is not listener]
+
+    def _put_msg(self, msg: can.Message) -> None:
+        """Update status and buffer from given message (see put_msg())."""
+        self._history.append(msg)
+        if msg.data[0] == 0x00:  # Info 0 telegram received.
+            # log.debug(f"{self}: Status: {status_str(self.status)}")
+            self.status = msg.data[1]  # Update the device status.
+            # Note: if not locked, we could have race conditions here with
+            # self.status and methods calling it such as self.has_error()!
+            if self.has_error():
+                log.error(f"{self}: Status: {status_str(self.status)}")
+                # Cannot raise here on error as this method is called from a
+                # thread continuously reading the CAN bus. Either
+                # send_and_check_rsp() or wait() will raise eventually which
+                # are called from main or a thread that is directly using the
+                # McsDevice instance and should handle the error then there.
+            else:
+                # Reset error code if error bit is not (or no longer) set in
+                # the modules status byte:
+                self.error = 0
+                # log.debug(f"{self}: Error cleared")
+            if self.has_warning():
+                log.warning(f"{self}: Status: {status_str(self.status)}")
+            else:
+                self.warning = 0
+                # log.debug(f"{self}: Warning cleared")
+            # TODO(MME): When do we update self.com_error? Here based on status
+            #  info, too?
+            if msg.data[2] == 0x00:
+                # A simple state change info (neither an ACK nor a NOT-ACK).
+                # E.g. the module state changed from busy to idle. As the state
+                # has been updated above already we do not need to handle this
+                # specifically and as this is not a direct response to a send
+                # message, we do not add it to the buffer and just return here:
+                # log.debug(f"{self}: Status: {status_str(self.status)}")
+                self._status_change.append(msg)
+                return
+            elif msg.data[2] == 0xff:
+                # Firmware of module does not acknowledge last received command
+                # (a NOT-ACK of our last send command):
+                log.error(f"{self}: Received NACK: {msg}")
+                self.mcs.metrics.inc("nacks", self.rsp_id)
+                #     self.mcs.send(self.id | 0x400, [0x1b, 0x06],
+                #                       block=False)  # send Info6-Request
+        # elif msg.data[0] == 0x01:
+        # # This is done in response handling of self.info_error() anyway!
+        #     # Info 1 telegram (holds error and warning code); is a response of
+        #     # a specific info 1 request.
+        #     self.error = msg.data[2] | (msg.data[3] << 8)  # Update error code
+        #     self.warning = msg.data[4] | (msg.data[5] << 8)  # Upd. warning.
+        #     if self.error:
+        #         log.debug(f"{self} reports error: {hex(self.error)}")
+        #     if self.warning:
+        #         log.debug(f"{self} reports warning: {hex(self.error)}")
+        elif msg.data[0] == 0x06:
+            # Info 6 telegram received (holds communication error code, e.g.
+            # cause for previous NOT-ACK; is a response of a specific info 6
+            # request.
+            self.com_error = msg.data[1] | (msg.data[2] << 8)  # Update error.
+        request = self._request[0] if self._request else None
+        if (request is not None and request.response is None
+                and request.matches(msg)):
+            request.response = msg
+            self.mcs.metrics.observe_rtt(
+                self.rsp_id, request.data[0],
+                time.perf_counter() - request.send_time)
+            channel = (self.acknowledges if msg.data[0] == 0x00
+                       else self.responses)
+        elif self._is_late_response(msg):
+            return
+        elif msg.data[0] == 0x00:
+            channel = self.acknowledges
+        else:
+            channel = self.unsolicited
+        popped = channel.put(msg)
+        if popped is not None and channel is self.unsolicited:
+            log.debug(f"{self}: Buffer overflow of {channel}: Discarding "
+                      f"message: {popped}")
+            self.mcs.metrics.inc("unsolicited_overflows", self.rsp_id)
+        elif popped is not None:
+            log.warning(f"{self}: Buffer overflow of {channel}: Discarding "
+                        f"message: {popped}")
+            self.mcs.metrics.inc("buffer_overflows", self.rsp_id)
+            # Should not happen. Usually there is only a single message in
+            # the response buffer.
+
+    def _is_late_response(self, msg: can.Message) -> bool:
+        """Return if message is response to a cancelled request (and forget
+        this request)."""
+        now = time.perf_counter()
+        for request in self._cancelled_requests:
+            if (request.response is None and request.matches(msg)
+                    and now - request.send_time < LATE_RESPONSE_TIME):
+                request.response = msg
+                log.debug(f"{self}: Discarding late response to {request}: "
+                          f"{msg}")
+                self.mcs.metrics.inc("late_responses", self.rsp_id)
+                return True
+        return False
+
+    @property
+    def buffer(self) -> List[can.Message]:
+        """Unhandled acknowledges and responses (copy)."""
+        return list(self.acknowledges) + list(self.responses)
+
+    @buffer.setter
+    def buffer(self, messages: List[can.Message]) -> None:
+        self.clear_buffer()
+        for msg in messages:
+            self.responses.put(msg)
+
+    def clear_buffer(self) -> None:
+        """Discard unhandled acknowledges, responses and unsolicited messages.
+        """
+        self.acknowledges.clear()
+        self.responses.clear()
+        self.unsolicited.clear()
+
+    def get_msg(self) -> can.Message:
+        """Return and remove (pop) oldest acknowledge or response."""
+        if self.acknowledges:
+            return self.acknowledges.get()
+        return self.responses.get()
+
+    def rcv(self, timeout=mcs.mcsbus.CAN_TIMEOUT) -> can.Message:
+        """Return received message as soon as available in buffer.
+
+        Args:
+            timeout: Time to wait for a message in buffer. If no message is
+                available in buffer within this time, an McsTimeoutException
+                is raised.
+
+        Returns:
+            message: Received message read from buffer.
+
+        Raises:
+            McsTimeoutException: If no message was received in time.
+        """
+        # Block until the reader thread notifies about a new message (see
+        # put_msg()) instead of polling the buffer. This is the most time
+        # sensitive part (besides logging). Test performance if changes have
+        # been done here (see benchmarks/bench_rcv.py)!
+        request = self.request
+        if request is not None:
+            request.deadline = time.perf_counter() + timeout
+        with self._rcv_condition:
+            available = self._rcv_condition.wait_for(
+                lambda: self._is_msg_available() or (
+                    request is not None and request.cancelled),
+                timeout=timeout)
+        if not available or not self._is_msg_available():
+            # Released at once (no need to wait for the late response):
+            self.cancel_request(request)
+            self.mcs.metrics.inc("timeouts", self.rsp_id)
+            reason = "cancelled" if available else "no response"
+            self._log_history_and_raise(
+                McsTimeoutException(f"Time out: {reason} from {self}"))
+        can_msg = self.get_msg()
+        self._finish_request(request)
+        return can_msg
+
+    def send(self, data: List[int], block: bool = True,
+             priority: int = mcs.mcsbus.PRIORITY_CONTROL) -> None:
+        """Send message to CAN bus and add to history.
+
+        Args:
+            data: List of data to be send, e.g. [0x1c, 0xff].
+            block: Do not allow other commands to be send until acknowledge
+                response is received. Highly recommended. Know what you are
+                doing if you set this to False!
+            priority: Transmit lane of McsBus, e.g. PRIORITY_POLL for polling
+                requests.
+
+        Raises:
+            RuntimeError: If device communication is locked (device is waiting
+                on response by slave) for longer than 1 second.
+        """
+        if block:
+            acquired = self._lock.acquire(timeout=1.0)
+            if not acquired:
+                self.mcs.metrics.inc("lock_failures", self.rsp_id)
+                try:
+                    self.mcs.log_recent_commands()
+                finally:
+                    raise RuntimeError("Cannot acquire lock for sending")
+        request = self._start_request(data, self._lock if block else None)
+        try:
+            sent_msg = self.mcs.send(can_id=self.id, data=data,
+                                     priority=priority)
+        except Exception:
+            self.cancel_request(request)
+            raise
+        self._history.append(sent_msg)
+
+    def send_nowait(self, data: List[int],
+                    priority: int = mcs.mcsbus.PRIORITY_CONTROL
+                    ) -> concurrent.futures.Future:
+        """Queue message for sending, no locking (see McsBus.send_nowait()).
+
+        The response is received with rcv() as usual.
+
+        Returns:
+            future: Done when message is sent (result is sent message).
+        """
+        self._start_request(data)
+        return self.mcs.send_nowait(self.id, data, priority=priority)
+
+    @property
+    def request(self) -> Optional[Request]:
+        """Outstanding (or last finished) request."""
+        return self._request[0] if self._request else None
+
+    def _start_request(self, data: List[int],
+                       lock: Optional[threading.Lock] = None
+                       ) -> Optional[Request]:
+        """Create request expecting a response (see _put_msg()).
+
+        A previous request still waiting for its response is cancelled and
+        unhandled acknowledges and responses (to previous requests) are
+        discarded.
+        """
+        previous = self.request
+        if previous is not None and previous.response is None:
+            self.cancel_request(previous)
+        self.acknowledges.clear()
+        self.responses.clear()
+        if not data:
+            self._request.clear()
+            if lock is not None:
+                lock.release()
+            return None
+        request = Request(data, lock)
+        self._request.append(request)
+        return request
+
+    def _finish_request(self, request: Optional[Request]) -> None:
+        """Release request (lock) after its response has been received."""
+        if request is not None:
+            request.release()
+
+    def cancel_request(self, request: Optional[Request] = None
+                       ) -> Optional[Request]:
+        """Cancel request: a late response to it will be discarded.
+
+        The device lock is released at once, so the next command can be sent
+        without waiting. A thread waiting in rcv() for the response raises
+        McsTimeoutException.
+
+        Args:
+            request: Request to be cancelled (default: outstanding request).
+
+        Returns:
+            request: Cancelled request (None if there is none).
+        """
+        if request is None:
+            request = self.request
+        if request is None or request.cancelled:
+            return None
+        with self._rcv_condition:
+            request.cancelled = True
+            if request.response is None:
+                self._cancelled_requests.append(request)
+            self._rcv_condition.notify_all()
+        request.release()
+        return request
+
+    def _is_msg_available(self) -> bool:
+        """Return bool if a message is available for this device."""
+        return len(self.acknowledges) > 0 or len(self.responses) > 0
+
+    def check_msg(self, msg: Optional[can.Message],
+                  data: Optional[List[int]] = None,
+                  check_dlc: bool = True) -> None:
+        if self.rsp_id != msg.arbitration_id:
+            raise_txt = (f"Wrong CAN ID: received {msg.arbitration_id:0x}, "
+                         f"expected {self.id:0x}")
+            # This can only happen if the message was not assigned to the
+            # proper device/module handler. This is not a hardware module error.
+            # We directly raise here:
+            self._log_history_and_raise(ValueError(raise_txt))
+        # Check for NACK:
+        if msg.data[0] == 0x00 and msg.data[2] == 0xff:
+            self._handle_not_acknowledge()
+        if check_dlc:
+            dlc = len(data)
+            if dlc != msg.dlc:
+                raise_txt = (f"{self}: Wrong DLC: received {msg.dlc}, "
+                             f"expected {dlc}")
+                self._log_history_and_raise(ValueError(raise_txt))
+        if isinstance(data, TelegramCheck) and data.matches(msg.data):
+            pass  # Compiled check (e.g. TELEGRAMS[0x40].ack) passed at once.
+        elif data:
+            for i in range(len(data)):
+                if data[i] and data[i] != msg.data[i]:
+                    raise_txt = (
+                        f"{self}: Wrong data {i}: Received "
+                        f"{msg.data[i]:02x}, expected {data[i]:02x}, message: "
+                        f"{msg}")
+                    self._log_history_and_raise(ValueError(raise_txt))
+
+    def send_and_check_rsp(self, data: List[int],
+                           block: bool = True,
+                           timeout: int = 0.3,
+                           check: Optional[List[int]] = None,
+                           check_dlc: bool = True,
+                           ) -> can.Message:
+        self.send(data, block)
+        rsp = self.rcv(timeout)  # Status is updated automatically here.
+        return self.check_rsp(rsp, data, check, check_dlc)
+
+    def check_rsp(self, rsp: can.Message, data: List[int],
+                  check: Optional[List[int]] = None,
+                  check_dlc: bool = True) -> can.Message:
+        """Handle error state and check response to given sent data.
+
+        Second part of send_and_check_rsp() (after the response has been
+        received). Also used by Mcs.send_and_check_rsp_group().
+
+        Args:
+            rsp: Received response.
+            data: Data sent before.
+            check: Expected response data (None items are not checked).
+            check_dlc: Check length of response data, too.
+
+        Returns:
+            rsp: Given (checked) response.
+        """
+        log.debug(f"received {rsp}")
+        if (self.has_error() or self.has_warning()) and (data != [0x1b, 0x01]):
+            # Request modules error and warning codes with an info error
+            # telegram. If last send data is info request, i.e. [0x1b, 0x01],
+            # we do not handle here again.
+            log.debug(f"{self}: Requesting error info")
+            self._handle_error()  # Raises
+        else:
+            self.check_msg(rsp, check, check_dlc)
+        return rsp
+
+    def _get_history_str(self):
+        history = f"{self}: Call history:\n"
+        for i in self._history:
+            history += f"{mcs.mcsbus.msg_txt(i)}\n"
+        return history
+
+    def _log_history_and_raise(self, exc):
+        try:
+            log.critical(exc)
+            log.critical(self._get_history_str())
+        finally:
+            raise exc
+
+    def _handle_error(self) -> None:
+        """Handle error.
+
+        Request modules error and warning state and eventually raise.
+
+        Raises:
+            McsHardwareException: Raises in all cases (that's the job).
+        """
+        error_code, warning_code = self.info_error()  # Sends CAN command.
+        self._raise_error(error_code, warning_code)
+
+    def _raise_error(self, error_code: int, warning_code: int) -> None:
+        """Raise exception for error and warning codes (see _handle_error()).
+        """
+        warn_txt = mcs.CanErrors.MODULE_ERRORS.get(self.warning,
+                                                   "<unknown warning>")
+        err_txt = mcs.CanErrors.MODULE_ERRORS.get(self.error,
+                                                  "<unknown error>")
+        raise_txt = (f"{self}: Error {hex(error_code)} '{err_txt}' "
+                     f"and warning {hex(warning_code)} '{warn_txt}'")
+        exception = McsHardwareException(raise_txt, err_code=error_code)
+        self._log_history_and_raise(exception)
+
+    def _handle_not_acknowledge(self) -> None:
+        """Handle NACK reported by device.
+
+        Raises:
+            McsHardwareException: Raises in all cases (that's the job).
+        """
+        # Request error and warning codes:
+        error_code, warning_code = self.info_error()
+        self._raise_not_acknowledge(error_code, warning_code)
+
+    def _raise_not_acknowledge(self, error_code: int, warning_code: int
+                               ) -> None:
+        """Raise exception for NACK (see _handle_not_acknowledge())."""
+        raise_txt = f"{self}: NACK received"
+        if error_code:
+            err_txt = mcs.CanErrors.MODULE_ERRORS.get(self.error,
+                                                      "<unknown error>")
+            raise_txt += (f": error {error_code} ({hex(error_code)}) "
+                          f"'{err_txt}'")
+        if warning_code:
+            warn_txt = mcs.CanErrors.MODULE_ERRORS.get(self.warning,
+                                                       "<unknown warning>")
+            raise_txt += (f": warning {warning_code} ({hex(warning_code)}) "
+                          f" '{warn_txt}'")
+        exception = McsHardwareException(raise_txt, err_code=error_code)
+        self._log_history_and_raise(exception)
+
+    def wait(self, timeout: int = 60) -> None:
+        """Wait till module reports to be not busy anymore.
+
+        Args:
+            timeout: Time in seconds to wait that device is no longer busy. If
+                set to 0 will wait forever. Default is 60 but might not fit all
+                device actions.
+
+        Raises:
+            McsTimeoutException: On timeout while waiting.
+        """
+        # log.debug(f"{self}: Waiting: Status: {status_str(self.status)}")
+        # Status changes are reported by info 0 telegrams which notify the
+        # condition in put_msg(), so there is no need to poll the status here:
+        with self._rcv_condition:
+            idle = self._rcv_condition.wait_for(lambda: not self.is_busy(),
+                                                timeout=timeout or None)
+        if not idle:
+            log.debug(f"{self}: Time-out: Status: {self.status}")
+            self.mcs.metrics.inc("wait_timeouts", self.rsp_id)
+            self._log_history_and_raise(
+                McsTimeoutException(
+                    f"{self}: Time-out waiting for busy module: "
+                    f"Status: {bin(self.status)}"))
+        if self.has_error() or self.has_warning():
+            log.debug(f"{self}: Has error or warning")
+            self._handle_error()  # Raises
+        # log.debug(f"{self}: Done: Status: {status_str(self.status)}")
+
+    def wait_for_status(self, condition: Callable[[int], bool],
+                        max_time: float) -> bool:
+        """Wait (at most max_time) until module status fulfills condition.
+
+        Like wait() but for any condition and without exception on time-out,
+        e.g. to replace a fixed sleep by a status-confirmed completion with the
+        sleep as upper bound.
+
+        Args:
+            condition: Called with the status byte on each status update, e.g.
+                lambda status: not status & STATUS_ACTIVE.
+            max_time: Max. seconds to wait.
+
+        Returns:
+            fulfilled: False on time-out.
+        """
+        with self._rcv_condition:
+            return self._rcv_condition.wait_for(
+                lambda: condition(self.status), timeout=max_time)
+
+    def wait_for_port(self, port: int, predicate: Callable[[int], bool],
+                      max_time: float, signed: bool = False) -> bool:
+        """Wait (at most max_time) until port value fulfills predicate.
+
+        Like WaitScheduler.wait_until() (see mcs.scheduler) but without
+        exception on time-out.
+
+        Args:
+            port: Port id.
+            predicate: Called with the raw port value, e.g. lambda value:
+                value == 0. Must return quickly.
+            max_time: Max. seconds to wait.
+            signed: Port value is signed.
+
+        Returns:
+            fulfilled: False on time-out (or if the port cannot be read, then
+                max_time is waited).
+        """
+        end_time = time.monotonic() + max_time
+        try:
+            mcs.get_wait_scheduler().wait_until(
+                getattr(self, "_device", self), port, predicate,
+                timeout=max_time, signed=signed)
+        except McsTimeoutException:
+            return False
+        except McsHardwareException as exc:
+            log.warning(f"{self}: Reading port {port} failed, waiting "
+                        f"{max_time} s: {exc}")
+            time.sleep(max(0.0, end_time - time.monotonic()))
+            return False
+        return True
+
+    def wait_for_reappearance(self, max_time: float,
+                              period: float = REAPPEARANCE_POLL_PERIOD
+                              ) -> bool:
+        """Wait (at most max_time) until module stopped answering and answers
+        again, e.g. while it restarts after go_main().
+
+        Info requests are sent every period (holding the device lock like
+        send()). A status change telegram counts as answer, too.
+
+        Args:
+            max_time: Max. seconds to wait.
+            period: Seconds between info requests.
+
+        Returns:
+            reappeared: False if the module never stopped answering or did not
+                answer again in time (e.g. it answers with another CAN id).
+        """
+        end_time = time.monotonic() + max_time
+        missing = False
+        while True:
+            now = time.monotonic()
+            if now >= end_time:
+                return False
+            poll_end = min(now + period, end_time)
+            if not self._lock.acquire(timeout=poll_end - now):
+                continue  # Another command is in progress.
+            status_change = (self._status_change[0] if self._status_change
+                             else None)
+            data = [0x1b, 0x00]
+            request = self._start_request(data, self._lock)
+            try:
+                sent_msg = self.mcs.send(can_id=self.id, data=data,
+                                         priority=mcs.mcsbus.PRIORITY_POLL)
+            except Exception:
+                self.cancel_request(request)
+                raise
+            self._history.append(sent_msg)
+            with self._rcv_condition:
+                answered = self._rcv_condition.wait_for(
+                    lambda: (self._is_msg_available()
+                             or self._status_change
+                             and self._status_change[0] is not status_change),
+                    timeout=max(0.0, poll_end - time.monotonic()))
+            if not answered:
+                self.cancel_request(request)  # Discard late answer.
+                missing = True
+                continue
+            if request.response is None:
+                self.cancel_request(request)  # Status change only.
+            else:
+                self.get_msg()
+                self._finish_request(request)
+            if missing:
+                log.debug(f"{self}: Reappeared")
+                return True
+            time.sleep(max(0.0, poll_end - time.monotonic()))  # Pace polling.
+
+    # State bits:
+    def is_busy(self) -> bool:
+        return bool(self.status & STATUS_ACTIVE)
+
+    def has_error(self) -> bool:
+        return bool(self.status & STATUS_ERROR)
+
+    def has_warning(self) -> bool:
+        return bool(self.status & STATUS_WARNING)
+
+    def is_prepared(self) -> bool:
+        return bool(self.status & STATUS_PREPARED)
+
+    def is_not_initialized(self) -> bool:
+        return bool(self.status & STATUS_NOT_INIT)
+
+    def has_detected(self) -> bool:
+        return bool(self.status & STATUS_DETECTED)
+
+    def has_data(self) -> bool:
+        return bool(self.status & STATUS_DATA)
+
+    # MCS telegrams:
+    def info(self, info_id):
+        """Request an info with given info id.
+
+        There are more specific info_... methods available that also check the
+        dlc of the received info message.
+
+        Args:
+            info_id: Info id (0 .. 6)
+
+        Returns:
+            info_data: List of ints
+
+        """
+        rsp = self.send_and_check_rsp(
+            data=[0x1b, info_id], check=[info_id], check_dlc=False)
+        return rsp[1:]
+
+    def info_error(self) -> (int, int):
+        """Request and return error and warning code.
+
+        Returns:
+            error_code: Code of last error.
+            warning_code: Code of last warning.
+        """
+        rsp = self.send_and_check_rsp(
+            data=[0x1b, 0x01],
+            check=[0x01, None, None, None, None, None, None, None])
+        error_code = rsp.data[2] | (rsp.data[3] << 8)
+        warning_code = rsp.data[4] | (rsp.data[5] << 8)
+        print(error_code, warning_code, rsp)
+        # Update self.error and self.warning:
+        self.error = error_code
+        self.warning = warning_code
+        return error_code, warning_code
+
+    def info_firmware_version(self) -> List[int]:
+        """Send firmware version info command and return received data.
+
+        Returns:
+              firmware version data: Full data list. For research use firmware
+              the version is in elements [4:8].
+        """
+        rsp = self.send_and_check_rsp(
+            data=[0x1b, 0x03],
+            check=[0x03, None, None, None, None, None, None, None])
+        return rsp.data
+
+    def get_firmware_version_str(self, medical: bool = False) -> str:
+        """Request firmware version and return as string.
+
+        Args:
+            medical: If version code is of MCS medical type or not.
+
+        Returns:
+              firmware version str: E.g. '2.1.1.r' for non-medical."
+        """
+        rsp = self.info_firmware_version()
+        if medical:
+            shift = 0
+            result = 0
+            for i in range(4, len(rsp)):
+                result = result | (rsp[i] << shift)
+                shift = shift + 8
+            if result > 9999999:
+                result = result % 10000000
+                return "E_%6d_%d" % (result / 10, result % 10)
+            else:
+                return "I_%6d_%d" % (result / 10, result % 10)
+        else:
+            # rsp.data[4:8]
+            fw_str = f"{rsp[4]}.{rsp[5]}.{rsp[6]}.{chr(rsp[7])}"
+        return fw_str
+
+    def get_firmware_version_tuple(self) -> (int, int, int, int):
+        """Request firmware version and return as tuple (major, minor, ...).
+
+        Returns:
+              firmware version: [major, minor, patch, release identifier]
+                Example: [2, 1, 1, 72] where 72 (ASCII "r") = release version.
+        """
+        rsp = self.info_firmware_version()
+        return rsp[4:8]
+
+    def info_hardware_configuration(self) -> (int, int, int, int, int):
+        """Request and return hardware related device data.
+
+        Returns:
+            controller mode: 0: main program active, 1: boot loader running.
+            boot CAN id: Varies from main CAN id for some modules (e.g. PNM).
+            hardware version: Hardware configuration device is reporting.
+            boot block: Block data required for flashing.
+            main block: Block data required for flashing.
+        """
+        rsp = self.send_and_check_rsp(
+            data=[0x1b, 0x05],
+            check=[0x05, None, None, None, None, None, None, None])
+        mode = rsp.data[1]
+        boot_id = rsp.data[2]
+        hardware_version = rsp.data[3]
+        boot_block = rsp.data[4] | (rsp.data[5] << 8)
+        main_block = rsp.data[6] | (rsp.data[7] << 8)
+        return mode, boot_id, hardware_version, boot_block, main_block
+
+    def get_controller_mode(self) -> int:
+        c, i, h, b, m = self.info_hardware_configuration()
+        return c
+
+    def get_boot_id(self) -> int:
+        c, i, h, b, m = self.info_hardware_configuration()
+        return i
+
+    def get_hardware_version(self) -> int:
+        c, i, h, b, m = self.info_hardware_configuration()
+        return h
+
+    def get_boot_block(self) -> int:
+        c, i, h, b, m = self.info_hardware_configuration()
+        return b
+
+    def get_main_block(self) -> int:
+        c, i, h, b, m = self.info_hardware_configuration()
+        return m
+
+    def info_com_error(self) -> int:
+        """Request and return last communication error code."""
+        rsp = self.send_and_check_rsp(data=[0x1b, 0x06],
+                                      check=[0x06, None, None])
+        nack_error_code = rsp.data[1] | (rsp.data[2] << 8)
+        return nack_error_code
+
+    def reset(self, reset_mask: int = 0xff, timeout: int = 10) -> None:
+        """Reset device.
+
+        Args:
+            reset_mask: Reset actions are defined by the reset mask.
+                0x01: Reset warning bit and warning code
+                0x02: Reset error bit, error code, and communication error code.
+                0x04: Stop all activities
+                0x08: Set device into NOT-INIT state. If active: includes: stop
+                    all actions. The reset flag "stop all activities" may result
+                    into a situation, that the module looses information
+                    necessary to perform further activities. (e.g. actual step
+                    count, actual position). In such cases also the NOT-INIT
+                    flag is set.
+                0x10: Not used
+                0x20: Resets counters and other local data, which the module
+                    stores for external use. E.g.: actual step count of pump.
+                0x40: Resets port state: Reset all Port modes to "NORMAL" mode.
+                    Resets data bit in state byte. Resets port limit data (FRAM
+                    -> RAM). If active: includes: stop all actions. If no FRAM
+                    available: Reset to 0 or module specific defaults.
+                0x80: Free / module specific
+                0xff: A Reset(0xFF) puts the module in a state which is
+                    logically equivalent to the power on situation.
+                Note: If module is busy and reset mask does not stop activity:
+                    Completion of command cannot be detected by evaluating the
+                    active bit. Observe other bit influenced by reset mask
+                    instead. As active bit is normally used to detect timeout
+                    errors, command must be sent without timeout control.
+                    Completion must be polled.
+                Caution: Be careful: not all combinations of bits in the reset
+                    mask may make sense.
+            timeout: Seconds to wait until not busy anymore. 0: no wait.
+
+        Raises:
+            McsTimeoutException: On timeout while waiting.
+        """
+        self.send_and_check_rsp(data=[0x1c, reset_mask],
+                                check=TELEGRAMS[0x1c].ack)
+        if timeout:
+            self.wait(timeout)
+
+    def init(self, cmd_mode: int = 0, timeout: int = 10) -> None:
+        """Initialize device.
+
+        Does all activities to bring module in a defined, usable state.
+        NOT-INIT and DETECTED flag is erased. If NOT-INIT flag is already
+        erased (i.e. device is already initialised) flag is set with
+        acknowledge message. Module may go busy for a time.
+        On success: NOT-INIT and DETECTED bits are reset.
+
+        Args:
+            cmd_mode: May modify command behaviour (device specific).
+            timeout: Seconds to wait until not busy anymore. 0: no wait.
+
+        Raises:
+            McsTimeoutException: On timeout while waiting.
+        """
+        self.send_and_check_rsp(data=[0x22, cmd_mode],
+                                check=TELEGRAMS[0x22].ack)
+        if timeout:
+            self.wait(timeout)
+
+    def operate(self, cmd_mode: int = 0, timeout: int = 0) -> None:
+        """Send operate command to device.
+
+        Args:
+            cmd_mode: Device specific operate mode.
+            timeout: Seconds to wait until not busy anymore. 0: no wait.
+
+        Raises:
+            McsTimeoutException: On timeout while waiting.
+        """
+        self.send_and_check_rsp(data=[0xef, cmd_mode],
+                                check=TELEGRAMS[0xef].ack)
+        if timeout:
+            self.wait(timeout)
+
+    def stop(self, cmd_mode: int = 0, timeout: int = 0) -> None:
+        """Immediately stop device activity.
+
+        If already stopped, command succeeds immediately. Device may stay/go
+        busy for a while.
+
+        Args:
+            cmd_mode: Device specific operate mode.
+            timeout: Seconds to wait until not busy anymore. 0: no wait.
+        """
+        self.send_and_check_rsp(data=[0x2f, cmd_mode],
+                                check=TELEGRAMS[0x2f].ack)
+        if timeout:
+            self.wait(timeout)
+
+    def set_target_value(self, value: int) -> None:
+        """Set target value for operation.
+
+        Usually for closed loop control done by firmware. Often the operation
+        command has to be send afterwards to take effect if a control loop is
+        running. Operation may be required to be stopped to change the target
+        value (device specific).
+
+        Args:
+            value: Target value to be set.
+        """
+        self.send_and_check_rsp(data=TELEGRAMS[0xe2].encode(value),
+                                check=TELEGRAMS[0xe2].ack)
+
+    def set_target_value_deprecated(self, value: int) -> None:
+        """Set target value for operation - deprecated!
+
+        Args:
+            value: Target value to be set.
+
+        Deprecated: only used in Prodigy TEC Board Rev5 Firmware. New designs
+        shall use 0xE2 telegram: set_target_value().
+        """
+        warnings.warn("Deprecated. Use set_target_value instead!",
+                      PendingDeprecationWarning)
+        self.send_and_check_rsp(data=[0xe5,
+                                      value & 0xff,
+                                      (value >> 8) & 0xff],
+                                check=[0x00, None, 0xe5])
+
+    def set_port(self, port: int, value: int, length: int, pulse_time: int = 0,
+                 timeout: int = 0) -> None:
+        """Set a port to a specified value.
+
+        A port can be real or virtual. A port can be analogous or digital.
+        Often a port is a connected digital or analogue data source. There are
+        two kinds of ports. Output ports can be set to an arbitrary value of
+        their specified data range (e.g. digital on/off, or analogous for D/A
+        converters). Input ports (e.g. all sensors) can be queried. As an input
+        a port can be configured to provide feedback or interrupt signals for
+        other functions on the same module.
+
+        Args:
+            length: Number of bytes of port value (port specific: 1, 2, or 4).
+            port: Port id.
+            value: Value to be set to port.
+            pulse_time: Device specific to modify command behaviour.
+            timeout: Seconds to wait until not busy anymore. 0: no wait.
+                Usually setting a port does not change the modules busy status.
+                Some special devices activate (and are then busy) if a port is
+                set to a non-zero value for the duration of the pulse time
+                (e.g. buffer supply station pump).
+
+        Raises:
+            McsTimeoutException: On timeout while waiting.
+        """
+        data = TELEGRAMS[0x40].encode(0x00, port, pulse_time, value,
+                                      length=length)
+        self.send_and_check_rsp(data=data, check=TELEGRAMS[0x40].ack)
+        if timeout:
+            self.wait(timeout)
+
+    def get_port(self, port: int, signed: bool = False) -> int:
+        """Read the current port value.
+
+        Args:
+            port: Port id.
+            signed: If port value is signed.
+
+        Returns:
+            value: Value read from given port.
+        """
+        rsp = self.send_and_check_rsp(
+            data=[0x41, port], check=[0x42, None, port, None, None, None, None],
+            check_dlc=False)  # We do not know how many bytes the port holds.
+        return get_value_from_rsp(rsp, offset=4, signed=signed)
+
+    def set_port_mode(self, port: int, mode: int, data_valid_time: int = 0,
+                      port_idle_time: int = 0) -> None:
+        """Set port mode.
+
+        Ports may operate in different modes (normal, stop, and auto). A port
+        must not operate in several modes at the same time.
+
+        Reset of respective status bits:
+            Stop mode: Detected bit is erased with init() and any command
+                switching module into busy state (e.g. rotate, move).
+            Auto mode: Reset Data bit, when all triggered AUTO ports were
+                queried by getPortData(). Send new INFO 0 if data bit was reset.
+
+        Args:
+            port: Port id.
+            mode: Mode the port will be set to:
+                0x00: Normal mode.
+                0x02: Stop mode: Stops device when condition becomes true.
+                0x20: Auto mode: Sets DATA status bit, when condition becomes
+                    true.
+            data_valid_time:
+            port_idle_time:
+        """
+        self.send_and_check_rsp(
+            data=TELEGRAMS[0x43].encode(port, mode, data_valid_time,
+                                        port_idle_time),
+            check=TELEGRAMS[0x43].ack)
+
+    def get_port_mode(self, port: int) -> int:
+        """Read the port mode currently set.
+
+        Args:
+            port: Port id.
+
+        Returns:
+            value: Mode read from given port:
+                0x00: Normal mode.
+                0x02: Stop mode: Stops device when condition becomes true.
+                0x20: Auto mode: Sets DATA status bit, when condition becomes
+                    true.
+        """
+        rsp = self.send_and_check_rsp(
+            data=[0x44, port],
+            check=[0x45, port, None, None, None, None, None, None],
+            check_dlc=False)  # Not exactly specified how many bytes rsp. holds.
+        mode = rsp.data[2]
+        return mode
+
+    def set_port_parameter(self, port: int, parameter: int, value: int,
+                           length: int = 4) -> None:
+        """Set value of a port parameter.
+
+        Port parameter are used for conversion between port values and user
+        units. Usually this conversion calculation is done:
+
+        User units = ((internal port units * multiplier) / divisor) – offset
+
+        Where:
+            internal port units: E. g. Digits representing a pressure value
+            offset: value must be given in user units.
+
+        Args:
+            length: Number of bytes of port parameter (e.g.: 1, 2, or 4).
+            port: Port id.
+            parameter: Port parameter id:
+                0: Offset.
+                1: Divisor.
+                2: Multiplier.
+                3: Delta.
+                4: Lower limit.
+                5: Upper limit.
+                6: Target value.
+            value: Value to be set to port parameter.
+        """
+        data = TELEGRAMS[0x49].encode(0x00, port, parameter, value,
+                                      length=length)
+        self.send_and_check_rsp(data=data, check=TELEGRAMS[0x49].ack)
+
+    def get_port_parameter(self, port: int, parameter: int,
+                           signed: bool = False) -> int:
+        """Read value of a port parameter.
+
+        Args:
+            port: Port id.
+            parameter: Port parameter id: 0 .. 6 (see set_port_parameter).
+            signed: If port value is signed.
+
+        Returns:
+            value: Read result.
+        """
+        rsp = self.send_and_check_rsp(
+            data=[0x4a, 0, port, parameter],
+            check=[0x4b, None, port, parameter, None, None, None, None],
+            check_dlc=False)  # Not known how many bytes the port param. holds.
+        return TELEGRAMS[0x4b].decode_value(rsp.data, signed=signed)
+
+    def set_port_zero(self, port: int, timeout: int = 5) -> None:
+        """Set current port value as new zero value.
+
+        Some ports can be zero-ed for calibration purposes to remove an offset.
+
+        Args:
+            port: Port to be zero-ed.
+            timeout: Seconds to wait until not busy anymore. 0: no wait.
+        """
+        self.send_and_check_rsp(data=[0x4c, 0, port],
+                                check=TELEGRAMS[0x4c].ack)
+        if timeout:
+            self.wait(timeout)
+
+    def set_parameter(self, parameter: int, value: int, length: int = 4
+                      ) -> None:
+        """Set a parameter value.
+
+        A device maintains a table of parameters. The number, meaning, and size
+        of parameters is module specific. Parameter values are used to store
+        calibration values, hardware specific properties, persistent counters,
+        etc. If available parameters might be stored persistent in non-volatile
+        RAM (FRAM). In many cases parameters from 0 to 127 are FRAM-parameters
+        and parameters from 128 on are volatile.
+
+        Args:
+            length: Number of bytes of port parameter (e.g.: 1, 2, or 4). More
+                recent firmware uses 4 bytes for all parameters.
+            parameter: Parameter id.
+            value: Value to be set to parameter.
+        """
+        data = TELEGRAMS[0xde].encode(parameter, value, length=length)
+        self.send_and_check_rsp(data=data, check=TELEGRAMS[0xde].ack)
+
+    def get_parameter(self, parameter: int, signed: bool = False) -> int:
+        """Read the current parameter value.
+
+        Args:
+            parameter: Parameter id.
+            signed: If parameter value is signed.
+
+        Returns:
+            value: Value read from given parameter.
+        """
+        rsp = self.send_and_check_rsp(
+            data=[0xdb, parameter],
+            check=[0xdc, parameter, None, None, None, None],
+            check_dlc=False)  # We do not know how many bytes the param. holds.
+        return get_value_from_rsp(rsp, offset=2, signed=signed)
+
+    def rotate(self, cmd_mode: int, direction: int, speed: int,
+               timeout: int = 0) -> None:
+        """Do rotate action.
+
+        Not all devices have a rotation actor. Usually rotation is done until
+        stopped, so a time_out does not make sense. Some special command modes
+        might set a duration time though.
+
+        Args:
+            cmd_mode: Device specific operate mode.
+            direction: 0: CW (clock-wise), 1: CCW (counter-clock-wise).
+            speed: Rotation velocity. Usually unsigned (direction is a separate
+                argument). Device specific units.
+            timeout: Seconds to wait until not busy anymore. 0: no wait.
+
+        Raises:
+            McsTimeoutException: On timeout while waiting.
+        """
+        self.send_and_check_rsp(
+            data=TELEGRAMS[0x25].encode(cmd_mode, direction, speed),
+            check=TELEGRAMS[0x25].ack)
+        if timeout:
+            self.wait(timeout)
+
+    def move(self, position: int, speed: int, timeout: int = 0,
+             cmd_mode: int = 0) -> None:
+        """Do an absolute or relative move.
+
+        Not all devices have a moving actor.
+
+        Args:
+            cmd_mode: Device specific move mode. Usually: 0: absolute move,
+                                                          1: relative move.
+                For Diluter: 0: absolute move, 1: relative move,
+                             2: automatic stop on bubble detection.
+            position: Target position to move to (absolute move mode) or to 
+                move by (relative move mode).
+            speed: Velocity (device specific units).
+            timeout: Seconds to wait until not busy anymore. 0: no wait.
+
+        Raises:
+            McsTimeoutException: On timeout while waiting.
+        """
+        self.send_and_check_rsp(
+            data=TELEGRAMS[0x23].encode(cmd_mode, position, speed),
+            check=TELEGRAMS[0x23].ack)
+        if timeout:
+            self.wait(timeout)
+
+    def move_abs(self, position: int, speed: int, timeout: int = 0) -> None:
+        self.move(position=position, speed=speed, timeout=timeout, cmd_mode=0)
+
+    def move_rel(self, position: int, speed: int, timeout: int = 0) -> None:
+        self.move(position=position, speed=speed, timeout=timeout, cmd_mode=1)
+
+    def move_discrete(self, cmd_mode: int, position_id: int,
+                      direction: Union[int, str] = 'CCW',
+                      timeout: int = 10) -> None:
+        """Move to a predefined position.
+
+        Not all devices have a moving actor.
+
+        Args:
+            cmd_mode: Device specific move mode.
+            direction: Direction of move/rotation:
+                0x00 or "CCW": Counter-clock-wise.
+                0x80 or "CW": Clock-wise.
+                0x40 or "SHORTEST": Shortest way.
+            position_id: Predefined position to move to.
+            timeout: Seconds to wait until not busy anymore. 0: no wait.
+        """
+
+        if isinstance(direction, str):
+            direction = direction.upper()
+            if direction == 'CCW':
+                position_id = position_id | 0x00
+            elif direction == "CW":
+                position_id = position_id | 0x80
+            elif direction == "SHORTEST":
+                position_id = position_id | 0x40
+        self.send_and_check_rsp(data=[0x24, cmd_mode, position_id & 0xff],
+                                check=[0x00, None, 0x24])
+        if timeout:
+            self.wait(timeout)
+
+    def get_move(self) -> (int, int):
+        """Read and return current position and speed.
+
+        Not available for all devices.
+        """
+        rsp = self.send_and_check_rsp(
+            data=[0x26, 0x00],
+            check=[0x27, None, None, None, None, None, None, None])
+        shift = 0
+        position = 0
+        for i in range(2, 6):
+            position = position | (rsp.data[i] << shift)
+            shift = shift + 8
+        position = unsigned_to_signed(position, 4)
+        shift = 0
+        speed = 0
+        for i in range(6, 8):
+            speed = speed | (rsp.data[i] << shift)
+            shift = shift + 8
+        speed = unsigned_to_signed(speed, 2)
+        return position, speed
+
+    def get_pos(self) -> int:
+        p, s = self.get_move()
+        return p
+
+    def get_speed(self) -> int:
+        p, s = self.get_move()
+        return s
+
+    def set_ramping(self, acceleration: int, deceleration: int) -> None:
+        """Set acceleration and deceleration data."""
+        data = [0x28, acceleration & 0xff, (acceleration >> 8) & 0xff,
+                deceleration & 0xff, (deceleration >> 8) & 0xff]
+        self.send_and_check_rsp(data=data, check=[0x00, None, 0x28])
+
+    def get_ramping(self) -> (int, int):
+        """Read acceleration and deceleration data.
+
+        Returns:
+            acceleration:
+            deceleration:
+        """
+        rsp = self.send_and_check_rsp([0x29, ], check=[0x2a, ])
+        shift = 0
+        acceleration = 0
+        for i in range(1, 3):
+            acceleration = acceleration | (rsp.data[i] << shift)
+            shift = shift + 8
+        shift = 0
+        deceleration = 0
+        for i in range(3, 5):
+            deceleration = deceleration | (rsp.data[i] << shift)
+            shift = shift + 8
+        return acceleration, deceleration
+
+    def set_discrete_position(self, position_id: int, position: int) -> None:
+        data = [0x2b, position_id & 0xff, position & 0xff,
+                (position >> 8) & 0xff]
+        self.send_and_check_rsp(data=data, check=[0x00, None, 0x2b])
+
+    def get_discrete_position(self, position_id: int) -> int:
+        rsp = self.send_and_check_rsp(data=[0x2c, ], check=[0x2d, position_id],
+                                      check_dlc=False)
+        shift = 0
+        position = 0
+        for i in range(2, 6):
+            position = position | (rsp.data[i] << shift)
+            shift = shift + 8
+        return position
+
+    def erase_mem(self, address: int, timeout: int = 15) -> None:
+        data = [0xfd, address & 0xff, (address >> 8) & 0xff,
+                (address >> 16) & 0xff]
+        self.send_and_check_rsp(data=data, check=[0x00, None, 0xfd])
+        if timeout:
+            self.wait(timeout)
+
+    def set_mem_list(self, address: int, data: List[int]) -> None:
+        d = TELEGRAMS[0xfe].encode(address) + bytes(data)
+        self.send_and_check_rsp(data=d, check=TELEGRAMS[0xfe].ack)
+
+    def set_mem_int(self, address: int, data: Union[int, List[int]],
+                    length: Optional[int] = None) -> None:
+        d = [data & 0xff, (data >> 8) & 0xff, (data >> 16) & 0xff,
+             (data >> 24) & 0xff]
+        self.set_mem_list(address=address, data=d[:4+length])
+
+    def set_mem_array(self, address: int, data: str) -> None:
+        d = []
+        for b in data:
+            d.append(ord(b))
+
+        self.set_mem_list(address=address, data=d)
+
+    def get_mem_list(self, address: int, length: int) -> List[int]:
+        d = TELEGRAMS[0xfb].encode(address, length)
+        rsp = self.send_and_check_rsp(data=d, check=[0xfc, ], check_dlc=False)
+        log.debug(f"rsp: {rsp.data[1:]} ")
+        return rsp.data[1:]
+
+    def get_mem_int(self, address: int, length: int, signed: bool = False
+                    ) -> int:
+        rsp = self.get_mem_list(address=address, length=length)
+        result = int.from_bytes(rsp, "little")
+        if signed:
+            result = unsigned_to_signed(result, number_of_bytes=len(rsp)-1)
+        return result
+
+    def get_mem_array(self, address: int, length: int) -> List[str]:
+        rsp = self.get_mem_list(address=address, length=length)
+        data = []
+        for i in rsp:
+            data.append(chr(i))  # TODO(MME): Check if this is what we want.
+        return data
+
+    def get_mem_str(self, address: int, length: int) -> str:
+        rsp = self.get_mem_list(address=address, length=length)
+        data = ""
+        for i in rsp:
+            data += chr(i)
+        return data
+
+    def set_aux_data(self, data: List[int]) -> None:
+        d = [0x55, ] + data
+        self.send_and_check_rsp(data=d, check=[0x00, None, 0x55])
+
+    def get_aux_data(self) -> List[int]:
+        rsp = self.send_and_check_rsp(data=[0x53, ], check=[0x54, ],
+                                      check_dlc=False)
+        return rsp.data[1:]
+
+    def set_boot_mode(self, mode: int, crc: int, timeout: int = 15) -> None:
+        self.send_and_check_rsp(
+            data=[0xfa, mode, crc & 0xff, (crc >> 8) & 0xff],
+            check=[0x0, None, 0xfa])
+        if timeout:
+            self.wait(timeout)
+
+    def go_main(self, timeout: int = 2) -> None:
+        self.send_and_check_rsp([0xf9, ], check=[0x00, None, 0xf9])
+        # Wait till the module answers again after the restart. Device might
+        # have a different CAN id in main mode now (waits timeout seconds
+        # then).
+        self.wait_for_reappearance(timeout)
+
+    def go_boot(self, timeout=2) -> None:
+        self.send_and_check_rsp(data=[0xf8, ], check=[0x00, None, 0xf8])
+        # Wait till the module answers again after the restart. Device might
+        # have a different CAN id in boot mode now (waits timeout seconds
+        # then).
+        self.wait_for_reappearance(timeout)
+
+    def init_boot(self, cmd_mode: int = 0, timeout: int = 10) -> None:
+        self.send_and_check_rsp(data=[0x1d, cmd_mode], check=[0x00, None, 0x1d])
+        if timeout:
+            self.wait(timeout)
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""Performance counters of the MCS stack.
+
+Each McsBus holds an McsMetrics instance (McsBus.metrics) which is updated by
+the bus, its devices and the reading thread of Mcs:
+
+    counter              label   incremented on
+    tx_frames            device  frame written to the communicator
+    tx_retries           device  retry while TX buffer is full
+    rx_frames            device  frame put into device (see count_rx())
+    timeouts             device  McsTimeoutException in rcv()
+    wait_timeouts        device  McsTimeoutException in wait()
+    nacks                device  NACK received
+    buffer_overflows     device  acknowledge or response discarded
+    unsolicited_overflows device unsolicited message discarded
+    lock_failures        device  lock not acquired in send()
+    late_responses       device  response to cancelled request discarded
+    error_frames         bus     error frame read
+    invalid_frames       bus     non MCS conform frame read
+
+Frames with extended ids (TML devices) are counted bus wide.
+
+Round trip times (request sent to response put into the device buffer) are
+collected in histograms per device and command byte (see RTT_BUCKETS).
+
+Metrics are read with snapshot() or exported in Prometheus text format
+(to_prometheus(), e.g. for the textfile collector of node_exporter) or as
+JSON (to_json()). start_export() periodically writes them to a file.
+"""
+import bisect
+import collections
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+# Upper bounds of round trip time histogram buckets in seconds:
+RTT_BUCKETS = (0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.3, 1.0)
+EXPORT_INTERVAL = 10.0  # Default seconds between writes of start_export().
+PROMETHEUS_PREFIX = "mcs"
+
+
+def _device_label(can_id: Optional[int]) -> str:
+    return "bus" if can_id is None else f"0x{can_id:03x}"
+
+
+class McsMetrics(object):
+    """Thread-safe counters and round trip time histograms.
+
+    Counters are kept per device (response CAN id, or None for bus wide
+    counters). Updates take a lock and a dictionary lookup only, so metrics
+    can stay enabled in production.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, Optional[int]], int] = (
+            collections.defaultdict(int))
+        # Written by the reading thread only (see count_rx()), index 256 is
+        # for extended frames:
+        self._rx_frames = [0] * 257
+        # Per (device, command byte): [bucket counts..., +Inf count, sum]:
+        self._rtt: Dict[Tuple[int, int], list] = {}
+        self._export_thread = None
+        self._export_stop = threading.Event()
+
+    def inc(self, name: str, can_id: Optional[int] = None, n: int = 1
+            ) -> None:
+        """Increment counter.
+
+        Args:
+            name: Counter name, e.g. "timeouts".
+            can_id: Response CAN id of device (0x00 to 0xff) or None for bus
+                wide counters.
+            n: Increment.
+        """
+        with self._lock:
+            self._counters[(name, can_id)] += n
+
+    def count_rx(self, can_id: Optional[int] = None) -> None:
+        """Increment rx_frames counter (from the reading thread only).
+
+        Does not take the lock (single writer) as it is called for each frame
+        received.
+        """
+        self._rx_frames[256 if can_id is None else can_id] += 1
+
+    def observe_rtt(self, can_id: int, cmd: int, seconds: float) -> None:
+        """Add round trip time of a request to histogram.
+
+        Args:
+            can_id: Response CAN id of device.
+            cmd: Command byte of request (data[0]).
+            seconds: Time from sending the request to receiving the response.
+        """
+        i = bisect.bisect_left(RTT_BUCKETS, seconds)
+        with self._lock:
+            histogram = self._rtt.get((can_id, cmd))
+            if histogram is None:
+                histogram = self._rtt[(can_id, cmd)] = (
+                    [0] * (len(RTT_BUCKETS) + 1) + [0.0])
+            histogram[i] += 1
+            histogram[-1] += seconds
+
+    def get(self, name: str, can_id: Optional[int] = None) -> int:
+        """Return counter value (see inc())."""
+        if name == "rx_frames":
+            return self._rx_frames[256 if can_id is None else can_id]
+        with self._lock:
+            return self._counters.get((name, can_id), 0)
+
+    def reset(self) -> None:
+        """Reset all counters and histograms."""
+        with self._lock:
+            self._counters.clear()
+            self._rtt.clear()
+            self._rx_frames[:] = [0] * 257
+
+    def snapshot(self) -> dict:
+        """Return copy of all metrics (JSON serializable).
+
+        Returns:
+            snapshot: {"time": ..., "counters": {name: {"total": n, "devices":
+                {"0x021": n, ...}}}, "rtt": {"0x021": {"0x41": {"count": n,
+                "sum": seconds, "buckets": [cumulative counts per
+                "rtt_buckets"]}}}, "rtt_buckets": [...]}
+        """
+        with self._lock:
+            counters = list(self._counters.items())
+            rtt = [(key, list(h)) for key, h in self._rtt.items()]
+        counters += [(("rx_frames", None if i == 256 else i), value)
+                     for i, value in enumerate(self._rx_frames) if value]
+        snapshot = {"time": time.time(), "counters": {}, "rtt": {},
+                    "rtt_buckets": list(RTT_BUCKETS)}
+        for (name, can_id), value in sorted(counters, key=_counter_sort_key):
+            counter = snapshot["counters"].setdefault(
+                name, {"total": 0, "devices": {}})
+            counter["total"] += value
+            if can_id is not None:
+                counter["devices"][_device_label(can_id)] = value
+        for (can_id, cmd), histogram in sorted(rtt):
+            cumulative = []
+            count = 0
+            for bucket_count in histogram[:-1]:
+                count += bucket_count
+                cumulative.append(count)
+            snapshot["rtt"].setdefault(_device_label(can_id), {})[
+                f"0x{cmd:02x}"] = {"count": count, "sum": histogram[-1],
+                                   "buckets": cumulative[:-1]}
+        return snapshot
+
+    def to_json(self) -> str:
+        """Return snapshot() as JSON text."""
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self, labels: Optional[Dict[str, str]] = None) -> str:
+        """Return metrics in Prometheus text exposition format.
+
+        Args:
+            labels: Additional labels for all samples, e.g. {"bus": "can0"}.
+        """
+        extra = "".join(f'{k}="{v}",' for k, v in (labels or {}).items())
+        snapshot = self.snapshot()
+        lines = []
+        for name, counter in snapshot["counters"].items():
+            metric = f"{PROMETHEUS_PREFIX}_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            samples = counter["devices"] or {}
+            bus_value = counter["total"] - sum(samples.values())
+            if bus_value or not samples:
+                samples = dict(samples, bus=bus_value)
+            for device, value in samples.items():
+                lines.append(f'{metric}{{{extra}device="{device}"}} {value}')
+        metric = f"{PROMETHEUS_PREFIX}_rtt_seconds"
+        if snapshot["rtt"]:
+            lines.append(f"# TYPE {metric} histogram")
+        for device, commands in snapshot["rtt"].items():
+            for cmd, h in commands.items():
+                label = f'{extra}device="{device}",cmd="{cmd}"'
+                for le, value in zip(RTT_BUCKETS, h["buckets"]):
+                    lines.append(f'{metric}_bucket{{{label},le="{le}"}} '
+                                 f'{value}')
+                lines.append(f'{metric}_bucket{{{label},le="+Inf"}} '
+                             f'{h["count"]}')
+                lines.append(f'{metric}_sum{{{label}}} {h["sum"]}')
+                lines.append(f'{metric}_count{{{label}}} {h["count"]}')
+        return "\n".join(lines) + "\n"
+
+    def write_to_file(self, path: str, fmt: str = "prometheus",
+                      labels: Optional[Dict[str, str]] = None) -> None:
+        """Write metrics to file (replaced atomically).
+
+        Args:
+            path: File path, e.g. "/var/lib/node_exporter/mcs.prom".
+            fmt: "prometheus" or "json".
+            labels: Additional labels (Prometheus format only).
+        """
+        if fmt == "prometheus":
+            text = self.to_prometheus(labels)
+        elif fmt == "json":
+            text = self.to_json()
+        else:
+            raise ValueError(f"Unknown metrics format '{fmt}'")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    def start_export(self, path: str, interval: float = EXPORT_INTERVAL,
+                     fmt: str = "prometheus",
+                     labels: Optional[Dict[str, str]] = None) -> None:
+        """Write metrics to file periodically in a background thread.
+
+        See write_to_file(). Stopped by stop_export().
+        """
+        self.stop_export()
+        self._export_stop.clear()
+
+        def export():
+            while True:
+                try:
+                    self.write_to_file(path, fmt, labels)
+                except (OSError, ValueError) as exc:
+                    log.error(f"Writing metrics to {path} failed: {exc}")
+                if self._export_stop.wait(interval):
+                    return
+
+        self._export_thread = threading.Thread(
+            name=f"{__name__} export", target=export, daemon=True)
+        self._export_thread.start()
+        log.info(f"Exporting metrics to {path} every {interval} s")
+
+    def stop_export(self) -> None:
+        """Stop writing metrics to file (see start_export())."""
+        thread, self._export_thread = self._export_thread, None
+        if thread:
+            self._export_stop.set()
+            thread.join(timeout=5)
+
+
+def _counter_sort_key(item):
+    (name, can_id), _ = item
+    return name, -1 if can_id is None else can_id
@@ -1,121 +1,121 @@
-# -*- coding: utf-8 -*-
-
-
-DEVICE_NAME = {
-    0x401: "stepper valve 0",
-    0x402: "stepper valve 1",
-    0x403: "stepper valve 2",
-    0x404: "stepper valve 3",
-    0x405: "stepper valve 4",
-    0x406: "fld stepper pump",
-    0x407: "stepper pump",  # MQ: "magnet"
-    0x408: "magnet 0",
-    0x409: "magnet 1",
-    0x40a: "xyz code reader",
-    0x40b: "solenoid strobe",
-    0x40c: "<unknown>",  # reserved
-    0x40d: "xyz camera",
-    0x40e: "xyz lock 0",
-    0x40f: "xyz lock 1",
-    0x411: "xyz piezo drive",
-    0x412: "needle arm y",
-    0x413: "needle arm z",
-    0x414: "servo pump 0",
-    0x415: "servo pump 1",
-    0x417: "needle-mixer",
-    0x418: "waste pump. dual servo 0",
-    0x419: "waste pump. dual servo 1",
-    0x41a: "waste-dc-pump",
-    0x41b: "rack detection",
-    0x420: "laser boot",
-    0x421: "laser 0",
-    0x422: "laser 1",
-    0x423: "laser 2",
-    0x424: "fld fan",
-    0x425: "laser base board",
-    0x427: "fld liquid detection",
-    0x431: "syringe pump 0",
-    0x432: "syringe pump 1",
-    0x433: "pressure sensor",
-    0x436: "fld-dc-pump",
-    0x437: "fld-pinch-valves",
-    0x438: "led door",
-    0x439: "led bottles",
-    0x43a: "bottle detect",
-    0x43b: "fld pressure-sensor",
-    0x43c: "power led",
-    0x441: "bss",
-    0x442: "standby control",
-    0x443: "buffer supply lhs boot",
-    0x444: "buffer supply lhs 0",
-    0x445: "buffer supply lhs 1",
-    0x448: "led door temperature",
-    0x449: "led bottles temperature",
-    0x451: "remote port. valve",
-    0x452: "remote port pump",
-    0x453: "hts stepper pump",
-    0x454: "ves",
-    0x455: "stepper boot",
-    0x456: "stepper magnet 0",
-    0x457: "stepper magnet 1",
-    0x458: "stepper pump",
-    0x460: "pnm boot",
-    0x461: "pnm 0",
-    0x462: "pnm 1",
-    0x463: "pnm 2",
-    0x464: "pnm 3",
-    0x465: "pnm 4",
-    0x466: "pnm 5",
-    0x467: "pnm 6",
-    0x468: "pnm 7",
-    0x470: "cpc sample drive",
-    0x471: "cpc vacuum",
-    0x472: "cpc compressor",
-    0x473: "cpc waste line",
-    0x474: "fan-cio fan 0",
-    0x475: "fan-cio fan 1",
-    0x476: "fan-cio fan 2",
-    0x477: "fan-cio fan 3",
-    0x478: "fan-cio power monitor",
-    0x481: "pressure generation unit",
-    0x482: "pressure control unit 0",
-    0x483: "pressure control unit 1",
-    0x484: "pressure control unit 2",
-    0x485: "pressure control unit 3",
-    0x486: "pressure control unit 4",
-    0x487: "pressure control unit 5",
-    0x488: "pressure control unit 6",
-    0x491: "mini sampler",  # ICP/Prodigy: "camera focus"
-    0x492: "bio shake",  # RS232 tunneling
-    0x494: "dual servo 625 0",
-    0x495: "dual servo 625 1",
-    0x496: "dual servo 625 2",
-    0x497: "dual servo 625 3",
-    0x498: "dual servo 625 4",
-    0x499: "dual servo 625 5",
-    0x49f: "sampler carriage",
-    0x4a1: "sampler carriage shaker axis",
-    0x4a2: "sampler carriage shaker",
-    0x4a3: "sampler carriage shaker sledge",
-    0x4b1: "tec",
-    0x4b2: "gas mix",
-    0x4b3: "icp peristaltic pump",
-    0x4b4: "icp solenoid valves",
-    0x4b5: "icp servo",
-    0x4b6: "icp slider",
-    0x4b7: "icp magnet",
-    0x4b8: "icp cover lock",
-    0x4b9: "icp backplane connector",
-    0x4ba: "icp camera",
-    0x4bb: "icp devices",
-    0x4bc: "flash light boot",
-    0x4bd: "flash light module",
-    0x4be: "flash light heater",
-    0x4bf: "interlayer camera",
-    0x4c0: "microscope camera",
-    0x4c1: "electroporator",
-    0x4c2: "electroporator magnetic valve",
-    0x4c3: "electroporator <unknown>",  # reserved
-    0x4cf: "external temperature sensor board",
-    0x4f1: "foot switch",
-}
+# -*- coding: utf-8 -*-
+
+
+DEVICE_NAME = {
+    0x401: "stepper valve 0",
+    0x402: "stepper valve 1",
+    0x403: "stepper valve 2",
+    0x404: "stepper valve 3",
+    0x405: "stepper valve 4",
+    0x406: "fld stepper pump",
+    0x407: "stepper pump",  # MQ: "magnet"
+    0x408: "magnet 0",
+    0x409: "magnet 1",
+    0x40a: "xyz code reader",
+    0x40b: "solenoid strobe",
+    0x40c: "<unknown>",  # reserved
+    0x40d: "xyz camera",
+    0x40e: "xyz lock 0",
+    0x40f: "xyz lock 1",
+    0x411: "xyz piezo drive",
+    0x412: "needle arm y",
+    0x413: "needle arm z",
+    0x414: "servo pump 0",
+    0x415: "servo pump 1",
+    0x417: "needle-mixer",
+    0x418: "waste pump. dual servo 0",
+    0x419: "waste pump. dual servo 1",
+    0x41a: "waste-dc-pump",
+    0x41b: "rack detection",
+    0x420: "laser boot",
+    0x421: "laser 0",
+    0x422: "laser 1",
+    0x423: "laser 2",
+    0x424: "fld fan",
+    0x425: "laser base board",
+    0x427: "fld liquid detection",
+    0x431: "syringe pump 0",
+    0x432: "syringe pump 1",
+    0x433: "pressure sensor",
+    0x436: "fld-dc-pump",
+    0x437: "fld-pinch-valves",
+    0x438: "led door",
+    0x439: "led bottles",
+    0x43a: "bottle detect",
+    0x43b: "fld pressure-sensor",
+    0x43c: "power led",
+    0x441: "bss",
+    0x442: "standby control",
+    0x443: "buffer supply lhs boot",
+    0x444: "buffer supply lhs 0",
+    0x445: "buffer supply lhs 1",
+    0x448: "led door temperature",
+    0x449: "led bottles temperature",
+    0x451: "remote port. valve",
+    0x452: "remote port pump",
+    0x453: "hts stepper pump",
+    0x454: "ves",
+    0x455: "stepper boot",
+    0x456: "stepper magnet 0",
+    0x457: "stepper magnet 1",
+    0x458: "stepper pump",
+    0x460: "pnm boot",
+    0x461: "pnm 0",
+    0x462: "pnm 1",
+    0x463: "pnm 2",
+    0x464: "pnm 3",
+    0x465: "pnm 4",
+    0x466: "pnm 5",
+    0x467: "pnm 6",
+    0x468: "pnm 7",
+    0x470: "cpc sample drive",
+    0x471: "cpc vacuum",
+    0x472: "cpc compressor",
+    0x473: "cpc waste line",
+    0x474: "fan-cio fan 0",
+    0x475: "fan-cio fan 1",
+    0x476: "fan-cio fan 2",
+    0x477: "fan-cio fan 3",
+    0x478: "fan-cio power monitor",
+    0x481: "pressure generation unit",
+    0x482: "pressure control unit 0",
+    0x483: "pressure control unit 1",
+    0x484: "pressure control unit 2",
+    0x485: "pressure control unit 3",
+    0x486: "pressure control unit 4",
+    0x487: "pressure control unit 5",
+    0x488: "pressure control unit 6",
+    0x491: "mini sampler",  # ICP/Prodigy: "camera focus"
+    0x492: "bio shake",  # RS232 tunneling
+    0x494: "dual servo 625 0",
+    0x495: "dual servo 625 1",
+    0x496: "dual servo 625 2",
+    0x497: "dual servo 625 3",
+    0x498: "dual servo 625 4",
+    0x499: "dual servo 625 5",
+    0x49f: "sampler carriage",
+    0x4a1: "sampler carriage shaker axis",
+    0x4a2: "sampler carriage shaker",
+    0x4a3: "sampler carriage shaker sledge",
+    0x4b1: "tec",
+    0x4b2: "gas mix",
+    0x4b3: "icp peristaltic pump",
+    0x4b4: "icp solenoid valves",
+    0x4b5: "icp servo",
+    0x4b6: "icp slider",
+    0x4b7: "icp magnet",
+    0x4b8: "icp cover lock",
+    0x4b9: "icp backplane connector",
+    0x4ba: "icp camera",
+    0x4bb: "icp devices",
+    0x4bc: "flash light boot",
+    0x4bd: "flash light module",
+    0x4be: "flash light heater",
+    0x4bf: "interlayer camera",
+    0x4c0: "microscope camera",
+    0x4c1: "electroporator",
+    0x4c2: "electroporator magnetic valve",
+    0x4c3: "electroporator <unknown>",  # reserved
+    0x4cf: "external temperature sensor board",
+    0x4f1: "foot switch",
+}
@@ -1,100 +1,100 @@
-# -*- coding: utf-8 -*-
-
-OPCODE_NAME = {
-    # write 16-bit value
-    0x206b: "write sats",
-    0x20c6: "write t err max",
-    0x21b0: "set home flag",
-
-    # write 32-bit value
-    0x24a2: "write c acc",
-    0x2658: "write c dec",
-    0x24a0: "write c spd",
-    0x249e: "write c pos",
-    0x2794: "write home spd",
-    0x2792: "write home pos",
-
-    # read 16-bit value
-    0xb204: "read 16-bit",
-    # 0xb204: "read mer",
-    # 0xb204: "read sats",
-    # 0xb204: "read t err max",
-    # 0xb204: "read iq",
-    # 0xb204: "read home flag",
-    # 0xb204: "read sats default",
-    # 0xb204: "read err max default",
-    # 0xb204: "read t err max default",
-    # 0xb204: "read pos err",
-    # 0xb204: "read err max",
-
-    # read 32-bit value
-    0xb205: "read 32-bit",
-    # 0xb205: "read sr32",
-    # 0xb205: "read actual pos",
-    # 0xb205: "read target pos",
-
-    # homing
-    0xEA00: "homing mode 0",
-    0xEA01: "homing mode 1",
-    0xEA02: "homing mode 2",
-    0xEA03: "homing mode 3",
-    0xEA04: "homing mode 4",
-    0xEA05: "homing mode 5",
-    0xEA06: "homing mode 6",
-    0xEA07: "homing mode 7",
-    0xEA08: "homing mode 8",
-    0xEA09: "homing mode 9",
-    0xEA0A: "homing mode 10",
-    0xEA0B: "homing mode 11",
-    0xEA0C: "homing mode 12",
-    0xEA0D: "homing mode 13",
-    0xEA0E: "homing mode 14",
-    0xEA0F: "homing mode 15",
-    0xEA10: "homing mode 16",
-    0xEA11: "homing mode 17",
-    0xEA12: "homing mode 18",
-    0xEA13: "homing mode 19",
-    0xEA14: "homing mode 20",
-    0xEA15: "homing mode 21",
-    0xEA16: "homing mode 22",
-    0xEA17: "homing mode 23",
-    0xEA18: "homing mode 24",
-    0xEA19: "homing mode 25",
-    0xEA1A: "homing mode 26",
-    0xEA1B: "homing mode 27",
-    0xEA1C: "homing mode 28",
-    0xEA1D: "homing mode 29",
-    0xEA1E: "homing mode 30",
-    0xEA1F: "homing mode 31",
-
-    # other
-    0x022A: "read pos err",
-    0x0002: "axis off",
-    0x0102: "axis on",
-    0x0104: "stop 0",
-    0x0144: "stop 1",
-    0x0184: "stop 2",
-    0x01C4: "stop 3",
-    0x0108: "upd",
-    0x5909: "cpa/cpr/mode pp/tum 0/tum 1",
-    0x0402: "reset",
-    0x1C02: "abort",
-    0x22AC: "home crt 0",
-    0x0681: "dis lsn",
-    0x2CB2: "sta",
-}
-
-OPERATION_CATEGORY = {  # TODO(MME): The wording needs to be checked here:
-    0x00: "Motor command",
-    0x02: "execute immediate",
-    0x04: "read/write",
-    0x05: "read sr32",
-    0x06: "write t err max",
-    0x08: "start motion",
-    0x09: "set cpa, mode pp, sats or tum1",
-    0x1E: "write c pos",
-    0x20: "set c spd",
-    0x32: "set sta",
-    0x59: "GiveMeData2",
-    0x6a: "TakeData2",
-}
+# -*- coding: utf-8 -*-
+
+OPCODE_NAME = {
+    # write 16-bit value
+    0x206b: "write sats",
+    0x20c6: "write t err max",
+    0x21b0: "set home flag",
+
+    # write 32-bit value
+    0x24a2: "write c acc",
+    0x2658: "write c dec",
+    0x24a0: "write c spd",
+    0x249e: "write c pos",
+    0x2794: "write home spd",
+    0x2792: "write home pos",
+
+    # read 16-bit value
+    0xb204: "read 16-bit",
+    # 0xb204: "read mer",
+    # 0xb204: "read sats",
+    # 0xb204: "read t err max",
+    # 0xb204: "read iq",
+    # 0xb204: "read home flag",
+    # 0xb204: "read sats default",
+    # 0xb204: "read err max default",
+    # 0xb204: "read t err max default",
+    # 0xb204: "read pos err",
+    # 0xb204: "read err max",
+
+    # read 32-bit value
+    0xb205: "read 32-bit",
+    # 0xb205: "read sr32",
+    # 0xb205: "read actual pos",
+    # 0xb205: "read target pos",
+
+    # homing
+    0xEA00: "homing mode 0",
+    0xEA01: "homing mode 1",
+    0xEA02: "homing mode 2",
+    0xEA03: "homing mode 3",
+    0xEA04: "homing mode 4",
+    0xEA05: "homing mode 5",
+    0xEA06: "homing mode 6",
+    0xEA07: "homing mode 7",
+    0xEA08: "homing mode 8",
+    0xEA09: "homing mode 9",
+    0xEA0A: "homing mode 10",
+    0xEA0B: "homing mode 11",
+    0xEA0C: "homing mode 12",
+    0xEA0D: "homing mode 13",
+    0xEA0E: "homing mode 14",
+    0xEA0F: "homing mode 15",
+    0xEA10: "homing mode 16",
+    0xEA11: "homing mode 17",
+    0xEA12: "homing mode 18",
+    0xEA13: "homing mode 19",
+    0xEA14: "homing mode 20",
+    0xEA15: "homing mode 21",
+    0xEA16: "homing mode 22",
+    0xEA17: "homing mode 23",
+    0xEA18: "homing mode 24",
+    0xEA19: "homing mode 25",
+    0xEA1A: "homing mode 26",
+    0xEA1B: "homing mode 27",
+    0xEA1C: "homing mode 28",
+    0xEA1D: "homing mode 29",
+    0xEA1E: "homing mode 30",
+    0xEA1F: "homing mode 31",
+
+    # other
+    0x022A: "read pos err",
+    0x0002: "axis off",
+    0x0102: "axis on",
+    0x0104: "stop 0",
+    0x0144: "stop 1",
+    0x0184: "stop 2",
+    0x01C4: "stop 3",
+    0x0108: "upd",
+    0x5909: "cpa/cpr/mode pp/tum 0/tum 1",
+    0x0402: "reset",
+    0x1C02: "abort",
+    0x22AC: "home crt 0",
+    0x0681: "dis lsn",
+    0x2CB2: "sta",
+}
+
+OPERATION_CATEGORY = {  # TODO(MME): The wording needs to be checked here:
+    0x00: "Motor command",
+    0x02: "execute immediate",
+    0x04: "read/write",
+    0x05: "read sr32",
+    0x06: "write t err max",
+    0x08: "start motion",
+    0x09: "set cpa, mode pp, sats or tum1",
+    0x1E: "write c pos",
+    0x20: "set c spd",
+    0x32: "set sta",
+    0x59: "GiveMeData2",
+    0x6a: "TakeData2",
+}
@@ -0,0 +1,479 @@
+# -*- coding: utf-8 -*-
+"""Waiting for port values to fulfill a condition and periodic polling.
+
+Instead of looping on reads with sleeps, e.g.:
+
+    while device.get_port(30) < 2000:
+        time.sleep(0.1)
+
+wait for the condition (see also HardwareDevice.wait_until()):
+
+    value = mcs.get_wait_scheduler().wait_until(device, 30,
+                                                lambda v: v >= 2000)
+
+All waits are multiplexed onto a single scheduler thread. Each port data
+telegram received for the port (pushed by a subscription, see
+mcs.subscription, or read by anyone else) is checked at once. Ports without
+subscription are polled with an adaptive interval: it starts with min_period
+and grows while the value does not change (up to MAX_POLL_PERIOD). Pushed
+ports are polled with MAX_POLL_PERIOD only (in case a push is missed).
+
+Ports and parameters read periodically (e.g. by HardwareModel for display)
+are registered at the PollScheduler (see get_poll_scheduler()). Each reader
+has its own period. Reads are done in earliest deadline first order within a
+bus wide budget (reads per second), requests to different devices are sent
+back-to-back before the responses are collected. Readers without consumer
+(see PollReader.touch()) are paused.
+"""
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Callable, List, Optional
+
+import can
+
+import mcs
+from mcs.codec import TELEGRAMS
+from mcs.mcsdevice import get_value_from_rsp
+
+log = logging.getLogger(__name__)
+
+MIN_POLL_PERIOD = 0.01  # Default seconds between first reads of a port.
+MAX_POLL_PERIOD = 0.5  # Max. seconds between reads of a port.
+POLL_PERIOD_GROWTH = 2  # Factor the poll period grows while value is const.
+POLL_BUDGET = 200  # Default max. reads per second of the PollScheduler.
+POLL_BATCH_SIZE = 16  # Max. requests sent back-to-back (one per device).
+POLL_IDLE_TIMEOUT = 5.0  # Default seconds a reader without consumer is read.
+
+
+class PortWait(object):
+    """Condition on a port value waited for (see WaitScheduler.wait_until()).
+
+    Attributes:
+        device: McsDevice.
+        port: Port id.
+        value: Raw port value fulfilling the condition (None if not yet).
+        reads: No. of reads (requests) sent for this wait.
+    """
+
+    def __init__(self, device: mcs.McsDevice, port: int,
+                 predicate: Callable[[int], bool], deadline: float,
+                 min_period: float, signed: bool = False) -> None:
+        self.device = device
+        self.port = port
+        self.predicate = predicate
+        self.deadline = deadline
+        self.signed = signed
+        self.period = min_period
+        self.min_period = min_period
+        self.value: Optional[int] = None
+        self.reads = 0
+        self.error: Optional[Exception] = None
+        self.done = threading.Event()
+        self._lock = threading.Lock()
+        self._last_value: Optional[int] = None
+
+    def __repr__(self) -> str:
+        return f"wait for {self.device} port {self.port}"
+
+    def check(self, value: int) -> bool:
+        """Check value (from any thread), return if wait is done."""
+        with self._lock:
+            if self.done.is_set():
+                return True
+            try:
+                fulfilled = self.predicate(value)
+            except Exception as exc:
+                self.error = exc
+                fulfilled = True
+            if fulfilled:
+                self.value = value
+                self.done.set()
+            return fulfilled
+
+    def on_msg(self, msg: can.Message) -> None:
+        """Check port data telegrams of the port (called by reader thread)."""
+        if msg.data[0] == 0x42 and msg.data[2] == self.port:
+            self.check(TELEGRAMS[0x42].decode_value(msg.data, self.signed))
+
+    def adapt_period(self, value: int) -> None:
+        """Adapt seconds till next read to changes of value."""
+        if self.port in self.device.pushed_ports:
+            self.period = MAX_POLL_PERIOD
+        elif value == self._last_value:
+            self.period = min(self.period * POLL_PERIOD_GROWTH,
+                              MAX_POLL_PERIOD)
+        else:
+            self.period = self.min_period
+        self._last_value = value
+
+
+class WaitScheduler(object):
+    """Single thread polling the ports of all waits (see wait_until())."""
+
+    def __init__(self) -> None:
+        self._queue = []  # Heap of (due time, sequence no., wait).
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def wait_until(self, device: mcs.McsDevice, port: int,
+                   predicate: Callable[[int], bool], timeout: float = 10.0,
+                   min_period: float = MIN_POLL_PERIOD, signed: bool = False
+                   ) -> int:
+        """Block until port value fulfills condition.
+
+        Args:
+            device: McsDevice (the registered instance, not a HardwareDevice).
+            port: Port id.
+            predicate: Condition, called with the raw port value (from the
+                scheduler or reader thread, must return quickly).
+            timeout: Max. seconds to wait.
+            min_period: Min. seconds between reads of the port.
+            signed: Port value is signed.
+
+        Returns:
+            value: Raw port value fulfilling the condition.
+
+        Raises:
+            McsTimeoutException: If condition is not fulfilled in time.
+            McsHardwareException: If reading the port fails.
+        """
+        now = time.monotonic()
+        wait = PortWait(device, port, predicate, now + timeout, min_period,
+                        signed)
+        device.add_listener(wait.on_msg)
+        try:
+            self._schedule(wait, now)
+            wait.done.wait(timeout)
+        finally:
+            wait.done.set()  # Stops polling.
+            device.remove_listener(wait.on_msg)
+        if wait.error is not None:
+            raise wait.error
+        if wait.value is None:
+            device.mcs.metrics.inc("wait_timeouts", device.rsp_id)
+            raise mcs.McsTimeoutException(
+                f"{device}: Time-out waiting for condition of port {port} "
+                f"({wait.reads} reads)")
+        return wait.value
+
+    def _schedule(self, wait: PortWait, due: float) -> None:
+        with self._condition:
+            heapq.heappush(self._queue, (due, next(self._sequence), wait))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    name=__name__, target=self._run, daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self) -> None:
+        """Read ports of due waits (scheduler thread)."""
+        while True:
+            with self._condition:
+                while not self._queue or self._queue[0][0] > time.monotonic():
+                    timeout = (self._queue[0][0] - time.monotonic()
+                               if self._queue else None)
+                    self._condition.wait(timeout)
+                _, _, wait = heapq.heappop(self._queue)
+            if wait.done.is_set():
+                continue
+            self._read(wait)
+            if not wait.done.is_set():
+                self._schedule(wait, min(time.monotonic() + wait.period,
+                                         wait.deadline))
+
+    def _read(self, wait: PortWait) -> None:
+        try:
+            wait.reads += 1
+            value = wait.device.get_port(wait.port, wait.signed)
+        except mcs.McsTimeoutException as exc:
+            log.debug(f"{wait}: Reading port failed: {exc}")
+            return
+        except Exception as exc:
+            with wait._lock:
+                wait.error = exc
+                wait.done.set()
+            return
+        if not wait.check(value):
+            wait.adapt_period(value)
+
+
+PORT = "port"
+PARAMETER = "parameter"
+
+
+class PollReader(object):
+    """Periodic read of a port or parameter (see PollScheduler.register()).
+
+    Attributes:
+        device: HardwareDevice.
+        kind: PORT or PARAMETER.
+        name: Port or parameter name.
+        period: Seconds between reads.
+        value: Last value read (user units, None if not read yet).
+        timestamp: Time (time.time()) of last read.
+        reads: No. of reads (requests sent).
+        errors: No. of failed reads.
+    """
+
+    def __init__(self, device: "mcs.HardwareDevice", kind: str, name: str,
+                 period: float,
+                 callback: Optional[Callable[["PollReader"], None]] = None,
+                 idle_timeout: Optional[float] = POLL_IDLE_TIMEOUT,
+                 paused: Optional[Callable[[], bool]] = None) -> None:
+        self.device = device
+        self.kind = kind
+        self.name = name
+        if kind == PORT:
+            self.data_port = device.ports[name]
+            self.request = [0x41, self.data_port.id]
+            self.check = [0x42, None, self.data_port.id]
+            self.value_offset = 4
+        else:
+            self.data_port = device.parameters[name]
+            self.request = [0xdb, self.data_port.id]
+            self.check = [0xdc, self.data_port.id]
+            self.value_offset = 2
+        self.period = period
+        self.callback = callback
+        self.idle_timeout = idle_timeout
+        self.paused = paused
+        self.value: Optional[float] = None
+        self.timestamp: Optional[float] = None
+        self.reads = 0
+        self.errors = 0
+        self.due = 0.0
+        self.cancelled = False
+        self.last_access = time.monotonic()
+
+    def __repr__(self) -> str:
+        return f"reader of {self.device} {self.kind} '{self.name}'"
+
+    def touch(self) -> bool:
+        """Mark value as used (readers without consumer are paused).
+
+        Returns:
+            idle: Reader has been paused for idle timeout (value is outdated,
+                see PollScheduler.wake()).
+        """
+        now = time.monotonic()
+        idle = (self.idle_timeout is not None
+                and now - self.last_access > self.idle_timeout)
+        self.last_access = now
+        return idle
+
+    def is_active(self, now: float) -> bool:
+        """Return if value has to be read (has a consumer, not paused)."""
+        if (self.idle_timeout is not None
+                and now - self.last_access > self.idle_timeout):
+            return False
+        return not (self.paused and self.paused())
+
+    def _update(self, raw_value: int) -> None:
+        self.value = self.data_port.convert_from_raw(raw_value)
+        self.timestamp = time.time()
+        if self.callback is not None:
+            try:
+                self.callback(self)
+            except Exception as exc:
+                log.exception(f"{self}: Callback failed: {exc}")
+
+
+class PollScheduler(object):
+    """Single thread reading ports and parameters periodically within a bus
+    wide budget (see register())."""
+
+    def __init__(self, budget: float = POLL_BUDGET,
+                 batch_size: int = POLL_BATCH_SIZE) -> None:
+        """Instantiate scheduler (see get_poll_scheduler() for the shared
+        instance).
+
+        Args:
+            budget: Max. reads (request and response) per second.
+            batch_size: Max. requests sent back-to-back.
+        """
+        self.budget = budget
+        self.batch_size = batch_size
+        self._queue = []  # Heap of (deadline, sequence no., reader).
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._tokens = float(batch_size)
+        self._refill_time = time.monotonic()
+
+    def register(self, device: "mcs.HardwareDevice", kind: str, name: str,
+                 period: float,
+                 callback: Optional[Callable[[PollReader], None]] = None,
+                 idle_timeout: Optional[float] = POLL_IDLE_TIMEOUT,
+                 paused: Optional[Callable[[], bool]] = None) -> PollReader:
+        """Read port or parameter periodically.
+
+        Args:
+            device: HardwareDevice.
+            kind: PORT or PARAMETER.
+            name: Port or parameter name (of device.ports or
+                device.parameters).
+            period: Seconds between reads (if budget allows).
+            callback: Called with the reader after each read (from the
+                scheduler thread).
+            idle_timeout: Reading is paused if the reader has not been
+                touched (see PollReader.touch()) for this time. None: Never
+                paused.
+            paused: Reading is paused while this returns True (e.g. while the
+                device reports an error).
+
+        Returns:
+            reader: Use for unregister().
+        """
+        reader = PollReader(device, kind, name, period, callback, idle_timeout,
+                            paused)
+        self._schedule(reader, time.monotonic())
+        return reader
+
+    def unregister(self, reader: PollReader) -> None:
+        """Stop reading (see register())."""
+        reader.cancelled = True
+
+    def wake(self, reader: PollReader) -> None:
+        """Read at once (e.g. a reader touched after being idle)."""
+        if not reader.cancelled:
+            self._schedule(reader, time.monotonic())
+
+    def _schedule(self, reader: PollReader, due: float) -> None:
+        reader.due = due
+        with self._condition:
+            heapq.heappush(self._queue, (due, next(self._sequence), reader))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    name=f"{__name__} poll", target=self._run, daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _next_batch(self) -> List[PollReader]:
+        """Wait for due readers and return those to be read now (one per
+        device, within budget)."""
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                if not self._queue or self._queue[0][0] > now:
+                    self._condition.wait(self._queue[0][0] - now
+                                         if self._queue else None)
+                    continue
+                self._tokens = min(
+                    self._tokens + (now - self._refill_time) * self.budget,
+                    float(self.batch_size))
+                self._refill_time = now
+                if self._tokens < 1:
+                    self._condition.wait((1 - self._tokens) / self.budget)
+                    continue
+                batch = []
+                devices = set()
+                deferred = []
+                while (self._queue and self._queue[0][0] <= now
+                       and len(batch) < int(self._tokens)):
+                    due, _, reader = heapq.heappop(self._queue)
+                    if reader.cancelled or due != reader.due:
+                        continue  # Unregistered or rescheduled by wake().
+                    device_id = reader.device.rsp_id
+                    if not reader.is_active(now):
+                        self._reschedule(reader, now)
+                    elif device_id in devices:
+                        deferred.append(reader)  # Next batch.
+                    elif self._read_from_cache(reader):
+                        self._reschedule(reader, now)
+                    else:
+                        batch.append(reader)
+                        devices.add(device_id)
+                for reader in deferred:
+                    heapq.heappush(self._queue, (reader.due,
+                                                 next(self._sequence), reader))
+                if batch:
+                    self._tokens -= len(batch)
+                    return batch
+
+    def _reschedule(self, reader: PollReader, now: float) -> None:
+        """Schedule next read (missed reads are skipped, not caught up)."""
+        reader.due += reader.period
+        if reader.due < now:
+            reader.due = now + reader.period
+        heapq.heappush(self._queue, (reader.due, next(self._sequence),
+                                     reader))
+
+    @staticmethod
+    def _read_from_cache(reader: PollReader) -> bool:
+        cache = reader.device.cache
+        if cache is None:
+            return False
+        raw_value = cache.get(reader.device, reader.kind, reader.data_port)
+        if raw_value is None:
+            return False
+        reader._update(raw_value)
+        return True
+
+    def _run(self) -> None:
+        """Read due ports and parameters (scheduler thread)."""
+        while True:
+            batch = self._next_batch()
+            self._read(batch)
+            now = time.monotonic()
+            with self._condition:
+                for reader in batch:
+                    if not reader.cancelled:
+                        self._reschedule(reader, now)
+
+    def _read(self, batch: List[PollReader]) -> None:
+        """Send requests of batch back-to-back, then collect responses."""
+        sent = []
+        for reader in batch:
+            try:
+                reader.reads += 1
+                reader.device._device.send(
+                    reader.request, priority=mcs.mcsbus.PRIORITY_POLL)
+            except Exception as exc:
+                reader.errors += 1
+                log.debug(f"{reader}: Reading failed: {exc}")
+            else:
+                sent.append(reader)
+        end_time = time.monotonic() + mcs.mcsbus.CAN_TIMEOUT
+        for reader in sent:
+            device = reader.device._device
+            try:
+                rsp = device.rcv(max(0.0, end_time - time.monotonic()))
+                device.check_rsp(rsp, reader.request, reader.check,
+                                 check_dlc=False)
+            except Exception as exc:
+                reader.errors += 1
+                log.debug(f"{reader}: Reading failed: {exc}")
+                continue
+            raw_value = get_value_from_rsp(rsp, reader.value_offset,
+                                           reader.data_port.signed)
+            if reader.device.cache is not None:
+                reader.device.cache.put(device, reader.kind, reader.data_port,
+                                        raw_value)
+            reader._update(raw_value)
+
+
+_scheduler: Optional[WaitScheduler] = None
+_poll_scheduler: Optional[PollScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_wait_scheduler() -> WaitScheduler:
+    """Return the shared wait scheduler (created on first call)."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = WaitScheduler()
+        return _scheduler
+
+
+def get_poll_scheduler() -> PollScheduler:
+    """Return the shared poll scheduler (created on first call)."""
+    global _poll_scheduler
+    with _scheduler_lock:
+        if _poll_scheduler is None:
+            _poll_scheduler = PollScheduler()
+        return _poll_scheduler
@@ -0,0 +1,484 @@
+# -*- coding: utf-8 -*-
+"""Simulated CAN communicator emulating MCS firmware modules.
+
+ComSimulated can be used instead of ComPythonCan or ComPeakCan to run the
+whole stack (Mcs, McsDevice, HardwareDevice, ...) without CAN hardware, e.g.
+for tests and benchmarks:
+
+    com = mcs.ComSimulated([mcs.SimulatedLaserBoard(0x423)], latency=0.0005)
+    can_mcs = mcs.Mcs(mcs.McsBus(com))
+    can_mcs.open()
+    laser = mcs.LaserBoard(can_mcs.get_device(0x423))
+
+Each SimulatedModule answers MCS telegrams sent to its master CAN id like the
+firmware does (info 0 ACK/NACK status, info 1/3/5/6, get/set port, port mode,
+port parameter and parameter, ...) and reports busy to idle transitions and
+new data of ports in auto mode with (unsolicited) info 0 telegrams.
+Behaviour of specific modules is added in child classes (see
+SimulatedLaserBoard).
+"""
+import heapq
+import itertools
+import math
+import random
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+import can
+
+import mcs
+from mcs.mcsdevice import (STATUS_ACTIVE, STATUS_DATA, STATUS_DETECTED,
+                           STATUS_ERROR, STATUS_NOT_INIT, STATUS_WARNING)
+
+NACK = 0xff
+PORT_MODE_AUTO = 0x20
+
+# Communication error codes reported by info 6 (see MCS_ErrorCodes.csv):
+COM_ERROR_INVALID_CMD = 0x0004
+
+
+def _to_bytes(value: int, length: int) -> List[int]:
+    return list((value & ((1 << (8 * length)) - 1)).to_bytes(length, "little"))
+
+
+def _from_bytes(data: Iterable[int]) -> int:
+    return int.from_bytes(bytes(data), "little")
+
+
+class SimulatedModule(object):
+    """Emulation of the generic MCS firmware of a hardware module.
+
+    Holds status, error codes, ports, port modes, port parameters and
+    parameters. Override handle_...() methods or update() in child classes
+    to emulate module specific behaviour.
+    """
+    firmware_version = (2, 1, 1, ord("r"))
+    hardware_version = 1
+    reset_time = 0.01  # Seconds module is busy after reset.
+    init_time = 0.01  # Seconds module is busy after init.
+    restart_time = 0.2  # Seconds module is silent after go main/boot.
+    port_len = 2  # Default no. of port data bytes.
+
+    def __init__(self, can_id: int, ports: Optional[Dict[int, int]] = None,
+                 parameters: Optional[Dict[int, int]] = None,
+                 port_lengths: Optional[Dict[int, int]] = None) -> None:
+        """Instantiate simulated module.
+
+        Args:
+            can_id: Master or slave CAN id, e.g. 0x423 or 0x023.
+            ports: Initial port values (raw) by port id.
+            parameters: Initial parameter values (raw) by parameter id.
+            port_lengths: No. of data bytes by port id (default: port_len).
+        """
+        self.rsp_id = can_id & 0xff
+        self.id = self.rsp_id + 0x400
+        self.status = STATUS_NOT_INIT
+        self.error = 0
+        self.warning = 0
+        self.com_error = 0
+        self.ports = dict(ports or {})
+        self.port_lengths = dict(port_lengths or {})
+        self.port_modes = {}
+        self.triggered_ports = set()  # Auto mode ports with new data.
+        self._port_triggers = {}  # Current trigger (object) by port.
+        self.port_parameters = {}
+        self.parameters = dict(parameters or {})
+        self.operate_mode = 0
+        self.target_value = 0
+        self.com = None  # Set by ComSimulated.add_module().
+        self._last_update = time.time()
+        self._silent_until = 0.0  # Time (time.time()) restart is done.
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__} {hex(self.id)}"
+
+    def handle(self, data: List[int]) -> List[List[int]]:
+        """Return response telegram(s) for given received telegram.
+
+        Args:
+            data: Data of telegram received from master.
+
+        Returns:
+            responses: List of response data (usually a single one).
+        """
+        now = time.time()
+        if now < self._silent_until:  # Restarting.
+            return []
+        self.update(now - self._last_update)
+        self._last_update = now
+        handler = getattr(self, f"handle_{data[0]:02x}", None)
+        if handler is None:
+            self.com_error = COM_ERROR_INVALID_CMD
+            return [self.nack()]
+        try:
+            return handler(data)
+        except IndexError:  # Telegram too short.
+            self.com_error = COM_ERROR_INVALID_CMD
+            return [self.nack()]
+
+    def update(self, dt: float) -> None:
+        """Update simulated physics (called before handling each telegram).
+
+        Args:
+            dt: Seconds since last update.
+        """
+        pass
+
+    def ack(self, cmd: int) -> List[int]:
+        return [0x00, self.status, cmd]
+
+    def nack(self) -> List[int]:
+        return [0x00, self.status, NACK]
+
+    def set_error(self, error: int) -> None:
+        """Set error code and error status bit (and report status)."""
+        self.error = error
+        self.set_status(self.status | STATUS_ERROR)
+
+    def set_warning(self, warning: int) -> None:
+        """Set warning code and warning status bit (and report status)."""
+        self.warning = warning
+        self.set_status(self.status | STATUS_WARNING)
+
+    def set_status(self, status: int) -> None:
+        """Set status and send a status change info 0 telegram."""
+        self.status = status
+        if self.com:
+            self.com.push(self, [0x00, self.status, 0x00])
+
+    def go_busy(self, duration: float, idle_status: Optional[int] = None
+                ) -> None:
+        """Set busy status bit and report idle after given duration.
+
+        Args:
+            duration: Seconds module stays busy.
+            idle_status: Status after busy phase. Defaults to current status
+                without busy bit.
+        """
+        if idle_status is None:
+            idle_status = self.status & ~STATUS_ACTIVE
+        self.status |= STATUS_ACTIVE
+        if self.com:
+            self.com.push(self, [0x00, idle_status, 0x00], delay=duration,
+                          callback=lambda: setattr(self, "status",
+                                                   idle_status))
+        else:
+            self.status = idle_status
+
+    # Info request:
+    def handle_1b(self, data: List[int]) -> List[List[int]]:
+        info_id = data[1]
+        if info_id == 0:
+            return [[0x00, self.status, 0x1b]]
+        if info_id == 1:
+            return [[0x01, self.status] + _to_bytes(self.error, 2)
+                    + _to_bytes(self.warning, 2) + [0, 0]]
+        if info_id == 3:
+            return [[0x03, self.status, 0, 0] + list(self.firmware_version)]
+        if info_id == 5:
+            return [[0x05, 0, self.rsp_id, self.hardware_version, 0, 0, 0, 0]]
+        if info_id == 6:
+            return [[0x06] + _to_bytes(self.com_error, 2)]
+        return [self.nack()]
+
+    # Reset:
+    def handle_1c(self, data: List[int]) -> List[List[int]]:
+        mask = data[1]
+        if mask & 0x01:
+            self.warning = 0
+            self.status &= ~STATUS_WARNING
+        if mask & 0x02:
+            self.error = 0
+            self.com_error = 0
+            self.status &= ~STATUS_ERROR
+        if mask & 0x04:
+            self.operate_mode = 0
+        if mask & 0x08:
+            self.status |= STATUS_NOT_INIT
+        if mask & 0x40:
+            self.port_modes = {}
+            self._port_triggers = {}
+        self.go_busy(self.reset_time)
+        return [self.ack(0x1c)]
+
+    # Init:
+    def handle_22(self, data: List[int]) -> List[List[int]]:
+        if self.status & STATUS_ERROR:
+            return [self.nack()]
+        self.go_busy(self.init_time, self.status
+                     & ~(STATUS_NOT_INIT | STATUS_DETECTED | STATUS_ACTIVE))
+        return [self.ack(0x22)]
+
+    # Stop:
+    def handle_2f(self, data: List[int]) -> List[List[int]]:
+        self.operate_mode = 0
+        return [self.ack(0x2f)]
+
+    # Operate:
+    def handle_ef(self, data: List[int]) -> List[List[int]]:
+        if self.status & (STATUS_NOT_INIT | STATUS_ERROR):
+            return [self.nack()]
+        self.operate_mode = data[1]
+        return [self.ack(0xef)]
+
+    # Set target value:
+    def handle_e2(self, data: List[int]) -> List[List[int]]:
+        self.target_value = _from_bytes(data[1:3])
+        return [self.ack(0xe2)]
+
+    # Set port:
+    def handle_40(self, data: List[int]) -> List[List[int]]:
+        port = data[2]
+        self.ports[port] = _from_bytes(data[4:])
+        return [self.ack(0x40)]
+
+    # Get port:
+    def handle_41(self, data: List[int]) -> List[List[int]]:
+        port = data[1]
+        length = self.port_lengths.get(port, self.port_len)
+        value = self.get_port_value(port)
+        if port in self.triggered_ports:
+            self.triggered_ports.discard(port)
+            if not self.triggered_ports:
+                self.set_status(self.status & ~STATUS_DATA)
+        return [[0x42, self.status, port, 0] + _to_bytes(value, length)]
+
+    def get_port_value(self, port: int) -> int:
+        """Return raw port value (override for simulated sensors)."""
+        return self.ports.get(port, 0)
+
+    # Set port mode:
+    def handle_43(self, data: List[int]) -> List[List[int]]:
+        port, mode = data[1], data[2]
+        self.port_modes[port] = mode
+        idle_time = _from_bytes(data[5:7]) / 1000
+        self._port_triggers[port] = object()
+        if mode & PORT_MODE_AUTO and idle_time:
+            self._trigger_port(port, idle_time, self._port_triggers[port])
+        return [self.ack(0x43)]
+
+    def _trigger_port(self, port: int, idle_time: float, token: object
+                      ) -> None:
+        """Report new data of auto mode port every idle_time seconds (until
+        the port mode is set again)."""
+        if not self.com:
+            return
+
+        def trigger():
+            if self._port_triggers.get(port) is token:
+                self.triggered_ports.add(port)
+                self.status |= STATUS_DATA
+                self._trigger_port(port, idle_time, token)
+
+        self.com.push(self, [0x00, self.status | STATUS_DATA, 0x00],
+                      delay=idle_time, callback=trigger)
+
+    # Get port mode:
+    def handle_44(self, data: List[int]) -> List[List[int]]:
+        port = data[1]
+        return [[0x45, port, self.port_modes.get(port, 0)]]
+
+    # Set port parameter:
+    def handle_49(self, data: List[int]) -> List[List[int]]:
+        self.port_parameters[(data[2], data[3])] = _from_bytes(data[4:])
+        return [self.ack(0x49)]
+
+    # Get port parameter:
+    def handle_4a(self, data: List[int]) -> List[List[int]]:
+        port, parameter = data[2], data[3]
+        value = self.port_parameters.get((port, parameter), 0)
+        return [[0x4b, self.status, port, parameter] + _to_bytes(value, 4)]
+
+    # Set port zero:
+    def handle_4c(self, data: List[int]) -> List[List[int]]:
+        return [self.ack(0x4c)]
+
+    # Set parameter:
+    def handle_de(self, data: List[int]) -> List[List[int]]:
+        self.parameters[data[1]] = _from_bytes(data[2:])
+        return [self.ack(0xde)]
+
+    # Get parameter:
+    def handle_db(self, data: List[int]) -> List[List[int]]:
+        parameter = data[1]
+        value = self.parameters.get(parameter, 0)
+        return [[0xdc, parameter] + _to_bytes(value, 4)]
+
+    # Go boot, go main:
+    def handle_f8(self, data: List[int]) -> List[List[int]]:
+        self.restart()
+        return [self.ack(data[0])]
+
+    handle_f9 = handle_f8
+
+    def restart(self) -> None:
+        """Go silent for restart_time and come up again not initialized (the
+        same CAN id in boot and main mode), reported by a status change."""
+        self._silent_until = time.time() + self.restart_time
+        self.status = STATUS_NOT_INIT
+        if self.com:
+            self.com.push(self, [0x00, self.status, 0x00],
+                          delay=self.restart_time)
+        self.operate_mode = 0
+        self.port_modes = {}
+        self._port_triggers = {}
+
+
+class SimulatedLaserBoard(SimulatedModule):
+    """Simulated MQ laser board (see LaserBoard) with temperature dynamics.
+
+    While operating (operate(1)) the laser temperature (port 3 and 4) follows
+    the target temperature (parameter 0) with a first order lag, otherwise it
+    follows the ambient temperature. Temperatures are in 0.01 °C.
+    """
+    time_constant = 5.0  # Seconds.
+    ambient = 2500  # 25.00 °C
+
+    def __init__(self, can_id: int, temperature: Optional[float] = None,
+                 **kwargs) -> None:
+        super().__init__(can_id, **kwargs)
+        self.temperature = float(self.ambient if temperature is None
+                                 else temperature)
+        self.parameters.setdefault(0, 2200)  # Target temperature (FRAM).
+
+    def update(self, dt: float) -> None:
+        target = self.parameters[0] if self.operate_mode else self.ambient
+        self.temperature = target + ((self.temperature - target)
+                                     * math.exp(-dt / self.time_constant))
+
+    def get_port_value(self, port: int) -> int:
+        if port in (3, 4):
+            return round(self.temperature)
+        if port in (7, 8):
+            return int(bool(self.operate_mode))
+        return super().get_port_value(port)
+
+
+class ComSimulated(mcs.mcsbus.ComInterface):
+    """CAN communicator connected to simulated MCS modules (no hardware).
+
+    Responses are delivered after a configurable latency with random jitter.
+    Telegrams to CAN ids without simulated module are not answered (like on a
+    real bus). Extended (TML) frames are ignored.
+    """
+
+    def __init__(self, modules: Iterable[SimulatedModule] = (),
+                 latency: float = 0.0005, jitter: float = 0.0,
+                 seed: Optional[int] = None) -> None:
+        """Instantiate simulated communicator.
+
+        Args:
+            modules: Simulated modules on the bus.
+            latency: Mean seconds from sending a telegram till the response
+                is received.
+            jitter: Max. seconds added to or subtracted from latency
+                (uniformly distributed).
+            seed: Seed for jitter random generator (for reproducibility).
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.modules: Dict[int, SimulatedModule] = {}
+        self._random = random.Random(seed)
+        self._queue = []  # Heap of (delivery time, sequence no., msg, cb).
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._is_open = False
+        self._woken_up = False
+        for module in modules:
+            self.add_module(module)
+
+    def add_module(self, module: SimulatedModule) -> None:
+        """Add (or replace) simulated module on the bus."""
+        module.com = self
+        self.modules[module.rsp_id] = module
+
+    def remove_module(self, can_id: int) -> None:
+        """Remove simulated module (it will not respond anymore)."""
+        module = self.modules.pop(can_id & 0xff, None)
+        if module:
+            module.com = None
+
+    def open(self) -> None:
+        self._is_open = True
+
+    def close(self) -> None:
+        with self._condition:
+            self._is_open = False
+            self._queue = []
+            self._condition.notify_all()
+
+    def send(self, msg: can.Message) -> None:
+        if msg.is_extended_id or msg.arbitration_id & 0x700 != 0x400:
+            return
+        module = self.modules.get(msg.arbitration_id & 0xff)
+        if module is None:
+            return
+        with self._condition:
+            for data in module.handle(list(msg.data[:msg.dlc])):
+                self.push(module, data)
+
+    def push(self, module: SimulatedModule, data: List[int],
+             delay: float = 0.0, callback=None) -> None:
+        """Queue telegram sent by simulated module for reception.
+
+        Args:
+            module: Sending module.
+            data: Telegram data.
+            delay: Seconds added to the (jittered) bus latency.
+            callback: Called (in reader thread) right before reception, e.g.
+                to update the module's status.
+        """
+        latency = self.latency + delay
+        if self.jitter:
+            latency += self._random.uniform(-self.jitter, self.jitter)
+        msg = can.Message(arbitration_id=module.rsp_id, is_extended_id=False,
+                          dlc=len(data), data=data)
+        with self._condition:
+            heapq.heappush(self._queue, (time.time() + max(0.0, latency),
+                                         next(self._sequence), msg, callback))
+            self._condition.notify_all()
+
+    def read_in_loop(self) -> Optional[can.Message]:
+        with self._condition:
+            if not self._queue:
+                self._condition.wait(0.01)
+            if not self._queue:
+                return None
+            delivery_time = self._queue[0][0]
+            delay = delivery_time - time.time()
+            if delay > 0:
+                self._condition.wait(min(delay, 0.01))
+                if not self._queue or self._queue[0][0] > time.time():
+                    return None
+            _, _, msg, callback = heapq.heappop(self._queue)
+        if callback:
+            callback()
+        msg.timestamp = time.time()
+        return msg
+
+    def read_batch(self) -> List[can.Message]:
+        with self._condition:
+            if not self._woken_up and (not self._queue
+                                       or self._queue[0][0] > time.time()):
+                delay = (self._queue[0][0] - time.time() if self._queue
+                         else mcs.mcsbus.READ_TIMEOUT)
+                self._condition.wait(min(delay, mcs.mcsbus.READ_TIMEOUT))
+            self._woken_up = False
+            due = []
+            now = time.time()
+            while (self._queue and self._queue[0][0] <= now
+                   and len(due) < mcs.mcsbus.READ_BATCH_SIZE):
+                due.append(heapq.heappop(self._queue))
+        msgs = []
+        for _, _, msg, callback in due:
+            if callback:
+                callback()
+            msg.timestamp = time.time()
+            msgs.append(msg)
+        return msgs
+
+    def wake_up(self) -> None:
+        with self._condition:
+            self._woken_up = True
+            self._condition.notify_all()
@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+"""Subscriptions to port values pushed by MCS modules (auto-port mode).
+
+Instead of polling a port (one request and response per value), the port is
+set to auto mode (see McsDevice.set_port_mode()). The module reports new data
+by setting the DATA status bit (info 0 status change), the triggered ports are
+queried once by a background thread and the port data telegrams are decoded
+in the reader thread, cached and handed to the callbacks of the subscriptions:
+
+    can_mcs = mcs.get_mcs()
+    subscription = can_mcs.subscribe(0x423, port=4, period=1.0,
+                                     callback=lambda s: print(s.value))
+    ...
+    temperature = can_mcs.subscriptions.get_value(0x423, port=4)
+    can_mcs.unsubscribe(subscription)
+
+Port data telegrams pushed by the module itself (unsolicited 0x42) and port
+data requested by anyone else (e.g. get_port()) update subscriptions, too.
+Ports of modules rejecting auto mode (NACK) are polled with the given period.
+"""
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import can
+
+import mcs
+from mcs.codec import TELEGRAMS
+from mcs.mcsdevice import STATUS_DATA
+
+log = logging.getLogger(__name__)
+
+PORT_MODE_NORMAL = 0x00
+PORT_MODE_AUTO = 0x20
+MAX_PORT_IDLE_TIME = 0xffff  # ms (see McsDevice.set_port_mode()).
+
+
+class PortSubscription(object):
+    """Subscription to the values of a device port (see PortSubscriptions).
+
+    Attributes:
+        device: Subscribed McsDevice.
+        port: Port id.
+        period: Seconds between pushed (or polled) values (None: on change).
+        callback: Called with this subscription (from the reader thread) for
+            each received value. Must return quickly.
+        signed: Port value is signed.
+        polled: Module rejected auto mode, port is polled.
+        value: Last received value (None if no value has been received yet).
+        timestamp: Time (time.time()) the last value has been received.
+    """
+
+    def __init__(self, device: mcs.McsDevice, port: int,
+                 period: Optional[float] = None,
+                 callback: Optional[Callable[["PortSubscription"], None]
+                                    ] = None,
+                 signed: bool = False) -> None:
+        self.device = device
+        self.port = port
+        self.period = period
+        self.callback = callback
+        self.signed = signed
+        self.polled = False
+        self.value: Optional[int] = None
+        self.timestamp: Optional[float] = None
+        self._next_poll = 0.0
+
+    def __repr__(self) -> str:
+        return f"subscription of {self.device} port {self.port}"
+
+    def _update(self, msg: can.Message) -> None:
+        """Decode port data and call callback (in reader thread)."""
+        self.value = TELEGRAMS[0x42].decode_value(msg.data, self.signed)
+        self.timestamp = msg.timestamp or time.time()
+        if self.callback is not None:
+            try:
+                self.callback(self)
+            except Exception as exc:
+                log.exception(f"{self}: Callback failed: {exc}")
+
+
+class PortSubscriptions(object):
+    """Port subscriptions of the devices of an Mcs instance.
+
+    Holds a cache of the latest port values (see get_value()). Ports of a
+    device triggering new data (DATA status bit) and polled ports are queried
+    by a single background thread (started on first subscription).
+    """
+
+    def __init__(self, mcs_instance: "mcs.Mcs") -> None:
+        """Instantiate subscriptions (see Mcs.subscribe()).
+
+        Args:
+            mcs_instance: Mcs instance the subscribed devices are registered
+                at.
+        """
+        self.mcs = mcs_instance
+        self._lock = threading.Lock()
+        # Subscriptions by (response CAN id, port), replaced on change (read
+        # by the reader thread without lock):
+        self._subscriptions: Dict[Tuple[int, int],
+                                  List[PortSubscription]] = {}
+        self._latest: Dict[Tuple[int, int], can.Message] = {}
+        self._triggered = queue.Queue()  # Devices reporting new data.
+        self._pending = set()  # Response CAN ids in _triggered.
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def subscribe(self, device: Union[int, mcs.McsDevice], port: int,
+                  period: Optional[float] = None,
+                  callback: Optional[Callable[[PortSubscription], None]
+                                     ] = None,
+                  signed: bool = False) -> PortSubscription:
+        """Subscribe to values of a device port.
+
+        Sets the port to auto mode (if not subscribed yet). If the module
+        rejects auto mode, the port is polled with given period.
+
+        Args:
+            device: Registered McsDevice or its CAN id, e.g. 0x423.
+            port: Port id.
+            period: Seconds between values (port idle time of auto mode).
+                None: Value is reported on change only.
+            callback: Called with the subscription for each received value
+                (from the reader thread, must return quickly).
+            signed: Port value is signed.
+
+        Returns:
+            subscription: Use for unsubscribe().
+
+        Raises:
+            McsException: If device is not registered.
+            McsHardwareException: If module rejects auto mode and no period
+                is given.
+        """
+        device = self.mcs.get_device(device if isinstance(device, int)
+                                     else device.rsp_id)
+        subscription = PortSubscription(device, port, period, callback, signed)
+        key = (device.rsp_id, port)
+        with self._lock:
+            others = self._subscriptions.get(key, [])
+            if device.rsp_id not in (d.rsp_id for d in self._devices()):
+                device.add_listener(self._on_msg)
+            subscriptions = dict(self._subscriptions)
+            subscriptions[key] = others + [subscription]
+            self._subscriptions = subscriptions
+        if others:
+            subscription.polled = others[0].polled
+        else:
+            try:
+                self._set_auto_mode(subscription)
+            except Exception:
+                self._remove(subscription)
+                raise
+        if not subscription.polled:
+            device.pushed_ports.add(port)
+        self._start()
+        log.debug(f"Subscribed to {device} port {port} ("
+                  f"{'polled' if subscription.polled else 'auto mode'})")
+        return subscription
+
+    def unsubscribe(self, subscription: PortSubscription) -> None:
+        """Cancel subscription (port is set to normal mode if it has been the
+        last subscription of the port)."""
+        if self._remove(subscription) and not subscription.polled:
+            subscription.device.pushed_ports.discard(subscription.port)
+            try:
+                subscription.device.set_port_mode(subscription.port,
+                                                  PORT_MODE_NORMAL)
+            except mcs.McsException as exc:
+                log.warning(f"{subscription}: Resetting port mode failed: "
+                            f"{exc}")
+
+    def get_value(self, device: Union[int, mcs.McsDevice], port: int,
+                  signed: bool = False, max_age: Optional[float] = None
+                  ) -> Optional[int]:
+        """Return latest received value of a port (without any request).
+
+        Args:
+            device: McsDevice or its CAN id.
+            port: Port id.
+            signed: Port value is signed.
+            max_age: Max. seconds since the value has been received.
+
+        Returns:
+            value: Port value or None if none (or none recent enough) has
+                been received.
+        """
+        can_id = device if isinstance(device, int) else device.rsp_id
+        msg = self._latest.get((can_id & 0xff, port))
+        if msg is None or (max_age is not None
+                           and time.time() - msg.timestamp > max_age):
+            return None
+        return TELEGRAMS[0x42].decode_value(msg.data, signed)
+
+    def close(self) -> None:
+        """Stop background thread and remove all subscriptions (port modes
+        are not reset)."""
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=5)
+        with self._lock:
+            for device in self._devices():
+                device.remove_listener(self._on_msg)
+                device.pushed_ports.clear()
+            self._subscriptions = {}
+
+    def _devices(self) -> List[mcs.McsDevice]:
+        devices = {}
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                devices[subscription.device.rsp_id] = subscription.device
+        return list(devices.values())
+
+    def _remove(self, subscription: PortSubscription) -> bool:
+        """Remove subscription, return if it has been the last of its port."""
+        device = subscription.device
+        key = (device.rsp_id, subscription.port)
+        with self._lock:
+            remaining = [s for s in self._subscriptions.get(key, [])
+                         if s is not subscription]
+            subscriptions = dict(self._subscriptions)
+            if remaining:
+                subscriptions[key] = remaining
+            else:
+                subscriptions.pop(key, None)
+            self._subscriptions = subscriptions
+            if device.rsp_id not in (s.device.rsp_id for s in self._devices()):
+                device.remove_listener(self._on_msg)
+        return not remaining
+
+    def _set_auto_mode(self, subscription: PortSubscription) -> None:
+        """Set port to auto mode or fall back to polling."""
+        idle_time = 0
+        if subscription.period:
+            idle_time = min(round(subscription.period * 1000),
+                            MAX_PORT_IDLE_TIME)
+        try:
+            subscription.device.set_port_mode(subscription.port,
+                                              PORT_MODE_AUTO,
+                                              port_idle_time=idle_time)
+        except mcs.McsHardwareException:
+            if not subscription.period:
+                raise
+            log.info(f"{subscription}: Auto mode rejected, polling every "
+                     f"{subscription.period} s")
+            subscription.polled = True
+
+    def _on_msg(self, msg: can.Message) -> None:
+        """Called from reader thread for each message of subscribed devices.
+        """
+        rsp_cmd = msg.data[0]
+        if rsp_cmd == 0x42:
+            key = (msg.arbitration_id, msg.data[2])
+            subscriptions = self._subscriptions.get(key)
+            if subscriptions:
+                self._latest[key] = msg
+                for subscription in subscriptions:
+                    subscription._update(msg)
+        elif (rsp_cmd == 0x00 and msg.data[2] == 0x00
+              and msg.data[1] & STATUS_DATA
+              and msg.arbitration_id not in self._pending):
+            self._pending.add(msg.arbitration_id)
+            self._triggered.put(msg.arbitration_id)
+
+    def _start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(name=f"{__name__}",
+                                            target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Query triggered and polled ports (background thread)."""
+        while not self._stop.is_set():
+            polled = [s for subscriptions in self._subscriptions.values()
+                      for s in subscriptions[:1] if s.polled]
+            now = time.monotonic()
+            timeout = min([s._next_poll - now for s in polled] + [0.1])
+            try:
+                can_id = self._triggered.get(timeout=max(0.0, timeout))
+            except queue.Empty:
+                can_id = None
+            if can_id is not None:
+                self._pending.discard(can_id)
+                for (rsp_id, port), subscriptions in list(
+                        self._subscriptions.items()):
+                    if rsp_id == can_id and not subscriptions[0].polled:
+                        self._query(subscriptions[0])
+            now = time.monotonic()
+            for subscription in polled:
+                if subscription._next_poll <= now:
+                    subscription._next_poll = now + subscription.period
+                    self._query(subscription)
+
+    def _query(self, subscription: PortSubscription) -> None:
+        """Request port data (handed to subscriptions by _on_msg())."""
+        try:
+            subscription.device.get_port(subscription.port)
+        except (mcs.McsException, RuntimeError) as exc:
+            log.warning(f"{subscription}: Reading port failed: {exc}")
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""Binary CAN trace recording.
+
+A trace file starts with a header (magic, format version, record size)
+followed by fixed-size records. Each record holds:
+
+    offset  size  content
+    0       8     timestamp (float64, seconds)
+    8       4     arbitration id (uint32)
+    12      1     flags (see FLAG_...)
+    13      1     dlc
+    14      8     data (zero padded)
+    22      2     padding
+
+All values are little endian. Fixed-size records allow direct (memory mapped)
+access and bulk decoding of a trace without parsing text.
+"""
+import collections
+import gzip
+import logging
+import os
+import shutil
+import struct
+import threading
+
+import can
+
+log = logging.getLogger(__name__)
+
+TRACE_MAGIC = b"MCSTRACE"
+TRACE_VERSION = 1
+HEADER = struct.Struct("<8sHH4x")  # magic, version, record size
+RECORD = struct.Struct("<dIBB8s2x")
+
+# Record flags:
+FLAG_EXTENDED = 0x01  # Extended (29 bit) arbitration id, e.g. TML.
+FLAG_REMOTE = 0x02  # Remote frame.
+FLAG_ERROR = 0x04  # Error frame.
+FLAG_TX = 0x08  # Sent by this process (master), else received.
+
+TRACE_BUFFER_SIZE = 65536  # Max. no. of frames waiting to be written.
+TRACE_MAX_BYTES = 2**26  # 64 MiB, i.e. ~2.8 million frames per file.
+TRACE_BACKUP_COUNT = 10
+TRACE_FLUSH_INTERVAL = 0.1  # Seconds between writes of buffered frames.
+
+
+def get_flags(msg: can.Message, sent: bool = False) -> int:
+    """Return record flags of given message.
+
+    Args:
+        msg: CAN message.
+        sent: If message was sent by this process (True) or received.
+    """
+    flags = 0
+    if msg.is_extended_id:
+        flags |= FLAG_EXTENDED
+    if msg.is_remote_frame:
+        flags |= FLAG_REMOTE
+    if msg.is_error_frame:
+        flags |= FLAG_ERROR
+    if sent:
+        flags |= FLAG_TX
+    return flags
+
+
+def pack_record(timestamp: float, arbitration_id: int, flags: int, dlc: int,
+                data: bytes) -> bytes:
+    """Return binary trace record (data is zero padded to 8 bytes)."""
+    return RECORD.pack(timestamp, arbitration_id, flags, dlc, bytes(data))
+
+
+class TraceRecorder(object):
+    """Record CAN frames to an append-only binary trace file.
+
+    Frames are put into a bounded buffer by record() (usually called from the
+    CAN reader thread) and are packed and written in batches by a background
+    writer thread. If the buffer is full, frames are dropped (and counted)
+    instead of blocking the caller.
+
+    The trace is rotated when it reaches max_bytes: the current file is
+    renamed with suffix '.1' (or compressed into '.1.gz'), existing backups
+    are renamed to increment their suffix and the oldest one is removed.
+    """
+
+    def __init__(self, path: str, max_bytes: int = TRACE_MAX_BYTES,
+                 backup_count: int = TRACE_BACKUP_COUNT,
+                 compress: bool = False,
+                 buffer_size: int = TRACE_BUFFER_SIZE) -> None:
+        """Instantiate trace recorder.
+
+        Args:
+            path: Full path to trace file (incl. file name).
+            max_bytes: File size limit for rotation. 0: never rotate.
+            backup_count: Max. no. of rotated files to keep.
+            compress: Compress rotated files with gzip.
+            buffer_size: Max. no. of frames waiting to be written.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.compress = compress
+        self.dropped = 0  # No. of frames dropped on buffer overflow.
+        self.written = 0  # No. of frames written to file.
+        self._buffer = collections.deque()  # Appending is thread-safe.
+        self._buffer_size = buffer_size
+        self._file = None
+        self._writer_thread = None
+        self._stop = threading.Event()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
+
+    def start(self) -> None:
+        """Open trace file and start writer thread."""
+        if self._writer_thread and self._writer_thread.is_alive():
+            raise RuntimeError("Trace writer thread is still alive")
+        self._open()
+        self._stop.clear()
+        self._writer_thread = threading.Thread(
+            name=f"{__name__} writer", target=self._write_loop, daemon=True)
+        self._writer_thread.start()
+
+    def stop(self) -> None:
+        """Write pending frames, stop writer thread and close trace file."""
+        if self._writer_thread:
+            self._stop.set()
+            self._writer_thread.join()
+            self._writer_thread = None
+        if self._file:
+            self._file.close()
+            self._file = None
+        if self.dropped:
+            log.warning(f"Trace {self.path}: {self.dropped} frames dropped")
+
+    def record(self, msg: can.Message, sent: bool = False) -> None:
+        """Add frame to trace (non-blocking).
+
+        Args:
+            msg: CAN message sent or received.
+            sent: If message was sent by this process (True) or received.
+        """
+        if len(self._buffer) < self._buffer_size:
+            self._buffer.append((msg.timestamp, msg.arbitration_id,
+                                 get_flags(msg, sent), msg.dlc, msg.data))
+        else:
+            self.dropped += 1
+
+    def _open(self) -> None:
+        self._file = open(self.path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(HEADER.pack(TRACE_MAGIC, TRACE_VERSION,
+                                         RECORD.size))
+
+    def _write_loop(self) -> None:
+        """Write buffered frames in batches until stopped."""
+        do_write = True
+        while do_write:
+            do_write = not self._stop.wait(TRACE_FLUSH_INTERVAL)
+            frames = []
+            while self._buffer:  # Drain buffer (popleft() is thread-safe).
+                frames.append(self._buffer.popleft())
+            if frames:
+                try:
+                    self._write(frames)
+                except Exception as exc:
+                    log.exception(exc)
+
+    def _write(self, frames) -> None:
+        self._file.write(b"".join(
+            [pack_record(*frame) for frame in frames]))
+        self.written += len(frames)
+        if self.max_bytes and self._file.tell() >= self.max_bytes:
+            self._rotate()
+
+    def _backup_name(self, i: int) -> str:
+        suffix = ".gz" if self.compress else ""
+        return f"{self.path}.{i}{suffix}"
+
+    def _rotate(self) -> None:
+        """Rotate trace files (see class docstring)."""
+        self._file.close()
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                if os.path.exists(self._backup_name(i)):
+                    os.replace(self._backup_name(i), self._backup_name(i + 1))
+            if self.compress:
+                with open(self.path, "rb") as src, \
+                        gzip.open(self._backup_name(1), "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+                os.remove(self.path)
+            else:
+                os.replace(self.path, self._backup_name(1))
+        else:
+            os.remove(self.path)
+        self._open()
+
@@ -0,0 +1,459 @@
+# -*- coding: utf-8 -*-
+"""Offline reading, decoding and querying of CAN traces.
+
+Reads binary traces written by McsBus.record_to_file() (see mcs.trace) and
+text logs written by McsBus.log_to_file(). Frames are decoded in bulk into
+NumPy structured arrays and indexed by arbitration id and time, so queries
+like "all port data responses of 0x063 between t0 and t1" do not need to scan
+the whole trace.
+
+Requires NumPy (not required by the rest of the mcs package).
+
+Example:
+    trace = read_trace("mcs_2021-01-26-16_50_03.trace")
+    rsp = trace.query(0x063, t0, t1, cmd="port data")
+    print(trace.latency_stats())
+
+Command line usage:
+    $ python -m mcs.trace_reader TRACE [--id 0x063] [--cmd "port data"]
+        [--t0 T0] [--t1 T1] [--latency]
+"""
+import argparse
+import gzip
+import logging
+import os
+import re
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from mcs.cmd_names import CMD_NAME
+from mcs.mcsbus import get_data_from_tml_id
+from mcs.opcode_names import OPCODE_NAME
+from mcs.trace import (FLAG_ERROR, FLAG_EXTENDED, FLAG_REMOTE, FLAG_TX, HEADER,
+                       RECORD, TRACE_MAGIC)
+
+log = logging.getLogger(__name__)
+
+# Same layout as mcs.trace.RECORD:
+RECORD_DTYPE = np.dtype([("timestamp", "<f8"),
+                         ("arbitration_id", "<u4"),
+                         ("flags", "u1"),
+                         ("dlc", "u1"),
+                         ("data", "u1", (8, )),
+                         ("padding", "V2")])
+assert RECORD_DTYPE.itemsize == RECORD.size
+
+# Decoded frames. For MCS (standard) frames: device is the slave CAN id (e.g.
+# 0x63 for master id 0x463 and slave id 0x063) and cmd the first data byte.
+# For TML (extended) frames: device is the axis id and opcode, op_category and
+# operand_id are decoded from the arbitration id (see get_data_from_tml_id()).
+# Not applicable fields are -1.
+FRAME_DTYPE = np.dtype([("timestamp", "<f8"),
+                        ("arbitration_id", "<u4"),
+                        ("flags", "u1"),
+                        ("dlc", "u1"),
+                        ("data", "u1", (8, )),
+                        ("device", "<i2"),
+                        ("cmd", "<i2"),
+                        ("opcode", "<i4"),
+                        ("op_category", "<i2"),
+                        ("operand_id", "<i2")])
+
+_TEXT_LOG_PATTERN = re.compile(
+    r"Timestamp:\s*(?P<timestamp>[0-9.]+)\s+ID:\s*(?P<id>[0-9a-fA-F]+)\s+"
+    r"(?P<flags>(?:[A-Z]{1,2} )*?[A-Z]{1,2})\s+DLC:\s*(?P<dlc>\d+)"
+    r"(?P<data>(?:\s+[0-9a-fA-F]{2}\b)*)")
+
+_CMD_BY_NAME = {name: cmd for cmd, name in CMD_NAME.items()}
+_OPCODE_BY_NAME = {name: opcode for opcode, name in OPCODE_NAME.items()}
+
+
+def read_binary_trace(path: str) -> np.ndarray:
+    """Return records of binary trace file.
+
+    Uncompressed files are memory mapped (i.e. not read into memory at once).
+    Gzip compressed files (e.g. rotated backups '.gz') are decompressed into
+    memory. A partial record at the end (e.g. of a trace still being written
+    or cut off by a crash) is ignored.
+
+    Args:
+        path: Path to binary trace file.
+
+    Returns:
+        records: Structured array of RECORD_DTYPE.
+
+    Raises:
+        ValueError: If file is not a supported binary trace file.
+    """
+    if path.endswith(".gz"):
+        with gzip.open(path, "rb") as f:
+            data = f.read()
+        size = len(data)
+    else:
+        with open(path, "rb") as f:
+            data = f.read(HEADER.size)
+        size = os.path.getsize(path)
+    magic, version, record_size = HEADER.unpack_from(data)
+    if magic != TRACE_MAGIC or record_size != RECORD_DTYPE.itemsize:
+        raise ValueError(f"Not a supported binary trace file: {path}")
+    n, tail = divmod(size - HEADER.size, RECORD_DTYPE.itemsize)
+    if tail:
+        log.warning(f"{path}: Partial record at end ignored ({tail} bytes)")
+    if path.endswith(".gz"):
+        return np.frombuffer(data, dtype=RECORD_DTYPE, count=n,
+                             offset=HEADER.size)
+    if n == 0:
+        return np.zeros(0, dtype=RECORD_DTYPE)  # Empty files cannot be mapped.
+    return np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER.size,
+                     shape=(n, ))
+
+
+def read_text_log(path: str) -> np.ndarray:
+    """Return records parsed from text log file (see McsBus.log_to_file()).
+
+    Text logs do not hold the direction of a frame. Standard frames with a
+    master CAN id (0x400 to 0x4ff) are flagged as sent (FLAG_TX).
+
+    Args:
+        path: Path to text log file.
+
+    Returns:
+        records: Structured array of RECORD_DTYPE.
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    rows = []
+    with opener(path, "rt") as f:
+        for line in f:
+            match = _TEXT_LOG_PATTERN.search(line)
+            if match is None:
+                continue  # E.g. "CAN message logging started"
+            can_id = int(match["id"], 16)
+            letters = match["flags"].split()
+            flags = 0
+            if "X" in letters:
+                flags |= FLAG_EXTENDED
+            elif (can_id & 0x700) == 0x400:
+                flags |= FLAG_TX
+            if "R" in letters:
+                flags |= FLAG_REMOTE
+            if "E" in letters:
+                flags |= FLAG_ERROR
+            dlc = int(match["dlc"])
+            data = bytes.fromhex(match["data"])[:min(dlc, 8)]
+            rows.append((float(match["timestamp"]), can_id, flags, dlc,
+                         data.ljust(8, b"\0")))
+    records = np.zeros(len(rows), dtype=RECORD_DTYPE)
+    if rows:
+        timestamp, can_id, flags, dlc, data = zip(*rows)
+        records["timestamp"] = timestamp
+        records["arbitration_id"] = can_id
+        records["flags"] = flags
+        records["dlc"] = dlc
+        records["data"] = np.frombuffer(b"".join(data),
+                                        dtype=np.uint8).reshape(-1, 8)
+    return records
+
+
+def _is_binary_trace(path: str) -> bool:
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rb") as f:
+        return f.read(len(TRACE_MAGIC)) == TRACE_MAGIC
+
+
+def read_records(paths: Union[str, Sequence[str]]) -> np.ndarray:
+    """Return records of binary trace or text log file(s).
+
+    Args:
+        paths: Path or list of paths (e.g. rotated files), concatenated in the
+            given order.
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+    parts = []
+    for path in paths:
+        if _is_binary_trace(path):
+            parts.append(read_binary_trace(path))
+        else:
+            parts.append(read_text_log(path))
+    if len(parts) == 1:
+        return parts[0]
+    return np.concatenate(parts)
+
+
+def decode(records: np.ndarray) -> np.ndarray:
+    """Return decoded frames (FRAME_DTYPE) for given records (in bulk).
+
+    Args:
+        records: Structured array of RECORD_DTYPE (or FRAME_DTYPE).
+    """
+    frames = np.empty(len(records), dtype=FRAME_DTYPE)
+    for name in RECORD_DTYPE.names:
+        if name != "padding":
+            frames[name] = records[name]
+    can_id = frames["arbitration_id"]
+    extended = (frames["flags"] & FLAG_EXTENDED) != 0
+    axis_id, opcode, op_category, operand_id, _, _ = get_data_from_tml_id(
+        can_id)
+    has_cmd = ~extended & (frames["dlc"] > 0)
+    frames["device"] = np.where(extended, axis_id, can_id & 0xff)
+    frames["cmd"] = np.where(has_cmd, frames["data"][:, 0], -1)
+    frames["opcode"] = np.where(extended, opcode, -1)
+    frames["op_category"] = np.where(extended, op_category, -1)
+    frames["operand_id"] = np.where(extended, operand_id, -1)
+    return frames
+
+
+def cmd_names(frames: np.ndarray) -> np.ndarray:
+    """Return array of command (MCS) or opcode (TML) names of given frames."""
+    names = np.full(len(frames), "-", dtype=object)
+    cmd_table = np.array([CMD_NAME.get(i, "?") for i in range(256)],
+                         dtype=object)
+    has_cmd = frames["cmd"] >= 0
+    names[has_cmd] = cmd_table[frames["cmd"][has_cmd]]
+    has_opcode = frames["opcode"] >= 0
+    opcodes, inverse = np.unique(frames["opcode"][has_opcode],
+                                 return_inverse=True)
+    opcode_table = np.array([OPCODE_NAME.get(int(i), "-") for i in opcodes],
+                            dtype=object)
+    names[has_opcode] = opcode_table[inverse]
+    return names
+
+
+def _get_cmd(cmd: Union[int, str]) -> int:
+    if isinstance(cmd, str):
+        return _CMD_BY_NAME[cmd]
+    return cmd
+
+
+def _get_opcode(opcode: Union[int, str]) -> int:
+    if isinstance(opcode, str):
+        return _OPCODE_BY_NAME[opcode]
+    return opcode
+
+
+class TraceIndex(object):
+    """Index of trace records by arbitration id and time.
+
+    Record positions are sorted by arbitration id and then by time stamp, so
+    the records of an arbitration id within a time window are a contiguous
+    range found by binary search.
+    """
+
+    def __init__(self, records: np.ndarray) -> None:
+        timestamps = records["timestamp"]
+        can_ids = records["arbitration_id"]
+        self.order = np.lexsort((timestamps, can_ids))
+        self.sorted_timestamps = timestamps[self.order]
+        sorted_ids = can_ids[self.order]
+        ids, starts = np.unique(sorted_ids, return_index=True)
+        ends = np.append(starts[1:], len(sorted_ids))
+        self.ranges = {int(i): (int(s), int(e))
+                       for i, s, e in zip(ids, starts, ends)}
+
+    def get_ids(self) -> List[int]:
+        """Return all arbitration ids in trace."""
+        return sorted(self.ranges)
+
+    def lookup(self, can_id: int, t0: Optional[float] = None,
+               t1: Optional[float] = None) -> np.ndarray:
+        """Return record positions of arbitration id within time window.
+
+        Args:
+            can_id: Arbitration id.
+            t0: Start of time window (included). None: from start.
+            t1: End of time window (excluded). None: till end.
+
+        Returns:
+            positions: Record positions (sorted by time).
+        """
+        start, end = self.ranges.get(can_id, (0, 0))
+        timestamps = self.sorted_timestamps[start:end]
+        low, high = 0, len(timestamps)
+        if t0 is not None:
+            low = int(np.searchsorted(timestamps, t0, side="left"))
+        if t1 is not None:
+            high = int(np.searchsorted(timestamps, t1, side="left"))
+        return self.order[start + low:start + max(low, high)]
+
+
+class Trace(object):
+    """CAN trace with bulk decoding, indexed queries and statistics."""
+
+    def __init__(self, records: np.ndarray) -> None:
+        """Instantiate trace.
+
+        Args:
+            records: Structured array of RECORD_DTYPE (see read_records()).
+        """
+        self.records = records
+        self._index = None
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def index(self) -> TraceIndex:
+        """Index by arbitration id and time (built on first use)."""
+        if self._index is None:
+            self._index = TraceIndex(self.records)
+        return self._index
+
+    def decode(self) -> np.ndarray:
+        """Return all frames decoded (FRAME_DTYPE)."""
+        return decode(self.records)
+
+    def query(self, can_id: Optional[int] = None,
+              t0: Optional[float] = None,
+              t1: Optional[float] = None,
+              cmd: Union[None, int, str] = None,
+              opcode: Union[None, int, str] = None) -> np.ndarray:
+        """Return decoded frames matching all given conditions.
+
+        Example: all port data responses (get port) of laser board 0x463:
+            trace.query(0x063, t0, t1, cmd="port data")
+
+        Args:
+            can_id: Arbitration id (e.g. 0x063 for responses and 0x463 for
+                requests of device 0x463). None: all ids.
+            t0: Start of time window (included). None: from start.
+            t1: End of time window (excluded). None: till end.
+            cmd: MCS command byte or name (see CMD_NAME).
+            opcode: TML opcode or name (see OPCODE_NAME).
+
+        Returns:
+            frames: Matching frames (FRAME_DTYPE) sorted by time.
+        """
+        if can_id is None:
+            timestamps = self.records["timestamp"]
+            mask = np.ones(len(self.records), dtype=bool)
+            if t0 is not None:
+                mask &= timestamps >= t0
+            if t1 is not None:
+                mask &= timestamps < t1
+            positions = np.flatnonzero(mask)
+        else:
+            positions = self.index.lookup(can_id, t0, t1)
+        frames = decode(self.records[positions])
+        if cmd is not None:
+            frames = frames[frames["cmd"] == _get_cmd(cmd)]
+        if opcode is not None:
+            frames = frames[frames["opcode"] == _get_opcode(opcode)]
+        if can_id is None:
+            frames = frames[np.argsort(frames["timestamp"], kind="stable")]
+        return frames
+
+    def latency_stats(self) -> Dict[int, Dict[str, float]]:
+        """Return request to response latency statistics per MCS device.
+
+        A request is a frame sent by the master (0x4xx). Its response is the
+        first frame received from the device (0x0xx) after the request and
+        before the next request to the device (in trace order). Status
+        change telegrams (info 0 that is neither ACK nor NACK) are not
+        responses. Requests sent before the bus time was synchronized (time
+        stamp 0, see McsBus) are ignored.
+
+        Returns:
+            stats: Dict with master CAN id (e.g. 0x463) as key and dict with
+                "requests", "unanswered", "mean", "p50", "p99" and "max"
+                latency (in seconds) as value.
+        """
+        records = self.records
+        data = records["data"]
+        status_change = ((records["dlc"] >= 3) & (data[:, 0] == 0x00)
+                         & (data[:, 2] == 0x00))
+        stats = {}
+        for can_id in self.index.get_ids():
+            if (can_id & 0x700) != 0x400:  # Not a request (master) id.
+                continue
+            requests = self.index.lookup(can_id)
+            requests = requests[((records["flags"][requests]
+                                  & (FLAG_EXTENDED | FLAG_ERROR)) == 0)
+                                & (records["timestamp"][requests] > 0)]
+            responses = self.index.lookup(can_id & 0xff)
+            responses = responses[~status_change[responses]
+                                  & ((records["flags"][responses]
+                                      & (FLAG_TX | FLAG_ERROR)) == 0)]
+            if not len(requests):
+                continue
+            # Pair by record position (order in which the frames passed the
+            # McsBus) as time stamps of sent and received frames are taken
+            # from different clocks:
+            requests = np.sort(requests)
+            responses = np.sort(responses)
+            i = np.searchsorted(responses, requests)
+            answered = i < len(responses)
+            next_requests = np.append(requests[1:], len(records))
+            answered[answered] = (responses[i[answered]]
+                                  < next_requests[answered])
+            latency = (records["timestamp"][responses[i[answered]]]
+                       - records["timestamp"][requests[answered]])
+            device_stats = {"requests": len(requests),
+                            "unanswered": int(np.count_nonzero(~answered))}
+            if len(latency):
+                device_stats.update(
+                    mean=float(latency.mean()),
+                    p50=float(np.percentile(latency, 50)),
+                    p99=float(np.percentile(latency, 99)),
+                    max=float(latency.max()))
+            stats[can_id] = device_stats
+        return stats
+
+
+def read_trace(paths: Union[str, Sequence[str]]) -> Trace:
+    """Return Trace of binary trace or text log file(s).
+
+    See read_records().
+    """
+    return Trace(read_records(paths))
+
+
+def _format_frame(frame, name: str) -> str:
+    data = " ".join(f"{b:02x}" for b in frame["data"][:frame["dlc"]])
+    direction = "TX" if frame["flags"] & FLAG_TX else "RX"
+    width = 8 if frame["flags"] & FLAG_EXTENDED else 4
+    return (f"{frame['timestamp']:17.6f} {direction} "
+            f"{frame['arbitration_id']:0{width}x} DLC: {frame['dlc']} "
+            f"{data:<24} {name}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m mcs.trace_reader",
+        description="Query CAN trace (binary trace or text log files).")
+    parser.add_argument("paths", nargs="+", help="trace file(s)")
+    parser.add_argument("--id", type=lambda x: int(x, 0),
+                        help="arbitration id, e.g. 0x063")
+    parser.add_argument("--cmd", help="MCS command byte or name")
+    parser.add_argument("--opcode", help="TML opcode or name")
+    parser.add_argument("--t0", type=float, help="start time (s)")
+    parser.add_argument("--t1", type=float, help="end time (s)")
+    parser.add_argument("--latency", action="store_true",
+                        help="print request to response latency statistics")
+    args = parser.parse_args(argv)
+
+    trace = read_trace(args.paths)
+    if args.latency:
+        for can_id, s in trace.latency_stats().items():
+            txt = f"{can_id:03x}: {s['requests']:8d} requests " \
+                  f"{s['unanswered']:6d} unanswered"
+            if "mean" in s:
+                txt += (f"  mean {s['mean'] * 1e3:7.3f} ms  "
+                        f"p50 {s['p50'] * 1e3:7.3f} ms  "
+                        f"p99 {s['p99'] * 1e3:7.3f} ms  "
+                        f"max {s['max'] * 1e3:7.3f} ms")
+            print(txt)
+        return
+    cmd = args.cmd
+    if cmd is not None and cmd not in _CMD_BY_NAME:
+        cmd = int(cmd, 0)
+    opcode = args.opcode
+    if opcode is not None and opcode not in _OPCODE_BY_NAME:
+        opcode = int(opcode, 0)
+    frames = trace.query(args.id, args.t0, args.t1, cmd, opcode)
+    for frame, name in zip(frames, cmd_names(frames)):
+        print(_format_frame(frame, name))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
-# -*- coding: utf-8 -*-
-__version__ = '0.3.0.dev1'
-# Use the official PEP 440 versioning scheme:
-# https://www.python.org/dev/peps/pep-0440/#version-scheme
-# Also use the "Major.Minor.Patch" aspects of semantic versioning (clauses
-# 1-8 in the 2.0.0 specification):
-# https://semver.org/lang/de/#semantic-versioning-200
-
+# -*- coding: utf-8 -*-
+__version__ = '0.3.0.dev1'
+# Use the official PEP 440 versioning scheme:
+# https://www.python.org/dev/peps/pep-0440/#version-scheme
+# Also use the "Major.Minor.Patch" aspects of semantic versioning (clauses
+# 1-8 in the 2.0.0 specification):
+# https://semver.org/lang/de/#semantic-versioning-200
+
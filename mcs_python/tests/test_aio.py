@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import threading
+import time
+import pytest
+
+import mcs
+
+
+@pytest.fixture(scope='function')
+def mcs_sim():
+    m = mcs.get_simulated_mcs([mcs.SimulatedLaserBoard(can_id)
+                               for can_id in range(0x430, 0x440)],
+                              latency=0.01)
+    yield m
+    m.close()
+
+
+def test_async_requests_run_concurrently(mcs_sim):
+    """Test requests to many devices run concurrently in one event loop."""
+    async_mcs = mcs.AsyncMcs(mcs_sim)
+    devices = [async_mcs.get_device(can_id) for can_id in range(0x430, 0x440)]
+
+    async def run():
+        await asyncio.gather(*[d.reset() for d in devices])
+        await asyncio.gather(*[d.init() for d in devices])
+        await asyncio.gather(*[d.set_parameter(0, 2000) for d in devices])
+        start = time.monotonic()
+        values = await asyncio.gather(*[d.get_port(4) for d in devices])
+        return values, time.monotonic() - start
+
+    values, duration = asyncio.run(run())
+    assert values == [2500] * len(devices)
+    assert duration < 16 * 0.02 / 2  # Serial requests: >= 16 * 20 ms.
+    device = mcs_sim.get_device(0x430)
+    assert device.status == 0
+    assert device.get_parameter(0) == 2000  # Sync API keeps working.
+
+
+def test_async_request_waits_for_sync_lock(mcs_sim):
+    """Test an async request waits while the sync API holds the device."""
+    device = mcs_sim.get_device(0x430)
+    async_device = mcs.AsyncMcs(mcs_sim).get_device(0x430)
+    locked = threading.Event()
+
+    def hold_lock():
+        with device._lock:
+            locked.set()
+            time.sleep(0.1)
+
+    async def run():
+        thread = threading.Thread(target=hold_lock)
+        thread.start()
+        locked.wait()
+        start = time.monotonic()
+        await async_device.get_port(4)
+        thread.join()
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 0.09
+
+
+def test_async_nack_and_timeout(mcs_sim):
+    """Test NACK raises hardware exception and missing response times out."""
+    mcs_sim.register(mcs.McsDevice(0x422, mcs_sim.bus))
+    async_mcs = mcs.AsyncMcs(mcs_sim)
+
+    async def run():
+        with pytest.raises(mcs.McsHardwareException):
+            await async_mcs.get_device(0x430).send_and_check_rsp([0x99])
+        with pytest.raises(mcs.McsTimeoutException):
+            await async_mcs.get_device(0x422).get_port(4)
+
+    asyncio.run(run())
@@ -1,69 +1,232 @@
-# -*- coding: utf-8 -*-
-# import collections
-import threading
-import pytest
-# from unittest.mock import call
-from unittest.mock import MagicMock
-
-import mcs
-
-
-@pytest.fixture(scope='function')
-def com():
-    return MagicMock()
-
-
-@pytest.fixture(scope='function')
-def mcs_bus(com):
-    b = mcs.McsBus(com)
-    b.error_code = 0
-    yield b
-
-
-@pytest.fixture(scope='function')
-def mcs_instance(mcs_bus):
-    m = mcs.Mcs(mcs_bus)
-    yield m
-
-
-# Test McsBus
-def test_mcs_bus__init__(com):
-    """Test instantiation of McsBus."""
-    bus_instance = mcs.McsBus(com)
-
-    isinstance(bus_instance.lock, type(threading.Lock))
-    isinstance(bus_instance.errorLock, type(threading.Lock))
-    assert bus_instance.error_code == 0
-    assert bus_instance.error_can_id == 0
-    assert bus_instance.error_text == ""
-    assert bus_instance.isClosed is True
-    # assert bus_instance._com == com
-    # assert bus_instance._do_read is False
-    # assert bus_instance._time_shift is None
-    # isinstance(bus_instance._cmd_history, type(collections.deque))
-    # assert bus_instance._file_log is None
-
-
-# Test McsDevice
-@pytest.mark.parametrize('can_id', [0x456, 0x056])
-def test_mcs_device__init__(mcs_bus, can_id):
-    """Test instantiation of McsDevice."""
-    device = mcs.McsDevice(can_id, mcs_bus)
-
-    assert device.rsp_id == 0x056
-    assert device.id == 0x456  # Default is master id.
-    assert device.name == "stepper magnet 0"
-    assert device.mcs == mcs_bus
-    assert device.status == 0
-    assert device.error == 0
-    assert device.warning == 0
-    assert device.com_error == 0
-    assert device.buffer == []
-    # isinstance(device._history, type(collections.deque))
-
-
-def test_mcs_device__init__raises(mcs_bus):
-    """Test instantiation of McsDevice raises on bus error."""
-    mcs_bus.error_code = 1
-    with pytest.raises(RuntimeError):
-        mcs.McsDevice(0x012, mcs_bus)
+# -*- coding: utf-8 -*-
+# import collections
+import logging
+import socket
+import threading
+import time
+import can
+import pytest
+# from unittest.mock import call
+from unittest.mock import MagicMock, patch
+
+import mcs
+
+
+@pytest.fixture(scope='function')
+def com():
+    return MagicMock()
+
+
+@pytest.fixture(scope='function')
+def mcs_bus(com):
+    b = mcs.McsBus(com)
+    b.error_code = 0
+    yield b
+
+
+@pytest.fixture(scope='function')
+def mcs_instance(mcs_bus):
+    m = mcs.Mcs(mcs_bus)
+    yield m
+
+
+# Test McsBus
+def test_mcs_bus__init__(com):
+    """Test instantiation of McsBus."""
+    bus_instance = mcs.McsBus(com)
+
+    isinstance(bus_instance.lock, type(threading.Lock))
+    isinstance(bus_instance.errorLock, type(threading.Lock))
+    assert bus_instance.error_code == 0
+    assert bus_instance.error_can_id == 0
+    assert bus_instance.error_text == ""
+    assert bus_instance.isClosed is True
+    # assert bus_instance._com == com
+    # assert bus_instance._do_read is False
+    # assert bus_instance._time_shift is None
+    # isinstance(bus_instance._cmd_history, type(collections.deque))
+    # assert bus_instance._file_log is None
+
+
+# Test McsDevice
+@pytest.mark.parametrize('can_id', [0x456, 0x056])
+def test_mcs_device__init__(mcs_bus, can_id):
+    """Test instantiation of McsDevice."""
+    device = mcs.McsDevice(can_id, mcs_bus)
+
+    assert device.rsp_id == 0x056
+    assert device.id == 0x456  # Default is master id.
+    assert device.name == "stepper magnet 0"
+    assert device.mcs == mcs_bus
+    assert device.status == 0
+    assert device.error == 0
+    assert device.warning == 0
+    assert device.com_error == 0
+    assert device.buffer == []
+    # isinstance(device._history, type(collections.deque))
+
+
+def test_mcs_device__init__raises(mcs_bus):
+    """Test instantiation of McsDevice raises on bus error."""
+    mcs_bus.error_code = 1
+    with pytest.raises(RuntimeError):
+        mcs.McsDevice(0x012, mcs_bus)
+
+
+def test_mcs_device_rcv_is_notified_by_put_msg(mcs_bus):
+    """Test rcv() returns as soon as put_msg() is called from another thread."""
+    device = mcs.McsDevice(0x056, mcs_bus)
+    msg = can.Message(arbitration_id=0x056, data=[0x00, 0x00, 0x22])
+    threading.Timer(0.05, device.put_msg, args=(msg,)).start()
+
+    assert device.rcv(timeout=1) is msg
+    assert device.buffer == []
+
+
+def test_mcs_device_rcv_raises_on_timeout(mcs_bus):
+    """Test rcv() raises McsTimeoutException if no message is received."""
+    device = mcs.McsDevice(0x056, mcs_bus)
+    with pytest.raises(mcs.McsTimeoutException):
+        device.rcv(timeout=0.01)
+
+
+def test_mcs_device_wait_is_notified_by_status_change(mcs_bus):
+    """Test wait() returns when an info 0 telegram reports idle state."""
+    device = mcs.McsDevice(0x056, mcs_bus)
+    device.status = mcs.mcsdevice.STATUS_ACTIVE
+    msg = can.Message(arbitration_id=0x056, data=[0x00, 0x00, 0x00])
+    threading.Timer(0.05, device.put_msg, args=(msg,)).start()
+
+    device.wait(timeout=1)
+    assert not device.is_busy()
+    with pytest.raises(mcs.McsTimeoutException):
+        device.status = mcs.mcsdevice.STATUS_ACTIVE
+        device.wait(timeout=0.01)
+
+
+def test_mcs_bus_send_formats_lazily(mcs_bus, monkeypatch, caplog):
+    """Test messages are not formatted if no log record is emitted."""
+    msg_txt = MagicMock(return_value="")
+    monkeypatch.setattr(mcs.mcsbus, "msg_txt", msg_txt)
+    caplog.set_level(logging.INFO, logger="mcs.mcsbus")
+    mcs_bus.send(0x456, [0x22, 0x00])
+    msg_txt.assert_not_called()
+
+
+def test_mcs_bus_log_to_file(mcs_bus, tmp_path):
+    """Test sent messages are written to file log by background writer."""
+    path = tmp_path / "mcs.log"
+    mcs_bus.log_to_file(str(path))
+    mcs_bus.send(0x456, [0x22, 0x00])
+    mcs_bus.stop_log_to_file()
+
+    lines = path.read_text().splitlines()
+    assert lines[0].startswith("CAN message logging started")
+    assert lines[1].endswith("init")
+    assert "ID: 0456" in lines[1]
+
+
+def test_telegram_codecs():
+    """Test telegram layouts encode, decode and check data."""
+    telegrams = mcs.codec.TELEGRAMS
+    assert telegrams[0x40].encode(0, 5, 0, -2, length=2) == bytes(
+        [0x40, 0x00, 5, 0, 0xfe, 0xff])
+    assert telegrams[0xfb].encode(0x123456, 4) == bytes(
+        [0xfb, 0x56, 0x34, 0x12, 4])
+    rsp = bytearray([0x42, 0x00, 5, 0x00, 0xfe, 0xff])
+    assert telegrams[0x42].decode(rsp) == (0x00, 5, 0x00)
+    assert telegrams[0x42].decode_value(rsp, signed=True) == -2
+    assert telegrams[0x40].ack.matches(bytearray([0x00, 0x04, 0x40]))
+    assert not telegrams[0x40].ack.matches(bytearray([0x00, 0x04, 0x41]))
+    assert not mcs.codec.compile_check([0x42, None, 6]).matches(rsp)
+
+
+# Test Mcs
+def test_mcs_can_filters_follow_registered_devices(mcs_instance, com):
+    """Test CAN filters are updated on register, unregister and TML handler."""
+    mcs_instance.register(mcs.McsDevice(0x456, mcs_instance.bus))
+    com.set_filters.assert_called_with(
+        [{"can_id": 0x056, "can_mask": 0x7ff, "extended": False}])
+    mcs_instance.ext_msg_rcv = MagicMock()
+    com.set_filters.assert_called_with(
+        [{"can_id": 0x056, "can_mask": 0x7ff, "extended": False},
+         {"can_id": 0, "can_mask": 0, "extended": True}])
+    mcs_instance.ext_msg_rcv = None
+    mcs_instance.unregister(0x456)
+    com.set_filters.assert_called_with(None)
+    com.set_filters.reset_mock()
+    mcs_instance.register_missing_devices(range(0x100))
+    com.set_filters.assert_called_once_with(
+        [{"can_id": 0x000, "can_mask": 0x700, "extended": False}])
+
+
+def test_get_filter_ranges():
+    """Test CAN filters are merged to id ranges (e.g. for PCANBasic)."""
+    filters = [{"can_id": can_id, "can_mask": 0x7ff, "extended": False}
+               for can_id in [0x21, 0x23, 0x22, 0x41]]
+    filters.append({"can_id": 0, "can_mask": 0, "extended": True})
+    assert mcs.mcsbus.get_filter_ranges(filters) == [
+        (0x21, 0x23, False), (0x41, 0x41, False), (0, 0x1fffffff, True)]
+
+
+def test_com_python_can_read_batch_blocks_and_wakes_up():
+    """Test read_batch() waits on bus fd, drains all messages, and wakes up."""
+    rsock, wsock = socket.socketpair()
+    bus = MagicMock()
+    bus.fileno.return_value = rsock.fileno()
+    msgs = [can.Message(arbitration_id=0x023, data=[0x00, 0x00, i])
+            for i in range(3)]
+    bus.recv.side_effect = lambda timeout: msgs.pop(0) if msgs else None
+    com = mcs.ComPythonCan(channel="can0", bus_type="socketcan")
+    with patch("can.interface.Bus", return_value=bus):
+        com.open()
+    try:
+        wsock.send(b"\x00")  # Socket is readable (messages received).
+        assert [m.data[2] for m in com.read_batch()] == [0, 1, 2]
+        rsock.recv(1)
+        threading.Timer(0.05, com.wake_up).start()
+        start = time.monotonic()
+        assert com.read_batch() == []
+        assert 0.04 < time.monotonic() - start < mcs.mcsbus.READ_TIMEOUT
+    finally:
+        com.close()
+        rsock.close()
+        wsock.close()
+
+
+def test_mcs_bus_tx_queue_priority_retry_and_pacing(com):
+    """Test TX thread sends control before polling lane, retries on full TX
+    buffer and paces to bit rate."""
+    sent = []
+    release = threading.Event()
+    buffer_full = [2]  # Raise twice.
+
+    def send(msg):
+        if msg.data[0] == 0x01:
+            release.wait(1)
+        if msg.data[0] == 0x02 and buffer_full[0]:
+            buffer_full[0] -= 1
+            raise mcs.McsBusTxBufferFullException("TX buffer full")
+        sent.append(msg.data[0])
+
+    com.send.side_effect = send
+    com.open.return_value = None
+    com.bit_rate = 125000
+    bus = mcs.McsBus(com)
+    bus.open()
+    try:
+        first = bus.send_nowait(0x456, [0x01])  # Blocks TX thread.
+        poll = bus.send_nowait(0x456, [0x03], priority=mcs.mcsbus.PRIORITY_POLL)
+        control = bus.send_nowait(0x456, [0x02])
+        release.set()
+        assert poll.result(1).data[0] == 0x03
+        assert first.done() and control.done()
+        assert sent == [0x01, 0x02, 0x03]  # Control lane first, retried.
+
+        start = time.monotonic()
+        futures = [bus.send_nowait(0x456, [0] * 8) for _ in range(50)]
+        futures[-1].result(1)
+        # 50 frames of ~1.07 ms at 125 kbit/s (pacing window is 1 ms):
+        assert time.monotonic() - start > 0.045
+    finally:
+        bus.close()
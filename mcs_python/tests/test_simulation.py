@@ -0,0 +1,435 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+import can
+import pytest
+
+import mcs
+
+
+@pytest.fixture(scope='function')
+def mcs_sim():
+    m = mcs.get_simulated_mcs([mcs.SimulatedLaserBoard(0x423),
+                               mcs.SimulatedModule(0x421)])
+    yield m
+    m.close()
+
+
+# Test ComSimulated
+def test_simulated_mcs_scan(mcs_sim):
+    """Test only simulated modules respond to scan."""
+    devices = mcs_sim.get_registered_devices()
+    assert [d.id for d in devices] == [0x421, 0x423]
+
+
+def test_simulated_module_startup_and_ports(mcs_sim):
+    """Test reset and init with busy to idle transition, ports, parameters."""
+    device = mcs_sim.get_device(0x421)
+    device.reset()
+    assert device.is_not_initialized()
+    device.init()
+    assert device.status == 0
+    assert device.get_firmware_version_str() == "2.1.1.r"
+    device.set_port(port=5, value=0x1234, length=2)
+    assert device.get_port(port=5) == 0x1234
+    device.set_parameter(parameter=130, value=-2)
+    assert device.get_parameter(parameter=130, signed=True) == -2
+
+
+def test_simulated_module_nack_and_timeout(mcs_sim):
+    """Test NACK on unknown command and time out for missing module."""
+    device = mcs_sim.get_device(0x421)
+    with pytest.raises(mcs.McsHardwareException):
+        device.send_and_check_rsp([0x99])
+    assert device.info_com_error() == 0x0004
+    missing = mcs.McsDevice(0x422, mcs_sim.bus)
+    mcs_sim.register(missing)
+    with pytest.raises(mcs.McsTimeoutException):
+        missing.info_firmware_version()
+
+
+def test_simulated_laser_board_temperature(mcs_sim):
+    """Test laser temperature follows target temperature when operating."""
+    laser = mcs.LaserBoard(mcs_sim.get_device(0x423))
+    laser.initialize()
+    assert laser.get_temperature_laser_2() == 2500
+    laser.set_temp_laser(2000)
+    laser.operate(1)
+    time.sleep(0.1)
+    assert 2000 < laser.get_temperature_laser_2() < 2500
+    assert laser.is_laser_2_on() == 1
+
+
+def test_get_port_group():
+    """Test group request to many devices takes about one round trip."""
+    lasers = [mcs.SimulatedLaserBoard(can_id) for can_id in range(0x430, 0x43a)]
+    m = mcs.get_simulated_mcs(lasers, latency=0.02)
+    try:
+        m.register(mcs.McsDevice(0x422, m.bus))  # Not responding.
+        start = time.monotonic()
+        values, errors = m.get_port_group(
+            port={0x430: 3, 0x431: 4, 0x422: 4, 0x4ff: 4}, timeout=0.1)
+        assert time.monotonic() - start < 0.15
+        assert values == {0x430: 2500, 0x431: 2500}
+        assert isinstance(errors[0x422], mcs.McsTimeoutException)
+        assert isinstance(errors[0x4ff], mcs.McsException)
+        values, errors = m.get_parameter_group(
+            parameter=0, can_ids=[d.id for d in lasers])
+        assert len(values) == len(lasers) and not errors
+    finally:
+        m.close()
+
+
+def test_multi_mcs():
+    """Test devices with same CAN id on two buses are served in parallel."""
+    instances = {}
+    for bus, temperature in [("sim0", 2000), ("sim1", 3000)]:
+        laser = mcs.SimulatedLaserBoard(0x423, temperature=temperature)
+        laser.ambient = temperature
+        instances[bus] = mcs.Mcs(mcs.McsBus(
+            mcs.ComSimulated([laser], latency=0.02)))
+    with mcs.MultiMcs(instances) as multi_mcs:
+        assert list(multi_mcs.get_registered_devices()) == [("sim0", 0x423),
+                                                             ("sim1", 0x423)]
+        assert multi_mcs.get_device("sim1", 0x423) is \
+            multi_mcs["sim1"].get_device(0x23)
+        start = time.monotonic()
+        values, errors = multi_mcs.get_port_group(port=4)
+        assert time.monotonic() - start < 0.035
+        assert values == {("sim0", 0x423): 2000, ("sim1", 0x423): 3000}
+        assert not errors
+
+
+def test_scan_with_topology(tmp_path):
+    """Test topology cache is written on first open, used on next open and
+    scanned again if the topology changed."""
+    path = str(tmp_path / "topology.json")
+    com_sim = mcs.ComSimulated([mcs.SimulatedModule(0x421)])
+    with_topology = mcs.Mcs(mcs.McsBus(com_sim), topology_path=path)
+    with_topology.open()
+    try:
+        assert mcs.mcs.load_topology(path) == {
+            0x21: {"name": mcs.DEVICE_NAME[0x421], "firmware": "2.1.1.r"}}
+        start = time.monotonic()
+        assert [d.id for d in with_topology.scan_with_topology(path)] == [0x421]
+        assert time.monotonic() - start < mcs.mcsbus.CAN_TIMEOUT
+        com_sim.add_module(mcs.SimulatedLaserBoard(0x423))  # Not in cache.
+        com_sim.remove_module(0x421)  # Cached device missing: scan all ids.
+        devices = with_topology.scan_with_topology(path)
+        assert [d.id for d in devices] == [0x423]
+        assert list(mcs.mcs.load_topology(path)) == [0x23]
+    finally:
+        with_topology.close()
+
+
+def test_metrics(mcs_sim, tmp_path):
+    """Test frames, NACKs, time outs and round trip times are counted."""
+    metrics = mcs_sim.bus.metrics
+    metrics.reset()
+    device = mcs_sim.get_device(0x421)
+    device.get_port(port=5)
+    with pytest.raises(mcs.McsHardwareException):
+        device.send_and_check_rsp([0x99])
+    with pytest.raises(mcs.McsTimeoutException):
+        device.send_and_check_rsp([0x41, 5], timeout=0)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"]["nacks"]["devices"] == {"0x021": 1}
+    assert snapshot["counters"]["timeouts"]["total"] == 1
+    assert metrics.get("tx_frames", 0x21) == 4  # Incl. info 1 after NACK.
+    assert metrics.get("rx_frames", 0x21) >= 3
+    assert snapshot["rtt"]["0x021"]["0x41"]["count"] >= 1
+    path = tmp_path / "mcs.prom"
+    metrics.write_to_file(str(path), labels={"bus": "sim"})
+    text = path.read_text()
+    assert 'mcs_nacks_total{bus="sim",device="0x021"} 1' in text
+    assert 'mcs_rtt_seconds_count{bus="sim",device="0x021",cmd="0x99"} 1' \
+        in text
+
+
+def test_unsolicited_messages_do_not_disturb_responses(mcs_sim):
+    """Test pushed port data is kept apart from acknowledges and responses."""
+    device = mcs_sim.get_device(0x421)
+    for i in range(mcs.mcsdevice.UNSOLICITED_BUFFER_SIZE + 3):
+        device.put_msg(can.Message(arbitration_id=0x021,
+                                   data=[0x42, 0x00, 7, 0x00, i, 0x00]))
+    device.set_port(port=5, value=0x1234, length=2)
+    assert device.get_port(port=5) == 0x1234
+    assert device.buffer == []
+    assert len(device.unsolicited) == mcs.mcsdevice.UNSOLICITED_BUFFER_SIZE
+    assert device.unsolicited.dropped == 3
+    assert device.unsolicited.get().data[4] == 3  # Oldest dropped.
+    assert mcs_sim.bus.metrics.get("unsolicited_overflows", 0x21) == 3
+
+
+def test_late_response_is_discarded_after_timeout():
+    """Test a timed out request releases the device at once and its late
+    response is not taken for the response to the next request."""
+    m = mcs.get_simulated_mcs([mcs.SimulatedModule(0x421)], latency=0.05)
+    try:
+        device = m.get_device(0x421)
+        device.set_port(port=5, value=0x1234, length=2)
+        with pytest.raises(mcs.McsTimeoutException):
+            device.send_and_check_rsp(data=[0x41, 4], timeout=0.01)
+        assert device.request.cancelled
+        start = time.perf_counter()
+        assert device.get_port(port=5) == 0x1234
+        assert time.perf_counter() - start < 0.5  # No lock stall.
+        assert m.bus.metrics.get("late_responses", 0x21) == 1
+    finally:
+        m.close()
+
+
+def test_port_subscription(mcs_sim):
+    """Test subscribed port values are received without polling."""
+    values = []
+    subscription = mcs_sim.subscribe(0x423, port=4, period=0.02,
+                                     callback=lambda s: values.append(s.value))
+    assert mcs_sim.get_device(0x423).get_port_mode(4) == 0x20
+    time.sleep(0.2)
+    assert len(values) >= 3
+    assert subscription.value == values[-1]
+    assert mcs_sim.subscriptions.get_value(0x423, port=4) == values[-1]
+
+    mcs_sim.unsubscribe(subscription)
+    assert mcs_sim.get_device(0x423).get_port_mode(4) == 0x00
+    time.sleep(0.05)
+    count = len(values)
+    time.sleep(0.1)
+    assert len(values) == count
+
+
+def test_wait_until():
+    """Test wait_until() returns as soon as the port value fulfills the
+    condition and raises on time out."""
+    module = mcs.SimulatedModule(0x421)
+    m = mcs.get_simulated_mcs([module])
+    try:
+        device = mcs.HardwareDevice(m.get_device(0x421),
+                                    ports={"level": mcs.DataPort(5, 2)})
+        threading.Timer(0.1, module.ports.__setitem__, args=(5, 300)).start()
+        start = time.perf_counter()
+        assert device.wait_until("level", lambda level: level >= 200,
+                                 timeout=2) == 300
+        assert time.perf_counter() - start < 0.5
+        with pytest.raises(mcs.McsTimeoutException):
+            device.wait_until("level", lambda level: level > 300, timeout=0.1)
+    finally:
+        m.close()
+
+
+def test_data_cache():
+    """Test parameters are read from the device once until written or the
+    device is reset, volatile ports are not cached."""
+    m = mcs.get_simulated_mcs([mcs.SimulatedLaserBoard(0x423)])
+    try:
+        device = mcs.HardwareDevice(
+            m.get_device(0x423),
+            parameters={"target": mcs.Parameter(0, factor_raw_to_user=0.01)},
+            ports={"temperature": mcs.DataPort(4, 2, factor_raw_to_user=0.01)})
+        cache = device.enable_cache()
+        assert device.read_parameter("target") == 22.0
+        assert device.read_parameter("target") == 22.0
+        assert cache.stats()["hits"] == 1
+        device.write_parameter("target", 30.0)
+        assert device.read_parameter("target") == 30.0
+        device.set_parameter(0, 3100)  # Not written by write_parameter().
+        assert device.read_parameter("target") == 31.0
+        device.read_parameter("target")
+        device.reset()
+        device.read_parameter("target")
+        device.read_port("temperature")
+        assert cache.stats()["hits"] == 2
+        assert cache.stats()["misses"] == 4
+        assert cache.stats()["bypasses"] == 1
+        assert mcs.Parameter(128).cache_ttl == 0  # RAM parameter.
+        model = mcs.HardwareModel(mcs.HardwareDevice(m.get_device(0x423)))
+        assert model._device.cache is None  # Opt-in for models, too.
+    finally:
+        m.close()
+
+
+def test_configuration_apply_and_restore(tmp_path):
+    """Test only differing parameters are written and a snapshot restores
+    them."""
+    modules = [mcs.SimulatedModule(0x421, parameters={0: 10, 1: 20}),
+               mcs.SimulatedModule(0x422, parameters={0: 30, 1: 40})]
+    m = mcs.get_simulated_mcs(modules)
+    try:
+        devices = [mcs.HardwareDevice(
+            m.get_device(can_id),
+            parameters={"a": mcs.Parameter(0, factor_raw_to_user=0.1),
+                        "b": mcs.Parameter(1)}) for can_id in (0x421, 0x422)]
+        config = mcs.configuration
+        snapshot, errors = config.snapshot(devices)
+        assert not errors
+        path = str(tmp_path / "snapshot.json")
+        config.save_snapshot(path, snapshot)
+
+        written, errors = config.apply({devices[0]: {"a": 1.0, "b": 21},
+                                        devices[1]: {"a": 3.0}}, snapshot)
+        assert not errors
+        assert written == {devices[0]: {"b": 21}, devices[1]: {}}
+        assert modules[0].parameters == {0: 10, 1: 21}
+
+        written, errors = config.restore(devices, config.load_snapshot(path))
+        assert not errors
+        assert written == {devices[0]: {"b": 20}, devices[1]: {}}
+        assert modules[0].parameters == {0: 10, 1: 20}
+
+        reads = []
+        handle_db = modules[1].handle_db
+        modules[1].handle_db = lambda data: reads.append(data[1]) or handle_db(
+            data)
+        devices[1].parameters["mode"] = mcs.DataPort(2, 1, False, "w")
+        written, errors = config.apply({devices[1]: {"mode": 3, "a": 3.0}})
+        assert not errors
+        assert written == {devices[1]: {"mode": 3}}
+        assert modules[1].parameters[2] == 3
+        assert reads == [0]  # Write-only parameter is never read.
+    finally:
+        m.close()
+
+
+def test_bring_up_runs_independent_devices_concurrently():
+    """Test independent devices are brought up at the same time and a device
+    waits for its dependencies."""
+    modules = [mcs.SimulatedModule(0x421 + i) for i in range(5)]
+    for module in modules:
+        module.reset_time = module.init_time = 0.1
+    m = mcs.get_simulated_mcs(modules)
+    try:
+        devices = [mcs.HardwareDevice(m.get_device(0x421 + i))
+                   for i in range(5)]
+        bring_up = mcs.BringUp()
+        for device in devices[:4]:
+            bring_up.add(device, steps=["reset", "init"])
+        bring_up.add(devices[4], after=devices[:2])
+        results = bring_up.run()
+        assert all(result.ok for result in results.values())
+        assert bring_up.duration < 0.7  # Serial: 5 * 0.2 s.
+        assert 0.15 < results[devices[4]].waited < 0.4
+        assert set(results[devices[0]].steps) == {"reset", "init"}
+
+        def fail(device):
+            raise mcs.McsHardwareException(f"{device}: Failed")
+
+        bring_up = mcs.BringUp()
+        bring_up.add(devices[0], steps=[("fail", fail)])
+        bring_up.add(devices[1], after=[devices[0]])
+        results = bring_up.run()
+        assert results[devices[0]].error is not None
+        assert results[devices[1]].start is None
+        assert isinstance(results[devices[1]].error, mcs.McsException)
+
+        bring_up = mcs.BringUp()  # Invalid step (resolved in worker).
+        bring_up.add(devices[0], steps=["nonexistent"])
+        bring_up.add(devices[1], after=[devices[0]])
+        results = bring_up.run()
+        assert isinstance(results[devices[0]].error, AttributeError)
+        assert "nonexistent" in results[devices[0]].steps
+        assert results[devices[1]].start is None
+        assert isinstance(results[devices[1]].error, mcs.McsException)
+    finally:
+        m.close()
+
+
+def test_status_confirmed_completion():
+    """Test go_main(), gripper_out() and send_and_read() return when the
+    module is ready instead of after a fixed time."""
+    m = mcs.get_simulated_mcs([mcs.SimulatedModule(0x421,
+                                                   ports={0: 1, 6: 1})])
+    try:
+        ejector = mcs.Ejector(m.get_device(0x421))
+        start = time.monotonic()
+        ejector.gripper_out()  # Gripper sensor (port 6) reports out.
+        assert time.monotonic() - start < 0.1  # Was 0.2 s.
+
+        start = time.monotonic()
+        ejector.go_main(timeout=2)
+        assert 0.2 <= time.monotonic() - start < 1.0
+        assert ejector.get_port(6) == 1  # Answers again.
+
+        tunneler = mcs.SerialTunneler(m.get_device(0x421))
+        tunneler.write = lambda cmd: None
+        tunneler.read = lambda raise_on_fail: "ok"
+        start = time.monotonic()
+        assert tunneler.send_and_read("x", read_delay=0.2) == "ok"
+        assert time.monotonic() - start >= 0.2  # read_delay is the minimum.
+        start = time.monotonic()
+        assert tunneler.send_and_read("x", read_delay=0.2, length=1) == "ok"
+        assert time.monotonic() - start < 0.1  # Port 0: 1 byte received.
+    finally:
+        m.close()
+
+
+def test_poll_scheduler_budget():
+    """Test models share the poll scheduler within its bus budget and unused
+    data is not read."""
+    m = mcs.get_simulated_mcs([mcs.SimulatedModule(0x421, ports={5: 77}),
+                               mcs.SimulatedModule(0x422)])
+    scheduler = mcs.PollScheduler(budget=100)
+    try:
+        models = []
+        for can_id in (0x421, 0x422):
+            device = mcs.HardwareDevice(
+                m.get_device(can_id),
+                ports={f"port {i}": mcs.DataPort(i, 2) for i in range(8)})
+            model = mcs.HardwareModel(device, scheduler)
+            model.update_rate = 0.01  # Would be 1600 reads/s.
+            model.idle_timeout = 0.3
+            model.start_update()
+            models.append(model)
+        time.sleep(0.5)
+        readers = [r for model in models for r in model._readers.values()]
+        reads = sum(r.reads for r in readers)
+        assert 20 < reads <= 100 * 0.5 + scheduler.batch_size
+        assert models[0].get_port("port 5") == 77
+        assert all(r.errors == 0 for r in readers)
+
+        time.sleep(0.1)  # Idle timeout of all readers but the touched one.
+        reads = sum(r.reads for r in readers)
+        time.sleep(0.2)
+        assert sum(r.reads for r in readers) - reads <= 0.2 / 0.01 + 1
+
+        idle = models[1]._readers[(mcs.scheduler.PORT, "port 3")]
+        reads = idle.reads
+        models[1].get_port("port 3")  # Touching an idle reader reads at once.
+        time.sleep(0.02)
+        assert idle.reads > reads
+        assert mcs.HardwareModel.idle_timeout is None
+        for model in models:
+            model.stop_update()
+    finally:
+        m.close()
+
+
+def test_model_writes_are_coalesced(mcs_sim):
+    """Test pending writes of the same port are superseded by the latest."""
+    device = mcs.HardwareDevice(mcs_sim.get_device(0x421),
+                                ports={"speed": mcs.DataPort(5, 2)})
+    model = mcs.HardwareModel(device)
+    written = []
+    device.write_port = lambda name, value: written.append(value)
+    busy = threading.Event()
+    blocker = model.submit(busy.wait, 1)
+    futures = [model.set_port("speed", value) for value in range(10)]
+    busy.set()
+    assert blocker.result(timeout=1)
+    futures[-1].result(timeout=1)
+    assert written == [9]
+    assert all(f is futures[0] for f in futures)
+    assert mcs.get_executor(device).coalesced == 9
+
+    commands = []  # Commands other than writes are never superseded.
+    device.init = lambda: commands.append("init")
+    device.operate = commands.append
+    busy.clear()
+    blocker = model.submit(busy.wait, 1)
+    futures = [model.init(), model.set_port("speed", 1), model.init(),
+               model.operate(1), model.operate(2)]
+    busy.set()
+    for future in futures:
+        future.result(timeout=1)
+    assert commands == ["init", "init", 1, 2]
+    assert written == [9, 1]
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+import gzip
+import os
+
+import can
+import pytest
+from unittest.mock import MagicMock
+
+import mcs
+from mcs import trace
+
+
+@pytest.fixture(scope='function')
+def mcs_bus():
+    b = mcs.McsBus(MagicMock())
+    yield b
+
+
+def _read_records(data: bytes):
+    magic, version, size = trace.HEADER.unpack_from(data)
+    assert magic == trace.TRACE_MAGIC
+    assert size == trace.RECORD.size
+    return [trace.RECORD.unpack_from(data, offset) for offset in
+            range(trace.HEADER.size, len(data), size)]
+
+
+# Test TraceRecorder
+def test_mcs_bus_record_to_file(mcs_bus, tmp_path):
+    """Test sent and received frames are recorded as binary records."""
+    path = str(tmp_path / "mcs.trace")
+    recorder = mcs_bus.record_to_file(path)
+    mcs_bus.send(0x456, [0x41, 0x05])
+    recorder.record(can.Message(timestamp=1.5, arbitration_id=0x56,
+                                is_extended_id=False,
+                                data=[0x42, 0x00, 0x05, 0x00, 0x08]))
+    mcs_bus.stop_record_to_file()
+
+    with open(path, "rb") as f:
+        records = _read_records(f.read())
+    assert len(records) == 2
+    assert records[0][1:4] == (0x456, trace.FLAG_TX, 2)
+    assert records[0][4] == bytes([0x41, 0x05, 0, 0, 0, 0, 0, 0])
+    assert records[1][:4] == (1.5, 0x56, 0, 5)
+
+
+def test_trace_recorder_rotates_compressed(tmp_path):
+    """Test trace file is rotated into gzip compressed backups."""
+    path = str(tmp_path / "mcs.trace")
+    size = trace.HEADER.size + 10 * trace.RECORD.size
+    msg = can.Message(arbitration_id=0x56, is_extended_id=False, data=[0])
+    with trace.TraceRecorder(path, max_bytes=size, backup_count=2,
+                             compress=True) as recorder:
+        for i in range(35):
+            recorder.record(msg)
+            if i % 10 == 9:  # Write a batch of 10 frames (one file each).
+                recorder.stop()
+                recorder.start()
+
+    assert not os.path.exists(path + ".3.gz")
+    with gzip.open(path + ".1.gz") as f:
+        assert len(_read_records(f.read())) == 10
+    with open(path, "rb") as f:
+        assert len(_read_records(f.read())) == 5
+
+
+# Test trace reader
+def test_trace_reader_query_and_latency(mcs_bus, tmp_path):
+    """Test querying binary and text traces gives the same decoded frames."""
+    trace_reader = pytest.importorskip("mcs.trace_reader")
+    trace_path = str(tmp_path / "mcs.trace")
+    log_path = str(tmp_path / "mcs.log")
+    mcs_bus.record_to_file(trace_path)
+    mcs_bus.log_to_file(log_path)
+    mcs_bus._time_shift = 1.0  # Sent messages get time stamps.
+    for i in range(3):
+        mcs_bus.send(0x463, [0x41, 0x04])
+        mcs_bus._com.read_batch.return_value = [can.Message(
+            timestamp=mcs_bus.get_recent_commands(1)[0].timestamp + 0.001,
+            arbitration_id=0x063, is_extended_id=False,
+            data=[0x42, 0x00, 0x04, 0x00, 0x08, i])]
+        mcs_bus.read()
+    mcs_bus.send(0x1640e004, [0xf0, 0x0f, 0xb1, 0x03], is_extended=True)
+    mcs_bus.stop_record_to_file()
+    mcs_bus.stop_log_to_file()
+
+    for path in (trace_path, log_path):
+        trace = trace_reader.read_trace(path)
+        assert len(trace) == 7
+        rsp = trace.query(0x063, cmd="port data")
+        assert list(rsp["data"][:, 5]) == [0, 1, 2]
+        assert list(trace_reader.cmd_names(rsp)) == ["port data"] * 3
+        assert len(trace.query(0x063, t1=rsp["timestamp"][1])) == 1
+        tml = trace.query(opcode=0xb204)
+        assert tml["device"][0] == 7  # Axis id.
+        stats = trace.latency_stats()[0x463]
+        assert stats["requests"] == 3
+        assert stats["unanswered"] == 0
+        assert stats["max"] == pytest.approx(0.001, abs=1e-5)
+
+    with open(trace_path, "ab") as f:
+        f.write(bytes(10))  # Partial record of a trace being written.
+    assert len(trace_reader.read_binary_trace(trace_path)) == 7
+    with open(trace_path, "rb") as f, gzip.open(trace_path + ".gz", "wb") as g:
+        g.write(f.read())
+    assert len(trace_reader.read_binary_trace(trace_path + ".gz")) == 7
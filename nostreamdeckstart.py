@@ -63,6 +63,24 @@ def read_temp(device):
     return temp_float
 
 
+def read_temps(pis):
+    """Read temperatures of all given lasers in one CAN bus round.
+
+    Lasers that failed to respond are missing in the returned dict.
+    """
+    ports = {}
+    for pi in pis:
+        if CAN_DEVICES.get(pi):
+            can_id = CAN_DEVICES[pi]._device.id
+            ports[can_id] = 4 if str(hex(can_id))[-1] == '3' else 3
+    values, errors = can.get_port_group(port=ports)
+    for can_id, err in errors.items():
+        print(f"Could not read temperature of {hex(can_id)}: {err}")
+    return {pi: values[CAN_DEVICES[pi]._device.id] / 100.0
+            for pi in pis
+            if CAN_DEVICES.get(pi) and CAN_DEVICES[pi]._device.id in values}
+
+
 
 def set_temp(device, target):
     print("About to set temperature")
@@ -172,15 +190,20 @@ class Fullscreen_Window:
         for i in range(101 + IP_OFFSET, 111 + IP_OFFSET):
             self.press_laserpi_key(laserpi=i)
 
-        # Initialize and turn on the lasers
+        # Initialize and turn on the lasers (all at the same time)
+        bring_up = mcs.BringUp()
         for pi, is_on in self.laserPIs.items():
             if is_on:
                 if CAN_DEVICES[pi]:
-                    can_device = CAN_DEVICES[pi]
-                    can_device.initialize()
-
-                    can_device.operate(1)
-                    print("TTTTTTTTTTTTTTTTT", can_device.get_temperature_laser_1())
+                    bring_up.add(CAN_DEVICES[pi],
+                                 steps=["initialize",
+                                        ("operate", lambda d: d.operate(1))])
+        results = bring_up.run()
+        print(bring_up.report())
+        for result in results.values():
+            if result.error is not None:
+                raise result.error
+            print("TTTTTTTTTTTTTTTTT", result.device.get_temperature_laser_1())
 
         print("laserPis", self.laserPIs)
 
@@ -215,6 +238,10 @@ class Fullscreen_Window:
                 else: 
                     self.usb_lock = False
                 ready_states = []
+                temperatures = {}
+                if self.started:
+                    temperatures = read_temps(
+                        [pi for pi, is_on in self.laserPIs.items() if is_on])
                 for pi, is_on in self.laserPIs.items():                 # Laser IDs and state
                     # print(f"    ...  {pi=} {is_on=} {ready_states=}")
                     if not is_on:
@@ -226,7 +253,9 @@ class Fullscreen_Window:
                         print(":::::::::::::::::::::::pi", pi, "key", key)
 
                         # Reading the temperature via CAN and posting it to the associated Raspberry
-                        temperature = read_temp(CAN_DEVICES[pi])
+                        temperature = temperatures.get(pi)
+                        if temperature is None:
+                            temperature = read_temp(CAN_DEVICES[pi])
                         print("TEMPPPPPPPPPP", temperature)
                         with open(f"read_temp.float.{pi}", "w+") as f:
                             f.write(str(temperature))